@@ -122,6 +122,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "store_project.meso.profiling.QueryProfileMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -291,6 +292,32 @@ MESO_AGENT_RUN_SYNC = os.environ.get("MESO_AGENT_RUN_SYNC", "false").lower() in
     "true",
     "yes",
 )
+# The agent's own django-q queue (``agent.jobs``; ``ALT_CLUSTERS`` below), so a
+# burst of Claude calls can't starve the invite sweeps or each other. Worker
+# processes for that queue, and how many runs one coach may have in flight at
+# once (0 = no per-coach cap); interactive runs are always picked before evals.
+MESO_AGENT_WORKERS = int(os.environ.get("MESO_AGENT_WORKERS", "2"))
+MESO_AGENT_COACH_CONCURRENCY = int(os.environ.get("MESO_AGENT_COACH_CONCURRENCY", "1"))
+# Seconds until a ticket that found every waiting batch held by that cap tries
+# again (a run that finishes early wakes them sooner). The agent cluster's
+# scheduler ticks about every 30s, so that's the effective floor.
+MESO_AGENT_REQUEUE_DELAY = int(os.environ.get("MESO_AGENT_REQUEUE_DELAY", "30"))
+# The designer waits on a drafting batch over one server-sent-events stream
+# (``views.batch_events``, woken by ``agent.events``) instead of polling. How
+# long one stream stays open before the client falls back to polling, and how
+# often it writes a keep-alive comment so proxies don't drop it as idle.
+MESO_AGENT_STREAM_TIMEOUT = int(os.environ.get("MESO_AGENT_STREAM_TIMEOUT", "120"))
+MESO_AGENT_STREAM_HEARTBEAT = int(os.environ.get("MESO_AGENT_STREAM_HEARTBEAT", "15"))
+# Each open stream holds a gunicorn thread and that thread's database connection
+# (CONN_MAX_AGE keeps one per thread) for up to MESO_AGENT_STREAM_TIMEOUT. How
+# many one worker process may hold at once; past it the stream answers 503 and
+# the client polls (0 = never stream). Keep it under the Dockerfile's
+# ``--threads`` (8) so ordinary requests always have threads left. Sizing: the
+# web tier holds up to WEB_CONCURRENCY x threads connections — streams among
+# them, at most WEB_CONCURRENCY x MESO_AGENT_STREAM_MAX — plus one per qcluster
+# worker (the sweeps' and MESO_AGENT_WORKERS); Postgres' max_connections must
+# cover that total.
+MESO_AGENT_STREAM_MAX = int(os.environ.get("MESO_AGENT_STREAM_MAX", "4"))
 # Demo/sandbox mode (issues #388/#389): swap the Claude client for a curated,
 # deterministic one (``agent.fake.FakeDemoClient``) with no Anthropic call and no
 # network — for a re-recordable walkthrough video or a public sandbox that must
@@ -362,6 +389,61 @@ MESO_SANDBOX_MAX_CONCURRENT = int(os.environ.get("MESO_SANDBOX_MAX_CONCURRENT",
 MESO_DEMO_VIDEO_URL = os.environ.get("MESO_DEMO_VIDEO_URL", "")
 MESO_DEMO_VIDEO_POSTER_URL = os.environ.get("MESO_DEMO_VIDEO_POSTER_URL", "")
 
+# Designer undo/redo snapshot storage (``meso.history``). Snapshot chunks are
+# deduplicated per plan and stored compressed with this codec: ``zlib`` (the
+# default) or ``raw`` (uncompressed — handy when inspecting rows by hand).
+# Existing chunks keep the codec they were written with.
+MESO_SNAPSHOT_CODEC = os.environ.get("MESO_SNAPSHOT_CODEC", "zlib")
+
+# Designer grid payload cache (``meso.grid_cache``). Entries are versioned by
+# ``Plan.edit_version``, so designer writes invalidate them immediately; the
+# TTL (seconds) only bounds staleness from writes made outside the designer
+# (admin, profile/contraindication edits). 0 disables the cache.
+MESO_GRID_CACHE_TTL = int(os.environ.get("MESO_GRID_CACHE_TTL", "600"))
+
+# Athlete home cache (``meso.home_cache``): each athlete's home cards, versioned
+# by a per-athlete generation that plan writes, link changes and logging bump,
+# plus the page's ETag. The TTL (seconds) bounds staleness from writes outside
+# those paths (admin edits) for both; 0 disables the cache and the ETag.
+MESO_HOME_CACHE_TTL = int(os.environ.get("MESO_HOME_CACHE_TTL", "600"))
+
+# Scored session results cache (``meso.results_cache``): the coach results
+# screen and the profile's latest-session card, keyed by the log's updated-at,
+# its PR-ledger stamp and the plan's ``edit_version``. The TTL (seconds) bounds
+# staleness from writes outside the log endpoint and the designer (admin edits);
+# 0 disables the cache.
+MESO_RESULTS_CACHE_TTL = int(os.environ.get("MESO_RESULTS_CACHE_TTL", "600"))
+
+# Bulk offline log sync (``meso.views.athlete_log_sync``): how long (seconds; a
+# week by default) an applied idempotency key is remembered, so a retried flush
+# whose response was lost is answered as a duplicate instead of re-applying a
+# stale log. 0 keeps no receipts (a retry re-applies — the write is an upsert).
+MESO_LOG_SYNC_RECEIPT_TTL = int(os.environ.get("MESO_LOG_SYNC_RECEIPT_TTL", "604800"))
+
+# Memoized agent grounding (``meso.agent.service._grid_context``): the plan and
+# block grids of the agent's context, keyed by mesocycle and stamped with the
+# plan's ``edit_version`` and the athlete's generation. The TTL (seconds) bounds
+# staleness from writes outside the designer and the log endpoint; 0 disables.
+MESO_AGENT_CONTEXT_CACHE_TTL = int(
+    os.environ.get("MESO_AGENT_CONTEXT_CACHE_TTL", "600")
+)
+
+# ETags on the re-requested meso reads (``meso.etags``): the designer's week and
+# grid, the proposal-batch poll, the tour config and the athlete session page.
+# Derived from plan versions and per-user generations; the window (seconds)
+# bounds staleness from writes outside those paths. 0 disables them.
+MESO_ETAG_TTL = int(os.environ.get("MESO_ETAG_TTL", "600"))
+
+# Per-request SQL profiling of the meso views (``meso.profiling``): query count,
+# SQL vs. Python time and duplicate queries, returned to staff as a
+# ``Server-Timing`` header and aggregated on the staff query-profile dashboard.
+# Off by default — it wraps every query and writes the cache once per request.
+MESO_QUERY_PROFILING = os.environ.get("MESO_QUERY_PROFILING", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 # Cache
 
 DEFAULT_CACHE_TIMEOUT = 604800  # one week
@@ -405,4 +487,16 @@ Q_CLUSTER = {
     "poll": 4,  # ORM broker poll interval (s) — easy on the DB
     "save_limit": 250,  # cap retained successful-task rows
     "label": "Scheduled tasks",
+    # The Meso agent's dedicated queue (``agent.jobs.AGENT_CLUSTER``): its own
+    # broker key and its own worker process (``Q_CLUSTER_NAME=meso-agent
+    # python manage.py qcluster``), inheriting everything above but the size.
+    # Its scheduler fires only the schedules targeted at it (the delayed
+    # ``agent.jobs.REQUEUE_SCHEDULE`` retry); the sweeps stay on the default
+    # cluster.
+    "ALT_CLUSTERS": {
+        "meso-agent": {
+            "workers": MESO_AGENT_WORKERS,
+            "label": "Meso agent",
+        },
+    },
 }
@@ -1,9 +1,14 @@
+from contextlib import contextmanager
+
 import pytest
+from django.core.cache import cache
 
 from store_project.exercises.factories import CategoryFactory
 from store_project.exercises.factories import ExerciseFactory
 from store_project.exercises.models import Category
 from store_project.exercises.models import Exercise
+from store_project.meso.profiling import QUERY_BUDGETS
+from store_project.meso.profiling import record_queries
 from store_project.pages.factories import PageFactory
 from store_project.pages.models import Page
 from store_project.products.factories import BookFactory
@@ -20,6 +25,44 @@ def media_storage(settings, tmpdir):
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The LocMem cache outlives a test's rolled-back transaction, and SQLite
+    # reuses the rolled-back pks — so a cached grid payload (``meso.grid_cache``)
+    # could otherwise leak into the next test under the same key.
+    cache.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """Fail a block that runs more queries than an endpoint's declared budget.
+
+    ``with query_budget("meso:roster"): client.get(...)`` — the budget comes
+    from ``meso.profiling.QUERY_BUDGETS``, so the tests and the staff query
+    dashboard hold endpoints to the same number. The failure lists the repeated
+    statement shapes, which is usually where the new N+1 is.
+    """
+
+    @contextmanager
+    def within(name):
+        budget = QUERY_BUDGETS[name]
+        with record_queries() as recorder:
+            yield recorder
+        if recorder.count > budget:
+            repeated = "\n".join(
+                f"  x{n} {shape}"
+                for shape, n in sorted(
+                    recorder.duplicates().items(), key=lambda item: -item[1]
+                )
+            )
+            pytest.fail(
+                f"{name} ran {recorder.count} queries, over its budget of "
+                f"{budget}.\nRepeated statements:\n{repeated or '  (none)'}"
+            )
+
+    return within
+
+
 @pytest.fixture
 def user() -> User:
     return UserFactory()
@@ -24,12 +24,21 @@ stale — or falling outside the 14-day window entirely — instead of today.
 Closing this would need a separate written-at/completed-at timestamp, which
 is out of scope for the ``created_at``-only design decided in §4a.
 
+The roster reads both signals for every active athlete at once
+(``link_cadences`` — one grouped query for the whole list, not two per link);
+the single-link helpers are that query over a one-link list.
+
 Nothing here mutates state; it's a pure read layer the presenter formats.
 """
 
+from dataclasses import dataclass
+from datetime import datetime
 from datetime import timedelta
 
+from django.db.models import Count
 from django.db.models import F
+from django.db.models import Max
+from django.db.models import Q
 from django.utils import timezone
 
 from .models import CoachAthlete
@@ -54,28 +63,83 @@ def link_last_trained(link):
         return None
     return (
         SessionLog.objects.filter(
-            session__week__mesocycle__plan__relationship=link,
+            relationship=link,
             athlete=link.athlete,
             status=SessionLog.Status.DONE,
         )
-        .exclude(session__week__mesocycle__plan__status=Plan.Status.ARCHIVED)
+        .exclude(plan__status=Plan.Status.ARCHIVED)
         .select_related("session__week__mesocycle__plan")
         .order_by("-created_at")
         .first()
     )
 
 
+@dataclass(frozen=True)
+class Cadence:
+    """One link's cadence signal: when they last trained and how often lately.
+
+    ``last_trained_at`` is the newest done log's ``created_at`` (``None``
+    without one) and ``recency_days`` the whole days since it;
+    ``session_count`` is the distinct done sessions inside the window.
+    """
+
+    last_trained_at: datetime | None
+    recency_days: int | None
+    session_count: int
+
+
+NO_CADENCE = Cadence(last_trained_at=None, recency_days=None, session_count=0)
+
+
+def link_cadences(links, *, days=14):
+    """``{link.pk: Cadence}`` for every link in ``links``, in one grouped query.
+
+    The set-based ``link_last_trained`` + ``link_session_count``: the roster
+    needs both signals for every active athlete, and one query per link (two,
+    on the profile) made a big roster's load grow with its size. Same rules as
+    the single-link helpers — done logs only, the link's own athlete only,
+    archived plans excluded, a session logged done twice counted once. A link
+    with no done log maps to ``NO_CADENCE``.
+    """
+    pks = [link.pk for link in links if link is not None]
+    if not pks:
+        return {}
+    now = timezone.now()
+    since = now - timedelta(days=days)
+    rows = (
+        SessionLog.objects.filter(
+            relationship_id__in=pks,
+            athlete=F("relationship__athlete"),
+            status=SessionLog.Status.DONE,
+        )
+        .exclude(plan__status=Plan.Status.ARCHIVED)
+        .values("relationship_id")
+        .annotate(
+            last=Max("created_at"),
+            recent=Count("session_id", distinct=True, filter=Q(created_at__gte=since)),
+        )
+        .order_by()
+    )
+    cadences = dict.fromkeys(pks, NO_CADENCE)
+    for row in rows:
+        cadences[row["relationship_id"]] = Cadence(
+            last_trained_at=row["last"],
+            recency_days=(now - row["last"]).days,
+            session_count=row["recent"],
+        )
+    return cadences
+
+
 def link_recency_days(link):
     """Whole days since ``link_last_trained`` — the roster pill's tone input.
 
     ``0`` for a log written today; ``None`` when there's no done log yet
     (mirrors the old meter's hidden state — the roster shows "No sessions
-    yet" rather than a misleading number).
+    yet" rather than a misleading number). One link's ``link_cadences``.
     """
-    log = link_last_trained(link)
-    if log is None:
+    if link is None:
         return None
-    return (timezone.now() - log.created_at).days
+    return link_cadences([link])[link.pk].recency_days
 
 
 def link_session_count(link, *, days=14):
@@ -85,23 +149,12 @@ def link_session_count(link, *, days=14):
     percent — a date-less program exposes no prescribed weekly frequency to
     divide by, so there is no honest denominator to build a meter from. Same
     archived-plan exclusion as ``link_last_trained``. A session logged done
-    more than once (the model allows dated history) counts once.
+    more than once (the model allows dated history) counts once. One link's
+    ``link_cadences``.
     """
     if link is None:
         return 0
-    since = timezone.now() - timedelta(days=days)
-    return (
-        SessionLog.objects.filter(
-            session__week__mesocycle__plan__relationship=link,
-            athlete=link.athlete,
-            status=SessionLog.Status.DONE,
-            created_at__gte=since,
-        )
-        .exclude(session__week__mesocycle__plan__status=Plan.Status.ARCHIVED)
-        .values("session_id")
-        .distinct()
-        .count()
-    )
+    return link_cadences([link], days=days)[link.pk].session_count
 
 
 def recent_logs(coach, *, limit=8):
@@ -117,19 +170,18 @@ def recent_logs(coach, *, limit=8):
     log's ``athlete`` is tied to the plan's own athlete: the write path always
     enforces this, but the model carries no DB constraint, so a stray mismatched
     row (admin / import) must not surface an unrelated name + a profile link the
-    coach can't open. ``select_related`` the athlete + session so the presenter
-    formats each event without a per-row query.
+    coach can't open. ``select_related`` the athlete + session (and the day slot
+    its name comes from) so the presenter formats each event without a per-row
+    query.
     """
     return list(
         SessionLog.objects.filter(
             status=SessionLog.Status.DONE,
-            session__week__mesocycle__plan__relationship__coach=coach,
-            session__week__mesocycle__plan__relationship__status=(
-                CoachAthlete.Status.ACTIVE
-            ),
-            athlete=F("session__week__mesocycle__plan__relationship__athlete"),
+            relationship__coach=coach,
+            relationship__status=CoachAthlete.Status.ACTIVE,
+            athlete=F("relationship__athlete"),
         )
-        .exclude(session__week__mesocycle__plan__status=Plan.Status.ARCHIVED)
-        .select_related("athlete", "session")
+        .exclude(plan__status=Plan.Status.ARCHIVED)
+        .select_related("athlete", "session__session_slot")
         .order_by("-created_at")[:limit]
     )
@@ -3,14 +3,18 @@ from django.contrib import admin
 from .models import AgentProposalBatch
 from .models import AthleteOneRm
 from .models import AthleteProfile
+from .models import BatchDelivery
+from .models import BatchDeliveryTarget
 from .models import CoachAthlete
 from .models import CoachInvite
 from .models import CoachProfile
 from .models import CoachSubscription
 from .models import Contraindication
 from .models import ExerciseSlot
+from .models import LiftBest
 from .models import LoggedSet
 from .models import Mesocycle
+from .models import PersonalRecordEntry
 from .models import Plan
 from .models import Prescription
 from .models import ProposedChange
@@ -226,6 +230,23 @@ class WeekDeliveryAdmin(admin.ModelAdmin):
     readonly_fields = ("delivered_at", "payload", "created_at")
 
 
+class BatchDeliveryTargetInline(admin.TabularInline):
+    model = BatchDeliveryTarget
+    extra = 0
+    fields = ("relationship", "status", "copy", "error", "finished_at")
+    readonly_fields = fields
+    can_delete = False
+
+
+@admin.register(BatchDelivery)
+class BatchDeliveryAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "coach", "status", "created_at", "finished_at")
+    list_filter = ("status",)
+    raw_id_fields = ("plan", "coach", "source_block")
+    readonly_fields = ("created_at", "finished_at")
+    inlines = (BatchDeliveryTargetInline,)
+
+
 @admin.register(Session)
 class SessionAdmin(admin.ModelAdmin):
     list_display = ("__str__", "week", "session_slot", "day_number", "order")
@@ -309,6 +330,9 @@ class AgentProposalBatchAdmin(admin.ModelAdmin):
         "request_id",
         "stop_reason",
         "duration_ms",
+        "queue_depth",
+        "started_at",
+        "queue_wait_ms",
         "estimated_cost_usd",
         "trigger",
         "billing_status",
@@ -376,3 +400,21 @@ class AthleteOneRmAdmin(admin.ModelAdmin):
     search_fields = ("athlete__email", "athlete__name", "name")
     raw_id_fields = ("athlete", "exercise")
     readonly_fields = ("key", "created_at", "updated_at")
+
+
+@admin.register(LiftBest)
+class LiftBestAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "athlete", "key", "unit", "value", "updated_at")
+    list_filter = ("unit",)
+    search_fields = ("athlete__email", "athlete__name", "key")
+    raw_id_fields = ("athlete", "logged_set", "session_log")
+    readonly_fields = ("updated_at",)
+
+
+@admin.register(PersonalRecordEntry)
+class PersonalRecordEntryAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "athlete", "key", "unit", "previous", "date")
+    list_filter = ("unit",)
+    search_fields = ("athlete__email", "athlete__name", "key", "name")
+    raw_id_fields = ("athlete", "logged_set", "session_log")
+    readonly_fields = ("created_at",)
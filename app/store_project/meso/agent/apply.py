@@ -260,8 +260,9 @@ def apply_batch(batch):
             applied.append(result)
         batch.status = AgentProposalBatch.Status.APPLIED
         batch.save(update_fields=["status"])
-        # Bump the plan so it reads as the coach's working plan (auto_now).
-        batch.plan.save(update_fields=["modified"])
+        # Bump the plan so it reads as the coach's working plan (auto_now) and
+        # its cached grid payload is rebuilt.
+        batch.plan.touch()
     return {"applied": len(applied), "skipped": skipped}
 
 
@@ -10,11 +10,18 @@ Model + thinking (pinned against the ``claude-api`` reference at build time):
 ``claude-opus-4-8`` (settings ``MESO_AGENT_MODEL``). We force ``tool_choice`` to
 the proposal tool so the model always returns a structured batch; **adaptive
 thinking is omitted** because a forced ``tool_choice`` is incompatible with
-extended/adaptive thinking, and this is a single constrained extraction. The
-stable system prompt is sent with ``cache_control`` (prompt caching); the
-volatile per-plan grounding + instruction go in the user turn. Revisit auto
-``tool_choice`` + adaptive thinking when the agent becomes multi-turn — see
+extended/adaptive thinking, and this is a single constrained extraction. Revisit
+auto ``tool_choice`` + adaptive thinking when the agent becomes multi-turn — see
 ``docs/archive/meso/agent-plan.md``.
+
+Prompt caching: the system prompt carries one ``cache_control`` breakpoint and
+the user turn is split at a second (``user_content``) — first the context's
+stable prefix (``STABLE_CONTEXT_KEYS``: coach style, athlete, plan, block),
+then its volatile suffix (recent logs, the "last time" / 1RM ``lift_history``)
+and the instruction. Both halves are serialized deterministically (sorted
+keys), so a second run on an unchanged plan reads the whole prefix from the
+cache — a log only moves the suffix; the usage report shows the resulting
+cache-hit ratio.
 """
 
 import json
@@ -25,6 +32,12 @@ from django.conf import settings
 
 TOOL_NAME = "propose_program_changes"
 
+# The grounding keys (``service.build_context``) that change only when the
+# coach edits the plan or the athlete's profile — the prompt-cached prefix.
+# Everything else (the recent logs, the lifts' "last time" / 1RM) moves with
+# every log and follows it.
+STABLE_CONTEXT_KEYS = ("coach_style", "athlete", "plan", "block")
+
 
 @dataclass
 class RunUsage:
@@ -242,12 +255,36 @@ SYSTEM_PROMPT = (
 )
 
 
-def _user_prompt(context, instruction):
-    return (
-        "Plan context (JSON):\n"
-        f"{json.dumps(context, ensure_ascii=False, sort_keys=True)}\n\n"
-        f"Coach instruction:\n{instruction}"
-    )
+def _context_json(context, keys):
+    part = {key: context[key] for key in keys if key in context}
+    return json.dumps(part, ensure_ascii=False, sort_keys=True)
+
+
+def user_content(context, instruction):
+    """The user turn's content blocks: the cached stable prefix, then the rest.
+
+    The first block is the same bytes for every run on an unchanged plan, so
+    it ends in a ``cache_control`` breakpoint; the log-derived keys and the
+    instruction, which change run to run, follow it uncached. A context key
+    outside both halves (a caller's extra grounding) rides in the suffix.
+    """
+    volatile = [key for key in sorted(context) if key not in STABLE_CONTEXT_KEYS]
+    return [
+        {
+            "type": "text",
+            "text": "Plan context (JSON):\n"
+            + _context_json(context, STABLE_CONTEXT_KEYS),
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": (
+                "Recent context (JSON):\n"
+                f"{_context_json(context, volatile)}\n\n"
+                f"Coach instruction:\n{instruction}"
+            ),
+        },
+    ]
 
 
 def _extract_usage(message):
@@ -306,7 +343,7 @@ class MesoAgentClient:
             ],
             tools=[PROPOSE_TOOL],
             tool_choice={"type": "tool", "name": TOOL_NAME},
-            messages=[{"role": "user", "content": _user_prompt(context, instruction)}],
+            messages=[{"role": "user", "content": user_content(context, instruction)}],
         )
         data = {"summary": "", "changes": []}
         for block in message.content:
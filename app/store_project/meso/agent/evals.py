@@ -19,12 +19,29 @@ Run against the real model with ``manage.py meso_agent_eval`` (needs
 ``ScriptedEvalClient`` below and no network. The CI tests in
 ``tests/test_agent_evals.py`` run the corpus through scripted clients so the
 checks are covered without a key.
+
+``run_corpus`` is the whole-corpus runner the command uses. Every case grounds
+on the same plan and block, so the context is built once; the Claude calls —
+the slow part, and the only part with no database — then run on a thread pool,
+and each response is persisted and checked back on the calling thread, inside
+its (rolled-back) transaction. A ``ResponseCache`` replays a response recorded
+for the same model, context and instruction instead of calling again, and the
+context fingerprint covers the system prompt and tool schema too — so after a
+prompt change every case re-runs, and after an unrelated change none do.
+``corpus_report`` is the machine-readable summary: per case, the checks plus
+the call's latency and token usage.
 """
 
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
+from pathlib import Path
 
 from ..models import AgentProposalBatch
+from . import client as client_module
 from . import service
 from . import validation
 
@@ -78,6 +95,12 @@ class EvalResult:
     n_changes: int = 0
     n_rejected: int = 0
     summary: str = ""
+    # The Claude call behind the case: its wall-clock latency and token usage,
+    # and whether it was replayed from a ``ResponseCache`` (then nothing was
+    # spent, and the usage is zero).
+    latency_ms: int = 0
+    usage: client_module.RunUsage = field(default_factory=client_module.RunUsage)
+    cached: bool = False
 
 
 def check_result(case, plan, batch, rejected):
@@ -155,7 +178,212 @@ def evaluate(plan, case, *, client, mesocycle):
         n_changes=batch.changes.count(),
         n_rejected=len(rejected),
         summary=batch.summary,
+        latency_ms=batch.duration_ms or 0,
+        usage=client_module.RunUsage(
+            input_tokens=batch.input_tokens,
+            output_tokens=batch.output_tokens,
+            cache_creation_input_tokens=batch.cache_creation_input_tokens,
+            cache_read_input_tokens=batch.cache_read_input_tokens,
+            request_id=batch.request_id,
+            stop_reason=batch.stop_reason,
+            api_calls=batch.api_calls,
+        ),
+    )
+
+
+def context_hash(context):
+    """Fingerprint of everything the model sees besides the instruction.
+
+    The grounding ``context`` plus the system prompt and the tool schema, so a
+    prompt edit changes it as surely as a plan edit does.
+    """
+    payload = json.dumps(
+        [client_module.SYSTEM_PROMPT, client_module.PROPOSE_TOOL, context],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def response_key(model, context_digest, instruction):
+    """The ``ResponseCache`` key for one call: (model, context hash, instruction)."""
+    payload = json.dumps([model, context_digest, instruction], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Recorded agent responses, replayed by ``run_corpus`` instead of a new call.
+
+    One JSON file keyed by ``response_key``, read on construction and written by
+    ``save``. Only the tool data is kept: a replay made no API call, so it
+    reports empty usage rather than the recorded run's tokens.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return client_module.ProposalResult(data=entry["data"])
+
+    def put(self, key, *, model, instruction, result):
+        # The model and instruction ride along only so the file reads sensibly.
+        self.entries[key] = {
+            "model": model,
+            "instruction": instruction,
+            "data": result.data,
+        }
+
+    def save(self):
+        self.path.write_text(
+            json.dumps(self.entries, ensure_ascii=False, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+
+
+@dataclass
+class _Call:
+    result: client_module.ProposalResult = None
+    error: str = ""
+    latency_ms: int = 0
+    cached: bool = False
+
+
+class _ReplayClient:
+    """Hands ``evaluate`` a response ``run_corpus`` already has in hand."""
+
+    def __init__(self, model, result):
+        self.model = model
+        self._result = result
+
+    def propose(self, *, context, instruction):
+        return self._result
+
+
+def _call(client, context, instruction):
+    started = time.monotonic()
+    try:
+        result = client.propose(context=context, instruction=instruction)
+    except Exception as exc:  # external boundary — fails the case, not the run
+        return _Call(error=str(exc), latency_ms=_elapsed_ms(started))
+    return _Call(
+        result=client_module.normalize_result(result),
+        latency_ms=_elapsed_ms(started),
+    )
+
+
+def _elapsed_ms(started):
+    return int((time.monotonic() - started) * 1000)
+
+
+def run_corpus(plan, cases, *, client, mesocycle, workers=1, cache=None):
+    """Run ``cases`` against ``mesocycle`` of ``plan``; one ``EvalResult`` each.
+
+    The calls run ``workers`` at a time on a thread pool and never touch the
+    database; persisting and checking each response stays on this thread, in
+    case order, so it runs inside the caller's transaction like ``evaluate``.
+    With a ``cache``, a recorded response replays instead of calling, and each
+    new successful response is recorded (the caller ``save``s it). A call that
+    raises fails its own case with the error rather than the whole run.
+    """
+    context = service.build_context(plan, mesocycle)
+    model = getattr(client, "model", "")
+    digest = context_hash(context)
+    keys = [response_key(model, digest, case.instruction) for case in cases]
+
+    calls = [None] * len(cases)
+    pending = []
+    for i, key in enumerate(keys):
+        recorded = cache.get(key) if cache is not None else None
+        if recorded is None:
+            pending.append(i)
+        else:
+            calls[i] = _Call(result=recorded, cached=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        made = pool.map(lambda i: _call(client, context, cases[i].instruction), pending)
+        for i, call in zip(pending, made, strict=True):
+            calls[i] = call
+            if cache is not None and not call.error:
+                cache.put(
+                    keys[i],
+                    model=model,
+                    instruction=cases[i].instruction,
+                    result=call.result,
+                )
+
+    results = []
+    for case, call in zip(cases, calls, strict=True):
+        if call.error:
+            results.append(
+                EvalResult(
+                    case=case,
+                    passed=False,
+                    failures=[f"The agent request failed: {call.error}"],
+                    latency_ms=call.latency_ms,
+                )
+            )
+            continue
+        result = evaluate(
+            plan,
+            case,
+            client=_ReplayClient(model, call.result),
+            mesocycle=mesocycle,
+        )
+        result.latency_ms = call.latency_ms
+        result.cached = call.cached
+        results.append(result)
+    return results
+
+
+def corpus_report(results, *, model, plan, mesocycle):
+    """The machine-readable run summary (``meso_agent_eval --report``).
+
+    Per case: the verdict, the checks' failures and warnings, the change counts,
+    the call's latency, token usage and whether it was a replay; plus totals.
+    """
+    usage_fields = (
+        "input_tokens",
+        "output_tokens",
+        "cache_creation_input_tokens",
+        "cache_read_input_tokens",
     )
+    cases = [
+        {
+            "name": r.case.name,
+            "passed": r.passed,
+            "failures": r.failures,
+            "warnings": r.warnings,
+            "n_changes": r.n_changes,
+            "n_rejected": r.n_rejected,
+            "cached": r.cached,
+            "latency_ms": r.latency_ms,
+            **{name: getattr(r.usage, name) for name in usage_fields},
+            "stop_reason": r.usage.stop_reason,
+        }
+        for r in results
+    ]
+    totals = {
+        name: sum(case[name] for case in cases)
+        for name in ("latency_ms", *usage_fields)
+    }
+    totals["cases"] = len(cases)
+    totals["failed"] = sum(not case["passed"] for case in cases)
+    totals["cached"] = sum(case["cached"] for case in cases)
+    return {
+        "model": model,
+        "plan": plan.pk,
+        "mesocycle": mesocycle.pk,
+        "passed": not totals["failed"],
+        "totals": totals,
+        "cases": cases,
+    }
 
 
 def _first_targets(context):
@@ -0,0 +1,136 @@
+"""Wake a waiting status stream the moment an agent batch resolves.
+
+While a run drafts, the designer used to poll ``batch_status`` every 1.5s — a
+full request (session, auth, the batch scope query) per tick, and a worker per
+tick, for as long as Claude takes. The status stream (``views.batch_events``)
+replaces that with one long-lived request that sleeps until the batch leaves
+``drafting``; this module is how it's woken.
+
+On Postgres it's ``LISTEN``/``NOTIFY``: the agent service announces a batch on
+``CHANNEL`` in the same transaction that resolves it (``notify``), so the
+announcement is sent on commit — a listener that re-reads the status then sees
+the new row — and dropped with a rollback. The stream ``LISTEN``s on its own
+request's connection (``listening``) and blocks in ``psycopg``'s
+``notifies()``, with no query per tick.
+
+Elsewhere (SQLite in dev and the tests) there's no ``NOTIFY``; ``listening``
+falls back to re-reading the status every ``POLL_INTERVAL`` — the old poll,
+moved server-side.
+
+A stream isn't free: for as long as it's open it holds one of its worker's
+threads and that thread's database connection. ``claim_slot`` caps how many a
+worker process holds at once (``MESO_AGENT_STREAM_MAX``), so a wave of drafting
+coaches can't take every thread from ordinary requests; past the cap the view
+answers 503 and the client polls ``batch_status`` instead.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+CHANNEL = "meso_agent_batch"
+
+# Seconds between status re-reads on a database without LISTEN/NOTIFY.
+POLL_INTERVAL = 1.0
+
+# Streams open in this process, guarded by ``_slots_lock`` (gthread serves
+# requests on several threads of one process).
+_open_streams = 0
+_slots_lock = threading.Lock()
+
+
+def notify(batch_id):
+    """Announce that batch ``batch_id`` has left ``drafting``.
+
+    A transactional ``pg_notify`` on Postgres (sent when the caller's
+    transaction commits); a no-op on any other database.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, str(batch_id)])
+
+
+@contextmanager
+def listening(batch_id):
+    """Listen for ``batch_id``'s announcement on this thread's connection.
+
+    Yields ``wait(timeout)``, which blocks for up to ``timeout`` seconds and
+    returns whether the batch's status may have changed — re-read it then.
+    Enter it *before* the first status read, so a batch that resolves in
+    between is still announced to us, and outside a transaction: Postgres only
+    delivers notifications to a session between transactions. Announcements
+    of other batches on the shared channel are skipped without waking the
+    caller. ``UNLISTEN``s on exit, so a pooled connection goes back quiet.
+    """
+    if connection.vendor != "postgresql":
+        yield _poll
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+    payload = str(batch_id)
+
+    def wait(timeout):
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            for note in connection.connection.notifies(timeout=remaining, stop_after=1):
+                if note.payload == payload:
+                    return True
+        return False
+
+    try:
+        yield wait
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"UNLISTEN {CHANNEL}")
+
+
+def _poll(timeout):
+    time.sleep(max(0, min(timeout, POLL_INTERVAL)))
+    return True
+
+
+def claim_slot(stream):
+    """Take one of this process's stream slots for ``stream``, or ``None``.
+
+    ``None`` when ``MESO_AGENT_STREAM_MAX`` streams are already open here (0
+    turns streaming off). Otherwise returns ``stream`` wrapped so the slot is
+    given back when the response is closed — which the server does whether the
+    stream ran to its end, the client went away, or it was never started.
+    """
+    global _open_streams
+    with _slots_lock:
+        if _open_streams >= settings.MESO_AGENT_STREAM_MAX:
+            return None
+        _open_streams += 1
+    return _Slot(stream)
+
+
+def open_streams():
+    """How many streams this process has open right now."""
+    return _open_streams
+
+
+class _Slot:
+    """An open stream holding a slot; ``close`` ends it and frees the slot."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._held = True
+
+    def __iter__(self):
+        return iter(self._stream)
+
+    def close(self):
+        global _open_streams
+        try:
+            self._stream.close()
+        finally:
+            with _slots_lock:
+                if self._held:
+                    self._held = False
+                    _open_streams -= 1
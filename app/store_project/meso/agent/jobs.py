@@ -7,7 +7,8 @@ so the job runs as a real queued task instead of a thread we hand-manage.
 
 The endpoint creates a ``drafting`` batch and ``dispatch_proposal`` enqueues
 ``run_proposal_job`` for the cluster to pick up; the request returns immediately
-and the frontend polls the batch's status endpoint until it resolves.
+and the frontend waits on the batch's status stream (``agent.events``) until it
+resolves.
 
 ``service.run_proposal_job`` is the unit of work — it never raises and always
 leaves the batch in a terminal state (``pending`` / ``failed``), so the queue
@@ -15,6 +16,33 @@ wrapper stays thin. Only the batch id is enqueued: the worker is a separate
 process that reconstructs its own Claude client (``get_default_client``), and a
 client isn't picklable anyway.
 
+The agent has its own queue: ``AGENT_CLUSTER``, an ``ALT_CLUSTERS`` entry on
+the same ORM broker with its own ``qcluster`` process sized by
+``MESO_AGENT_WORKERS``, so a burst of long Claude calls never sits in front of
+the invite sweeps. The broker itself is first-in-first-out, so what it carries
+is a *ticket*, not an order: each dispatch enqueues one, and the worker that
+picks a ticket up claims whichever waiting batch should go next —
+
+- interactive runs (``manual`` / ``draft``, a coach watching the spinner) before
+  ``eval`` runs (``BACKGROUND_TRIGGERS``);
+- then the coach with the fewest runs in flight, so one coach's burst can't
+  hold every worker while another coach waits;
+- then the oldest.
+
+A coach already at ``MESO_AGENT_COACH_CONCURRENCY`` in-flight runs is skipped.
+A ticket that finds only such batches leaves a delayed one behind — a single
+named ``ONCE`` schedule, ``MESO_AGENT_REQUEUE_DELAY`` seconds out — so a held
+batch is retried even when the run holding its slot never finishes (a worker
+killed at the timeout runs no ``finally``); and the run that does free a slot
+enqueues a follow-up ticket at once while anything is still waiting. The claim is a
+conditional ``UPDATE`` on ``started_at``, so two workers never run one batch;
+the per-coach cap is counted just before it, so a race between two workers can
+overshoot it by one (a soft cap — the real limit is the worker count).
+
+The batch records its ``queue_depth`` (the other runs drafting when it was
+dispatched) and its ``queue_wait_ms`` (dispatch to claim), next to the call's
+own ``duration_ms``.
+
 ``MESO_AGENT_RUN_SYNC`` runs the job inline instead of enqueuing it (tests, and
 any environment that prefers a blocking, queue-free call) so behavior is
 deterministic without a worker. The test settings also run django-q in ``sync``
@@ -22,25 +50,50 @@ mode, so an enqueued task there executes in-process.
 """
 
 import logging
+from datetime import timedelta
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Case
+from django.db.models import Count
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models import When
+from django.utils import timezone
+from django_q.models import Schedule
 from django_q.tasks import async_task
 
+from .. import models
+from . import events
 from . import service
 
 logger = logging.getLogger(__name__)
 
 # Dotted path django-q stores and imports in the worker process. It must keep
-# pointing at the unit of work; a rename that misses this string would break
-# dispatch silently in production (a test runs the enqueued task end to end under
-# sync mode to catch exactly that).
-RUN_PROPOSAL_TASK = "store_project.meso.agent.service.run_proposal_job"
+# pointing at the queued entry point; a rename that misses this string would
+# break dispatch silently in production (a test runs the enqueued task end to end
+# under sync mode to catch exactly that).
+RUN_PROPOSAL_TASK = "store_project.meso.agent.jobs.run_queued_proposal"
+
+# The agent's ``Q_CLUSTER["ALT_CLUSTERS"]`` entry — its broker key, and the
+# ``Q_CLUSTER_NAME`` its worker process runs under.
+AGENT_CLUSTER = "meso-agent"
+
+# Name of the one delayed ticket left behind for cap-held batches; the name
+# keeps a burst of capped tickets from stacking up a schedule apiece.
+REQUEUE_SCHEDULE = "meso-agent-requeue"
+
+# Triggers no coach is waiting on; they yield to every interactive run.
+BACKGROUND_TRIGGERS = (models.AgentProposalBatch.Trigger.EVAL,)
 
 
 def dispatch_proposal(batch_id, *, client=None):
     """Run ``run_proposal_job`` for ``batch_id`` — inline when sync, else queued."""
+    _record_depth(batch_id)
     if getattr(settings, "MESO_AGENT_RUN_SYNC", False):
+        _claim(
+            models.AgentProposalBatch.objects.only("pk", "created_at").get(pk=batch_id)
+        )
         service.run_proposal_job(batch_id, client=client)
         return
     # ATOMIC_REQUESTS wraps the view in a transaction. Enqueue on commit so the
@@ -50,24 +103,179 @@ def dispatch_proposal(batch_id, *, client=None):
     transaction.on_commit(lambda: _enqueue(batch_id))
 
 
+def run_queued_proposal(batch_id):
+    """The queued task: claim the next waiting batch and run it.
+
+    ``batch_id`` is the batch whose dispatch enqueued this ticket, kept for the
+    task record; the batch actually run is whichever ``claim_next`` picks. Runs
+    at most one batch, and enqueues a follow-up ticket when it's done if any
+    batch is still waiting (one a coach's cap held back). A ticket that claims
+    nothing while batches wait schedules a delayed retry instead.
+    """
+    claimed = claim_next()
+    if claimed is None:
+        if _waiting().exists():
+            _requeue_later(batch_id)
+        return None
+    try:
+        return service.run_proposal_job(claimed)
+    finally:
+        if _waiting().exists():
+            _enqueue_follow_up(batch_id)
+
+
+def claim_next():
+    """Claim the next batch the agent queue owes a worker; its pk, or ``None``.
+
+    ``None`` when nothing is waiting, or when every waiting batch belongs to a
+    coach already at ``MESO_AGENT_COACH_CONCURRENCY``.
+    """
+    cap = settings.MESO_AGENT_COACH_CONCURRENCY
+    background = Case(
+        When(trigger__in=BACKGROUND_TRIGGERS, then=Value(1)), default=Value(0)
+    )
+    while True:
+        waiting = list(
+            _waiting()
+            .only("pk", "coach_id", "trigger", "created_at")
+            .order_by(background, "created_at", "pk")
+        )
+        in_flight = _in_flight()
+        eligible = [
+            batch
+            for batch in waiting
+            if not cap or in_flight.get(batch.coach_id, 0) < cap
+        ]
+        if not eligible:
+            return None
+        # ``waiting`` is already in priority-then-age order and ``min`` keeps the
+        # first of equals, so the in-flight count only breaks ties within a tier.
+        batch = min(
+            eligible,
+            key=lambda b: (
+                b.trigger in BACKGROUND_TRIGGERS,
+                in_flight.get(b.coach_id, 0),
+            ),
+        )
+        if _claim(batch):
+            return batch.pk
+        # Another worker claimed it between the read and the update; look again.
+
+
+def _waiting():
+    """Drafting batches no worker has claimed yet."""
+    return models.AgentProposalBatch.objects.filter(
+        status=models.AgentProposalBatch.Status.DRAFTING, started_at__isnull=True
+    )
+
+
+def _live_runs_q():
+    """Claimed drafting batches still inside the queue's task timeout.
+
+    A run past the timeout was killed with its worker and will never resolve;
+    it mustn't hold its coach's slot (or inflate the depth) forever.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.Q_CLUSTER.get("timeout", 300))
+    return Q(started_at__gt=cutoff)
+
+
+def _in_flight():
+    """Coach id → the runs a worker is on for them right now."""
+    return dict(
+        models.AgentProposalBatch.objects.filter(
+            _live_runs_q(), status=models.AgentProposalBatch.Status.DRAFTING
+        )
+        .order_by()
+        .values("coach_id")
+        .annotate(runs=Count("pk"))
+        .values_list("coach_id", "runs")
+    )
+
+
+def _record_depth(batch_id):
+    """Stamp ``queue_depth``: the other runs waiting or in flight right now."""
+    depth = (
+        models.AgentProposalBatch.objects.filter(
+            Q(started_at__isnull=True) | _live_runs_q(),
+            status=models.AgentProposalBatch.Status.DRAFTING,
+        )
+        .exclude(pk=batch_id)
+        .count()
+    )
+    models.AgentProposalBatch.objects.filter(pk=batch_id).update(queue_depth=depth)
+
+
+def _claim(batch):
+    """Take ``batch`` for this worker — ``False`` if someone else already has.
+
+    A conditional ``update`` on the null ``started_at``: exactly one claimer
+    gets a row back. Records how long the batch waited since dispatch.
+    """
+    now = timezone.now()
+    wait_ms = max(0, int((now - batch.created_at).total_seconds() * 1000))
+    return bool(
+        models.AgentProposalBatch.objects.filter(
+            pk=batch.pk,
+            status=models.AgentProposalBatch.Status.DRAFTING,
+            started_at__isnull=True,
+        ).update(started_at=now, queue_wait_ms=wait_ms)
+    )
+
+
 def _enqueue(batch_id):
     """Hand the job to the cluster; resolve the batch if the broker write fails."""
     try:
-        async_task(RUN_PROPOSAL_TASK, batch_id)
+        async_task(RUN_PROPOSAL_TASK, batch_id, cluster=AGENT_CLUSTER)
     except Exception:  # a broker failure must not strand the batch in ``drafting``
         logger.exception("Meso agent failed to enqueue job for batch %s", batch_id)
         _fail_unqueued(batch_id)
 
 
+def _enqueue_follow_up(batch_id):
+    """Enqueue another ticket for the batches a coach's cap held back.
+
+    Unlike ``_enqueue`` this fails nothing on a broker error: the waiting
+    batches each still have their own ticket, or will be reached by the next
+    run to finish.
+    """
+    try:
+        async_task(RUN_PROPOSAL_TASK, batch_id, cluster=AGENT_CLUSTER)
+    except Exception:
+        logger.exception("Meso agent failed to enqueue a follow-up after %s", batch_id)
+
+
+def _requeue_later(batch_id):
+    """Schedule a ticket ``MESO_AGENT_REQUEUE_DELAY`` seconds out, once.
+
+    Leaves an already-pending retry alone, so however many tickets a cap turns
+    away there's one schedule; the scheduler deletes it when it fires, and a
+    retry that is turned away again schedules the next. A broker error is only
+    logged, like a follow-up's.
+    """
+    if Schedule.objects.filter(name=REQUEUE_SCHEDULE).exists():
+        return
+    try:
+        Schedule.objects.create(
+            name=REQUEUE_SCHEDULE,
+            func=RUN_PROPOSAL_TASK,
+            args=repr((batch_id,)),
+            schedule_type=Schedule.ONCE,
+            next_run=timezone.now()
+            + timedelta(seconds=settings.MESO_AGENT_REQUEUE_DELAY),
+            cluster=AGENT_CLUSTER,
+        )
+    except Exception:
+        logger.exception("Meso agent failed to schedule a retry after %s", batch_id)
+
+
 def _fail_unqueued(batch_id):
     """Mark a batch ``failed`` when its job could not be queued (no worker will).
 
     A bare ``update`` so it can't fail on a stale in-memory row and never widens
     the change beyond the status the status-poll surfaces.
     """
-    from .. import models
-
     models.AgentProposalBatch.objects.filter(pk=batch_id).update(
         status=models.AgentProposalBatch.Status.FAILED,
         error="The agent run could not be queued.",
     )
+    events.notify(batch_id)
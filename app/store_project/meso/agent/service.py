@@ -18,14 +18,19 @@ ever sees safe, in-plan edits, and the human review gate is unchanged.
 
 import logging
 import time
+from dataclasses import dataclass
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 
 from .. import models
 from .. import serializers
 from ..billing import access as billing_access
 from ..billing import agent_costs
+from ..billing import usage_rollup
 from . import client as client_module
+from . import events
 from . import validation
 
 logger = logging.getLogger(__name__)
@@ -78,7 +83,88 @@ def build_context(plan, mesocycle):
     (no block to program, or one hard-deleted mid-run); ``serialize_agent_block``
     degrades to an empty block rather than silently falling back to a different
     one.
+
+    Assembled as a stable prefix (``client.STABLE_CONTEXT_KEYS``: coach style,
+    athlete, plan, block) and a volatile suffix (the recent logs, and the
+    "last time" / 1RM overlays on the viewed week's lifts). The client sends
+    the prefix as its own prompt-cached block (``client.user_content``), so
+    back-to-back runs on an unchanged plan read it from Anthropic's prompt
+    cache — however much the athlete logs in between; the plan and block half
+    of it is memoized here too (``_grid_context``).
+    """
+    grid, lifts = _grid_context(plan, mesocycle)
+    context = {
+        "coach_style": _coach_style(plan.coach),
+        "athlete": {
+            "name": plan.athlete.display_name(),
+            "contraindications": [
+                c.text for c in plan.athlete.contraindications.filter(active=True)
+            ],
+        },
+        **grid,
+    }
+    # What the athlete actually logged recently (Phase 4 grounding).
+    context["recent_logs"] = serializers.serialize_recent_logs(
+        plan, limit=RECENT_LOG_LIMIT
+    )
+    # The designer's "last time" / 1RM overlays, by prescription id — kept out
+    # of ``plan`` so a log never changes the cached prefix.
+    context["lift_history"] = {
+        str(pk): overlay
+        for pk, overlay in serializers.lift_overlays(plan, lifts).items()
+    }
+    return context
+
+
+def context_cache_key(mesocycle_id):
+    return f"meso:agent:context:{mesocycle_id}"
+
+
+def _grid_stamp(plan):
+    # The grid moves with the plan's contents alone — ``edit_version`` — since
+    # it carries none of the log-derived overlays (``lift_history``).
+    return (plan.pk, plan.edit_version)
+
+
+@dataclass(frozen=True)
+class _Lift:
+    """A viewed-week prescription's lift identity, memoized beside the grid.
+
+    All ``serializers.lift_overlays`` reads off a prescription, so a run
+    overlays the memoized grid's lifts without reloading them.
     """
+
+    pk: int
+    exercise_id: int | None
+    name: str
+
+
+def _grid_context(plan, mesocycle):
+    """``({"plan", "block"}, [_Lift])`` for the context, from cache when current.
+
+    The heavy half of the stable prefix — the whole block's grid — memoized per
+    mesocycle and stamped like ``grid_cache`` (a stale stamp is a miss that
+    overwrites the entry in place), with the viewed week's lifts for the
+    overlays. The athlete and coach-style halves are read live: a
+    contraindication edit doesn't move the plan's version, and must never
+    wait out a TTL. ``MESO_AGENT_CONTEXT_CACHE_TTL`` bounds an entry's life; 0
+    disables the memo.
+    """
+    timeout = settings.MESO_AGENT_CONTEXT_CACHE_TTL
+    if not timeout:
+        return _serialize_grid_context(plan, mesocycle)
+    stamp = _grid_stamp(plan)
+    key = context_cache_key(mesocycle.pk if mesocycle is not None else "none")
+    entry = cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    built = _serialize_grid_context(plan, mesocycle)
+    cache.set(key, (stamp, built), timeout=timeout)
+    return built
+
+
+def _serialize_grid_context(plan, mesocycle):
+    """The plan and block grids ``_grid_context`` memoizes, built fresh."""
     # Both halves of the context must describe the SAME block. ``serialize_plan``
     # resolves its own opening week via ``current_week(plan)`` — the plan's
     # earliest live week — so left alone it would expose block 1's prescription
@@ -100,7 +186,9 @@ def build_context(plan, mesocycle):
     # produce for "no open week" (``program``/``weeks`` empty, ``viewing`` null)
     # rather than let its fallback reach past this (empty) block into another.
     resolved_week = serializers.first_live_week(mesocycle)
-    plan_context = serializers.serialize_plan(plan, week=resolved_week)
+    plan_context = serializers.serialize_plan(plan, week=resolved_week, overlays=False)
+    # The athlete (and their contraindications) rides the live ``athlete`` key.
+    del plan_context["athlete"]
     if resolved_week is None:
         plan_context["program"] = []
         plan_context["weeks"] = []
@@ -119,22 +207,18 @@ def build_context(plan, mesocycle):
         # is correct for "nothing to view."
         plan_context["phases"] = []
 
-    context = {
+    shown = [ex["id"] for day in plan_context["program"] for ex in day["exercises"]]
+    lifts = [
+        _Lift(pk=presc.pk, exercise_id=presc.exercise_id, name=presc.name)
+        for presc in models.Prescription.objects.filter(pk__in=shown).select_related(
+            "exercise_slot"
+        )
+    ]
+    grid = {
         "plan": plan_context,
-        "coach_style": _coach_style(plan.coach),
         "block": serializers.serialize_agent_block(plan, mesocycle),
     }
-    context["athlete"] = {
-        "name": plan.athlete.display_name(),
-        "contraindications": [
-            c.text for c in plan.athlete.contraindications.filter(active=True)
-        ],
-    }
-    # What the athlete actually logged recently (Phase 4 grounding).
-    context["recent_logs"] = serializers.serialize_recent_logs(
-        plan, limit=RECENT_LOG_LIMIT
-    )
-    return context
+    return grid, lifts
 
 
 def create_drafting_batch(
@@ -237,6 +321,8 @@ def _persist_result(batch, result, *, model, duration_ms=None):
         batch.status = models.AgentProposalBatch.Status.PENDING
         batch.error = ""
         batch.save(update_fields=["summary", "model", "status", "error", *usage_fields])
+        usage_rollup.record(batch)
+        events.notify(batch.pk)
 
     if rejected:
         logger.info(
@@ -264,7 +350,10 @@ def _fail(batch, message, *, model="", duration_ms=None):
     if duration_ms is not None:
         batch.duration_ms = duration_ms
         fields.append("duration_ms")
-    batch.save(update_fields=fields)
+    with transaction.atomic():
+        batch.save(update_fields=fields)
+        usage_rollup.record(batch)
+        events.notify(batch.pk)
     return batch, []
 
 
@@ -16,6 +16,11 @@ coach usage (the count is surfaced as a footnote). The cost is the **internal
 estimate** stored at write time (the Anthropic invoice stays authoritative);
 revenue is the coach's *current* plan price (the flat monthly Pro price, D14). See
 ``docs/meso/agent-usage-plan.md``.
+
+The month's usage is read from ``AgentUsageRollup`` — the ledger pre-summed by
+(month, coach, athlete, model, trigger, tier), kept current by
+``billing.usage_rollup`` — so a report costs the same however many runs the
+month holds.
 """
 
 from dataclasses import dataclass
@@ -29,9 +34,12 @@ from django.db.models import Count
 from django.utils import timezone
 
 from store_project.meso.models import AgentProposalBatch
+from store_project.meso.models import AgentUsageRollup
 from store_project.meso.models import CoachAthlete
 from store_project.meso.models import CoachSubscription
 
+from . import usage_rollup
+
 # Plan price (D14, flat monthly Pro plan) — the numeric source for the revenue
 # math, mirroring the ``presenters.PRICE_SUMMARY`` marketing copy ("$19/mo").
 # A string so the Decimal is exact. Update alongside that copy.
@@ -214,6 +222,16 @@ class Totals:
         else:
             self.cost += batch.estimated_cost_usd
 
+    def add_rollup(self, row):
+        """Add an ``AgentUsageRollup`` row — many runs at once."""
+        self.runs += row.runs
+        self.input_tokens += row.input_tokens
+        self.output_tokens += row.output_tokens
+        self.cache_creation_input_tokens += row.cache_creation_input_tokens
+        self.cache_read_input_tokens += row.cache_read_input_tokens
+        self.unknown_cost_runs += row.unknown_cost_runs
+        self.cost += row.cost
+
     @property
     def total_tokens(self):
         return (
@@ -223,6 +241,28 @@ class Totals:
             + self.cache_read_input_tokens
         )
 
+    @property
+    def prompt_tokens(self):
+        """Every input token sent, cached or not (the cache-hit ratio's base)."""
+        return (
+            self.input_tokens
+            + self.cache_creation_input_tokens
+            + self.cache_read_input_tokens
+        )
+
+    @property
+    def cache_hit_ratio(self):
+        """The share of input tokens read from the prompt cache, or ``None``.
+
+        ``cache_read / (input + cache_creation + cache_read)`` — how much of the
+        grounding the stable context prefix saved re-sending at full price
+        (``agent.client.user_content``). ``None`` when no input was recorded
+        (no runs, or only no-network runs), rather than a misleading 0%.
+        """
+        if not self.prompt_tokens:
+            return None
+        return self.cache_read_input_tokens / self.prompt_tokens
+
 
 @dataclass
 class ClientUsage:
@@ -317,22 +357,19 @@ def _attribution(plan):
 def build_report(*, start, end):
     """Aggregate the month's non-eval agent runs into a :class:`Report`.
 
-    Coaches and their clients are sorted by estimated cost (then run count)
-    descending, so the heaviest spenders surface first. Revenue and billable-seat
-    counts are read from each coach's *current* subscription.
+    ``start``/``end`` are a ``month_bounds`` window: the report sums the
+    ``AgentUsageRollup`` rows of the months it spans, after counting in any
+    resolved run they're still missing (``usage_rollup.catch_up``). Coaches and
+    their clients are sorted by estimated cost (then run count) descending, so
+    the heaviest spenders surface first. Revenue and billable-seat counts are
+    read from each coach's *current* subscription.
     """
-    in_window = AgentProposalBatch.objects.filter(
-        created_at__gte=start, created_at__lt=end
-    )
-    eval_runs_excluded = in_window.filter(
-        trigger=AgentProposalBatch.Trigger.EVAL
-    ).count()
-    batches = in_window.exclude(trigger=AgentProposalBatch.Trigger.EVAL).select_related(
-        "coach",
-        "plan",
-        "plan__relationship__athlete",
-    )
+    usage_rollup.catch_up(start=start, end=end)
+    rows = AgentUsageRollup.objects.filter(
+        month__gte=usage_rollup.month_of(start), month__lt=usage_rollup.month_of(end)
+    ).select_related("coach", "athlete")
 
+    eval_runs_excluded = 0
     totals = Totals()
     by_model = {}
     by_trigger = {}
@@ -340,28 +377,31 @@ def build_report(*, start, end):
     # coach_id -> {"label", "totals", "clients": {key: ClientUsage}}
     coaches = {}
 
-    for batch in batches:
-        totals.add(batch)
-        _bucket(by_model, batch.model or "(unset)").add(batch)
-        _bucket(by_trigger, batch.get_trigger_display()).add(batch)
-        by_tier[cost_bucket(batch.billing_status)].add(batch)
+    for row in rows:
+        if row.trigger == AgentProposalBatch.Trigger.EVAL:
+            eval_runs_excluded += row.runs
+            continue
+        totals.add_rollup(row)
+        _bucket(by_model, row.model or "(unset)").add_rollup(row)
+        _bucket(by_trigger, row.get_trigger_display()).add_rollup(row)
+        by_tier[row.tier].add_rollup(row)
 
-        acc = coaches.get(batch.coach_id)
+        acc = coaches.get(row.coach_id)
         if acc is None:
             acc = {
-                "label": batch.coach.display_name(),
+                "label": row.coach.display_name(),
                 "totals": Totals(),
                 "clients": {},
             }
-            coaches[batch.coach_id] = acc
-        acc["totals"].add(batch)
+            coaches[row.coach_id] = acc
+        acc["totals"].add_rollup(row)
 
-        key, label = _attribution(batch.plan)
+        key = ("athlete", row.athlete_id)
         client = acc["clients"].get(key)
         if client is None:
-            client = ClientUsage(label=label, totals=Totals())
+            client = ClientUsage(label=row.athlete.display_name(), totals=Totals())
             acc["clients"][key] = client
-        client.totals.add(batch)
+        client.totals.add_rollup(row)
 
     coach_ids = list(coaches)
     subs = {
@@ -0,0 +1,213 @@
+"""Keep ``AgentUsageRollup`` — the agent usage ledger summed by month — current.
+
+The usage report, the owner dashboard and the monthly margin sweep all ask the
+same question of a month: runs, tokens and estimated cost per coach, per client,
+per model, per trigger and per billing tier. Walking every ``AgentProposalBatch``
+in the month answered it in Python, one ``Totals.add`` per run; that grows with
+the run history. Instead each resolved run is added once to its rollup row —
+(month, coach, athlete, model, trigger, tier) — and the report sums those rows
+(``agent_usage_report.build_report``).
+
+- ``record`` adds one run when it resolves (``agent.service._persist_result`` /
+  ``_fail``), in the same transaction as the usage it counts;
+- ``catch_up`` adds, set-based, every resolved run not yet counted — runs
+  written outside the agent service (the admin, fixtures, the history from
+  before this table) — and runs ahead of every report read, so a report is
+  never missing a resolved run;
+- ``rebuild`` drops the rollups for a window and recounts it from the ledger
+  (``manage.py meso_agent_usage_rollup``).
+
+``AgentProposalBatch.usage_rolled_up`` makes every path count a run exactly
+once: a run is only added by whoever flips that flag from false. A ``drafting``
+run is counted when it resolves, not before — its usage isn't known yet.
+"""
+
+from decimal import Decimal
+
+from django.db import IntegrityError
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from store_project.meso.models import AgentProposalBatch
+from store_project.meso.models import AgentUsageRollup
+
+from . import agent_usage_report
+
+# Runs claimed and summed per ``catch_up`` transaction — bounds the ``IN`` list
+# and the row locks a backfill of a long history holds at once.
+CATCH_UP_CHUNK = 1000
+
+_ZERO = Decimal("0")
+
+
+def month_of(when):
+    """The rollup ``month`` for a datetime: the first day of its local month.
+
+    Local, like ``agent_usage_report.month_bounds``, so a run lands in the
+    month whose report window contains it.
+    """
+    return timezone.localdate(when).replace(day=1)
+
+
+def _unrolled():
+    return AgentProposalBatch.objects.filter(usage_rolled_up=False).exclude(
+        status=AgentProposalBatch.Status.DRAFTING
+    )
+
+
+def record(batch):
+    """Count ``batch``'s usage in its rollup row — unless it already is.
+
+    Reads ``batch.plan.relationship`` for the athlete (the service's batches
+    carry it). Returns whether this call counted it.
+    """
+    with transaction.atomic():
+        claimed = AgentProposalBatch.objects.filter(
+            pk=batch.pk, usage_rolled_up=False
+        ).update(usage_rolled_up=True)
+        if not claimed:
+            return False
+        key = {
+            "month": month_of(batch.created_at),
+            "coach_id": batch.coach_id,
+            "athlete_id": batch.plan.relationship.athlete_id,
+            "model": batch.model,
+            "trigger": batch.trigger,
+            "tier": agent_usage_report.cost_bucket(batch.billing_status),
+        }
+        unpriced = batch.estimated_cost_usd is None
+        _add(
+            key,
+            {
+                "runs": 1,
+                "input_tokens": batch.input_tokens,
+                "output_tokens": batch.output_tokens,
+                "cache_creation_input_tokens": batch.cache_creation_input_tokens,
+                "cache_read_input_tokens": batch.cache_read_input_tokens,
+                "cost": _ZERO if unpriced else batch.estimated_cost_usd,
+                "unknown_cost_runs": int(unpriced),
+            },
+        )
+    batch.usage_rolled_up = True
+    return True
+
+
+def catch_up(*, start=None, end=None):
+    """Count every resolved, uncounted run created in ``[start, end)``.
+
+    Unbounded on a side left ``None``. Claims a chunk of runs at a time (rows
+    another catch-up holds are skipped, not waited on), groups them by rollup
+    key in the database, and adds each group. Returns the runs counted.
+    """
+    pending = _unrolled()
+    if start is not None:
+        pending = pending.filter(created_at__gte=start)
+    if end is not None:
+        pending = pending.filter(created_at__lt=end)
+    counted = 0
+    while True:
+        with transaction.atomic():
+            pks = list(
+                pending.select_for_update(skip_locked=True)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:CATCH_UP_CHUNK]
+            )
+            if not pks:
+                return counted
+            AgentProposalBatch.objects.filter(pk__in=pks).update(usage_rolled_up=True)
+            for key, deltas in _groups(AgentProposalBatch.objects.filter(pk__in=pks)):
+                _add(key, deltas)
+        counted += len(pks)
+
+
+def rebuild(*, start=None, end=None):
+    """Recount the rollups of the months in ``[start, end)`` from the ledger.
+
+    ``start``/``end`` are month boundaries (``agent_usage_report.month_bounds``)
+    or ``None`` for the whole history. Returns the runs counted.
+    """
+    rollups = AgentUsageRollup.objects.all()
+    batches = AgentProposalBatch.objects.all()
+    if start is not None:
+        rollups = rollups.filter(month__gte=month_of(start))
+        batches = batches.filter(created_at__gte=start)
+    if end is not None:
+        rollups = rollups.filter(month__lt=month_of(end))
+        batches = batches.filter(created_at__lt=end)
+    with transaction.atomic():
+        rollups.delete()
+        batches.update(usage_rolled_up=False)
+        return catch_up(start=start, end=end)
+
+
+def _groups(batches):
+    """``(key, deltas)`` per rollup key among ``batches``, summed in the database.
+
+    The tier is mapped from the billing status here, so several statuses can
+    yield the same key; ``_add`` accumulates, so that's harmless.
+    """
+    rows = (
+        batches.order_by()
+        .values(
+            "coach_id",
+            "model",
+            "trigger",
+            "billing_status",
+            created_month=TruncMonth(
+                "created_at", tzinfo=timezone.get_current_timezone()
+            ),
+            athlete=F("plan__relationship__athlete_id"),
+        )
+        .annotate(
+            n_runs=Count("pk"),
+            n_input=Sum("input_tokens"),
+            n_output=Sum("output_tokens"),
+            n_cache_write=Sum("cache_creation_input_tokens"),
+            n_cache_read=Sum("cache_read_input_tokens"),
+            n_cost=Sum("estimated_cost_usd"),
+            n_unpriced=Count("pk", filter=Q(estimated_cost_usd__isnull=True)),
+        )
+    )
+    for row in rows:
+        key = {
+            "month": month_of(row["created_month"]),
+            "coach_id": row["coach_id"],
+            "athlete_id": row["athlete"],
+            "model": row["model"],
+            "trigger": row["trigger"],
+            "tier": agent_usage_report.cost_bucket(row["billing_status"]),
+        }
+        yield (
+            key,
+            {
+                "runs": row["n_runs"],
+                "input_tokens": row["n_input"] or 0,
+                "output_tokens": row["n_output"] or 0,
+                "cache_creation_input_tokens": row["n_cache_write"] or 0,
+                "cache_read_input_tokens": row["n_cache_read"] or 0,
+                "cost": row["n_cost"] or _ZERO,
+                "unknown_cost_runs": row["n_unpriced"],
+            },
+        )
+
+
+def _add(key, deltas):
+    """Add ``deltas`` to the rollup row at ``key``, creating it on first sight.
+
+    An ``F()`` increment, so concurrent adds to one row never lose an update; a
+    racing first insert of the same key loses to the unique constraint and
+    falls back to the increment.
+    """
+    increments = {name: F(name) + value for name, value in deltas.items()}
+    if AgentUsageRollup.objects.filter(**key).update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            AgentUsageRollup.objects.create(**key, **deltas)
+    except IntegrityError:
+        AgentUsageRollup.objects.filter(**key).update(**increments)
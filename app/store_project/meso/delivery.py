@@ -0,0 +1,293 @@
+"""Block delivery: stamp + snapshot a block, nudge the athlete, and batch fan-out.
+
+The individual deliver (``views.plan_deliver``) and batch-deliver share the
+same unit of work — every live week of one block is stamped ``delivered_at``
+and snapshotted as a ``WeekDelivery``, then the athlete gets one block-level
+email + push. That lives here so the batch fan-out can run it off the request
+thread.
+
+Batch-deliver (2c) copies the plan once per picked client, then delivers each
+copy. Doing a whole roster inside the request outran the gunicorn timeout, so
+``plan_batch_deliver`` now only validates the pick and records a
+``BatchDelivery`` (one ``BatchDeliveryTarget`` per client), and
+``dispatch_batch_delivery`` enqueues ``run_batch_delivery`` on the django-q
+cluster — the same ORM broker and on-commit dispatch as the agent's proposal
+job (``agent/jobs.py``). The deliver screen polls the batch's status endpoint
+for per-client progress.
+
+Each client is delivered in its own ``transaction.atomic()``: a failure rolls
+back that client's copy only, is recorded on its target, and the job moves on
+to the next one. ``run_batch_delivery`` never raises and always leaves the batch
+in a terminal state (``done`` / ``failed``). The test settings run django-q in
+``sync`` mode, so an enqueued job there executes in-process.
+"""
+
+import logging
+from urllib.parse import urljoin
+
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from django_q.tasks import async_task
+
+from store_project.notifications.emails import send_block_delivered_email
+
+from . import push as meso_push
+from . import sandbox as meso_sandbox
+from .models import BatchDelivery
+from .models import BatchDeliveryTarget
+from .models import CoachAthlete
+from .models import Plan
+from .models import Week
+from .models import WeekDelivery
+from .serializers import current_week
+from .serializers import first_live_week
+from .serializers import serialize_week_snapshots
+from .unsubscribe import athlete_opted_out
+from .unsubscribe import make_unsubscribe_token
+
+logger = logging.getLogger(__name__)
+
+# Dotted path django-q stores and imports in the worker process. It must keep
+# pointing at the unit of work — the batch-deliver tests run the enqueued job end
+# to end under sync mode, so a rename that misses this string fails them.
+RUN_BATCH_DELIVERY_TASK = "store_project.meso.delivery.run_batch_delivery"
+
+
+def stamp_block(block, now):
+    """Stamp every live week of ``block`` delivered at ``now`` and snapshot it.
+
+    One shared timestamp (the notify marker) and one fresh ``WeekDelivery``
+    per week — re-delivering re-stamps and writes new rows. The whole block is
+    snapshotted, stamped and recorded in a fixed number of queries
+    (``serialize_week_snapshots``, one ``update``, one ``bulk_create``), so a
+    deliver costs the same however many weeks and days the block holds.
+    Returns the number of weeks delivered.
+    """
+    live_weeks = list(block.weeks.filter(deleted_at__isnull=True))
+    if not live_weeks:
+        return 0
+    snapshots = serialize_week_snapshots(live_weeks)
+    Week.objects.filter(pk__in=[w.pk for w in live_weeks]).update(delivered_at=now)
+    WeekDelivery.objects.bulk_create(
+        [
+            WeekDelivery(week=week, delivered_at=now, payload=snapshots[week.pk])
+            for week in live_weeks
+        ]
+    )
+    for week in live_weeks:
+        week.delivered_at = now
+    return len(live_weeks)
+
+
+def notify_block_delivered(plan, mesocycle, week_count, *, base_url):
+    """Best-effort: ONE email + ONE push that a whole **block** was delivered.
+
+    The deliver nudge (P3; per-week notification retired with the 2d live+notify
+    model): the deliver path nudges about the whole mesocycle at once, so the
+    athlete gets a single "your new block is ready" heads-up — not one
+    notification per week. Sandbox-gated at the coach check, deferred
+    to ``transaction.on_commit`` (a rolled-back deliver must not notify a false
+    "your block is ready"), and each channel is independently best-effort — a
+    failure in one is swallowed and logged, never a 500 or a rolled-back
+    deliver, and never blocks the other.
+
+    ``base_url`` is the scheme + host the links in the email and push point at:
+    the request's own for an individual deliver, the one recorded on the
+    ``BatchDelivery`` for a queued batch (the worker has no request).
+
+    Sandbox gate (S4): a sandbox coach's deliveries never notify — there is no
+    real person behind a seeded demo athlete.
+    """
+    if meso_sandbox.is_sandbox(plan.coach):
+        return
+    home_url = urljoin(base_url, reverse("meso:athlete_home"))
+    unsubscribe_url = urljoin(
+        base_url,
+        reverse(
+            "meso:unsubscribe_delivery_email",
+            kwargs={"token": make_unsubscribe_token(plan.athlete)},
+        ),
+    )
+
+    def _send():
+        try:
+            # The athlete can opt out of delivery emails (the email's
+            # List-Unsubscribe link). Push is a separate, browser-opt-in channel
+            # and is never gated by the email opt-out.
+            if not athlete_opted_out(plan.athlete):
+                send_block_delivered_email(
+                    athlete=plan.athlete,
+                    coach=plan.coach,
+                    plan=plan,
+                    week_count=week_count,
+                    home_url=home_url,
+                    unsubscribe_url=unsubscribe_url,
+                )
+        except Exception:  # mail is best-effort; never fail a delivery on it
+            logger.exception(
+                "Failed to send block delivery email for plan %s mesocycle %s",
+                plan.pk,
+                mesocycle.pk,
+            )
+        try:
+            meso_push.notify_block_delivered(
+                athlete=plan.athlete,
+                coach=plan.coach,
+                plan=plan,
+                mesocycle=mesocycle,
+                week_count=week_count,
+                home_url=home_url,
+            )
+        except Exception:  # push is best-effort too; never fail a delivery on it
+            logger.exception(
+                "Failed to send block delivery push for plan %s mesocycle %s",
+                plan.pk,
+                mesocycle.pk,
+            )
+
+    transaction.on_commit(_send)
+
+
+def target_week_for_batch_copy(copy, source_block):
+    """Map the coach's *viewed* block onto one just-duplicated batch copy.
+
+    remove-current-week-plan.md §2.6 FIX 1: before this branch,
+    ``Plan.duplicate_for`` mirrored ``is_current`` onto the copy, so
+    ``current_week(copy)`` inherited whichever block the coach had open on the
+    source plan. That mirror is gone, so left to its own default
+    ``current_week(copy)`` always resolves to the copy's FIRST live block —
+    a coach batch-delivering from block 2's deliver screen would silently
+    stamp + notify every recipient about block 1 instead, with no visible
+    signal.
+
+    ``duplicate_for`` preserves both ``mesocycle.order`` and week ``index``
+    verbatim (it deep-copies the whole live tree in ``order``/``index``
+    sequence onto fresh rows), so "the copy's block at the same ``order`` as
+    the block the coach was viewing" IS that block — just re-homed onto new
+    pks. Map by position, never by pk.
+
+    Returns the copy's matching block's first live week, or ``None`` when
+    there is no ``source_block`` (no explicit/valid ``week_id`` was posted) or
+    the copy has nothing at that ``order`` / that block has no live week of
+    its own. The latter shouldn't normally happen — ``duplicate_for`` mirrors
+    every block unconditionally — but a concurrent edit to the source plan
+    between the request and the job is a real, if rare, race; callers degrade
+    to ``current_week(copy)`` rather than error.
+    """
+    if source_block is None:
+        return None
+    copy_block = copy.mesocycles.filter(order=source_block.order).first()
+    return first_live_week(copy_block)
+
+
+def dispatch_batch_delivery(batch_id):
+    """Queue ``run_batch_delivery`` for ``batch_id`` once the request commits.
+
+    On commit so the task lands only once the batch and its targets have durably
+    committed (a worker in another process would otherwise race the rows) and
+    never if the request rolls back.
+    """
+    transaction.on_commit(lambda: _enqueue(batch_id))
+
+
+def _enqueue(batch_id):
+    """Hand the job to the cluster; resolve the batch if the broker write fails."""
+    try:
+        async_task(RUN_BATCH_DELIVERY_TASK, batch_id)
+    except Exception:  # a broker failure must not strand the batch in ``queued``
+        logger.exception("Failed to enqueue batch delivery %s", batch_id)
+        _fail_batch(batch_id, "The delivery could not be queued.")
+
+
+def _fail_batch(batch_id, error):
+    """Mark a batch ``failed`` (a bare ``update`` — it can't trip on a stale row)."""
+    BatchDelivery.objects.filter(pk=batch_id).update(
+        status=BatchDelivery.Status.FAILED,
+        error=error,
+        finished_at=timezone.now(),
+    )
+
+
+def run_batch_delivery(batch_id):
+    """Deliver a copy to every pending target of ``batch_id``; never raises.
+
+    Only ``pending`` targets are worked, so a re-run (a retried task) picks up
+    where the last one stopped instead of copying twice. Each target commits or
+    rolls back on its own (``_deliver_target``); the batch ends ``done`` once
+    every target is resolved, or ``failed`` if the job itself blew up.
+    """
+    batch = (
+        BatchDelivery.objects.filter(pk=batch_id)
+        .select_related("plan", "coach", "source_block")
+        .first()
+    )
+    if batch is None:
+        logger.warning("Batch delivery %s vanished before it ran", batch_id)
+        return
+    try:
+        BatchDelivery.objects.filter(pk=batch.pk).update(
+            status=BatchDelivery.Status.RUNNING
+        )
+        targets = batch.targets.filter(
+            status=BatchDeliveryTarget.Status.PENDING
+        ).select_related("relationship__athlete")
+        for target in targets:
+            _deliver_target(batch, target)
+    except Exception:
+        logger.exception("Batch delivery %s failed", batch.pk)
+        _fail_batch(batch.pk, "The delivery stopped unexpectedly.")
+        return
+    BatchDelivery.objects.filter(pk=batch.pk).update(
+        status=BatchDelivery.Status.DONE, finished_at=timezone.now()
+    )
+
+
+def _deliver_target(batch, target):
+    """Copy, stamp, snapshot and notify one client — all or nothing for them.
+
+    The relationship is re-checked: a client the coach archived (or who left)
+    between the request and the job gets nothing. Any other failure rolls back
+    this client's copy, is logged, and leaves the reason on the target.
+    """
+    relationship = target.relationship
+    if (
+        not CoachAthlete.objects.for_coach(batch.coach)
+        .active()
+        .filter(pk=relationship.pk)
+        .exists()
+    ):
+        _resolve_target(
+            target,
+            BatchDeliveryTarget.Status.FAILED,
+            error="No longer an active client.",
+        )
+        return
+    try:
+        with transaction.atomic():
+            copy = batch.plan.duplicate_for(relationship, status=Plan.Status.ACTIVE)
+            target_week = target_week_for_batch_copy(
+                copy, batch.source_block
+            ) or current_week(copy)
+            block = target_week.mesocycle
+            week_count = stamp_block(block, timezone.now())
+            notify_block_delivered(copy, block, week_count, base_url=batch.base_url)
+            _resolve_target(target, BatchDeliveryTarget.Status.DELIVERED, copy=copy)
+    except Exception:
+        logger.exception(
+            "Batch delivery %s failed for relationship %s", batch.pk, relationship.pk
+        )
+        _resolve_target(
+            target,
+            BatchDeliveryTarget.Status.FAILED,
+            error="The copy could not be delivered.",
+        )
+
+
+def _resolve_target(target, status, *, copy=None, error=""):
+    """Record how one target ended — the row the status poll reports."""
+    target.status = status
+    target.copy = copy
+    target.error = error
+    target.finished_at = timezone.now()
+    target.save(update_fields=["status", "copy", "error", "finished_at"])
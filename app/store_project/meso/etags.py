@@ -0,0 +1,120 @@
+"""ETags for the meso reads that clients re-request while nothing has changed.
+
+The designer re-fetches a week (``week_view``) or the whole block
+(``api_mesocycle_grid``) on every switch and re-hydration, the agent panel polls
+``batch_status`` every couple of seconds while a proposal drafts, the tour driver
+re-reads ``tour_config`` after each fetch action, and the athlete PWA revalidates
+its session pages. Each used to rebuild and resend the full payload every time.
+
+Each validator here is derived from the versions the payload is built from —
+never from the payload itself — so a matching ``If-None-Match`` is answered
+with a bodiless ``304`` before any serializer runs:
+
+- a plan read keys off ``Plan.edit_version`` (bumped by every designer write,
+  ``Plan.touch``) plus the athlete's ``home_cache`` generation where the payload
+  overlays their logs and 1RMs (``week_view``, the session page);
+- a proposal batch keys off its own row and, once it has landed, its changes'
+  ``(pk, status)`` pairs — one narrow query — since the review gate flips a
+  change's status without touching the batch;
+- the tour config keys off the coach's ``tour_state`` and their generation,
+  which their plan writes, links and their athletes' logs bump.
+
+Every ETag also carries the ``MESO_ETAG_TTL`` window it was issued in, which
+bounds how long a response can outlive a write outside those paths (an admin
+edit, a renamed athlete, a billing change); 0 disables them all.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+
+from . import home_cache
+
+
+def make_etag(kind, *parts):
+    """A strong ETag over ``parts`` and the current TTL window, or ``None`` when off."""
+    timeout = settings.MESO_ETAG_TTL
+    if not timeout:
+        return None
+    raw = ":".join(map(str, (*parts, int(time.time() // timeout))))
+    return f'"{kind}-{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def _athlete_generation(plan):
+    # A template plan has no athlete, so nothing logged against it.
+    if plan.relationship_id is None:
+        return 0
+    return home_cache.generation(plan.relationship.athlete_id)
+
+
+def grid_etag(mesocycle, plan):
+    """``api_mesocycle_grid``'s ETag — the grid carries no log overlays."""
+    return make_etag("grid", mesocycle.pk, plan.pk, plan.edit_version)
+
+
+def week_etag(plan, week):
+    """``week_view``'s ETag — its "last time" and 1RM overlays follow the logs."""
+    return make_etag(
+        "week", plan.pk, week.pk, plan.edit_version, _athlete_generation(plan)
+    )
+
+
+def proposal_batch_etag(batch):
+    """``batch_status``'s ETag: the batch row, then its changes once it lands.
+
+    A drafting or failed batch's response is the row alone, so the poll while
+    the job runs costs no query beyond loading the batch.
+    """
+    parts = [batch.pk, batch.status, batch.summary, batch.error]
+    if batch.status not in (batch.Status.DRAFTING, batch.Status.FAILED):
+        parts.extend(batch.changes.order_by("pk").values_list("pk", "status"))
+    return make_etag("batch", *parts)
+
+
+def tour_etag(user, variant, profile):
+    """``tour_config``'s ETag for ``user``'s ``profile`` (``None``: no profile)."""
+    if profile is None:
+        return make_etag("tour", user.pk, variant, "none")
+    return make_etag(
+        "tour",
+        user.pk,
+        variant,
+        sorted((profile.tour_state or {}).items()),
+        home_cache.generation(user.pk),
+    )
+
+
+def session_etag(request, session):
+    """The athlete session page's ETag.
+
+    The page is the athlete's own log over the live plan, so it keys off the
+    plan's version and the athlete's generation (a log, a 1RM), plus the login
+    session: a new login rotates the CSRF token the logger posts with.
+    """
+    plan = session.week.mesocycle.plan
+    return make_etag(
+        "session",
+        request.user.pk,
+        session.pk,
+        plan.edit_version,
+        home_cache.generation(request.user.pk),
+        request.session.session_key or "",
+    )
+
+
+def not_modified(request, etag):
+    """The ``304`` for a matching ``If-None-Match``, else ``None``."""
+    if etag is None:
+        return None
+    return get_conditional_response(request, etag=etag)
+
+
+def tagged(response, etag):
+    """``response`` carrying ``etag``, revalidated on every use (never stale)."""
+    if etag is not None:
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
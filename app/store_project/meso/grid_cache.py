@@ -0,0 +1,105 @@
+"""Versioned cache for the designer's mesocycle grid payload (P1 table).
+
+``serialize_mesocycle_grid`` rebuilds the whole block — weeks, days, rows,
+every cell and sub-line, the phase rail, the athlete chip, the undo/redo
+state — from a handful of queries, and the designer asks for it on every load
+and after every mutation. Between two edits the answer can't change, so it is
+cached in the default (Redis) cache as the finished JSON **body bytes**: a hit
+is returned verbatim, byte-identical to the response the miss produced.
+
+Invalidation is by version, never by deletion: an entry is keyed by the
+mesocycle and stamped with the ``Plan.edit_version`` it was built at, and every
+designer write bumps that counter (``Plan.touch`` via the views' ``_touch_plan``,
+and ``agent.apply`` for an applied batch). A lookup whose stamp doesn't match
+the plan's current version is a miss and overwrites the entry in place — one
+key per block, so the small ``noeviction`` Redis never accumulates dead
+versions. ``MESO_GRID_CACHE_TTL`` bounds how long an entry can outlive a write
+that doesn't go through the designer (admin edits, an athlete renaming
+themselves, a new contraindication); 0 disables the cache.
+
+Hit/miss counters (``grid_cache_stats``) live beside the entries so the hit
+rate can be read off any box: ``manage.py meso_grid_cache_stats``.
+"""
+
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.http import JsonResponse
+
+from .serializers import serialize_mesocycle_grid
+
+HITS_KEY = "meso:grid:hits"
+MISSES_KEY = "meso:grid:misses"
+
+
+def grid_cache_key(mesocycle_id):
+    return f"meso:grid:{mesocycle_id}"
+
+
+def _count(key):
+    # ``add`` seeds the counter (no TTL — two keys, kept for the box's life) so
+    # ``incr`` never hits a missing key; both are atomic in Redis.
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between the add and the incr (LocMem culling) — drop the tick.
+        pass
+
+
+def grid_body(mesocycle):
+    """The grid endpoint's JSON body for ``mesocycle``, from cache when current.
+
+    ``mesocycle.plan`` must carry the plan's current ``edit_version`` (the
+    views hand in the plan they just loaded). Returns ``bytes`` — exactly what
+    ``JsonResponse({"ok": True, **serialize_mesocycle_grid(mesocycle)})`` would
+    have rendered.
+    """
+    timeout = settings.MESO_GRID_CACHE_TTL
+    version = mesocycle.plan.edit_version
+    key = grid_cache_key(mesocycle.pk)
+    if timeout:
+        entry = cache.get(key)
+        if entry is not None and entry[0] == version:
+            _count(HITS_KEY)
+            return entry[1]
+        _count(MISSES_KEY)
+    body = JsonResponse({"ok": True, **serialize_mesocycle_grid(mesocycle)}).content
+    if timeout:
+        cache.set(key, (version, body), timeout=timeout)
+    return body
+
+
+def grid_payload(mesocycle):
+    """``grid_body`` decoded back to the serializer's dict (no ``ok`` flag).
+
+    For the designer page, which embeds the grid via ``json_script`` — parsing
+    the cached bytes is far cheaper than re-serializing the block.
+    """
+    payload = json.loads(grid_body(mesocycle))
+    payload.pop("ok")
+    return payload
+
+
+def grid_response(mesocycle):
+    """``grid_body`` wrapped as the endpoint's ``application/json`` response."""
+    return HttpResponse(grid_body(mesocycle), content_type="application/json")
+
+
+def grid_cache_stats():
+    """``{"hits", "misses", "hit_rate"}`` since the counters were last reset."""
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = counts.get(HITS_KEY, 0)
+    misses = counts.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else None,
+    }
+
+
+def reset_grid_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -20,9 +20,42 @@ from the snapshot is hard-deleted rather than soft-deleted — see
 ``restore_plan_snapshot``. Deliberately excluded: ``delivered_at``,
 ``WeekDelivery``, ``SessionLog``/``LoggedSet``, ``AthleteOneRm``, and
 mesocycle fields — undo must never touch delivery stamps or athlete data.
+
+**Delta snapshots.** A plan-wide snapshot is O(plan) to read and write, which
+the hot per-keystroke autosaves (a cell edit on a six-block plan) can't
+afford. So an endpoint whose write stays inside a known *region* passes a
+``scope`` (``delta_scope``) to ``record_plan_action``: the snapshot then
+captures only the rows in that region, and stores the scope alongside them
+(``snapshot["scope"]``). Restore treats the region exactly the way it treats a
+whole plan for a full snapshot — rows in the snapshot are written back,
+region rows absent from it are soft-deleted (cells: hard-deleted) — and
+undo/redo capture the mirror-image row over the same scope. Because the
+stacks are strictly LIFO, the plan is always in the action's own "after"
+state when its delta is replayed, so restoring just the region is exact. A
+region must therefore cover every row the write touches, *before and after*
+(a cross-day move names both days). A snapshot without a ``scope`` key is a
+full one: block-level structural writes (weeks, new days, agent batches) and
+every legacy row keep going through the plan-wide path.
+
+**Storage.** ``PlanAction.snapshot`` doesn't hold the snapshot itself: it
+holds a manifest of content-addressed chunks (``store_snapshot``). A snapshot
+is cut into row-level pieces — one per exercise row with its cells, one per
+day with its sessions, one for the weeks — and each distinct piece is stored
+once per plan as a (by default zlib-compressed) ``PlanSnapshotChunk``, so the
+fifty near-identical snapshots on an undo stack share almost all of their
+bytes. Always read an action through ``action_snapshot``; rows recorded before
+chunked storage still hold their snapshot inline and read back unchanged
+(``meso_compact_plan_history`` converts them).
 """
 
+import hashlib
+import json
+import zlib
+from collections import defaultdict
+
+from django.conf import settings
 from django.db.models import Max
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
@@ -62,18 +95,23 @@ def _parse_dt(value):
     return parse_datetime(value)
 
 
-def serialize_plan_snapshot(plan):
-    """A self-contained, plan-wide snapshot of every editable row.
+def delta_scope(*, rows=(), days=()):
+    """The region a delta snapshot covers (see the module docstring).
 
-    Captures ALL ``Week``/``SessionSlot``/``ExerciseSlot``/``Session``/
-    ``Prescription`` rows belonging to ``plan`` — including soft-deleted ones.
-    Field lists mirror what the designer actually edits; delivery stamps,
-    logs, and athlete data are never captured (see module docstring).
+    ``rows`` are ``ExerciseSlot`` pks — each row plus every week's cells on it
+    (all lines). ``days`` are ``SessionSlot`` pks — each day plus every
+    ``ExerciseSlot`` currently on it, their cells, and the day's per-week
+    ``Session`` instances. Stored verbatim in the snapshot, so it's plain
+    JSON: sorted, de-duplicated pk lists.
+    """
+    return {"rows": sorted(set(rows)), "days": sorted(set(days))}
 
-    The P0 fixed-lineup cutover split the old per-week ``ExercisePrescription``
-    into a fixed ``SessionSlot``(day)/``ExerciseSlot``(row) identity plus a
-    per-week ``Prescription`` cell — so this snapshot now captures all four
-    row kinds instead of the old three.
+
+def _scoped_rows(plan, scope):
+    """The five editable-row querysets of ``plan``, narrowed to ``scope``.
+
+    ``scope`` ``None`` is the whole plan (a full snapshot). Otherwise weeks
+    are never in a delta's region — no delta-scoped write touches one.
     """
     weeks = models.Week.objects.filter(mesocycle__plan=plan)
     session_slots = models.SessionSlot.objects.filter(mesocycle__plan=plan)
@@ -87,7 +125,39 @@ def serialize_plan_snapshot(plan):
     cells = models.Prescription.objects.filter(
         week__mesocycle__plan=plan, athlete_authored=False
     )
-    return {
+    if scope is not None:
+        rows, days = scope.get("rows", []), scope.get("days", [])
+        weeks = weeks.none()
+        session_slots = session_slots.filter(pk__in=days)
+        exercise_slots = exercise_slots.filter(
+            Q(pk__in=rows) | Q(session_slot_id__in=days)
+        )
+        sessions = sessions.filter(session_slot_id__in=days)
+        cells = cells.filter(
+            Q(exercise_slot_id__in=rows) | Q(exercise_slot__session_slot_id__in=days)
+        )
+    return weeks, session_slots, exercise_slots, sessions, cells
+
+
+def serialize_plan_snapshot(plan, scope=None):
+    """A self-contained snapshot of every editable row — plan-wide by default.
+
+    Captures ALL ``Week``/``SessionSlot``/``ExerciseSlot``/``Session``/
+    ``Prescription`` rows belonging to ``plan`` — including soft-deleted ones.
+    Field lists mirror what the designer actually edits; delivery stamps,
+    logs, and athlete data are never captured (see module docstring).
+
+    The P0 fixed-lineup cutover split the old per-week ``ExercisePrescription``
+    into a fixed ``SessionSlot``(day)/``ExerciseSlot``(row) identity plus a
+    per-week ``Prescription`` cell — so this snapshot now captures all four
+    row kinds instead of the old three.
+
+    A ``scope`` (``delta_scope``) narrows capture to that region and is
+    recorded under the snapshot's ``scope`` key, which is what tells
+    ``restore_plan_snapshot`` to replay it as a delta.
+    """
+    weeks, session_slots, exercise_slots, sessions, cells = _scoped_rows(plan, scope)
+    snapshot = {
         "weeks": [
             {
                 "pk": w.pk,
@@ -148,6 +218,9 @@ def serialize_plan_snapshot(plan):
             for c in cells
         ],
     }
+    if scope is not None:
+        snapshot["scope"] = scope
+    return snapshot
 
 
 def restore_plan_snapshot(plan, snapshot):
@@ -178,127 +251,99 @@ def restore_plan_snapshot(plan, snapshot):
     sub-line created after the snapshot — undo removes it; also any bug-made
     stray), which is safe precisely because the pk-upsert makes a later redo
     able to recreate it.
+
+    A delta snapshot (one carrying a ``scope``) runs the same rules over its
+    region only: the "absent from the snapshot" cleanup is confined to the
+    region's rows, and — weeks never being in a delta's region — the stray-cell
+    rule reads week liveness from the DB rather than from the snapshot.
+
+    Writes are diffed and batched: every snapshotted row is loaded once,
+    compared field by field, and only rows that actually differ are written
+    (one ``bulk_update`` per distinct changed-field set, one ``bulk_create``
+    for recreated cells) — the restore runs under the plan's row lock, so its
+    write count is what every other autosave on the plan waits behind.
+    Returns the number of rows it wrote (updated, recreated, soft-deleted or
+    hard-deleted), which the undo/redo endpoints log alongside their latency.
     """
+    scope = snapshot.get("scope")
     week_rows = {row["pk"]: row for row in snapshot.get("weeks", [])}
     slot_rows = {row["pk"]: row for row in snapshot.get("session_slots", [])}
     exercise_slot_rows = {row["pk"]: row for row in snapshot.get("exercise_slots", [])}
     session_rows = {row["pk"]: row for row in snapshot.get("sessions", [])}
     cell_rows = {row["pk"]: row for row in snapshot.get("cells", [])}
 
-    week_pks = set(week_rows)
-    slot_pks = set(slot_rows)
-    exercise_slot_pks = set(exercise_slot_rows)
-    session_pks = set(session_rows)
-    cell_pks = set(cell_rows)
-
-    existing_week_pks = set(
-        models.Week.objects.filter(pk__in=week_pks).values_list("pk", flat=True)
-    )
-    if existing_week_pks != week_pks:
+    weeks = list(models.Week.objects.filter(pk__in=week_rows))
+    if len(weeks) != len(week_rows):
         raise HistoryUnavailable("A snapshotted week no longer exists.")
-    existing_slot_pks = set(
-        models.SessionSlot.objects.filter(pk__in=slot_pks).values_list("pk", flat=True)
-    )
-    if existing_slot_pks != slot_pks:
+    slots = list(models.SessionSlot.objects.filter(pk__in=slot_rows))
+    if len(slots) != len(slot_rows):
         raise HistoryUnavailable("A snapshotted session slot no longer exists.")
-    existing_exercise_slot_pks = set(
-        models.ExerciseSlot.objects.filter(pk__in=exercise_slot_pks).values_list(
-            "pk", flat=True
-        )
-    )
-    if existing_exercise_slot_pks != exercise_slot_pks:
+    exercise_slots = list(models.ExerciseSlot.objects.filter(pk__in=exercise_slot_rows))
+    if len(exercise_slots) != len(exercise_slot_rows):
         raise HistoryUnavailable("A snapshotted exercise slot no longer exists.")
-    existing_session_pks = set(
-        models.Session.objects.filter(pk__in=session_pks).values_list("pk", flat=True)
-    )
-    if existing_session_pks != session_pks:
+    sessions = list(models.Session.objects.filter(pk__in=session_rows))
+    if len(sessions) != len(session_rows):
         raise HistoryUnavailable("A snapshotted session no longer exists.")
     # Cells have no ``deleted_at`` — see the docstring above. A snapshotted
     # cell pk going missing is not an integrity error, so no existence check
-    # (and no ``HistoryUnavailable``) here; the write loop below is
-    # best-effort over whichever snapshotted pks still exist.
-
-    for week in models.Week.objects.filter(pk__in=week_pks):
-        row = week_rows[week.pk]
-        week.index = row["index"]
-        week.phase = row["phase"]
-        week.volume = row["volume"]
-        week.intensity = row["intensity"]
-        week.is_deload = row["is_deload"]
-        week.deleted_at = _parse_dt(row["deleted_at"])
-        week.save()
-
-    for slot in models.SessionSlot.objects.filter(pk__in=slot_pks):
-        row = slot_rows[slot.pk]
-        slot.mesocycle_id = row["mesocycle_id"]
-        slot.day_number = row["day_number"]
-        slot.name = row["name"]
-        slot.bias = row["bias"]
-        slot.order = row["order"]
-        slot.deleted_at = _parse_dt(row["deleted_at"])
-        slot.save()
-
-    for exercise_slot in models.ExerciseSlot.objects.filter(pk__in=exercise_slot_pks):
-        row = exercise_slot_rows[exercise_slot.pk]
-        exercise_slot.session_slot_id = row["session_slot_id"]
-        exercise_slot.exercise_id = row["exercise_id"]
-        exercise_slot.name = row["name"]
-        exercise_slot.order = row["order"]
-        exercise_slot.tags = list(row["tags"] or [])
-        exercise_slot.tempo = row.get("tempo", "")
-        exercise_slot.rest = row.get("rest", "")
-        exercise_slot.note = row.get("note", "")
-        exercise_slot.deleted_at = _parse_dt(row["deleted_at"])
-        exercise_slot.save()
-
-    for session in models.Session.objects.filter(pk__in=session_pks):
-        row = session_rows[session.pk]
-        session.week_id = row["week_id"]
-        session.session_slot_id = row["session_slot_id"]
-        session.deleted_at = _parse_dt(row["deleted_at"])
-        session.save()
+    # (and no ``HistoryUnavailable``) here; missing cells are recreated below.
+
+    touched = 0
+    touched += _write_changed(weeks, week_rows, _week_values)
+    touched += _write_changed(slots, slot_rows, _session_slot_values)
+    touched += _write_changed(exercise_slots, exercise_slot_rows, _exercise_slot_values)
+    touched += _write_changed(sessions, session_rows, _session_values)
 
     # Cells are UPSERTED by pk (Phase 2a): sub-line cells (line >= 1) are
     # created routinely while editing, and an undo taken before one existed
     # hard-deletes it below — so redo must be able to RECREATE the exact pk,
     # not just best-effort skip it (the old behavior, from when cells were
     # only ever created alongside a new slot/week).
-    existing_cells = {
-        c.pk: c for c in models.Prescription.objects.filter(pk__in=cell_pks)
-    }
-    for pk, row in cell_rows.items():
-        cell = existing_cells.get(pk) or models.Prescription(pk=pk)
-        # Never overwrite an athlete-authored cell (Phase 4a), even when an
-        # OLDER snapshot still holds a coach version of that same pk (a
-        # capture-only exclusion would let this restore clobber the athlete's
-        # later edit). The authority is the CURRENT DB row's flag, not the
-        # snapshot's — the snapshot never carries athlete cells at all.
-        if cell.athlete_authored:
-            continue
-        cell.exercise_slot_id = row["exercise_slot_id"]
-        cell.week_id = row["week_id"]
-        cell.line = row.get("line", 0)
-        cell.text = row.get("text", "")
-        cell.skipped = row["skipped"]
-        cell.save()
-
-    # Rows of this plan created *after* the snapshot was taken are absent from
-    # it — soft-delete them (never hard-delete: a later undo of an even-older
-    # action must still find the row, and redo must always revive a pk rather
-    # than recreate one).
-    now = timezone.now()
-    models.Week.objects.filter(mesocycle__plan=plan).exclude(pk__in=week_pks).update(
-        deleted_at=now
+    # Never overwrite an athlete-authored cell (Phase 4a), even when an OLDER
+    # snapshot still holds a coach version of that same pk (a capture-only
+    # exclusion would let this restore clobber the athlete's later edit). The
+    # authority is the CURRENT DB row's flag, not the snapshot's — the
+    # snapshot never carries athlete cells at all.
+    existing_cells = [
+        c
+        for c in models.Prescription.objects.filter(pk__in=cell_rows)
+        if not c.athlete_authored
+    ]
+    touched += _write_changed(existing_cells, cell_rows, _cell_values)
+    present_cell_pks = set(
+        models.Prescription.objects.filter(pk__in=cell_rows).values_list(
+            "pk", flat=True
+        )
     )
-    models.SessionSlot.objects.filter(mesocycle__plan=plan).exclude(
-        pk__in=slot_pks
-    ).update(deleted_at=now)
-    models.ExerciseSlot.objects.filter(session_slot__mesocycle__plan=plan).exclude(
-        pk__in=exercise_slot_pks
-    ).update(deleted_at=now)
-    models.Session.objects.filter(week__mesocycle__plan=plan).exclude(
-        pk__in=session_pks
-    ).update(deleted_at=now)
+    missing_cells = [
+        models.Prescription(pk=pk, **_cell_values(row))
+        for pk, row in cell_rows.items()
+        if pk not in present_cell_pks
+    ]
+    if missing_cells:
+        models.Prescription.objects.bulk_create(missing_cells)
+        touched += len(missing_cells)
+
+    # Rows of this plan (or of a delta's region) created *after* the snapshot
+    # was taken are absent from it — soft-delete them (never hard-delete: a
+    # later undo of an even-older action must still find the row, and redo
+    # must always revive a pk rather than recreate one). The region is read
+    # AFTER the writes above, so a row the snapshot just moved back out of a
+    # region (a cross-day move) is already gone from it. Rows already
+    # soft-deleted keep their original stamp — only live strays are written.
+    weeks, session_slots, exercise_slots, sessions, cells = _scoped_rows(plan, scope)
+    now = timezone.now()
+    for queryset, pks in (
+        (weeks, week_rows),
+        (session_slots, slot_rows),
+        (exercise_slots, exercise_slot_rows),
+        (sessions, session_rows),
+    ):
+        touched += (
+            queryset.exclude(pk__in=pks)
+            .filter(deleted_at__isnull=True)
+            .update(deleted_at=now)
+        )
 
     # Cells carry no ``deleted_at`` of their own (see the docstring above): a
     # cell is live iff its ``ExerciseSlot`` *and* its ``Week`` are both live,
@@ -312,17 +357,274 @@ def restore_plan_snapshot(plan, snapshot):
     live_exercise_slot_pks_in_snapshot = {
         pk for pk, row in exercise_slot_rows.items() if row["deleted_at"] is None
     }
-    live_week_pks_in_snapshot = {
-        pk for pk, row in week_rows.items() if row["deleted_at"] is None
+    if scope is None:
+        live_week_pks_in_snapshot = {
+            pk for pk, row in week_rows.items() if row["deleted_at"] is None
+        }
+    else:
+        live_week_pks_in_snapshot = set(
+            models.Week.objects.filter(
+                mesocycle__plan=plan, deleted_at__isnull=True
+            ).values_list("pk", flat=True)
+        )
+    # ``cells`` already excludes athlete-authored rows (``_scoped_rows``).
+    stray_pks = list(
+        cells.filter(
+            exercise_slot_id__in=live_exercise_slot_pks_in_snapshot,
+            week_id__in=live_week_pks_in_snapshot,
+        )
+        .exclude(pk__in=cell_rows)
+        .values_list("pk", flat=True)
+    )
+    if stray_pks:
+        models.Prescription.objects.filter(pk__in=stray_pks).delete()
+        touched += len(stray_pks)
+    return touched
+
+
+def _week_values(row):
+    return {
+        "index": row["index"],
+        "phase": row["phase"],
+        "volume": row["volume"],
+        "intensity": row["intensity"],
+        "is_deload": row["is_deload"],
+        "deleted_at": _parse_dt(row["deleted_at"]),
+    }
+
+
+def _session_slot_values(row):
+    return {
+        "mesocycle_id": row["mesocycle_id"],
+        "day_number": row["day_number"],
+        "name": row["name"],
+        "bias": row["bias"],
+        "order": row["order"],
+        "deleted_at": _parse_dt(row["deleted_at"]),
+    }
+
+
+def _exercise_slot_values(row):
+    return {
+        "session_slot_id": row["session_slot_id"],
+        "exercise_id": row["exercise_id"],
+        "name": row["name"],
+        "order": row["order"],
+        "tags": list(row["tags"] or []),
+        "tempo": row.get("tempo", ""),
+        "rest": row.get("rest", ""),
+        "note": row.get("note", ""),
+        "deleted_at": _parse_dt(row["deleted_at"]),
+    }
+
+
+def _session_values(row):
+    return {
+        "week_id": row["week_id"],
+        "session_slot_id": row["session_slot_id"],
+        "deleted_at": _parse_dt(row["deleted_at"]),
+    }
+
+
+def _cell_values(row):
+    return {
+        "exercise_slot_id": row["exercise_slot_id"],
+        "week_id": row["week_id"],
+        "line": row.get("line", 0),
+        "text": row.get("text", ""),
+        "skipped": row["skipped"],
     }
-    models.Prescription.objects.filter(
-        week__mesocycle__plan=plan,
-        exercise_slot_id__in=live_exercise_slot_pks_in_snapshot,
-        week_id__in=live_week_pks_in_snapshot,
-    ).exclude(pk__in=cell_pks).exclude(athlete_authored=True).delete()
 
 
-def record_plan_action(plan, label):
+def _write_changed(objs, rows_by_pk, values_for):
+    """Write back only the fields of ``objs`` that differ from their snapshot row.
+
+    ``values_for`` maps a snapshot row to the model attribute values it pins.
+    Unchanged rows issue no query at all; changed rows are grouped by the
+    exact set of fields that changed and written with one ``bulk_update`` per
+    group — an undo of a one-cell edit on a thousand-cell plan is a single
+    UPDATE, not a thousand ``save()`` calls under the plan lock. Returns the
+    number of rows written.
+    """
+    if not objs:
+        return 0
+    by_fields = defaultdict(list)
+    for obj in objs:
+        values = values_for(rows_by_pk[obj.pk])
+        changed = tuple(f for f, v in values.items() if getattr(obj, f) != v)
+        if not changed:
+            continue
+        for field in changed:
+            setattr(obj, field, values[field])
+        by_fields[changed].append(obj)
+    manager = type(objs[0])._default_manager
+    for fields, group in by_fields.items():
+        manager.bulk_update(group, fields)
+    return sum(len(group) for group in by_fields.values())
+
+
+# ---------------------------------------------------------------------------
+# Snapshot storage — content-addressed, per-plan deduplicated chunks
+# ---------------------------------------------------------------------------
+
+
+def _canonical(payload):
+    """``payload`` as canonical JSON bytes — what a chunk digest is taken over."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _split_snapshot(snapshot):
+    """Cut a snapshot into row-level chunk payloads (partial snapshots).
+
+    One chunk per exercise row with all of its cells, one per day with all of
+    its per-week sessions, and one holding the weeks — the granularity at which
+    consecutive snapshots actually differ (a cell edit changes one row's
+    chunk). Anything left over (a cell or session whose parent row isn't in
+    the snapshot) rides in a final catch-all chunk so nothing is ever dropped.
+    """
+    cells_by_row = defaultdict(list)
+    for row in snapshot.get("cells", []):
+        cells_by_row[row["exercise_slot_id"]].append(row)
+    sessions_by_day = defaultdict(list)
+    for row in snapshot.get("sessions", []):
+        sessions_by_day[row["session_slot_id"]].append(row)
+
+    payloads = []
+    if snapshot.get("weeks"):
+        payloads.append({"weeks": snapshot["weeks"]})
+    for row in snapshot.get("session_slots", []):
+        payloads.append(
+            {
+                "session_slots": [row],
+                "sessions": sessions_by_day.pop(row["pk"], []),
+            }
+        )
+    for row in snapshot.get("exercise_slots", []):
+        payloads.append(
+            {"exercise_slots": [row], "cells": cells_by_row.pop(row["pk"], [])}
+        )
+    leftover_sessions = [row for rows in sessions_by_day.values() for row in rows]
+    leftover_cells = [row for rows in cells_by_row.values() for row in rows]
+    if leftover_sessions or leftover_cells:
+        payloads.append({"sessions": leftover_sessions, "cells": leftover_cells})
+    return payloads
+
+
+def _encode(raw, codec):
+    if codec == models.PlanSnapshotChunk.Codec.ZLIB:
+        return zlib.compress(raw)
+    return raw
+
+
+def _decode(chunk):
+    data = bytes(chunk.data)
+    if chunk.codec == models.PlanSnapshotChunk.Codec.ZLIB:
+        data = zlib.decompress(data)
+    return json.loads(data)
+
+
+def store_snapshot(plan, snapshot):
+    """Persist ``snapshot`` as ``plan``'s chunks; returns ``(manifest, chunks)``.
+
+    Each chunk is written at most once per plan — one query finds which
+    digests the plan already holds and one ``bulk_create`` adds the rest. The
+    manifest (what ``PlanAction.snapshot`` then stores) lists the chunk
+    digests in order, plus a delta's ``scope``. Must run under the plan's row
+    lock, like every other op-log write.
+    """
+    codec = settings.MESO_SNAPSHOT_CODEC
+    encoded = {}
+    digests = []
+    for payload in _split_snapshot(snapshot):
+        raw = _canonical(payload)
+        digest = hashlib.sha256(raw).hexdigest()
+        digests.append(digest)
+        encoded.setdefault(digest, raw)
+    existing = set(
+        models.PlanSnapshotChunk.objects.filter(
+            plan=plan, digest__in=encoded
+        ).values_list("digest", flat=True)
+    )
+    models.PlanSnapshotChunk.objects.bulk_create(
+        [
+            models.PlanSnapshotChunk(
+                plan=plan,
+                digest=digest,
+                codec=codec,
+                data=_encode(raw, codec),
+                raw_size=len(raw),
+            )
+            for digest, raw in encoded.items()
+            if digest not in existing
+        ]
+    )
+    chunks = list(
+        models.PlanSnapshotChunk.objects.filter(plan=plan, digest__in=encoded)
+    )
+    manifest = {"chunks": digests}
+    if "scope" in snapshot:
+        manifest["scope"] = snapshot["scope"]
+    return manifest, chunks
+
+
+def create_plan_action(plan, *, stack, seq, label, snapshot):
+    """Insert one ``PlanAction`` whose ``snapshot`` is stored as chunks."""
+    manifest, chunks = store_snapshot(plan, snapshot)
+    action = models.PlanAction.objects.create(
+        plan=plan, stack=stack, seq=seq, label=label, snapshot=manifest
+    )
+    action.chunks.add(*chunks)
+    return action
+
+
+def action_snapshot(action):
+    """The full snapshot ``action`` recorded, reassembled from its chunks.
+
+    A legacy row (recorded before chunked storage, and not yet compacted by
+    ``meso_compact_plan_history``) holds its snapshot inline and is returned
+    as-is.
+    """
+    stored = action.snapshot
+    if "chunks" not in stored:
+        return stored
+    by_digest = {
+        chunk.digest: chunk
+        for chunk in models.PlanSnapshotChunk.objects.filter(
+            plan_id=action.plan_id, digest__in=stored["chunks"]
+        )
+    }
+    snapshot = {
+        "weeks": [],
+        "session_slots": [],
+        "exercise_slots": [],
+        "sessions": [],
+        "cells": [],
+    }
+    for digest in stored["chunks"]:
+        chunk = by_digest.get(digest)
+        if chunk is None:
+            raise HistoryUnavailable("A snapshot chunk no longer exists.")
+        for key, rows in _decode(chunk).items():
+            snapshot[key].extend(rows)
+    if "scope" in stored:
+        snapshot["scope"] = stored["scope"]
+    return snapshot
+
+
+def prune_snapshot_chunks(plan):
+    """Delete ``plan``'s chunks that no ``PlanAction`` references any more.
+
+    Called under the plan's row lock after the op-log drops rows (redo
+    invalidation, the undo cap, an undo/redo pop), so it never races a
+    writer that's about to reuse a chunk. Returns the number deleted.
+    """
+    deleted, _ = models.PlanSnapshotChunk.objects.filter(
+        plan=plan, actions__isnull=True
+    ).delete()
+    return deleted
+
+
+def record_plan_action(plan, label, *, scope=None):
     """Record one UNDO ``PlanAction`` for ``plan``, right before its mutation.
 
     Must run inside the caller's transaction, called immediately BEFORE the
@@ -333,9 +635,13 @@ def record_plan_action(plan, label):
     2. Allocate the next ``seq`` (one past the max over the plan's remaining
        rows — the redo stack is now empty, so this is the max undo ``seq``).
     3. Insert the UNDO row with a snapshot of the plan's current (pre-mutation)
-       state.
+       state, stored as deduplicated chunks (``create_plan_action``).
     4. Trim the undo stack to ``UNDO_STACK_CAP``, dropping the oldest
-       (lowest-seq) rows first.
+       (lowest-seq) rows first, and prune the chunks nothing references now.
+
+    ``scope`` (``delta_scope``) records a delta over just that region instead
+    of a plan-wide snapshot — see the module docstring for what a region must
+    cover.
 
     Row-locks the plan first: overlapping designer autosaves would otherwise
     both read the same max ``seq`` and the loser's insert would 500 on
@@ -353,12 +659,12 @@ def record_plan_action(plan, label):
     max_seq = (
         models.PlanAction.objects.filter(plan=plan).aggregate(m=Max("seq"))["m"] or 0
     )
-    models.PlanAction.objects.create(
-        plan=plan,
+    create_plan_action(
+        plan,
         stack=models.PlanAction.Stack.UNDO,
         seq=max_seq + 1,
         label=label,
-        snapshot=serialize_plan_snapshot(plan),
+        snapshot=serialize_plan_snapshot(plan, scope=scope),
     )
     undo_pks = list(
         models.PlanAction.objects.filter(plan=plan, stack=models.PlanAction.Stack.UNDO)
@@ -367,3 +673,4 @@ def record_plan_action(plan, label):
     )
     if len(undo_pks) > UNDO_STACK_CAP:
         models.PlanAction.objects.filter(pk__in=undo_pks[UNDO_STACK_CAP:]).delete()
+    prune_snapshot_chunks(plan)
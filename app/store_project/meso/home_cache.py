@@ -0,0 +1,139 @@
+"""Per-athlete cache of the athlete home's cards, and the page's ETag.
+
+The athlete PWA opens onto ``/meso/me/`` every time the app comes to the
+foreground, but what it shows — the cards ``presenters.athlete_home`` builds —
+only changes when a coach edits or delivers a plan, a coach link changes, or
+the athlete logs. So the cards are cached per athlete in the default (Redis)
+cache and the page carries an ``ETag``; a service-worker revalidation over a
+flaky gym connection then costs a ``304`` with no body.
+
+Invalidation is by a per-athlete **generation** counter, never by deletion:
+a cached entry is stamped with the generation it was built at, and every write
+that can change the page bumps it —
+
+- ``Plan.save`` for a plan with an athlete: every designer write ends in
+  ``_touch_plan`` → ``Plan.touch``, and so does a delivery (and a batch
+  delivery's copy is a new plan); archiving and admin edits save the plan too;
+- ``CoachAthlete.save``: an invite, accept, decline or end changes the cards
+  and the pending-links panel;
+- ``athlete_log_session``: a log flips a session to done, moves the scroll
+  hint, and can set a personal record.
+
+The same generation versions the ETags in ``etags`` (the session page and the
+designer's week follow an athlete's logs and 1RMs, the tour config a coach's
+plans, links and athletes' logs), so those paths bump the coach's generation
+too, and the 1RM writes bump the athlete's.
+
+A bump happens at once *and* again on commit, so a read racing the writer's
+transaction can't re-cache the pre-commit state under the new generation;
+``Plan.save``, on the autosave path, only bumps on commit (``bump_on_commit``).
+``MESO_HOME_CACHE_TTL`` bounds how long an entry — or an ETag — can outlive a
+write that doesn't go through those paths (a cell edited in the admin, a
+coach renaming themselves); 0 disables both the cache and the ETag.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from . import presenters
+
+
+def generation_key(athlete_id):
+    return f"meso:home:gen:{athlete_id}"
+
+
+def cards_key(athlete_id, focus_week_id):
+    return f"meso:home:{athlete_id}:{focus_week_id or 0}"
+
+
+def generation(athlete_id):
+    """``athlete_id``'s current generation, seeding one if the key is missing.
+
+    The seed is the clock in nanoseconds rather than 0: a counter lost to an
+    eviction or a cache flush restarts past every generation an old entry
+    (or a browser's ETag) could carry, so it can never be mistaken for current.
+    """
+    key = generation_key(athlete_id)
+    cache.add(key, time.time_ns(), timeout=None)
+    value = cache.get(key)
+    return value if value is not None else time.time_ns()
+
+
+def _bump(athlete_id):
+    key = generation_key(athlete_id)
+    cache.add(key, time.time_ns(), timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between the add and the incr — the next read seeds afresh,
+        # which invalidates just the same.
+        pass
+
+
+def bump(athlete_id):
+    """Invalidate ``athlete_id``'s cached home now and again when the write commits."""
+    if athlete_id is None:
+        return
+    _bump(athlete_id)
+    transaction.on_commit(lambda: _bump(athlete_id))
+
+
+def bump_on_commit(*athlete_ids):
+    """Invalidate the cached homes of ``athlete_ids`` once the write commits.
+
+    The lean form of ``bump`` for a write that doesn't read the home back in
+    its own transaction — ``Plan.save`` on every designer autosave: one
+    callback and no cache write before the commit. That's enough on its own —
+    a read before the commit sees the old rows under the old generation, which
+    the commit-time bump retires.
+    """
+    ids = [pk for pk in athlete_ids if pk is not None]
+    if ids:
+        transaction.on_commit(lambda: [_bump(pk) for pk in ids])
+
+
+def home_cards(user, focus_week_id=None):
+    """``presenters.athlete_home(user, focus_week_id)``, from cache when current.
+
+    One entry per (athlete, ``?week=`` anchor) — the bare home and each week
+    the athlete has jumped to — each stamped with the generation it was built at
+    and overwritten in place on a mismatch.
+    """
+    timeout = settings.MESO_HOME_CACHE_TTL
+    if not timeout:
+        return presenters.athlete_home(user, focus_week_id=focus_week_id)
+    current = generation(user.pk)
+    key = cards_key(user.pk, focus_week_id)
+    entry = cache.get(key)
+    if entry is not None and entry[0] == current:
+        return entry[1]
+    cards = presenters.athlete_home(user, focus_week_id=focus_week_id)
+    cache.set(key, (current, cards), timeout=timeout)
+    return cards
+
+
+def home_etag(request, focus_week_id=None):
+    """The athlete home page's ETag for ``request``, or ``None`` when disabled.
+
+    Derived without building the page: the athlete, the ``?week=`` anchor, their
+    generation, the session (a new login rotates the CSRF token the page's forms
+    embed, so the old copy must not revalidate) and the TTL window the entry
+    lives in (so a write outside the bump paths still surfaces within a TTL).
+    """
+    timeout = settings.MESO_HOME_CACHE_TTL
+    if not timeout:
+        return None
+    user_id = request.user.pk
+    parts = (
+        user_id,
+        focus_week_id or 0,
+        generation(user_id),
+        request.session.session_key or "",
+        int(time.time() // timeout),
+    )
+    digest = hashlib.sha256(":".join(map(str, parts)).encode()).hexdigest()
+    return f'"home-{digest[:32]}"'
@@ -8,10 +8,21 @@ in a transaction that is rolled back, so eval batches/changes are never persiste
     manage.py meso_agent_eval                # real model; needs ANTHROPIC_API_KEY
     manage.py meso_agent_eval --dry-run      # scripted client, no network / key
     manage.py meso_agent_eval --plan-id 3    # evaluate against a specific plan
+    manage.py meso_agent_eval --workers 8 --response-cache evals.json \
+        --report report.json                 # parallel, replaying, JSON report
+
+The cases' Claude calls run ``--workers`` at a time (``evals.run_corpus``).
+``--response-cache`` records each response in a JSON file and replays it on a
+later run with the same model, prompt, plan context and instruction, so only
+the cases a prompt change actually touches spend tokens. ``--report`` writes the
+per-case verdicts, latency and token usage as JSON (``-`` for stdout, replacing
+the text output) for regression-testing a prompt change.
 
 Exits non-zero if any case fails, so it can gate a scheduled quality check.
 """
 
+import json
+
 from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
 from django.db import transaction
@@ -36,6 +47,22 @@ class Command(BaseCommand):
             action="store_true",
             help="Use a scripted client (no network / no API key needed).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Cases to call the agent for concurrently (default: 4).",
+        )
+        parser.add_argument(
+            "--response-cache",
+            default=None,
+            help="JSON file of recorded responses to replay and extend.",
+        )
+        parser.add_argument(
+            "--report",
+            default=None,
+            help="Write a JSON report to this path ('-' for stdout).",
+        )
 
     def handle(self, *args, **options):
         plan = self._resolve_plan(options["plan_id"])
@@ -60,27 +87,55 @@ class Command(BaseCommand):
                 return
 
         model = getattr(client, "model", "scripted")
-        self.stdout.write(
-            f"Evaluating {len(evals.GOLDEN_CASES)} case(s) against plan "
-            f"#{plan.pk} ({plan.title}) with {model}\n"
-        )
+        json_only = options["report"] == "-"
+        if not json_only:
+            self.stdout.write(
+                f"Evaluating {len(evals.GOLDEN_CASES)} case(s) against plan "
+                f"#{plan.pk} ({plan.title}) with {model}\n"
+            )
+
+        cache = None
+        if options["response_cache"]:
+            cache = evals.ResponseCache(options["response_cache"])
 
-        # Roll the whole run back so eval proposals are never persisted.
-        results = []
+        # Roll the whole run back so eval proposals are never persisted. The
+        # recorded responses are kept either way — they were paid for.
         try:
             with transaction.atomic():
-                for case in evals.GOLDEN_CASES:
-                    results.append(
-                        evals.evaluate(plan, case, client=client, mesocycle=mesocycle)
-                    )
+                results = evals.run_corpus(
+                    plan,
+                    evals.GOLDEN_CASES,
+                    client=client,
+                    mesocycle=mesocycle,
+                    workers=options["workers"],
+                    cache=cache,
+                )
                 transaction.set_rollback(True)
         except Exception as exc:  # provider/db failure — surface, don't traceback
             raise CommandError(f"Eval run failed: {exc}") from exc
+        finally:
+            if cache is not None:
+                cache.save()
 
-        failed = self._report(results)
+        if options["report"]:
+            report = evals.corpus_report(
+                results, model=model, plan=plan, mesocycle=mesocycle
+            )
+            text = json.dumps(report, ensure_ascii=False, indent=2)
+            if json_only:
+                self.stdout.write(text)
+            else:
+                with open(options["report"], "w", encoding="utf-8") as fh:
+                    fh.write(text)
+
+        if json_only:
+            failed = sum(not r.passed for r in results)
+        else:
+            failed = self._report(results)
         if failed:
             raise CommandError(f"{failed} case(s) failed.")
-        self.stdout.write(self.style.SUCCESS("All cases passed."))
+        if not json_only:
+            self.stdout.write(self.style.SUCCESS("All cases passed."))
 
     def _resolve_plan(self, plan_id):
         if plan_id is not None:
@@ -103,9 +158,10 @@ class Command(BaseCommand):
         failed = 0
         for r in results:
             tag = self.style.SUCCESS("PASS") if r.passed else self.style.ERROR("FAIL")
+            timing = "replayed" if r.cached else f"{r.latency_ms} ms"
             self.stdout.write(
                 f"  [{tag}] {r.case.name}: {r.n_changes} change(s), "
-                f"{r.n_rejected} rejected"
+                f"{r.n_rejected} rejected ({timing})"
             )
             for problem in r.failures:
                 self.stdout.write(self.style.ERROR(f"        ✗ {problem}"))
@@ -32,6 +32,13 @@ def _usd(value, places=4):
     return f"${value:.{places}f}"
 
 
+def _pct(ratio):
+    """Format a 0–1 ratio as a whole percentage; an em-dash for ``None``."""
+    if ratio is None:
+        return "—"
+    return f"{ratio:.0%}"
+
+
 def _serialize_totals(totals):
     return {
         "runs": totals.runs,
@@ -40,6 +47,7 @@ def _serialize_totals(totals):
         "cache_creation_input_tokens": totals.cache_creation_input_tokens,
         "cache_read_input_tokens": totals.cache_read_input_tokens,
         "total_tokens": totals.total_tokens,
+        "cache_hit_ratio": totals.cache_hit_ratio,
         "cost": str(totals.cost),
         "unknown_cost_runs": totals.unknown_cost_runs,
     }
@@ -129,6 +137,7 @@ class Command(BaseCommand):
             excluded = f"   ({report.eval_runs_excluded} eval run(s) excluded)"
         w(
             f"Totals: {t.runs} run(s) · {t.total_tokens:,} tokens · "
+            f"cache hits {_pct(t.cache_hit_ratio)} · "
             f"est. {_usd(t.cost)}{suffix}{excluded}"
         )
 
@@ -152,6 +161,7 @@ class Command(BaseCommand):
             w(
                 f"      {coach.totals.runs} run(s) · "
                 f"{coach.totals.total_tokens:,} tokens · "
+                f"cache hits {_pct(coach.totals.cache_hit_ratio)} · "
                 f"cost {_usd(coach.totals.cost)} · "
                 f"revenue {_usd(coach.revenue, 2)} · "
                 f"margin {_usd(coach.margin)}"
@@ -176,5 +186,6 @@ class Command(BaseCommand):
                 note = f" ({totals.unknown_cost_runs} unpriced)"
             w(
                 f"  {key}: {totals.runs} run(s), "
-                f"{totals.total_tokens:,} tokens, {_usd(totals.cost)}{note}"
+                f"{totals.total_tokens:,} tokens, "
+                f"{_pct(totals.cache_hit_ratio)} cached, {_usd(totals.cost)}{note}"
             )
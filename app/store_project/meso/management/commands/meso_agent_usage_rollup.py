@@ -0,0 +1,44 @@
+"""Rebuild the monthly agent usage rollups from the run ledger.
+
+``AgentUsageRollup`` holds the ``AgentProposalBatch`` usage ledger pre-summed by
+(month, coach, athlete, model, trigger, tier); the usage report, the dashboard
+and the margin sweep read it (``billing.usage_rollup``). Each run is added once
+when it resolves, so the table only drifts if the ledger is edited behind it —
+a corrected cost, a backfilled model, a hand-deleted batch. This recounts a
+month (or the whole history) from the ledger.
+
+    manage.py meso_agent_usage_rollup                   # every month
+    manage.py meso_agent_usage_rollup --month 2026-06   # one month
+"""
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from store_project.meso.billing import agent_usage_report as report_mod
+from store_project.meso.billing import usage_rollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly agent usage rollups from the run ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--month",
+            help="Calendar month as YYYY-MM (defaults to every month).",
+        )
+
+    def handle(self, *args, **options):
+        start = end = None
+        label = "every month"
+        if options["month"]:
+            try:
+                year, month = report_mod.parse_month(options["month"])
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            start, end = report_mod.month_bounds(year, month)
+            label = f"{year:04d}-{month:02d}"
+
+        counted = usage_rollup.rebuild(start=start, end=end)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rolled up {counted} agent run(s) for {label}.")
+        )
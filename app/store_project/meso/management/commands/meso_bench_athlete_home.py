@@ -0,0 +1,103 @@
+"""Benchmark the athlete home payload (``presenters.athlete_home``) by plan count.
+
+The home builds one card per live plan across the athlete's coaches. It loads
+every card's weeks, anchored sessions (with cell counts and done flags) and
+block grid in bulk, so its query count stays flat however many plans the
+athlete has — before, each plan cost its own dozen-odd queries. This builds
+one athlete with 1, 5 and 20 plans (one coach each, a logged first session per
+plan) and reports queries and wall time per home open at each size.
+
+Everything runs inside one transaction that is rolled back at the end, so it's
+safe on any database.
+
+    manage.py meso_bench_athlete_home                      # 1/5/20 plans, 20 opens each
+    manage.py meso_bench_athlete_home --plans 1 10 50 --opens 5
+    manage.py meso_bench_athlete_home --weeks 6 --days 5 --rows 8
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+
+from store_project.meso import presenters
+from store_project.meso.management.commands.meso_bench_duplicate import build_template
+from store_project.meso.models import Session
+from store_project.meso.models import SessionLog
+
+
+def add_plans(athlete, count, *, weeks, days, rows):
+    """Give ``athlete`` ``count`` more one-block plans, each from a new coach.
+
+    The first session of each plan gets a done log, so every card anchors on a
+    logged week the way a training athlete's would.
+    """
+    for _ in range(count):
+        plan = build_template(
+            blocks=1, weeks=weeks, days=days, rows=rows, lines=2, athlete=athlete
+        )
+        first = (
+            Session.objects.filter(week__mesocycle__plan=plan)
+            .order_by("week__index")
+            .first()
+        )
+        SessionLog.objects.create(
+            session=first, athlete=athlete, status=SessionLog.Status.DONE
+        )
+
+
+class Command(BaseCommand):
+    help = "Measure queries and time per athlete-home open at several plan counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--plans",
+            type=int,
+            nargs="+",
+            default=[1, 5, 20],
+            help="Plan counts to measure, ascending.",
+        )
+        parser.add_argument("--opens", type=int, default=20)
+        parser.add_argument("--weeks", type=int, default=4)
+        parser.add_argument("--days", type=int, default=4)
+        parser.add_argument("--rows", type=int, default=6)
+
+    def handle(self, *args, **options):
+        sizes = options["plans"]
+        opens = options["opens"]
+        if opens < 1 or not sizes or min(sizes) < 1 or sizes != sorted(sizes):
+            raise CommandError(
+                "--opens and --plans must be positive, --plans ascending."
+            )
+        with transaction.atomic():
+            athlete = get_user_model().objects.create(
+                username=f"bench-home-athlete-{time.time_ns()}"
+            )
+            built = 0
+            for size in sizes:
+                add_plans(
+                    athlete,
+                    size - built,
+                    weeks=options["weeks"],
+                    days=options["days"],
+                    rows=options["rows"],
+                )
+                built = size
+                # One untimed open first, so import/URL-resolver warm-up
+                # doesn't land on the smallest size.
+                presenters.athlete_home(athlete)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    for _ in range(opens):
+                        cards = presenters.athlete_home(athlete)
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"  {len(cards):3d} plan(s)  {len(queries) / opens:6.1f} queries/open  "
+                    f"{elapsed * 1000 / opens:8.1f} ms/open"
+                )
+            # Nothing the benchmark made survives it.
+            transaction.set_rollback(True)
@@ -0,0 +1,268 @@
+"""Benchmark ``Plan.duplicate_for`` (the batch-deliver copy) against the old path.
+
+``plan_batch_deliver`` copies the source plan once per picked client, in one
+request. ``duplicate_for`` copies a whole tree in a fixed number of statements
+(one read + one ``bulk_create`` per level); before that it created every block,
+day, row and week with its own ``INSERT``. This runs both over the same plan —
+a synthetic template by default, or a real one via ``--plan`` — and reports
+statements and wall time per copy.
+
+Everything runs inside one transaction that is rolled back at the end: the
+synthetic template and every copy are discarded, so it's safe on any database.
+
+    manage.py meso_bench_duplicate                          # 4 blocks x 4 weeks, 30 copies
+    manage.py meso_bench_duplicate --copies 10 --blocks 2 --rows 8
+    manage.py meso_bench_duplicate --plan 123               # a real plan as the template
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+
+from store_project.meso.models import CoachAthlete
+from store_project.meso.models import ExerciseSlot
+from store_project.meso.models import Mesocycle
+from store_project.meso.models import Plan
+from store_project.meso.models import Prescription
+from store_project.meso.models import Session
+from store_project.meso.models import SessionSlot
+from store_project.meso.models import Week
+
+
+def rowwise_duplicate(plan, relationship):
+    """The pre-set-based ``duplicate_for``, verbatim — the benchmark's baseline.
+
+    One ``objects.create`` per block, day, row and week; only sessions and
+    cells were bulk-created, once per block.
+    """
+    copy = Plan.objects.create(
+        relationship=relationship,
+        title=plan.title,
+        goal=plan.goal,
+        status=Plan.Status.DRAFT,
+        unit=plan.unit,
+    )
+    for mesocycle in plan.mesocycles.order_by("order"):
+        meso_copy = Mesocycle.objects.create(
+            plan=copy,
+            name=mesocycle.name,
+            order=mesocycle.order,
+            week_count=mesocycle.week_count,
+        )
+        live_slots = list(
+            mesocycle.session_slots.filter(deleted_at__isnull=True).order_by(
+                "order", "day_number"
+            )
+        )
+        slot_map = {}
+        for slot in live_slots:
+            slot_map[slot.pk] = SessionSlot.objects.create(
+                mesocycle=meso_copy,
+                day_number=slot.day_number,
+                name=slot.name,
+                bias=slot.bias,
+                order=slot.order,
+            )
+        exercise_map = {}
+        live_exercise_slots = list(
+            ExerciseSlot.objects.filter(
+                session_slot__in=live_slots, deleted_at__isnull=True
+            ).order_by("order")
+        )
+        for row in live_exercise_slots:
+            exercise_map[row.pk] = ExerciseSlot.objects.create(
+                session_slot=slot_map[row.session_slot_id],
+                exercise=row.exercise,
+                name=row.name,
+                order=row.order,
+                tags=list(row.tags or []),
+                tempo=row.tempo,
+                rest=row.rest,
+                note=row.note,
+            )
+        live_weeks = list(
+            mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index")
+        )
+        week_map = {}
+        for week in live_weeks:
+            week_map[week.pk] = Week.objects.create(
+                mesocycle=meso_copy,
+                index=week.index,
+                phase=week.phase,
+                volume=week.volume,
+                intensity=week.intensity,
+                is_deload=week.is_deload,
+            )
+        Session.objects.bulk_create(
+            [
+                Session(
+                    week=week_map[session.week_id],
+                    session_slot=slot_map[session.session_slot_id],
+                )
+                for session in Session.objects.filter(
+                    week__in=live_weeks,
+                    session_slot__in=live_slots,
+                    deleted_at__isnull=True,
+                )
+            ]
+        )
+        Prescription.objects.bulk_create(
+            [
+                Prescription(
+                    exercise_slot=exercise_map[cell.exercise_slot_id],
+                    week=week_map[cell.week_id],
+                    line=cell.line,
+                    text=cell.text,
+                    skipped=cell.skipped,
+                )
+                for cell in Prescription.objects.filter(
+                    week__in=live_weeks,
+                    exercise_slot__in=live_exercise_slots,
+                )
+            ]
+        )
+    return copy
+
+
+def build_template(*, blocks, weeks, days, rows, lines, athlete=None):
+    """A throwaway coach/athlete link and a ``blocks``-block template plan.
+
+    Every block has ``weeks`` weeks and ``days`` training days of ``rows``
+    exercise rows; every cell carries ``lines`` lines (the prescription line
+    plus sub-lines). The coach is always new; ``athlete`` reuses an existing
+    user as the link's athlete (``meso_bench_athlete_home`` gives one athlete
+    many coaches this way).
+    """
+    User = get_user_model()
+    stamp = time.time_ns()
+    coach = User.objects.create(username=f"bench-coach-{stamp}")
+    if athlete is None:
+        athlete = User.objects.create(username=f"bench-athlete-{stamp}")
+    link = CoachAthlete.objects.create(
+        coach=coach,
+        athlete=athlete,
+        status=CoachAthlete.Status.ACTIVE,
+        invited_by=CoachAthlete.InvitedBy.COACH,
+    )
+    plan = Plan.objects.create(relationship=link, title="Benchmark template")
+    mesos = Mesocycle.objects.bulk_create(
+        [
+            Mesocycle(plan=plan, name=f"Block {b + 1}", order=b, week_count=weeks)
+            for b in range(blocks)
+        ]
+    )
+    week_rows = Week.objects.bulk_create(
+        [Week(mesocycle=m, index=w + 1) for m in mesos for w in range(weeks)]
+    )
+    slots = SessionSlot.objects.bulk_create(
+        [
+            SessionSlot(mesocycle=m, day_number=d + 1, name=f"Day {d + 1}", order=d)
+            for m in mesos
+            for d in range(days)
+        ]
+    )
+    Session.objects.bulk_create(
+        [
+            Session(week=w, session_slot=s)
+            for w in week_rows
+            for s in slots
+            if s.mesocycle_id == w.mesocycle_id
+        ]
+    )
+    exercise_slots = ExerciseSlot.objects.bulk_create(
+        [
+            ExerciseSlot(session_slot=s, name=f"Lift {r + 1}", order=r, tempo="3010")
+            for s in slots
+            for r in range(rows)
+        ]
+    )
+    slot_block = {s.pk: s.mesocycle_id for s in slots}
+    Prescription.objects.bulk_create(
+        [
+            Prescription(
+                exercise_slot=e,
+                week=w,
+                line=line,
+                text="4 x 6 @ RPE 8" if line == 0 else f"Cue {line}",
+            )
+            for e in exercise_slots
+            for w in week_rows
+            if slot_block[e.session_slot_id] == w.mesocycle_id
+            for line in range(lines)
+        ]
+    )
+    return plan
+
+
+class Command(BaseCommand):
+    help = "Compare the set-based Plan.duplicate_for with the old row-by-row copy."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--plan",
+            type=int,
+            help="Copy this existing plan instead of a synthetic template.",
+        )
+        parser.add_argument("--copies", type=int, default=30)
+        parser.add_argument("--blocks", type=int, default=4)
+        parser.add_argument("--weeks", type=int, default=4)
+        parser.add_argument("--days", type=int, default=4)
+        parser.add_argument("--rows", type=int, default=6)
+        parser.add_argument(
+            "--lines",
+            type=int,
+            default=2,
+            help="Lines per cell (the prescription line plus sub-lines).",
+        )
+
+    def handle(self, *args, **options):
+        copies = options["copies"]
+        if copies < 1:
+            raise CommandError("--copies must be at least 1.")
+        with transaction.atomic():
+            if options["plan"]:
+                plan = Plan.objects.filter(pk=options["plan"]).first()
+                if plan is None:
+                    raise CommandError(f"No plan {options['plan']}.")
+            else:
+                plan = build_template(
+                    blocks=options["blocks"],
+                    weeks=options["weeks"],
+                    days=options["days"],
+                    rows=options["rows"],
+                    lines=options["lines"],
+                )
+            cells = Prescription.objects.filter(
+                week__mesocycle__plan=plan, week__deleted_at__isnull=True
+            ).count()
+            self.stdout.write(
+                f"Template plan {plan.pk}: {plan.mesocycles.count()} block(s), "
+                f"{cells} cell(s); {copies} copies per engine."
+            )
+            results = {}
+            for name, copy in (
+                ("row-by-row", lambda: rowwise_duplicate(plan, plan.relationship)),
+                ("set-based", lambda: plan.duplicate_for(plan.relationship)),
+            ):
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    for _ in range(copies):
+                        copy()
+                    elapsed = time.perf_counter() - started
+                results[name] = elapsed
+                self.stdout.write(
+                    f"  {name:<10}  {len(queries) / copies:8.1f} statements/copy  "
+                    f"{elapsed * 1000 / copies:8.1f} ms/copy  "
+                    f"{elapsed:7.2f} s total"
+                )
+            if results["set-based"]:
+                self.stdout.write(
+                    f"Speed-up: {results['row-by-row'] / results['set-based']:.1f}x"
+                )
+            # Nothing the benchmark made survives it.
+            transaction.set_rollback(True)
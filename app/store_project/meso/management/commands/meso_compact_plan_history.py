@@ -0,0 +1,85 @@
+"""Move inline ``PlanAction`` snapshots into the chunked snapshot store.
+
+Undo/redo rows recorded before chunked storage hold their whole plan snapshot
+inline in ``PlanAction.snapshot``. This rewrites each one as a manifest over
+the plan's deduplicated, compressed ``PlanSnapshotChunk`` rows
+(``history.store_snapshot``) — the same storage every new action already uses
+— and reports how many bytes of snapshot JSON that saved.
+
+Each plan is converted in its own transaction under the plan's row lock (the
+lock every op-log writer takes), so it's safe to run against a live site and
+safe to re-run: already-chunked rows are skipped.
+
+    manage.py meso_compact_plan_history
+    manage.py meso_compact_plan_history --dry-run    # report the count, change nothing
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store_project.meso.history import prune_snapshot_chunks
+from store_project.meso.history import store_snapshot
+from store_project.meso.models import Plan
+from store_project.meso.models import PlanAction
+from store_project.meso.models import PlanSnapshotChunk
+
+
+def _json_size(payload):
+    return len(json.dumps(payload, separators=(",", ":")).encode())
+
+
+class Command(BaseCommand):
+    help = "Convert inline undo/redo snapshots to deduplicated, compressed chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many rows would be converted without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        inline = PlanAction.objects.exclude(snapshot__has_key="chunks")
+        if options["dry_run"]:
+            count = inline.count()
+            self.stdout.write(
+                f"{count} inline snapshot(s) to convert (dry run — no changes)."
+            )
+            return
+
+        plan_ids = list(inline.order_by().values_list("plan_id", flat=True).distinct())
+        converted = before = after = 0
+        for plan_id in plan_ids:
+            with transaction.atomic():
+                plan = Plan.objects.select_for_update().filter(pk=plan_id).first()
+                if plan is None:
+                    continue
+                chunk_ids = set(
+                    PlanSnapshotChunk.objects.filter(plan=plan).values_list(
+                        "pk", flat=True
+                    )
+                )
+                for action in inline.filter(plan=plan):
+                    before += _json_size(action.snapshot)
+                    manifest, chunks = store_snapshot(plan, action.snapshot)
+                    action.snapshot = manifest
+                    action.save(update_fields=["snapshot"])
+                    action.chunks.add(*chunks)
+                    after += _json_size(manifest)
+                    converted += 1
+                prune_snapshot_chunks(plan)
+                for chunk in PlanSnapshotChunk.objects.filter(plan=plan).exclude(
+                    pk__in=chunk_ids
+                ):
+                    after += len(chunk.data)
+
+        saved = before - after
+        percent = (saved / before * 100) if before else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Converted {converted} snapshot(s) across {len(plan_ids)} plan(s): "
+                f"{before:,} → {after:,} bytes ({saved:,} saved, {percent:.0f}%)."
+            )
+        )
@@ -0,0 +1,37 @@
+"""Report the designer grid cache's hit/miss counters (``meso.grid_cache``).
+
+Every ``api_mesocycle_grid`` / designer-page load counts a hit (the cached
+body was current for the plan's ``edit_version``) or a miss (rebuilt). The
+counters live in the shared cache, so any box reads the site-wide numbers.
+
+    manage.py meso_grid_cache_stats
+    manage.py meso_grid_cache_stats --reset    # print, then zero the counters
+"""
+
+from django.core.management.base import BaseCommand
+
+from store_project.meso.grid_cache import grid_cache_stats
+from store_project.meso.grid_cache import reset_grid_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the designer grid cache's hit/miss counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Zero the counters after reporting them.",
+        )
+
+    def handle(self, *args, **options):
+        stats = grid_cache_stats()
+        rate = stats["hit_rate"]
+        rate_text = "n/a" if rate is None else f"{rate:.0%}"
+        self.stdout.write(
+            f"Grid cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+            f"hit rate {rate_text}."
+        )
+        if options["reset"]:
+            reset_grid_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -93,9 +93,10 @@ class Command(BaseCommand):
             # sub-lines behind. Deleting the mesocycles cascades the whole
             # tree; the undo/redo stacks go with it (their plan-wide
             # snapshots reference the deleted pks — replaying one would
-            # resurrect ghost rows).
+            # resurrect ghost rows), and so do the chunks they were stored as.
             plan.mesocycles.all().delete()
             plan.actions.all().delete()
+            plan.snapshot_chunks.all().delete()
 
         for order, (path, block) in enumerate(parsed):
             mesocycle = Mesocycle.objects.create(
@@ -0,0 +1,103 @@
+"""Backfill or verify the materialized per-unit lift bests (``LiftBest``).
+
+A log save folds its own sets into ``LiftBest`` and only rescans a lift whose
+best set it replaced (``one_rm.fold_log_into_lift_bests``); a lift with no row
+yet is rescanned on its first save, so the table fills itself. This command
+fills it up front — every (athlete, unit) with completed logs, one full-history
+scan each — and checks it against a fresh scan.
+
+Verify reports drift the incremental path can't see on its own: a designer row
+renamed after it was logged moves its history to another lift key, and a best
+set whose cell was hard-deleted stops counting. Re-running the backfill repairs
+both.
+
+    manage.py meso_lift_bests                 # rebuild every athlete's rows
+    manage.py meso_lift_bests --athlete 42    # one athlete
+    manage.py meso_lift_bests --verify        # report drift, change nothing
+"""
+
+import math
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store_project.meso import one_rm
+from store_project.meso.models import LiftBest
+from store_project.meso.models import SessionLog
+
+
+def athlete_units(athlete_id=None):
+    """Every (athlete pk, unit) with a completed log or a stored best, sorted."""
+    logs = SessionLog.objects.filter(status=SessionLog.Status.DONE)
+    bests = LiftBest.objects.all()
+    if athlete_id is not None:
+        logs = logs.filter(athlete_id=athlete_id)
+        bests = bests.filter(athlete_id=athlete_id)
+    pairs = set(logs.values_list("athlete_id", "unit"))
+    pairs |= set(bests.values_list("athlete_id", "unit"))
+    return sorted(pairs)
+
+
+def drift(athlete_id, unit):
+    """``{key: (stored, derived)}`` for every lift whose stored best is wrong."""
+    derived = one_rm.derive_one_rm_values(athlete_id, unit=unit)
+    stored = dict(
+        LiftBest.objects.filter(athlete_id=athlete_id, unit=unit).values_list(
+            "key", "value"
+        )
+    )
+    mismatched = {}
+    for key in set(derived) | set(stored):
+        want = derived.get(key)
+        have = stored.get(key)
+        if want is None and have is None:
+            continue
+        if want is None or have is None or not math.isclose(want, have):
+            mismatched[key] = (have, want)
+    return mismatched
+
+
+class Command(BaseCommand):
+    help = "Backfill the materialized lift bests, or verify them against the logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--athlete", type=int, help="Only this athlete (user pk).")
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report lifts whose stored best differs from a fresh scan; "
+            "change nothing.",
+        )
+
+    def handle(self, *args, **options):
+        pairs = athlete_units(options["athlete"])
+        if options["verify"]:
+            self._verify(pairs)
+            return
+        athletes = get_user_model().objects.in_bulk({pk for pk, _unit in pairs})
+        lifts = 0
+        for athlete_id, unit in pairs:
+            with transaction.atomic():
+                lifts += len(one_rm.rebuild_lift_bests(athletes[athlete_id], unit))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt lift bests for {len(pairs)} athlete/unit pair(s) "
+                f"({lifts} lift(s) with a usable set)."
+            )
+        )
+
+    def _verify(self, pairs):
+        drifted = 0
+        for athlete_id, unit in pairs:
+            for key, (stored, derived) in sorted(drift(athlete_id, unit).items()):
+                drifted += 1
+                self.stdout.write(
+                    f"athlete {athlete_id} {unit} {key}: "
+                    f"stored {stored}, derived {derived}"
+                )
+        summary = f"{drifted} drifted lift(s) across {len(pairs)} athlete/unit pair(s)."
+        if drifted:
+            self.stdout.write(self.style.WARNING(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
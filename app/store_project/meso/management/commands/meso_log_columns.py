@@ -0,0 +1,82 @@
+"""Backfill or verify the denormalized ``SessionLog`` plan columns.
+
+``SessionLog.plan`` / ``relationship`` / ``unit`` copy the session's
+week → mesocycle → plan chain so the hot log reads skip that join.
+``SessionLog.save`` fills them on every new log and ``Plan.save`` carries a
+unit/relationship change down; migration 0051 filled the logs written before.
+A bulk ``update`` or a raw write can still leave a row behind — this command
+re-derives every log's columns from the join (two set-based ``UPDATE``s) or,
+with ``--verify``, reports the logs whose columns disagree with it.
+
+    manage.py meso_log_columns              # rewrite every log's columns
+    manage.py meso_log_columns --verify     # report drift, change nothing
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+
+from store_project.meso.models import Plan
+from store_project.meso.models import Session
+from store_project.meso.models import SessionLog
+
+
+def drifted_logs():
+    """Logs whose plan, relationship or unit disagrees with their session's plan."""
+    session_plan = F("session__week__mesocycle__plan")
+    return SessionLog.objects.filter(
+        Q(plan__isnull=True)
+        | ~Q(plan=session_plan)
+        | ~Q(unit=F("session__week__mesocycle__plan__unit"))
+        | ~Q(relationship=F("session__week__mesocycle__plan__relationship"))
+    )
+
+
+def rewrite_columns():
+    """Re-derive every log's columns from the join; returns the rows rewritten."""
+    SessionLog.objects.update(
+        plan_id=Subquery(
+            Session.objects.filter(pk=OuterRef("session_id")).values(
+                "week__mesocycle__plan_id"
+            )[:1]
+        )
+    )
+    plans = Plan.objects.filter(pk=OuterRef("plan_id"))
+    return SessionLog.objects.update(
+        relationship_id=Subquery(plans.values("relationship_id")[:1]),
+        unit=Subquery(plans.values("unit")[:1]),
+    )
+
+
+class Command(BaseCommand):
+    help = "Backfill the denormalized SessionLog plan columns, or verify them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report logs whose columns disagree with their session's plan; "
+            "change nothing.",
+        )
+
+    def handle(self, *args, **options):
+        if options["verify"]:
+            drifted = list(drifted_logs().values_list("pk", flat=True))
+            for pk in drifted:
+                self.stdout.write(f"session log {pk}")
+            summary = f"{len(drifted)} drifted session log(s)."
+            if drifted:
+                self.stdout.write(self.style.WARNING(summary))
+            else:
+                self.stdout.write(self.style.SUCCESS(summary))
+            return
+        with transaction.atomic():
+            rewritten = rewrite_columns()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rewrote the plan columns of {rewritten} session log(s)."
+            )
+        )
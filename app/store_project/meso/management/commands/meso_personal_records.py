@@ -0,0 +1,88 @@
+"""Backfill or verify the PR ledger (``PersonalRecordEntry``).
+
+A log save writes its own records (``personal_records.record_log``), and an
+athlete with a log saved outside the log endpoint is replayed on the next read,
+so the ledger fills itself. This command fills it up front — every (athlete,
+unit) with completed logs, one history replay each, which also rebuilds their
+``LiftBest`` rows — and checks the standing records against a fresh scan.
+
+    manage.py meso_personal_records                 # rebuild every athlete's ledger
+    manage.py meso_personal_records --athlete 42    # one athlete
+    manage.py meso_personal_records --verify        # report drift, change nothing
+"""
+
+import math
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store_project.meso import personal_records as pr
+from store_project.meso.management.commands.meso_lift_bests import athlete_units
+
+
+def drift(athlete, unit):
+    """``{key: (stored, derived)}`` for every lift whose standing record is wrong."""
+    derived = {
+        key: record.e1rm
+        for key, record in pr._best_per_lift(
+            pr._performed_sets(pr._completed_logged_sets(athlete, unit=unit), unit=unit)
+        ).items()
+    }
+    stored = {
+        key: record.e1rm
+        for key, record in pr.personal_records(athlete, unit=unit).items()
+    }
+    mismatched = {}
+    for key in set(derived) | set(stored):
+        want = derived.get(key)
+        have = stored.get(key)
+        if want is None or have is None or not math.isclose(want, have):
+            mismatched[key] = (have, want)
+    return mismatched
+
+
+class Command(BaseCommand):
+    help = "Backfill the personal-record ledger, or verify it against the logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--athlete", type=int, help="Only this athlete (user pk).")
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report lifts whose standing record differs from a fresh scan; "
+            "change nothing.",
+        )
+
+    def handle(self, *args, **options):
+        pairs = athlete_units(options["athlete"])
+        athletes = get_user_model().objects.in_bulk({pk for pk, _unit in pairs})
+        if options["verify"]:
+            self._verify(pairs, athletes)
+            return
+        entries = 0
+        for athlete_id, unit in pairs:
+            with transaction.atomic():
+                entries += len(pr.rebuild_records(athletes[athlete_id], unit))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt the PR ledger for {len(pairs)} athlete/unit pair(s) "
+                f"({entries} record(s))."
+            )
+        )
+
+    def _verify(self, pairs, athletes):
+        drifted = 0
+        for athlete_id, unit in pairs:
+            mismatched = drift(athletes[athlete_id], unit)
+            for key, (stored, derived) in sorted(mismatched.items()):
+                drifted += 1
+                self.stdout.write(
+                    f"athlete {athlete_id} {unit} {key}: "
+                    f"stored {stored}, derived {derived}"
+                )
+        summary = f"{drifted} drifted lift(s) across {len(pairs)} athlete/unit pair(s)."
+        if drifted:
+            self.stdout.write(self.style.WARNING(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
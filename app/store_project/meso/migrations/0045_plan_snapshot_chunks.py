@@ -0,0 +1,77 @@
+# Generated by Django 6.0.6 on 2026-10-17 17:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0044_agent_proposal_batch_mesocycle"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlanSnapshotChunk",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64, verbose_name="Digest")),
+                (
+                    "codec",
+                    models.CharField(
+                        choices=[("raw", "Uncompressed"), ("zlib", "zlib")],
+                        default="zlib",
+                        max_length=8,
+                        verbose_name="Codec",
+                    ),
+                ),
+                ("data", models.BinaryField(verbose_name="Data")),
+                (
+                    "raw_size",
+                    models.PositiveIntegerField(verbose_name="Uncompressed size"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Time created"
+                    ),
+                ),
+                (
+                    "plan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="snapshot_chunks",
+                        to="meso.plan",
+                        verbose_name="Plan",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Plan snapshot chunk",
+                "verbose_name_plural": "Plan snapshot chunks",
+            },
+        ),
+        migrations.AddField(
+            model_name="planaction",
+            name="chunks",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="actions",
+                to="meso.plansnapshotchunk",
+                verbose_name="Snapshot chunks",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="plansnapshotchunk",
+            constraint=models.UniqueConstraint(
+                fields=("plan", "digest"), name="unique_plan_snapshot_chunk"
+            ),
+        ),
+    ]
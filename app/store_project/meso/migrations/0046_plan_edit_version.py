@@ -0,0 +1,19 @@
+# Generated by Django 6.0.6 on 2026-10-17 17:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0045_plan_snapshot_chunks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plan",
+            name="edit_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Edit version"
+            ),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 6.0.6 on 2026-10-17 18:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0047_batch_delivery"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LiftBest",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=300, verbose_name="Lift key")),
+                (
+                    "unit",
+                    models.CharField(
+                        choices=[("kg", "Kilograms"), ("lb", "Pounds")],
+                        max_length=2,
+                        verbose_name="Unit",
+                    ),
+                ),
+                (
+                    "value",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="Best estimated 1RM"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Time last modified"
+                    ),
+                ),
+                (
+                    "athlete",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="meso_lift_bests",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Athlete",
+                    ),
+                ),
+                (
+                    "logged_set",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="meso.loggedset",
+                        verbose_name="Best set",
+                    ),
+                ),
+                (
+                    "session_log",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="meso.sessionlog",
+                        verbose_name="Best set's session log",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Lift best",
+                "verbose_name_plural": "Lift bests",
+                "ordering": ["athlete_id", "key", "unit"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("athlete", "key", "unit"),
+                        name="unique_athlete_lift_best",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.6 on 2026-10-17 18:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meso', '0048_lift_best'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessionlog',
+            name='records_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Time recorded in the PR ledger'),
+        ),
+        migrations.CreateModel(
+            name='PersonalRecordEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=300, verbose_name='Lift key')),
+                ('unit', models.CharField(choices=[('kg', 'Kilograms'), ('lb', 'Pounds')], max_length=2, verbose_name='Unit')),
+                ('name', models.CharField(max_length=200, verbose_name='Lift')),
+                ('value', models.FloatField(verbose_name='Estimated 1RM')),
+                ('previous', models.FloatField(blank=True, null=True, verbose_name='Previous best')),
+                ('reps', models.CharField(blank=True, max_length=32, verbose_name='Reps')),
+                ('load', models.CharField(blank=True, max_length=32, verbose_name='Load')),
+                ('date', models.DateField(blank=True, null=True, verbose_name='Date')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Time created')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meso_personal_records', to=settings.AUTH_USER_MODEL, verbose_name='Athlete')),
+                ('logged_set', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='meso.loggedset', verbose_name='Record set')),
+                ('session_log', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='record_entries', to='meso.sessionlog', verbose_name='Session log')),
+            ],
+            options={
+                'verbose_name': 'Personal record entry',
+                'verbose_name_plural': 'Personal record entries',
+                'ordering': ['athlete_id', 'unit', 'key', 'created_at'],
+                'indexes': [models.Index(fields=['athlete', 'unit', 'key'], name='meso_pr_entry_lift_idx')],
+            },
+        ),
+    ]
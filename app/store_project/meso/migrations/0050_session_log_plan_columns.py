@@ -0,0 +1,43 @@
+# Generated by Django 6.0.6 on 2026-10-17 19:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meso', '0049_personal_record_entry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessionlog',
+            name='plan',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='session_logs', to='meso.plan', verbose_name='Plan'),
+        ),
+        migrations.AddField(
+            model_name='sessionlog',
+            name='relationship',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='session_logs', to='meso.coachathlete', verbose_name='Relationship'),
+        ),
+        migrations.AddField(
+            model_name='sessionlog',
+            name='unit',
+            field=models.CharField(blank=True, choices=[('kg', 'Kilograms'), ('lb', 'Pounds')], editable=False, max_length=2, verbose_name='Unit'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionlog',
+            index=models.Index(fields=['athlete', 'status', '-created_at'], name='meso_log_athlete_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionlog',
+            index=models.Index(fields=['relationship', 'status', '-created_at'], name='meso_log_link_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionlog',
+            index=models.Index(fields=['athlete', 'unit', 'status'], name='meso_log_athlete_unit_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+"""Backfill ``SessionLog.plan`` / ``relationship`` / ``unit`` on existing logs.
+
+``SessionLog.save`` fills the denormalized columns on every write from here on;
+this one-off pass fills them on the logs written before, so the hot log reads
+that now filter on them see the whole history from the first deploy. Two
+set-based ``UPDATE``s (no per-row Python), each only touching rows still
+unfilled — a re-run is a no-op. ``manage.py meso_log_columns`` repeats it and
+verifies the columns against the join.
+
+The subqueries are inlined (not imported from app code) so this historical
+migration stays decoupled from the live model's helpers.
+"""
+
+from django.db import migrations
+from django.db.models import OuterRef
+from django.db.models import Subquery
+
+
+def backfill(apps, schema_editor):
+    SessionLog = apps.get_model("meso", "SessionLog")
+    Session = apps.get_model("meso", "Session")
+    Plan = apps.get_model("meso", "Plan")
+
+    SessionLog.objects.filter(plan__isnull=True).update(
+        plan_id=Subquery(
+            Session.objects.filter(pk=OuterRef("session_id")).values(
+                "week__mesocycle__plan_id"
+            )[:1]
+        )
+    )
+    plans = Plan.objects.filter(pk=OuterRef("plan_id"))
+    SessionLog.objects.filter(unit="").update(
+        relationship_id=Subquery(plans.values("relationship_id")[:1]),
+        unit=Subquery(plans.values("unit")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0050_session_log_plan_columns"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-17 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meso', '0051_backfill_session_log_plan_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessionlog',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Time last modified'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+"""The agent queue's bookkeeping on ``AgentProposalBatch``.
+
+``started_at`` doubles as the queue's claim (``agent.jobs`` only picks up a
+drafting batch whose ``started_at`` is null), so every existing row is stamped
+as started at creation: a batch left ``drafting`` by the old dispatch path is
+not something the new queue should suddenly run.
+"""
+
+from django.db import migrations
+from django.db import models
+from django.db.models import F
+
+
+def stamp_started(apps, schema_editor):
+    AgentProposalBatch = apps.get_model("meso", "AgentProposalBatch")
+    AgentProposalBatch.objects.filter(started_at__isnull=True).update(
+        started_at=F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0052_session_log_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agentproposalbatch",
+            name="queue_depth",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="Queue depth"
+            ),
+        ),
+        migrations.AddField(
+            model_name="agentproposalbatch",
+            name="queue_wait_ms",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="Queue wait (ms)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="agentproposalbatch",
+            name="started_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Time started"
+            ),
+        ),
+        migrations.RunPython(stamp_started, migrations.RunPython.noop),
+    ]
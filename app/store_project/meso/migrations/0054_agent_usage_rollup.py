@@ -0,0 +1,132 @@
+# Generated by Django 6.0.6 on 2026-10-17 20:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meso", "0053_agent_proposal_queue"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AgentUsageRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField(verbose_name="Month")),
+                (
+                    "model",
+                    models.CharField(blank=True, max_length=64, verbose_name="Model"),
+                ),
+                (
+                    "trigger",
+                    models.CharField(
+                        choices=[
+                            ("manual", "Manual"),
+                            ("draft", "Draft with AI"),
+                            ("eval", "Eval"),
+                        ],
+                        max_length=16,
+                        verbose_name="Trigger",
+                    ),
+                ),
+                ("tier", models.CharField(max_length=16, verbose_name="Billing tier")),
+                ("runs", models.PositiveIntegerField(default=0, verbose_name="Runs")),
+                (
+                    "input_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Input tokens"
+                    ),
+                ),
+                (
+                    "output_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Output tokens"
+                    ),
+                ),
+                (
+                    "cache_creation_input_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Cache-write input tokens"
+                    ),
+                ),
+                (
+                    "cache_read_input_tokens",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Cache-read input tokens"
+                    ),
+                ),
+                (
+                    "cost",
+                    models.DecimalField(
+                        decimal_places=6,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Estimated cost (USD)",
+                    ),
+                ),
+                (
+                    "unknown_cost_runs",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Unpriced runs"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Agent usage rollup",
+                "verbose_name_plural": "Agent usage rollups",
+                "ordering": ["-month"],
+            },
+        ),
+        migrations.AddField(
+            model_name="agentproposalbatch",
+            name="usage_rolled_up",
+            field=models.BooleanField(default=False, verbose_name="Usage rolled up"),
+        ),
+        migrations.AddIndex(
+            model_name="agentproposalbatch",
+            index=models.Index(
+                condition=models.Q(("usage_rolled_up", False)),
+                fields=["created_at"],
+                name="agent_batch_unrolled_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="agentusagerollup",
+            name="athlete",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Athlete",
+            ),
+        ),
+        migrations.AddField(
+            model_name="agentusagerollup",
+            name="coach",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Coach",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="agentusagerollup",
+            constraint=models.UniqueConstraint(
+                fields=("month", "coach", "athlete", "model", "trigger", "tier"),
+                name="unique_agent_usage_rollup",
+            ),
+        ),
+    ]
@@ -369,6 +369,16 @@ class CoachAthlete(models.Model):
     def __str__(self):
         return f"{self.coach.display_name()} → {self.athlete.display_name()} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        from .home_cache import bump
+
+        super().save(*args, **kwargs)
+        # A new, accepted, declined or ended link changes the athlete's home
+        # (their cards and pending-links panel) — invalidate its cache — and
+        # the coach's tour config (``etags``), which reads their self link.
+        bump(self.athlete_id)
+        bump(self.coach_id)
+
     # -- state machine ----------------------------------------------------
 
     @classmethod
@@ -1213,6 +1223,12 @@ class Plan(models.Model):
     )
     created = models.DateTimeField(_("Time created"), auto_now_add=True)
     modified = models.DateTimeField(_("Time last modified"), auto_now=True)
+    # Monotonic counter bumped by every designer write (``touch``). The cached
+    # grid payload (``grid_cache``) is valid only for the version it was built
+    # at, so a bump is all it takes to invalidate every block of the plan.
+    edit_version = models.PositiveIntegerField(
+        _("Edit version"), default=0, editable=False
+    )
 
     objects = PlanQuerySet.as_manager()
 
@@ -1239,6 +1255,86 @@ class Plan(models.Model):
             return f"{self.title} (template)" if self.is_template else self.title
         return f"{self.title} ({athlete.display_name()})"
 
+    def save(self, *args, **kwargs):
+        from .home_cache import bump_on_commit
+
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # Any write to an athlete's plan — every designer edit and delivery
+        # ends in ``touch`` — can change their home; invalidate its cache once
+        # the write commits. The coach's generation keys their tour config
+        # (``etags``), which reads whether they have a plan and whether they've
+        # delivered one.
+        bump_on_commit(*self._home_cache_ids())
+        update_fields = kwargs.get("update_fields")
+        if adding or (
+            update_fields is not None
+            and not {"unit", "relationship"} & set(update_fields)
+        ):
+            return
+        # Keep the plan's logs' denormalized copies (``SessionLog.plan`` et al.)
+        # in step — a no-op update unless the unit or relationship changed.
+        regraded = set()
+        if update_fields is None or "unit" in update_fields:
+            regraded = set(
+                self.session_logs.exclude(unit=self.unit)
+                .order_by()
+                .values_list("athlete_id", "unit")
+                .distinct()
+            )
+        self.session_logs.exclude(
+            unit=self.unit, relationship_id=self.relationship_id
+        ).update(unit=self.unit, relationship_id=self.relationship_id)
+        if regraded:
+            self._rebuild_records(regraded)
+
+    def _home_cache_ids(self):
+        """The users whose cached home/ETags a write to this plan invalidates.
+
+        The athlete and coach of a relationship plan — off an already-loaded
+        ``relationship``, else one ``values_list`` read — or a template's owner.
+        """
+        if self.relationship_id is None:
+            return (self.owner_id,)
+        if Plan.relationship.is_cached(self):
+            return (self.relationship.athlete_id, self.relationship.coach_id)
+        return (
+            CoachAthlete.objects.filter(pk=self.relationship_id)
+            .values_list("athlete_id", "coach_id")
+            .first()
+            or ()
+        )
+
+    def _rebuild_records(self, regraded):
+        """Replay the records of the logs a unit change just moved.
+
+        ``LiftBest`` and ``PersonalRecordEntry`` are keyed by unit, and the
+        moved logs' rows still sit under the unit they were logged in — and the
+        catch-up won't revisit them (their ``records_at`` is set). ``regraded``
+        is the ``(athlete_id, old unit)`` pairs moved; each athlete's old unit
+        and the plan's new one are rebuilt from their logs.
+        """
+        from django.contrib.auth import get_user_model
+
+        from .personal_records import rebuild_records
+
+        athletes = get_user_model().objects.in_bulk({pk for pk, _ in regraded})
+        units = regraded | {(pk, self.unit) for pk, _ in regraded}
+        for athlete_id, unit in sorted(units):
+            rebuild_records(athletes[athlete_id], unit)
+
+    def touch(self):
+        """Record a write to the plan's contents.
+
+        Stamps ``modified`` (so the plan reads as the coach's working plan) and
+        bumps ``edit_version`` atomically in the database — an ``F()`` increment,
+        so two writers racing outside the plan lock can't both claim the same
+        version — then reloads the new value onto this instance.
+        """
+        self.edit_version = models.F("edit_version") + 1
+        self.save(update_fields=["modified", "edit_version"])
+        self.refresh_from_db(fields=["edit_version"])
+
     @property
     def coach(self):
         """The coach who owns this plan.
@@ -1313,6 +1409,15 @@ class Plan(models.Model):
         every cell's whole line stack — text, ``skipped``, sub-lines — comes
         across verbatim. ``delivered_at`` resets — the copy is undelivered
         until a deliver stamps it. Returns the new ``Plan``.
+
+        Set-based: each level of the tree (blocks, days, rows, weeks,
+        sessions, cells) is read in one query across every block and written
+        in one ``bulk_create``, whose returned pks remap the next level's
+        foreign keys. A copy is a fixed number of statements however many
+        blocks, weeks and rows the plan has (``bulk_create`` only splits a
+        level past the backend's parameter limit) — ``plan_batch_deliver``
+        runs it once per picked client in a single request.
+        ``manage.py meso_bench_duplicate`` measures it.
         """
         copy = Plan.objects.create(
             relationship=relationship,
@@ -1321,88 +1426,116 @@ class Plan(models.Model):
             status=status or Plan.Status.DRAFT,
             unit=self.unit,
         )
-        for mesocycle in self.mesocycles.order_by("order"):
-            meso_copy = Mesocycle.objects.create(
+        meso_map = _bulk_clone(
+            Mesocycle,
+            self.mesocycles.order_by("order"),
+            lambda mesocycle: Mesocycle(
                 plan=copy,
                 name=mesocycle.name,
                 order=mesocycle.order,
                 week_count=mesocycle.week_count,
-            )
-            live_slots = list(
-                mesocycle.session_slots.filter(deleted_at__isnull=True).order_by(
-                    "order", "day_number"
-                )
-            )
-            slot_map = {}
-            for slot in live_slots:
-                slot_map[slot.pk] = SessionSlot.objects.create(
-                    mesocycle=meso_copy,
-                    day_number=slot.day_number,
-                    name=slot.name,
-                    bias=slot.bias,
-                    order=slot.order,
-                )
-            exercise_map = {}
-            live_exercise_slots = list(
-                ExerciseSlot.objects.filter(
-                    session_slot__in=live_slots, deleted_at__isnull=True
-                ).order_by("order")
-            )
-            for row in live_exercise_slots:
-                exercise_map[row.pk] = ExerciseSlot.objects.create(
-                    session_slot=slot_map[row.session_slot_id],
-                    exercise=row.exercise,
-                    name=row.name,
-                    order=row.order,
-                    tags=list(row.tags or []),
-                    tempo=row.tempo,
-                    rest=row.rest,
-                    note=row.note,
+            ),
+        )
+        slot_map = _bulk_clone(
+            SessionSlot,
+            SessionSlot.objects.filter(
+                mesocycle__plan=self, deleted_at__isnull=True
+            ).order_by("mesocycle__order", "order", "day_number"),
+            lambda slot: SessionSlot(
+                mesocycle=meso_map[slot.mesocycle_id],
+                day_number=slot.day_number,
+                name=slot.name,
+                bias=slot.bias,
+                order=slot.order,
+            ),
+        )
+        exercise_map = _bulk_clone(
+            ExerciseSlot,
+            ExerciseSlot.objects.filter(
+                session_slot__mesocycle__plan=self,
+                session_slot__deleted_at__isnull=True,
+                deleted_at__isnull=True,
+            ).order_by("session_slot__mesocycle__order", "order"),
+            lambda row: ExerciseSlot(
+                session_slot=slot_map[row.session_slot_id],
+                exercise_id=row.exercise_id,
+                name=row.name,
+                order=row.order,
+                tags=list(row.tags or []),
+                tempo=row.tempo,
+                rest=row.rest,
+                note=row.note,
+            ),
+        )
+        week_map = _bulk_clone(
+            Week,
+            Week.objects.filter(mesocycle__plan=self, deleted_at__isnull=True).order_by(
+                "mesocycle__order", "index"
+            ),
+            lambda week: Week(
+                mesocycle=meso_map[week.mesocycle_id],
+                index=week.index,
+                phase=week.phase,
+                volume=week.volume,
+                intensity=week.intensity,
+                is_deload=week.is_deload,
+            ),
+        )
+        Session.objects.bulk_create(
+            [
+                Session(
+                    week=week_map[week_id],
+                    session_slot=slot_map[session_slot_id],
                 )
-            live_weeks = list(
-                mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index")
-            )
-            week_map = {}
-            for week in live_weeks:
-                week_map[week.pk] = Week.objects.create(
-                    mesocycle=meso_copy,
-                    index=week.index,
-                    phase=week.phase,
-                    volume=week.volume,
-                    intensity=week.intensity,
-                    is_deload=week.is_deload,
+                for week_id, session_slot_id in Session.objects.filter(
+                    week__mesocycle__plan=self,
+                    week__deleted_at__isnull=True,
+                    session_slot__deleted_at__isnull=True,
+                    deleted_at__isnull=True,
+                    session_slot__mesocycle=models.F("week__mesocycle"),
+                ).values_list("week_id", "session_slot_id")
+            ]
+        )
+        Prescription.objects.bulk_create(
+            [
+                Prescription(
+                    exercise_slot=exercise_map[exercise_slot_id],
+                    week=week_map[week_id],
+                    line=line,
+                    text=text,
+                    skipped=skipped,
                 )
-            Session.objects.bulk_create(
-                [
-                    Session(
-                        week=week_map[session.week_id],
-                        session_slot=slot_map[session.session_slot_id],
-                    )
-                    for session in Session.objects.filter(
-                        week__in=live_weeks,
-                        session_slot__in=live_slots,
-                        deleted_at__isnull=True,
+                for exercise_slot_id, week_id, line, text, skipped in (
+                    Prescription.objects.filter(
+                        week__mesocycle__plan=self,
+                        week__deleted_at__isnull=True,
+                        exercise_slot__deleted_at__isnull=True,
+                        exercise_slot__session_slot__deleted_at__isnull=True,
+                        # A cell joins a row and a week of the SAME block.
+                        exercise_slot__session_slot__mesocycle=models.F(
+                            "week__mesocycle"
+                        ),
+                    ).values_list(
+                        "exercise_slot_id", "week_id", "line", "text", "skipped"
                     )
-                ]
-            )
-            Prescription.objects.bulk_create(
-                [
-                    Prescription(
-                        exercise_slot=exercise_map[cell.exercise_slot_id],
-                        week=week_map[cell.week_id],
-                        line=cell.line,
-                        text=cell.text,
-                        skipped=cell.skipped,
-                    )
-                    for cell in Prescription.objects.filter(
-                        week__in=live_weeks,
-                        exercise_slot__in=live_exercise_slots,
-                    )
-                ]
-            )
+                )
+            ]
+        )
         return copy
 
 
+def _bulk_clone(model, originals, build):
+    """``bulk_create`` ``build(row)`` for each of ``originals``; map old pk → copy.
+
+    ``bulk_create`` hands back the new rows, pks set (``RETURNING`` on Postgres
+    and SQLite), in input order — so zipping them with the originals is the
+    old → new id map the next level of a tree copy remaps its FKs through.
+    """
+    originals = list(originals)
+    copies = model.objects.bulk_create([build(row) for row in originals])
+    return {row.pk: clone for row, clone in zip(originals, copies, strict=True)}
+
+
 class Mesocycle(models.Model):
     """A training block within a plan — one bar in the macrocycle rail."""
 
@@ -1945,21 +2078,92 @@ class SessionLog(models.Model):
         related_name="meso_session_logs",
         verbose_name=_("Athlete"),
     )
+    # Denormalized off ``session`` → week → mesocycle → plan, a chain that never
+    # changes for a log: the hot log reads (cadence, the activity feed, "last
+    # time", the 1RM/PR scans) filter on these instead of that four-table join.
+    # ``save`` fills them; ``Plan.save`` carries a unit/relationship change down;
+    # ``manage.py meso_log_columns`` backfills and verifies them.
+    plan = models.ForeignKey(
+        Plan,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="session_logs",
+        verbose_name=_("Plan"),
+    )
+    relationship = models.ForeignKey(
+        CoachAthlete,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="session_logs",
+        verbose_name=_("Relationship"),
+    )
+    unit = models.CharField(
+        _("Unit"), max_length=2, choices=Unit, blank=True, editable=False
+    )
     date = models.DateField(_("Date"), null=True, blank=True)
     status = models.CharField(
         _("Status"), max_length=16, choices=Status, default=Status.PENDING
     )
     notes = models.TextField(_("Notes"), blank=True)
+    # When this log was last written into the PR ledger
+    # (``PersonalRecordEntry``). Null for a log saved outside the log
+    # endpoint, which ``personal_records`` catches up on its next read.
+    records_at = models.DateTimeField(
+        _("Time recorded in the PR ledger"), null=True, blank=True
+    )
     created_at = models.DateTimeField(_("Time created"), auto_now_add=True)
+    # Stamped by every save — the log endpoint saves the log before replacing
+    # its sets, so this versions the scored results (``results_cache``).
+    updated_at = models.DateTimeField(_("Time last modified"), auto_now=True)
+
+    # The columns ``fill_plan_columns`` writes.
+    PLAN_COLUMNS = ("plan", "relationship", "unit")
 
     class Meta:
         ordering = ["-date", "-created_at"]
         verbose_name = "Session log"
         verbose_name_plural = "Session logs"
+        indexes = [
+            # An athlete's newest done log (the profile, the tour, 1RM/PR scans).
+            models.Index(
+                fields=["athlete", "status", "-created_at"],
+                name="meso_log_athlete_recent_idx",
+            ),
+            # A link's newest done log — roster cadence and the activity feed.
+            models.Index(
+                fields=["relationship", "status", "-created_at"],
+                name="meso_log_link_recent_idx",
+            ),
+            # The unit-scoped 1RM / personal-record scans.
+            models.Index(
+                fields=["athlete", "unit", "status"], name="meso_log_athlete_unit_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.athlete.display_name()} · {self.session}"
 
+    def save(self, *args, **kwargs):
+        # The plan columns are derived, never hand-set: fill them on the first
+        # write (and on any write of a row that predates them).
+        if self.plan_id is None and self.session_id is not None:
+            self.fill_plan_columns()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *self.PLAN_COLUMNS}
+        super().save(*args, **kwargs)
+
+    def fill_plan_columns(self):
+        """Copy the session's plan, relationship and unit onto the log."""
+        plan = self.session.week.mesocycle.plan
+        self.plan = plan
+        self.relationship_id = plan.relationship_id
+        self.unit = plan.unit
+
 
 # ---------------------------------------------------------------------------
 # Delivery / lightweight versioning (Phase 4; reframed by 2d)
@@ -1995,6 +2199,125 @@ class WeekDelivery(models.Model):
         return f"{self.week} · delivered {self.delivered_at:%Y-%m-%d}"
 
 
+class BatchDelivery(models.Model):
+    """One batch-deliver run: a plan fanned out as independent copies (2c).
+
+    ``plan_batch_deliver`` validates the coach's pick and records it here, then
+    hands the fan-out to the django-q cluster (``meso.delivery``) — copying,
+    stamping, snapshotting and notifying a whole roster inside the request
+    outran the gunicorn timeout. Each picked client is a
+    ``BatchDeliveryTarget``; the deliver screen polls
+    ``api_batch_delivery_status`` for per-client progress.
+    """
+
+    class Status(models.TextChoices):
+        # QUEUED until a worker picks the job up, RUNNING while it works through
+        # the targets, then DONE (every target resolved, delivered or failed)
+        # or FAILED (the job could not be queued or crashed outright).
+        QUEUED = "queued", _("Queued")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    plan = models.ForeignKey(
+        Plan,
+        on_delete=models.CASCADE,
+        related_name="batch_deliveries",
+        verbose_name=_("Plan"),
+    )
+    coach = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="meso_batch_deliveries",
+        verbose_name=_("Coach"),
+    )
+    # The block the coach was viewing on the source plan's deliver screen,
+    # frozen at request time: the job maps it onto each copy by ``order``
+    # (``delivery.target_week_for_batch_copy``). Null = no opinion — each copy
+    # falls back to its own earliest live block.
+    source_block = models.ForeignKey(
+        "Mesocycle",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("Source block"),
+    )
+    # The request's scheme + host, so the worker (which has no request) can
+    # build the absolute links in the delivery email and push.
+    base_url = models.CharField(_("Base URL"), max_length=255)
+    status = models.CharField(
+        _("Status"), max_length=16, choices=Status, default=Status.QUEUED
+    )
+    # Why the job as a whole failed; per-client failures live on the targets.
+    error = models.TextField(_("Error"), blank=True)
+    created_at = models.DateTimeField(_("Time created"), auto_now_add=True)
+    finished_at = models.DateTimeField(_("Time finished"), null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Batch delivery"
+        verbose_name_plural = "Batch deliveries"
+
+    def __str__(self):
+        return f"Batch delivery of {self.plan.title} ({self.status})"
+
+
+class BatchDeliveryTarget(models.Model):
+    """One picked client of a ``BatchDelivery`` and how their copy went.
+
+    Each target is delivered in its own transaction: a failure rolls back that
+    client's copy only, records the reason here, and the job moves on.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        DELIVERED = "delivered", _("Delivered")
+        FAILED = "failed", _("Failed")
+
+    batch = models.ForeignKey(
+        BatchDelivery,
+        on_delete=models.CASCADE,
+        related_name="targets",
+        verbose_name=_("Batch delivery"),
+    )
+    relationship = models.ForeignKey(
+        CoachAthlete,
+        on_delete=models.CASCADE,
+        related_name="batch_delivery_targets",
+        verbose_name=_("Relationship"),
+    )
+    # The copy this target received — null until delivered (and after a
+    # failure, whose copy was rolled back).
+    copy = models.ForeignKey(
+        Plan,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("Delivered copy"),
+    )
+    status = models.CharField(
+        _("Status"), max_length=16, choices=Status, default=Status.PENDING
+    )
+    error = models.TextField(_("Error"), blank=True)
+    finished_at = models.DateTimeField(_("Time finished"), null=True, blank=True)
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = "Batch delivery target"
+        verbose_name_plural = "Batch delivery targets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["batch", "relationship"],
+                name="unique_batch_delivery_target",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.batch} → {self.relationship} ({self.status})"
+
+
 # ---------------------------------------------------------------------------
 # Agent proposals (Phase 1 of the agent slice — B6)
 #
@@ -2098,6 +2421,15 @@ class AgentProposalBatch(models.Model):
     stop_reason = models.CharField(_("Stop reason"), max_length=32, blank=True)
     # Wall-clock latency of the Claude call (null until measured / on early failure).
     duration_ms = models.PositiveIntegerField(_("Duration (ms)"), null=True, blank=True)
+    # The agent queue (``agent.jobs``): how many other runs were drafting when
+    # this one was queued, when a worker picked it up (also its claim — a worker
+    # only takes a batch whose ``started_at`` is still null), and how long it
+    # waited for that worker. Null for runs that never went through the queue.
+    queue_depth = models.PositiveIntegerField(_("Queue depth"), null=True, blank=True)
+    started_at = models.DateTimeField(_("Time started"), null=True, blank=True)
+    queue_wait_ms = models.PositiveIntegerField(
+        _("Queue wait (ms)"), null=True, blank=True
+    )
     # tokens × per-model rate, computed at write time so a later price change can't
     # rewrite history. An internal *estimate* — the Anthropic invoice is the truth.
     # Null when the model isn't in the rate table (don't guess; the report flags it).
@@ -2117,11 +2449,23 @@ class AgentProposalBatch(models.Model):
     billing_status = models.CharField(
         _("Billing status at run time"), max_length=16, blank=True
     )
+    # Whether this run's usage is counted in ``AgentUsageRollup`` — set, exactly
+    # once, by whoever adds it there (``billing.usage_rollup``).
+    usage_rolled_up = models.BooleanField(_("Usage rolled up"), default=False)
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Agent proposal batch"
         verbose_name_plural = "Agent proposal batches"
+        indexes = [
+            # The rollup catch-up's scan (``billing.usage_rollup.catch_up``):
+            # only the runs not yet counted, which is almost none of them.
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(usage_rolled_up=False),
+                name="agent_batch_unrolled_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Proposal for {self.plan.title} ({self.changes.count()} changes)"
@@ -2200,6 +2544,68 @@ class ProposedChange(models.Model):
         return self.title
 
 
+class AgentUsageRollup(models.Model):
+    """One month of agent usage for one (coach, athlete, model, trigger, tier).
+
+    The pre-aggregated read side of the ``AgentProposalBatch`` usage ledger: the
+    usage report (``billing.agent_usage_report.build_report``) sums these rows
+    instead of walking every run in the month. A run is added when it resolves
+    (``billing.usage_rollup.record``), and ``manage.py meso_agent_usage_rollup``
+    rebuilds the table from the ledger. ``month`` is the first day of the local
+    calendar month the run was created in; ``tier`` is the COGS-vs-CAC bucket
+    of the run's snapshotted billing status (``agent_usage_report.cost_bucket``).
+    Eval runs are rolled up too — the report counts, then excludes, them.
+    """
+
+    month = models.DateField(_("Month"))
+    coach = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Coach"),
+    )
+    athlete = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Athlete"),
+    )
+    model = models.CharField(_("Model"), max_length=64, blank=True)
+    trigger = models.CharField(
+        _("Trigger"), max_length=16, choices=AgentProposalBatch.Trigger.choices
+    )
+    tier = models.CharField(_("Billing tier"), max_length=16)
+    runs = models.PositiveIntegerField(_("Runs"), default=0)
+    input_tokens = models.PositiveBigIntegerField(_("Input tokens"), default=0)
+    output_tokens = models.PositiveBigIntegerField(_("Output tokens"), default=0)
+    cache_creation_input_tokens = models.PositiveBigIntegerField(
+        _("Cache-write input tokens"), default=0
+    )
+    cache_read_input_tokens = models.PositiveBigIntegerField(
+        _("Cache-read input tokens"), default=0
+    )
+    # The priced runs' summed estimate; an unpriced run (unknown model) is
+    # counted in ``unknown_cost_runs`` instead, as ``Totals`` does.
+    cost = models.DecimalField(
+        _("Estimated cost (USD)"), max_digits=14, decimal_places=6, default=0
+    )
+    unknown_cost_runs = models.PositiveIntegerField(_("Unpriced runs"), default=0)
+
+    class Meta:
+        ordering = ["-month"]
+        verbose_name = "Agent usage rollup"
+        verbose_name_plural = "Agent usage rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["month", "coach", "athlete", "model", "trigger", "tier"],
+                name="unique_agent_usage_rollup",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} · {self.coach_id} → {self.athlete_id}"
+
+
 class LoggedSet(models.Model):
     """A single set the athlete logged against a prescription."""
 
@@ -2362,13 +2768,147 @@ class AthleteOneRm(models.Model):
         super().save(*args, **kwargs)
 
 
+class LiftBest(models.Model):
+    """The athlete's best logged Epley estimate for one lift, in one unit.
+
+    A materialized ``one_rm.derive_one_rm_values``: deriving scanned every
+    completed set the athlete ever logged on each log save, so a veteran's
+    save grew with years of history. A log save now folds its own sets into
+    these rows (``one_rm.refresh_one_rms``) and only rescans a lift whose
+    current best set was edited, removed, or downgraded to a draft.
+
+    Unlike ``AthleteOneRm`` (one row per lift, last-unit-wins, may be the
+    athlete's manual number) this is keyed per unit and always log-derived —
+    it's the basis ``AthleteOneRm``'s logged value is written from. ``value`` is
+    null when the lift has sets in this unit but none usable (free-text loads).
+    ``logged_set`` / ``session_log`` point at the set the value came from; both
+    go null when that set or its log is deleted, which marks the row for a
+    rescan. ``manage.py meso_lift_bests`` backfills and verifies the table.
+    """
+
+    athlete = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="meso_lift_bests",
+        verbose_name=_("Athlete"),
+    )
+    # ``one_rm.key_str`` identity — the same key ``AthleteOneRm`` carries.
+    key = models.CharField(_("Lift key"), max_length=300)
+    unit = models.CharField(_("Unit"), max_length=2, choices=Unit)
+    value = models.FloatField(_("Best estimated 1RM"), null=True, blank=True)
+    logged_set = models.ForeignKey(
+        LoggedSet,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("Best set"),
+    )
+    session_log = models.ForeignKey(
+        SessionLog,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("Best set's session log"),
+    )
+    updated_at = models.DateTimeField(_("Time last modified"), auto_now=True)
+
+    class Meta:
+        ordering = ["athlete_id", "key", "unit"]
+        verbose_name = "Lift best"
+        verbose_name_plural = "Lift bests"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["athlete", "key", "unit"], name="unique_athlete_lift_best"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete.display_name()} · {self.key} ({self.unit}): {self.value}"
+
+    @property
+    def is_stale(self):
+        """Whether the set behind ``value`` is gone and the lift needs a rescan."""
+        return self.value is not None and (
+            self.logged_set_id is None or self.session_log_id is None
+        )
+
+
+class PersonalRecordEntry(models.Model):
+    """One personal record as it was set: a session's lift beat the prior best.
+
+    The PR ledger. ``personal_records.new_records_in`` used to rescan the
+    athlete's whole completed history every time a session's results were
+    shown; a log save now writes a row here for each lift whose best set beat
+    the athlete's best over every earlier session (``personal_records.record_log``)
+    and detection is a lookup by ``session_log``. The rows are history — a
+    record later beaten keeps its row, so a session still shows the PR it set —
+    while the *standing* best per lift is ``LiftBest``'s.
+
+    ``previous`` is the best it beat (null for a first-ever usable set of the
+    lift); ``reps`` / ``load`` / ``date`` / ``name`` are copied off the set so
+    the row reads on its own. Re-saving a session replaces its rows. A log
+    written outside the log endpoint (seeders, the admin, rows older than the
+    ledger) has no ``SessionLog.records_at`` and is caught up on the next read;
+    ``manage.py meso_personal_records`` rebuilds and verifies the table.
+    """
+
+    athlete = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="meso_personal_records",
+        verbose_name=_("Athlete"),
+    )
+    # ``one_rm.key_str`` identity — the same key ``LiftBest`` carries.
+    key = models.CharField(_("Lift key"), max_length=300)
+    unit = models.CharField(_("Unit"), max_length=2, choices=Unit)
+    name = models.CharField(_("Lift"), max_length=200)
+    value = models.FloatField(_("Estimated 1RM"))
+    previous = models.FloatField(_("Previous best"), null=True, blank=True)
+    reps = models.CharField(_("Reps"), max_length=32, blank=True)
+    load = models.CharField(_("Load"), max_length=32, blank=True)
+    date = models.DateField(_("Date"), null=True, blank=True)
+    logged_set = models.ForeignKey(
+        LoggedSet,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("Record set"),
+    )
+    session_log = models.ForeignKey(
+        SessionLog,
+        on_delete=models.CASCADE,
+        related_name="record_entries",
+        verbose_name=_("Session log"),
+    )
+    created_at = models.DateTimeField(_("Time created"), auto_now_add=True)
+
+    class Meta:
+        ordering = ["athlete_id", "unit", "key", "created_at"]
+        verbose_name = "Personal record entry"
+        verbose_name_plural = "Personal record entries"
+        indexes = [
+            models.Index(
+                fields=["athlete", "unit", "key"], name="meso_pr_entry_lift_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.athlete.display_name()} · {self.name}: {self.value} ({self.unit})"
+        )
+
+
 # ---------------------------------------------------------------------------
 # Undo/redo op-log (designer framework Phase 1)
 #
 # The designer needs plan-wide undo/redo, built on Phase 0's soft delete: every
 # mutating designer endpoint records ONE ``PlanAction`` on the undo stack — a
-# short human ``label`` plus a plan-wide ``snapshot`` of the editable state
-# taken just BEFORE the mutation (``history.serialize_plan_snapshot``). Undo
+# short human ``label`` plus a ``snapshot`` of the editable state taken just
+# BEFORE the mutation (``history.serialize_plan_snapshot``) — plan-wide, or a
+# delta over just the rows a hot cell/row/day write touches. Undo
 # pops the max-seq undo row, restores its snapshot, and pushes the mirror-image
 # redo row (same seq+label, snapshot = the state just left); redo is the exact
 # mirror. See ``history.py`` (the snapshot serializer/restorer + the
@@ -2387,7 +2927,8 @@ class PlanAction(models.Model):
     ``ExerciseSlot``/``Session``/``Prescription`` row
     belonging to the plan, including soft-deleted ones, so an undo can
     resurrect a delete or retract an add without ever hard-deleting or
-    recreating a row.
+    recreating a row — unless it carries a ``scope`` key, in which case it is
+    a delta holding only the rows of that region (``history.delta_scope``).
     """
 
     class Stack(models.TextChoices):
@@ -2405,7 +2946,17 @@ class PlanAction(models.Model):
     )
     seq = models.PositiveIntegerField(_("Sequence"))
     label = models.CharField(_("Label"), max_length=80)
+    # Either the snapshot itself (legacy rows) or a manifest of the
+    # content-addressed chunks it is stored as (``{"chunks": [<digest>, ...]}``
+    # plus any delta ``scope``). Read it through ``history.action_snapshot``,
+    # never directly.
     snapshot = models.JSONField(_("Snapshot"))
+    chunks = models.ManyToManyField(
+        "PlanSnapshotChunk",
+        related_name="actions",
+        blank=True,
+        verbose_name=_("Snapshot chunks"),
+    )
     created_at = models.DateTimeField(_("Time created"), auto_now_add=True)
 
     class Meta:
@@ -2420,3 +2971,49 @@ class PlanAction(models.Model):
 
     def __str__(self):
         return f"{self.plan_id} · {self.stack} #{self.seq} · {self.label}"
+
+
+class PlanSnapshotChunk(models.Model):
+    """One content-addressed piece of a plan's undo/redo snapshots.
+
+    Consecutive ``PlanAction`` snapshots of a plan are almost entirely
+    identical, so ``history.py`` splits each one into row-level chunks (one per
+    exercise row with its cells, one per day with its sessions, one for the
+    weeks) and stores each distinct chunk once per plan, keyed by the sha256 of
+    its canonical JSON. Actions reference their chunks through
+    ``PlanAction.chunks``; a chunk no action references any more is pruned
+    under the plan's row lock (``history.prune_snapshot_chunks``). Chunks are
+    plan-scoped on purpose: every writer of a plan's chunks already holds that
+    plan's lock, so dedupe and pruning can never race each other.
+    """
+
+    class Codec(models.TextChoices):
+        RAW = "raw", _("Uncompressed")
+        ZLIB = "zlib", _("zlib")
+
+    plan = models.ForeignKey(
+        Plan,
+        on_delete=models.CASCADE,
+        related_name="snapshot_chunks",
+        verbose_name=_("Plan"),
+    )
+    digest = models.CharField(_("Digest"), max_length=64)
+    codec = models.CharField(
+        _("Codec"), max_length=8, choices=Codec, default=Codec.ZLIB
+    )
+    data = models.BinaryField(_("Data"))
+    # The chunk's canonical JSON length before compression (space reporting).
+    raw_size = models.PositiveIntegerField(_("Uncompressed size"))
+    created_at = models.DateTimeField(_("Time created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Plan snapshot chunk"
+        verbose_name_plural = "Plan snapshot chunks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["plan", "digest"], name="unique_plan_snapshot_chunk"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.plan_id} · {self.digest[:12]}"
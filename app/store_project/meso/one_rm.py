@@ -10,6 +10,8 @@ promoted out of per-device localStorage (Phase 2b) into ``AthleteOneRm`` rows:
   athlete's *completed* logged sets;
 - ``refresh_one_rms`` — recompute + upsert the rows for the lifts in a session,
   called after a log save so the estimate tracks what the athlete actually did;
+  the per-unit bests it reads are materialized in ``LiftBest`` and folded
+  forward one log at a time (``fold_log_into_lift_bests``);
 - ``one_rm_values`` — read the stored estimate for a batch of prescriptions
   (one query), for the athlete logger's suggested load and the coach designer.
 
@@ -21,6 +23,8 @@ catalog-linked lift by FK, a free-text lift by normalized name. See
 import math
 from decimal import Decimal
 
+from django.utils import timezone
+
 from . import models
 from .serializers import _exercise_key
 from .serializers import _num
@@ -54,6 +58,36 @@ def epley_one_rm(load, reps):
     return w * (1 + r / 30)
 
 
+def _done_sets(athlete, unit=None):
+    """The athlete's logged sets from *completed* logs, optionally in ``unit``."""
+    logged_sets = models.LoggedSet.objects.filter(
+        session_log__athlete=athlete,
+        session_log__status=models.SessionLog.Status.DONE,
+        prescription__isnull=False,
+    ).select_related("prescription__exercise_slot")
+    if unit is not None:
+        logged_sets = logged_sets.filter(session_log__unit=unit)
+    return logged_sets
+
+
+def _best_sets(logged_sets, keys=None):
+    """``{key: (estimate, logged_set)}`` — the best Epley set per lift identity.
+
+    The first set wins a tie. ``keys``, when given, skips every other lift.
+    """
+    best = {}
+    for ls in logged_sets:
+        key = key_str(ls.prescription.exercise_id, ls.prescription.name)
+        if keys is not None and key not in keys:
+            continue
+        est = epley_one_rm(ls.load, ls.reps)
+        if est is None:
+            continue
+        if key not in best or est > best[key][0]:
+            best[key] = (est, ls)
+    return best
+
+
 def derive_one_rm_values(athlete, *, keys=None, unit=None):
     """Best Epley 1RM per lift identity from the athlete's *completed* logged sets.
 
@@ -67,27 +101,126 @@ def derive_one_rm_values(athlete, *, keys=None, unit=None):
     ``load`` is a bare number whose unit is the plan's, so pooling kg and lb sets
     for one lift would be unit-confused. The estimate is therefore derived (and
     stored) per unit.
+
+    This is the full-history scan; a log save reads the materialized
+    ``LiftBest`` rows instead (``fold_log_into_lift_bests``).
     """
-    logged_sets = models.LoggedSet.objects.filter(
-        session_log__athlete=athlete,
-        session_log__status=models.SessionLog.Status.DONE,
-        prescription__isnull=False,
-    ).select_related("prescription")
-    if unit is not None:
-        logged_sets = logged_sets.filter(
-            session_log__session__week__mesocycle__plan__unit=unit
-        )
-    best = {}
-    for ls in logged_sets:
-        key = key_str(ls.prescription.exercise_id, ls.prescription.name)
-        if keys is not None and key not in keys:
-            continue
-        est = epley_one_rm(ls.load, ls.reps)
-        if est is None:
+    best = _best_sets(_done_sets(athlete, unit), keys)
+    return {key: est for key, (est, _ls) in best.items()}
+
+
+# ---------------------------------------------------------------------------
+# Materialized bests (``LiftBest``) — one row per (athlete, lift, unit).
+# ---------------------------------------------------------------------------
+
+
+def rebuild_lift_bests(athlete, unit, keys=None):
+    """Rescan ``athlete``'s completed ``unit`` logs and rewrite their ``LiftBest`` rows.
+
+    ``keys`` limits the rescan to those lifts (each gets a row, ``value`` null
+    when it has no usable set); ``None`` rebuilds every lift the athlete has a
+    row or a usable set for — the backfill. Returns ``{key: float}`` for the
+    lifts with a usable set, like ``derive_one_rm_values``.
+    """
+    best = _best_sets(_done_sets(athlete, unit), keys)
+    rows = models.LiftBest.objects.filter(athlete=athlete, unit=unit)
+    if keys is not None:
+        rows = rows.filter(key__in=keys)
+    existing = {row.key: row for row in rows}
+    now = timezone.now()
+    wanted = set(best) | set(existing) if keys is None else set(keys)
+    creates = []
+    updates = []
+    for key in wanted:
+        est, ls = best.get(key, (None, None))
+        row = existing.get(key)
+        if row is None:
+            creates.append(
+                models.LiftBest(
+                    athlete=athlete,
+                    key=key,
+                    unit=unit,
+                    value=est,
+                    logged_set=ls,
+                    session_log_id=ls.session_log_id if ls else None,
+                )
+            )
             continue
-        if key not in best or est > best[key]:
-            best[key] = est
-    return best
+        row.value = est
+        row.logged_set = ls
+        row.session_log_id = ls.session_log_id if ls else None
+        row.updated_at = now  # ``bulk_update`` skips ``auto_now``
+        updates.append(row)
+    models.LiftBest.objects.bulk_create(creates)
+    models.LiftBest.objects.bulk_update(
+        updates, ["value", "logged_set", "session_log", "updated_at"]
+    )
+    return {key: est for key, (est, _ls) in best.items()}
+
+
+def fold_log_into_lift_bests(log, keys, unit):
+    """Update the ``LiftBest`` rows for ``keys`` after ``log`` was saved.
+
+    Incremental: a lift whose stored best came from some *other* log can only
+    go up, so it's compared against this log's sets (when the log is ``DONE``)
+    and raised if one beats it — no history read. A lift is rescanned
+    (``rebuild_lift_bests``) only when its best can't be trusted any more: the
+    row is missing, its best set came from this log (whose sets were just
+    replaced, or which went back to a draft), or that set has since been
+    deleted. Returns ``{key: float}`` for the lifts with a usable set.
+    """
+    rows = {
+        row.key: row
+        for row in models.LiftBest.objects.filter(
+            athlete_id=log.athlete_id, key__in=keys, unit=unit
+        )
+    }
+    rescan = {
+        key
+        for key in keys
+        if key not in rows or rows[key].is_stale or rows[key].session_log_id == log.pk
+    }
+    candidates = {}
+    if log.status == models.SessionLog.Status.DONE:
+        candidates = _best_sets(
+            log.sets.filter(prescription__isnull=False).select_related(
+                "prescription__exercise_slot"
+            ),
+            set(keys) - rescan,
+        )
+    values = {}
+    raised = []
+    for key in set(keys) - rescan:
+        row = rows[key]
+        candidate = candidates.get(key)
+        if candidate is not None and (row.value is None or candidate[0] > row.value):
+            row.value, row.logged_set = candidate
+            row.session_log_id = log.pk
+            row.updated_at = timezone.now()  # ``bulk_update`` skips ``auto_now``
+            raised.append(row)
+        if row.value is not None:
+            values[key] = row.value
+    models.LiftBest.objects.bulk_update(
+        raised, ["value", "logged_set", "session_log", "updated_at"]
+    )
+    if rescan:
+        values.update(rebuild_lift_bests(log.athlete, unit, keys=rescan))
+    return values
+
+
+def lift_best_values(athlete, keys, unit):
+    """``{key: float}`` off ``athlete``'s stored ``LiftBest`` rows for ``keys``.
+
+    For a caller that has just rebuilt the bests (the bulk log sync, after
+    ``personal_records.rebuild_records``) — a read, no history scan. A lift
+    with no row, or no usable set, is absent.
+    """
+    return {
+        row.key: row.value
+        for row in models.LiftBest.objects.filter(
+            athlete=athlete, key__in=keys, unit=unit, value__isnull=False
+        )
+    }
 
 
 # The largest value the ``value`` column (``Decimal(7, 2)``) can hold. A derived
@@ -102,7 +235,7 @@ def _quantize(value):
     return Decimal(str(round(float(value), 2)))
 
 
-def refresh_one_rms(athlete, prescriptions, unit):
+def refresh_one_rms(athlete, prescriptions, unit, *, log=None, rebuilt=False):
     """Recompute + persist ``athlete``'s 1RM for the lifts in ``prescriptions``.
 
     Called after a log save: for each lift identity among ``prescriptions``,
@@ -111,6 +244,13 @@ def refresh_one_rms(athlete, prescriptions, unit):
     the 1RM is a property of the athlete, not one plan). A lift with no usable
     logged set yet (no numeric load/reps anywhere) is left untouched rather than
     written as null. ``unit`` records what the stored value is denominated in.
+
+    ``log`` is the session log just saved: the bests then come from the
+    materialized ``LiftBest`` rows, folded forward with that log's sets
+    (``fold_log_into_lift_bests``). Without it the lifts are rescanned from
+    the full history (``rebuild_lift_bests``) — the seeders, and clearing a
+    manual value — unless ``rebuilt`` says the caller has just rebuilt them
+    (the bulk log sync), when they're read as stored (``lift_best_values``).
     """
     # One representative (exercise_id, name) per identity — a later prescription's
     # name wins for display, harmless since they share the identity.
@@ -135,8 +275,14 @@ def refresh_one_rms(athlete, prescriptions, unit):
         ).values_list("key", flat=True)
     )
     # Derive from same-unit logs only, so the stored value is unambiguously in
-    # ``unit`` (the unit it's written with).
-    derived = derive_one_rm_values(athlete, keys=set(reps_by_key), unit=unit)
+    # ``unit`` (the unit it's written with). Manual lifts' bests are kept current
+    # too — the table is purely log-derived.
+    if log is not None:
+        derived = fold_log_into_lift_bests(log, set(reps_by_key), unit)
+    elif rebuilt:
+        derived = lift_best_values(athlete, set(reps_by_key), unit)
+    else:
+        derived = rebuild_lift_bests(athlete, unit, keys=set(reps_by_key))
     for key, (exercise_id, name) in reps_by_key.items():
         if key in manual_keys:
             continue
@@ -14,8 +14,15 @@ the hybrid B4 lift identity (``serializers._exercise_key`` via
 ``derive_one_rm_values`` (a bare logged load is denominated in its plan's unit, so
 kg and lb sets for one lift must never pool).
 
-Nothing is persisted (no ``PersonalRecord`` table — that is a deliberate later
-slice) and ``new_records_in`` has no side effects (no writes, no ``PlanAction``).
+**Persisted.** Both used to rescan the athlete's whole completed history on
+every call — once per log save and again on every results view. The standing
+best per lift is now read off the materialized ``LiftBest`` rows (kept current
+on log save by ``one_rm.fold_log_into_lift_bests``), and each record as it is
+set is written to the ``PersonalRecordEntry`` ledger on log save
+(:func:`record_log`), so ``new_records_in`` is a lookup by session log. A log
+saved outside the log endpoint (seeders, the admin, logs older than the
+ledger) has no ``SessionLog.records_at``; the first read for that athlete
+replays their history into the ledger (:func:`rebuild_records`).
 
 **Seam.** The best-per-lift computation consumes an *iterable of normalized
 performed sets* (:class:`_PerformedSet` tuples: key, name, unit, reps, load,
@@ -24,12 +31,19 @@ that helper (:func:`_performed_sets`). A future free-text/parsed performance fee
 can drive the SAME computation by yielding the same tuples — no rework here.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date as date_cls
 
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models import Q
+from django.utils import timezone
+
 from . import models
 from .one_rm import epley_one_rm
 from .one_rm import key_str
+from .one_rm import rebuild_lift_bests
 
 
 @dataclass(frozen=True)
@@ -93,7 +107,7 @@ def _completed_logged_sets(athlete, *, unit):
     return models.LoggedSet.objects.filter(
         session_log__athlete=athlete,
         session_log__status=models.SessionLog.Status.DONE,
-        session_log__session__week__mesocycle__plan__unit=unit,
+        session_log__unit=unit,
         prescription__isnull=False,
     ).select_related("prescription__exercise_slot", "session_log")
 
@@ -148,67 +162,294 @@ def _best_per_lift(performed):
     return best
 
 
-def _session_unit(session_log):
-    """The unit a session's logged loads are denominated in (its plan's)."""
-    return session_log.session.week.mesocycle.plan.unit
+def _entry(athlete_id, session_log_id, record, previous):
+    """The ledger row for ``record`` beating ``previous`` (``None``: a first)."""
+    return models.PersonalRecordEntry(
+        athlete_id=athlete_id,
+        key=record.key,
+        unit=record.unit,
+        name=record.name[:200],
+        value=record.e1rm,
+        previous=previous,
+        reps=record.reps,
+        load=record.load,
+        date=record.date,
+        logged_set_id=record.logged_set_id,
+        session_log_id=session_log_id,
+    )
+
+
+def _replay_order(session_log):
+    """``(before, after)`` filters: the logs on either side of ``session_log``.
+
+    In :func:`rebuild_records`' replay order — workout ``date`` (undated
+    first), then ``created_at``, then pk — so the log save compares a session
+    against exactly the sessions the replay would.
+    """
+    created, pk = session_log.created_at, session_log.pk
+    earlier = Q(created_at__lt=created) | Q(created_at=created, pk__lt=pk)
+    later = Q(created_at__gt=created) | Q(created_at=created, pk__gt=pk)
+    if session_log.date is None:
+        before = Q(date__isnull=True) & earlier
+        after = Q(date__isnull=False) | (Q(date__isnull=True) & later)
+    else:
+        day = session_log.date
+        before = Q(date__isnull=True) | Q(date__lt=day) | (Q(date=day) & earlier)
+        after = Q(date__gt=day) | (Q(date=day) & later)
+    return before, after
+
+
+def _replay_key(session_log):
+    """:func:`_replay_order` as a sort key, for a log already in memory."""
+    return (
+        session_log.date is not None,
+        session_log.date or date_cls.min,
+        session_log.created_at,
+        session_log.pk,
+    )
+
+
+def _prior_bests(session_log, keys, unit, before):
+    """``{key: float | None}`` — the athlete's best per lift *before* this session.
+
+    Read off ``LiftBest`` *before* the save folds this log in: a row whose best
+    set came from an earlier log is exactly the best over every earlier
+    session (a heavier earlier set would have displaced it). Only a lift whose
+    row is missing, stale, or held by this or a later log is rescanned — one
+    query over the earlier sessions' sets.
+    """
+    rows = {
+        row.key: row
+        for row in models.LiftBest.objects.filter(
+            athlete_id=session_log.athlete_id, unit=unit, key__in=keys
+        ).select_related("session_log")
+    }
+    prior = {}
+    rescan = set()
+    for key in keys:
+        row = rows.get(key)
+        if (
+            row is None
+            or row.is_stale
+            or row.session_log is None
+            or _replay_key(row.session_log) >= _replay_key(session_log)
+        ):
+            rescan.add(key)
+        else:
+            prior[key] = row.value
+    if rescan:
+        earlier = _completed_logged_sets(session_log.athlete_id, unit=unit).filter(
+            session_log__in=models.SessionLog.objects.filter(
+                before, athlete_id=session_log.athlete_id
+            )
+        )
+        best = _best_per_lift(
+            ps for ps in _performed_sets(earlier, unit=unit) if ps.key in rescan
+        )
+        for key in rescan:
+            prior[key] = best[key].e1rm if key in best else None
+    return prior
+
+
+def record_log(session_log, prescriptions, unit):
+    """Write ``session_log``'s records for the lifts in ``prescriptions`` to the ledger.
+
+    Called by the log save, inside its transaction and *before*
+    ``one_rm.refresh_one_rms`` folds the log into ``LiftBest`` (the prior best
+    is read off the unfolded rows). Gives the same answer as
+    :func:`rebuild_records`: a lift whose best set beats the athlete's best over
+    every *earlier* same-unit session gets a :class:`models.PersonalRecordEntry`;
+    a tie or a lighter set gets none, and a pending log (not a finished
+    performance) none at all. So a re-saved older session keeps the record it
+    set, and a backdated one earns the record its date does.
+
+    The log's rows for these lifts are replaced, and so are those of any
+    session dated after it — its edit can make or unmake their records — by
+    replaying these lifts forward from the prior best. A save of the latest
+    session (the normal case) replays only itself. Stamps ``records_at``.
+    Returns the rows written.
+    """
+    keys = {key_str(p.exercise_id, p.name) for p in prescriptions}
+    replayed = [session_log.pk]
+    entries = []
+    if keys:
+        before, after = _replay_order(session_log)
+        replayed += list(
+            models.SessionLog.objects.filter(
+                after,
+                athlete_id=session_log.athlete_id,
+                status=models.SessionLog.Status.DONE,
+                unit=unit,
+            )
+            .order_by(F("date").asc(nulls_first=True), "created_at", "pk")
+            .values_list("pk", flat=True)
+        )
+        models.PersonalRecordEntry.objects.filter(
+            session_log__in=replayed, key__in=keys
+        ).delete()
+        sets_by_log = defaultdict(list)
+        for ls in _completed_logged_sets(session_log.athlete_id, unit=unit).filter(
+            session_log__in=replayed
+        ):
+            sets_by_log[ls.session_log_id].append(ls)
+        if sets_by_log:
+            standing = _prior_bests(session_log, keys, unit, before)
+            for log_id in replayed:
+                performed = _performed_sets(sets_by_log.get(log_id, ()), unit=unit)
+                for key, record in _best_per_lift(performed).items():
+                    if key not in keys:
+                        continue
+                    previous = standing.get(key)
+                    if previous is None or record.e1rm > previous:
+                        entries.append(
+                            _entry(session_log.athlete_id, log_id, record, previous)
+                        )
+                        standing[key] = record.e1rm
+            models.PersonalRecordEntry.objects.bulk_create(entries)
+    session_log.records_at = timezone.now()
+    models.SessionLog.objects.filter(pk=session_log.pk).update(
+        records_at=session_log.records_at
+    )
+    return entries
+
+
+def rebuild_records(athlete, unit):
+    """Replay ``athlete``'s completed ``unit`` history into the ledger and bests.
+
+    The backfill, and the catch-up for logs saved outside the log endpoint:
+    one scan of the athlete's DONE sets, walked session by session in date
+    order, writing an entry wherever a session's best beat everything logged
+    before it (a tie is not a record). Replaces the athlete's ``unit`` entries,
+    stamps every ``unit`` log ``records_at`` and rebuilds their ``LiftBest``
+    rows. Returns the entries written.
+    """
+    logs = models.SessionLog.objects.filter(
+        athlete=athlete,
+        status=models.SessionLog.Status.DONE,
+        unit=unit,
+    ).order_by(F("date").asc(nulls_first=True), "created_at", "pk")
+    sets_by_log = defaultdict(list)
+    for ls in _completed_logged_sets(athlete, unit=unit):
+        sets_by_log[ls.session_log_id].append(ls)
+    standing = {}
+    entries = []
+    for log_id in logs.values_list("pk", flat=True):
+        performed = _performed_sets(sets_by_log.get(log_id, ()), unit=unit)
+        for key, record in _best_per_lift(performed).items():
+            previous = standing.get(key)
+            if previous is None or record.e1rm > previous:
+                entries.append(_entry(athlete.pk, log_id, record, previous))
+                standing[key] = record.e1rm
+    models.PersonalRecordEntry.objects.filter(athlete=athlete, unit=unit).delete()
+    models.PersonalRecordEntry.objects.bulk_create(entries)
+    models.SessionLog.objects.filter(athlete=athlete, unit=unit).update(
+        records_at=timezone.now()
+    )
+    rebuild_lift_bests(athlete, unit)
+    return entries
+
+
+def _catch_up(athlete_id):
+    """Replay history for every unit the athlete has an unrecorded DONE log in.
+
+    One query when the ledger is current (the normal case): logs saved through
+    the log endpoint are recorded as they're written.
+    """
+    units = set(
+        models.SessionLog.objects.filter(
+            athlete_id=athlete_id,
+            status=models.SessionLog.Status.DONE,
+            records_at__isnull=True,
+        ).values_list("unit", flat=True)
+    )
+    if not units:
+        return
+    athlete = get_user_model().objects.get(pk=athlete_id)
+    for unit in sorted(units):
+        rebuild_records(athlete, unit)
 
 
 def personal_records(athlete, *, unit):
     """Best e1RM per lift for ``athlete`` in ``unit``, keyed by B4 identity.
 
-    Derive-on-read (nothing persisted): ``{key: PersonalRecord}`` over the
-    athlete's DONE, same-unit logged sets, each record carrying the display name,
-    best Epley e1RM (the raw ``epley_one_rm`` value), the winning reps/load
-    strings, the date, and the source ``LoggedSet``/``SessionLog`` ids. A lift
-    with no usable set is absent.
+    ``{key: PersonalRecord}`` over the athlete's DONE, same-unit logged sets,
+    each record carrying the display name, best Epley e1RM (the raw
+    ``epley_one_rm`` value), the winning reps/load strings, the date, and the
+    source ``LoggedSet``/``SessionLog`` ids. A lift with no usable set is absent.
+
+    Read off the materialized ``LiftBest`` rows (one query once the ledger is
+    caught up), not a history scan.
     """
-    logged_sets = _completed_logged_sets(athlete, unit=unit)
-    return _best_per_lift(_performed_sets(logged_sets, unit=unit))
+    _catch_up(athlete.pk)
+    rows = models.LiftBest.objects.filter(
+        athlete=athlete,
+        unit=unit,
+        value__isnull=False,
+        logged_set__prescription__isnull=False,
+    ).select_related(
+        "logged_set__prescription__exercise_slot", "logged_set__session_log"
+    )
+    records = {}
+    for row in rows:
+        ls = row.logged_set
+        records[row.key] = PersonalRecord(
+            key=row.key,
+            name=ls.prescription.name,
+            unit=unit,
+            e1rm=row.value,
+            reps=ls.reps,
+            load=ls.load,
+            date=ls.session_log.date,
+            logged_set_id=ls.pk,
+            session_log_id=ls.session_log_id,
+        )
+    return records
 
 
 def new_records_in(session_log):
-    """Lifts in ``session_log`` that beat the athlete's prior best — pure detection.
-
-    No side effects (no writes, no ``PlanAction``): returns a list of
-    :class:`NewRecord`, one per lift in this DONE session whose best e1RM exceeds
-    the athlete's best over *all other* same-unit DONE sets. The comparison
-    excludes the session under test, so a lone first-ever log is a PR (``previous``
-    is ``None``) rather than a tie against itself; a tie or a lighter session is
-    not a PR. A pending session (not a finished performance) yields nothing.
+    """Lifts in ``session_log`` that beat the athlete's prior best.
+
+    A list of :class:`NewRecord`, one per lift in this DONE session whose best
+    e1RM exceeded the athlete's best over every *earlier* same-unit DONE
+    session (by workout date). The comparison excludes the session under test,
+    so a lone first-ever log is a PR (``previous`` is ``None``) rather than a tie
+    against itself; a tie or a lighter session is not a PR. A pending session
+    (not a finished performance) yields nothing.
+
+    A lookup of the session's ``PersonalRecordEntry`` rows, written when the
+    log was saved (:func:`record_log`). A record stays the session's once set —
+    a heavier session logged later starts a record of its own rather than
+    taking this one back.
     """
-    if session_log.status != models.SessionLog.Status.DONE:
-        return []
+    return new_records_by_log([session_log]).get(session_log.pk, [])
 
-    unit = _session_unit(session_log)
-    this_sets = models.LoggedSet.objects.filter(
-        session_log=session_log, prescription__isnull=False
-    ).select_related("prescription__exercise_slot", "session_log")
-    this_best = _best_per_lift(_performed_sets(this_sets, unit=unit))
-    if not this_best:
-        return []
-
-    # Prior best over the athlete's OTHER same-unit DONE sets — excluding this
-    # session, so the session can't be its own prior record.
-    prior_qs = _completed_logged_sets(session_log.athlete, unit=unit).exclude(
-        session_log=session_log
-    )
-    prior_best = _best_per_lift(_performed_sets(prior_qs, unit=unit))
-
-    records = []
-    for key, record in this_best.items():
-        previous = prior_best.get(key)
-        previous_value = previous.e1rm if previous is not None else None
-        if previous_value is None or record.e1rm > previous_value:
-            records.append(
-                NewRecord(
-                    key=key,
-                    name=record.name,
-                    unit=record.unit,
-                    value=record.e1rm,
-                    previous=previous_value,
-                    reps=record.reps,
-                    load=record.load,
-                    logged_set_id=record.logged_set_id,
-                )
+
+def new_records_by_log(session_logs):
+    """:func:`new_records_in` for many logs at once: ``{log pk: [NewRecord]}``.
+
+    One ledger catch-up per athlete and one read of every DONE log's entries —
+    the bulk log sync reports each synced session's records from it. A log
+    with no record (or not DONE) is absent.
+    """
+    done = [log for log in session_logs if log.status == models.SessionLog.Status.DONE]
+    for athlete_id in sorted({log.athlete_id for log in done}):
+        _catch_up(athlete_id)
+    records = defaultdict(list)
+    if not done:
+        return records
+    for entry in models.PersonalRecordEntry.objects.filter(
+        session_log__in=[log.pk for log in done]
+    ).order_by("pk"):
+        records[entry.session_log_id].append(
+            NewRecord(
+                key=entry.key,
+                name=entry.name,
+                unit=entry.unit,
+                value=entry.value,
+                previous=entry.previous,
+                reps=entry.reps,
+                load=entry.load,
+                logged_set_id=entry.logged_set_id,
             )
+        )
     return records
@@ -27,8 +27,12 @@ from .models import AgentProposalBatch
 from .models import CoachAthlete
 from .models import CoachInvite
 from .models import CoachSubscription
+from .models import ExerciseSlot
 from .models import Plan
+from .models import Prescription
+from .models import Session
 from .models import SessionLog
+from .models import SessionSlot
 from .models import TourEvent
 from .models import Week
 from .models import WeekDelivery
@@ -37,6 +41,8 @@ from .one_rm import one_rm_values
 from .personal_records import new_records_in
 from .personal_records import personal_records
 from .serializers import _fmt_num
+from .serializers import _grid_cells
+from .serializers import _grid_row
 from .serializers import _num
 from .serializers import _phase_states
 from .serializers import _week_label
@@ -44,7 +50,6 @@ from .serializers import current_week
 from .serializers import diff_week_snapshots
 from .serializers import initials
 from .serializers import serialize_mesocycle
-from .serializers import serialize_mesocycle_grid
 from .serializers import serialize_new_record
 from .serializers import serialize_prescription
 from .serializers import serialize_proposed_change
@@ -220,26 +225,32 @@ def _profile_status(link, working_plan, delivered_plan):
 def _profile_results(link):
     """The athlete's most recent *done* session, scored for the profile card.
 
-    Reuses ``session_results`` (the coach results screen) so the profile's "Latest
-    session" card shows the same completion %, RPE-vs-target, and overshoot flag.
+    Reuses ``session_results`` (the coach results screen, through the same
+    ``results_cache``) so the profile's "Latest session" card shows the same
+    completion %, RPE-vs-target, and overshoot flag.
     Scoped to the athlete's own *done* logs — a pending "Save progress" draft isn't
     a result — on this link's plans. Archived plans are excluded. ``None`` — the
     card is hidden — when the athlete has no openable logged session yet.
     """
+    # Local import: ``results_cache`` wraps this module.
+    from .results_cache import session_results as cached_session_results
+
     log = (
         SessionLog.objects.filter(
-            session__week__mesocycle__plan__relationship=link,
+            relationship=link,
             athlete=link.athlete,
             status=SessionLog.Status.DONE,
         )
-        .exclude(session__week__mesocycle__plan__status=Plan.Status.ARCHIVED)
-        .select_related("session__week__mesocycle__plan__relationship")
+        .exclude(plan__status=Plan.Status.ARCHIVED)
+        .select_related("session__week__mesocycle__plan__relationship__athlete")
         .order_by("-date", "-created_at")
         .first()
     )
     if log is None:
         return None
-    summary = session_results(log.session)["summary"]
+    # The newest done log on the link is also its session's newest, so it's
+    # the log the session's results score.
+    summary = cached_session_results(log.session, log=log)["summary"]
     # The card links to *this* session's results, not the bare ``results``
     # redirect (which lands on the coach's globally-latest logged session —
     # possibly a different athlete).
@@ -281,8 +292,7 @@ def profile_program(link, working_plan):
     report a position or a percent against — this instead surfaces:
 
     - ``recency``/``session_count_14d`` — the athlete's cadence (``adherence.
-      link_last_trained`` + ``link_session_count``), the same signal behind
-      the roster's pill;
+      link_cadences``), the same signal behind the roster's pill;
     - ``macrocycle`` — the plan's blocks, the rail positioned at the most
       recent DONE log's block (factual history, not a "you are here" claim);
       no block highlights at all if the athlete hasn't logged anything yet on
@@ -329,14 +339,17 @@ def profile_program(link, working_plan):
     # The goal of the plan the coach is actively shaping if there is one, else
     # the delivered plan's.
     goal = (working_plan.goal if working_plan else "") or plan.goal
+    cadence = adherence.link_cadences([link], days=14)[link.pk]
     recency = (
-        "No sessions yet" if last_log is None else _relative_when(last_log.created_at)
+        "No sessions yet"
+        if cadence.last_trained_at is None
+        else _relative_when(cadence.last_trained_at)
     )
     return {
         "athlete": {
             "has_program": True,
             "recency": recency,
-            "session_count_14d": adherence.link_session_count(link, days=14),
+            "session_count_14d": cadence.session_count,
             "status": status,
             "status_label": status_label,
             "review_batch_id": review_batch_id,
@@ -351,7 +364,7 @@ def profile_program(link, working_plan):
 #
 # The persistent "records book" — best e1RM per lift with provenance — shared by
 # the athlete's training home and the coach's athlete-profile, both fed by the 4b
-# derive-on-read engine (``personal_records``); nothing is persisted. Unit is a
+# engine (``personal_records``, read off the materialized bests). Unit is a
 # per-PLAN property (there is no athlete-level preference), so each host scopes to
 # a single plan's unit rather than pooling kg and lb: the athlete's / this link's
 # most-recently-active plan. An empty row list hides the panel (the templates
@@ -878,15 +891,15 @@ def _worst_rep_shortfall(prescription, logged_sets):
     return worst
 
 
-def _coach_sub_lines_by_slot(session):
-    """This session's coach-authored sub-lines (line >= 1), keyed by exercise_slot id.
+def _results_cells(session):
+    """This session's trainable cells and coach sub-lines, from one query.
 
-    One query for the whole session (``Session.line_cells()``, already used
-    this way by ``serialize_session``) rather than one per prescription —
-    batched, matching the lookup ``seed_meso_demo.py``'s
-    ``_logged_sets_from_cells`` uses for the analogous (but cross-session)
-    case. A single session's cells all share one week, so grouping by slot id
-    alone is enough here (no need for that helper's ``(slot, week)`` key).
+    ``(prescriptions, sub_lines_by_slot)``: the line-0 cells the athlete trains
+    (``Session.trainable_cells()`` — live, non-skipped, in row order) and the
+    coach-authored sub-lines (line >= 1) beneath them keyed by exercise_slot id,
+    in stack order (``Session.line_cells()``). Both are the same (week, day, live
+    row) cell set split by line, so they're read together. A single session's
+    cells all share one week, so grouping by slot id alone is enough.
 
     Athlete-authored lines (the athlete's own freeform tracking sub-rows —
     ``135lbs x 12``, Phase 4a) are excluded: ``athlete_authored`` is stamped
@@ -895,18 +908,30 @@ def _coach_sub_lines_by_slot(session):
     the rows the *athlete* wrote — never the coach's own prescription, which
     is what a results target must be derived from.
     """
+    prescriptions = []
     by_slot = defaultdict(list)
-    for line_cell in session.line_cells():
-        if not line_cell.athlete_authored:
-            by_slot[line_cell.exercise_slot_id].append(line_cell)
-    return by_slot
+    for cell in (
+        Prescription.objects.filter(
+            week=session.week_id,
+            exercise_slot__session_slot=session.session_slot_id,
+            exercise_slot__deleted_at__isnull=True,
+        )
+        .select_related("exercise_slot")
+        .order_by("exercise_slot__order", "line")
+    ):
+        if cell.line == 0:
+            if not cell.skipped:
+                prescriptions.append(cell)
+        elif not cell.athlete_authored:
+            by_slot[cell.exercise_slot_id].append(cell)
+    return prescriptions, by_slot
 
 
 def _sub_line_rpe(prescription, sub_lines_by_slot):
     """The first RPE recovered from this cell's coach sub-lines, or None.
 
-    Walks the row's sub-lines in stack order (``_coach_sub_lines_by_slot``
-    sorts by ``line``) for the first that parses an RPE — the intended model
+    Walks the row's sub-lines in stack order (``_results_cells`` sorts by
+    ``line``) for the first that parses an RPE — the intended model
     per spreadsheet-parity plan §2.3/§2.6, an "RPE row directly beneath the
     prescription" reached by arrow-down. Only ever consulted when line 0
     itself carries none (see the callers) — line 0's inline RPE always wins.
@@ -1002,28 +1027,41 @@ def _logged_date(log):
     return f"{log.date:%a, %b} {log.date.day}"
 
 
-def session_results(session):
-    """The coach's results screen for one session, off the athlete's real log.
+def results_log(session):
+    """The athlete's most recent *done* ``SessionLog`` for ``session``, or None.
 
-    Reads the athlete's most recent *done* ``SessionLog`` for ``session`` and
-    scores its sets against the prescribed targets. A pending draft (the athlete
-    hit "Save progress" but hasn't finished) is not feedback yet, so it — like an
-    unlogged session — renders an honest awaiting state (targets only, 0%
-    complete) rather than inventing numbers. ``session`` arrives coach-scoped;
-    its cells are read via ``session.cells()`` (P0 fixed-lineup cutover).
+    What the results screen scores — and, with its ``updated_at``, what a cached
+    score is keyed on (``results_cache``).
     """
-    plan = session.week.mesocycle.plan
-    athlete = plan.athlete
-    prescriptions = list(session.trainable_cells())
-    sub_lines_by_slot = _coach_sub_lines_by_slot(session)
-    log = (
+    return (
         SessionLog.objects.filter(
-            session=session, athlete=athlete, status=SessionLog.Status.DONE
+            session=session,
+            athlete_id=session.week.mesocycle.plan.relationship.athlete_id,
+            status=SessionLog.Status.DONE,
         )
         .order_by("-date", "-created_at")
-        .prefetch_related("sets")
         .first()
     )
+
+
+def session_results(session, log=None):
+    """The coach's results screen for one session, off the athlete's real log.
+
+    Scores ``log`` — the athlete's most recent *done* ``SessionLog`` for
+    ``session`` (``results_log``), looked up when not handed in — against the
+    prescribed targets. A pending draft (the athlete hit "Save progress" but
+    hasn't finished) is not feedback yet, so it — like an unlogged session —
+    renders an honest awaiting state (targets only, 0% complete) rather than
+    inventing numbers. ``session`` arrives coach-scoped with its week → plan →
+    relationship loaded; its cells come from ``_results_cells`` (one query) and
+    the PR flags from the ledger the log endpoint wrote (``new_records_in``), so
+    a scoring is a fixed handful of queries. ``results_cache`` caches it.
+    """
+    plan = session.week.mesocycle.plan
+    athlete = plan.athlete
+    prescriptions, sub_lines_by_slot = _results_cells(session)
+    if log is None:
+        log = results_log(session)
     sets_by_prescription = defaultdict(list)
     if log is not None:
         for s in log.sets.all():
@@ -1113,28 +1151,78 @@ def _done_session_ids(session_ids, athlete):
     )
 
 
-def _athlete_session_row(session, *, done):
-    """One session in the athlete's week — a tappable row on the home screen."""
+def _trainable_cell_counts(sessions):
+    """``{(week_id, session_slot_id): n}`` trainable cells per session (one query).
+
+    The bulk form of ``session.trainable_cells().count()`` — live, line-0,
+    non-skipped cells — grouped so every anchored session's "N exercises" chip
+    is read from the one aggregate.
+    """
+    return {
+        (row["week_id"], row["exercise_slot__session_slot_id"]): row["n"]
+        for row in Prescription.objects.filter(
+            week_id__in={s.week_id for s in sessions},
+            exercise_slot__session_slot_id__in={s.session_slot_id for s in sessions},
+            exercise_slot__deleted_at__isnull=True,
+            line=0,
+            skipped=False,
+        )
+        .values("week_id", "exercise_slot__session_slot_id")
+        .annotate(n=Count("pk"))
+    }
+
+
+def _athlete_session_row(session, *, done, exercise_count):
+    """One session in the athlete's week — a tappable row on the home screen.
+
+    ``exercise_count`` is the session's trainable rows — live + non-skipped (P0
+    fixed-lineup cutover), so a week-skipped exercise doesn't count toward the
+    day's "N exercises" chip (see ``_trainable_cell_counts``).
+    """
     status = "done" if done else "pending"
     return {
         "id": session.pk,
         "n": session.day_number,
         "name": session.name,
         "bias": session.bias,
-        # Trainable rows only — live + non-skipped (P0 fixed-lineup cutover); a
-        # week-skipped exercise doesn't count toward the day's "N exercises" chip.
-        "exercise_count": session.trainable_cells().count(),
+        "exercise_count": exercise_count,
         "status": status,
         "status_label": "Logged" if done else "To do",
         "url": reverse("meso:athlete_session", kwargs={"pk": session.pk}),
     }
 
 
+def _athlete_sessions(anchors, user):
+    """``{week_id: [session row]}`` for every anchored week, in three queries.
+
+    The anchored weeks' live sessions (slot selected — its day number, name and
+    bias are the row's identity), their trainable-cell counts, and which of
+    them the athlete has done, each loaded once across every card.
+    """
+    session_objs = list(
+        Session.objects.filter(
+            week_id__in=[w.pk for w in anchors], deleted_at__isnull=True
+        ).select_related("session_slot")
+    )
+    counts = _trainable_cell_counts(session_objs)
+    done = _done_session_ids([s.pk for s in session_objs], user)
+    rows = defaultdict(list)
+    for s in session_objs:
+        rows[s.week_id].append(
+            _athlete_session_row(
+                s,
+                done=s.pk in done,
+                exercise_count=counts.get((s.week_id, s.session_slot_id), 0),
+            )
+        )
+    return rows
+
+
 def _cell_summary(cell):
     """A read-only prescription summary for one athlete-table cell.
 
-    Reads a ``serialize_mesocycle_grid`` cell dict (the athlete table is
-    transformed from that coach grid, not from ``Prescription`` rows): the
+    Reads a grid cell dict (``serializers._grid_row`` — the athlete table is
+    transformed from the coach grid's rows, not from ``Prescription`` rows): the
     freeform ``text`` verbatim (Phase 2a), with any non-blank sub-lines folded
     in after it so the athlete sees the whole stack.
     """
@@ -1143,11 +1231,58 @@ def _cell_summary(cell):
     return _text_label("\n".join(p for p in parts if p and p.strip()))
 
 
-def _athlete_block_grid(block, focus_week_id):
+def _athlete_block_days(weeks_by_block):
+    """The coach grid's ``days`` for several blocks at once, in three queries.
+
+    ``weeks_by_block`` maps a mesocycle pk to its live weeks (index order).
+    Builds each block's days exactly as ``serialize_mesocycle_grid`` does —
+    live days in ``(order, day_number)`` order, live rows in ``order``, cells
+    via the same ``_grid_cells``/``_grid_row`` — but loads the days, rows and
+    cells of every block together instead of one grid serialization per card.
+    Only what the athlete table reads is built (no session ids, phases or
+    history). Returns ``{mesocycle_id: [day]}``.
+    """
+    session_slots = list(
+        SessionSlot.objects.filter(
+            mesocycle_id__in=list(weeks_by_block), deleted_at__isnull=True
+        ).order_by("order", "day_number")
+    )
+    exercise_slots = list(
+        ExerciseSlot.objects.filter(
+            session_slot_id__in=[s.pk for s in session_slots],
+            deleted_at__isnull=True,
+        ).order_by("order")
+    )
+    rows_by_slot = defaultdict(list)
+    for exercise_slot in exercise_slots:
+        rows_by_slot[exercise_slot.session_slot_id].append(exercise_slot)
+    cells_by_key, lines_by_key = _grid_cells(
+        [e.pk for e in exercise_slots],
+        [w.pk for weeks in weeks_by_block.values() for w in weeks],
+    )
+    days = defaultdict(list)
+    for slot in session_slots:
+        weeks = weeks_by_block[slot.mesocycle_id]
+        days[slot.mesocycle_id].append(
+            {
+                "day_number": slot.day_number,
+                "name": slot.name,
+                "bias": slot.bias,
+                "rows": [
+                    _grid_row(exercise_slot, weeks, cells_by_key, lines_by_key)
+                    for exercise_slot in rows_by_slot.get(slot.pk, [])
+                ],
+            }
+        )
+    return days
+
+
+def _athlete_block_grid(weeks, grid_days, focus_week_id):
     """The athlete's read-only multi-week table, transformed from the coach grid.
 
-    Reuses ``serialize_mesocycle_grid`` (one dense query set for the whole block —
-    no N+1 per cell) and strips it to what a read-only table needs: every live
+    ``weeks`` are the block's live weeks and ``grid_days`` its coach-grid days
+    (``_athlete_block_days`` — loaded for every card at once, so no N+1 per
+    cell or per card). Strips them to what a read-only table needs: every live
     week of the block as a column (2d: delivery no longer gates visibility —
     the athlete sees the block exactly as it stands), each cell reduced to a
     display summary (the freeform text stack; em-dash rendered by the template
@@ -1158,20 +1293,18 @@ def _athlete_block_grid(block, focus_week_id):
     a light highlight — never a "you are here" claim, since the app doesn't
     make one (docs/meso/remove-current-week-plan.md).
     """
-    grid = serialize_mesocycle_grid(block)
-    columns = grid["weeks"]
-    col_keys = [str(w["id"]) for w in columns]
-    weeks = [
+    col_keys = [str(w.pk) for w in weeks]
+    columns = [
         {
-            "index": w["index"],
-            "label": w["label"],
-            "deload": w["deload"],
-            "focused": w["id"] == focus_week_id,
+            "index": w.index,
+            "label": _week_label(w),
+            "deload": w.is_deload,
+            "focused": w.pk == focus_week_id,
         }
-        for w in columns
+        for w in weeks
     ]
     days = []
-    for day in grid["days"]:
+    for day in grid_days:
         rows = []
         for row in day["rows"]:
             cells = []
@@ -1181,9 +1314,9 @@ def _athlete_block_grid(block, focus_week_id):
             # render as a name beside a strip of em-dashes, so gate on a
             # non-skipped cell somewhere.
             has_trainable = False
-            for w, key in zip(columns, col_keys):
+            for w, key in zip(weeks, col_keys):
                 cell = row["cells"].get(key)
-                focused = w["id"] == focus_week_id
+                focused = w.pk == focus_week_id
                 if cell is None:
                     cells.append({"present": False, "focused": focused})
                     continue
@@ -1208,10 +1341,36 @@ def _athlete_block_grid(block, focus_week_id):
                     "rows": rows,
                 }
             )
-    return {"weeks": weeks, "days": days}
+    return {"weeks": columns, "days": days}
+
+
+def _live_weeks_by_plan(plan_ids):
+    """``{plan_id: [week]}`` — every live week of each plan, in plan order (one query).
+
+    Plan order is the ``(mesocycle.order, index)`` tuple ``_scroll_hint`` walks;
+    one list per plan serves the anchor pick, the chip strip and (filtered to
+    the anchored block) the grid's columns.
+    """
+    weeks = defaultdict(list)
+    for week in (
+        Week.objects.filter(mesocycle__plan_id__in=plan_ids, deleted_at__isnull=True)
+        .select_related("mesocycle")
+        .order_by("mesocycle__order", "index")
+    ):
+        weeks[week.mesocycle.plan_id].append(week)
+    return weeks
+
+
+def _logged_week_ids(user, week_ids):
+    """Which of ``week_ids`` hold any of ``user``'s own logs, any status (one query)."""
+    return set(
+        SessionLog.objects.filter(
+            athlete=user, session__week_id__in=week_ids
+        ).values_list("session__week_id", flat=True)
+    )
 
 
-def _scroll_hint(plan_weeks, user):
+def _scroll_hint(plan_weeks, logged_week_ids):
     """The card's derived, re-read-on-every-request scroll position.
 
     The whole replacement for the removed ``is_current`` pointer (docs/meso/
@@ -1222,12 +1381,10 @@ def _scroll_hint(plan_weeks, user):
     ("back to where you last trained"), never a "you are here" claim, so it
     carries no special label or heading in the template — only a light
     ``focused`` highlight shared with the ``?week=`` override.
+
+    ``logged_week_ids`` is ``_logged_week_ids`` over every card's weeks, read
+    once for the whole home rather than once per card.
     """
-    logged_week_ids = set(
-        SessionLog.objects.filter(
-            athlete=user, session__week_id__in=[w.pk for w in plan_weeks]
-        ).values_list("session__week_id", flat=True)
-    )
     return next(
         (w for w in reversed(plan_weeks) if w.pk in logged_week_ids),
         plan_weeks[0],
@@ -1252,15 +1409,12 @@ def _athlete_default_plan_id(user, plans):
         return None
     plan_ids = [p.pk for p in plans]
     most_recent_log = (
-        SessionLog.objects.filter(
-            athlete=user, session__week__mesocycle__plan_id__in=plan_ids
-        )
-        .select_related("session__week__mesocycle")
+        SessionLog.objects.filter(athlete=user, plan_id__in=plan_ids)
         .order_by("-created_at")
         .first()
     )
     if most_recent_log is not None:
-        return most_recent_log.session.week.mesocycle.plan_id
+        return most_recent_log.plan_id
     most_delivered_plan_id = (
         Week.objects.filter(
             mesocycle__plan_id__in=plan_ids,
@@ -1306,14 +1460,13 @@ def athlete_home(user, focus_week_id=None):
     anchored block (Finding 1, issue #456): a coach adding a new block must
     stay reachable by tapping a chip. ``grid``/``sessions`` stay block-scoped
     — they follow the anchor (the scroll hint's mesocycle) alone.
+
+    Every card is built from the same bulk reads — the plans, the lead-card
+    pick, every plan's live weeks, the athlete's logged weeks, the anchored
+    weeks' sessions (+ cell counts, done flags) and every anchored block's
+    grid — so opening the home costs the same dozen-odd queries with one
+    coach or twenty.
     """
-    requested_week = None
-    if focus_week_id is not None:
-        requested_week = (
-            Week.objects.filter(pk=focus_week_id, deleted_at__isnull=True)
-            .select_related("mesocycle")
-            .first()
-        )
     plans = list(
         Plan.objects.for_athlete(user)
         .exclude(status=Plan.Status.ARCHIVED)
@@ -1321,17 +1474,40 @@ def athlete_home(user, focus_week_id=None):
         .order_by("-modified")
     )
     default_plan_id = _athlete_default_plan_id(user, plans)
-    cards = []
+    weeks_by_plan = _live_weeks_by_plan([p.pk for p in plans])
+    logged_week_ids = _logged_week_ids(
+        user, [w.pk for weeks in weeks_by_plan.values() for w in weeks]
+    )
+
+    # Each card's anchor: the ``?week=`` override when it names a live week of
+    # THIS plan (found among the plan's own live weeks — a foreign, deleted or
+    # other-plan id never matches, so it's a no-op for every other card), else
+    # the derived scroll hint.
+    anchors = {}
     for plan in plans:
-        # Every live week of the plan, in plan order — the same
-        # ``(mesocycle.order, index)`` tuple ``_scroll_hint`` walks. One list
-        # serves the anchor pick and the chip strip.
-        plan_weeks = list(
-            Week.objects.filter(mesocycle__plan_id=plan.pk, deleted_at__isnull=True)
-            .select_related("mesocycle")
-            .order_by("mesocycle__order", "index")
-        )
+        plan_weeks = weeks_by_plan.get(plan.pk)
         if not plan_weeks:
+            continue
+        requested = next((w for w in plan_weeks if w.pk == focus_week_id), None)
+        anchors[plan.pk] = requested or _scroll_hint(plan_weeks, logged_week_ids)
+
+    # The anchored week's sessions are the tappable log rows. Live rows only
+    # (soft delete, designer framework Phase 0): a day the coach removed after
+    # delivering is gone from the athlete's home too, and a removed exercise
+    # stops counting toward the row's "N exercises" chip.
+    sessions_by_week = _athlete_sessions(list(anchors.values()), user)
+    block_weeks = {
+        anchor.mesocycle_id: [
+            w for w in weeks_by_plan[plan_id] if w.mesocycle_id == anchor.mesocycle_id
+        ]
+        for plan_id, anchor in anchors.items()
+    }
+    block_days = _athlete_block_days(block_weeks)
+
+    cards = []
+    for plan in plans:
+        focus = anchors.get(plan.pk)
+        if focus is None:
             cards.append(
                 {
                     "id": plan.pk,
@@ -1345,34 +1521,8 @@ def athlete_home(user, focus_week_id=None):
                 }
             )
             continue
-
-        # ``requested_week`` (the ``?week=`` override) wins over the derived
-        # scroll hint when it names a live week of THIS plan — matched by
-        # ``plan_id`` rather than a second per-card query. A foreign/
-        # other-plan week never matches here, so it's a no-op for every other
-        # card.
-        if requested_week is not None and requested_week.mesocycle.plan_id == plan.pk:
-            anchor = requested_week
-        else:
-            anchor = _scroll_hint(plan_weeks, user)
-        block = anchor.mesocycle
-        focus = anchor
-
-        # The anchored week's sessions are the tappable log rows. Live rows
-        # only (soft delete, designer framework Phase 0): a day the coach
-        # removed after delivering is gone from the athlete's home too, and a
-        # removed exercise stops counting toward the row's "N exercises" chip
-        # (``_athlete_session_row`` reads it via ``session.trainable_cells()``,
-        # already live-filtered — P0 fixed-lineup cutover).
-        session_objs = list(focus.sessions.filter(deleted_at__isnull=True))
-        done = _done_session_ids([s.pk for s in session_objs], user)
-        sessions = [_athlete_session_row(s, done=s.pk in done) for s in session_objs]
-
-        # Week chips (issue #456 Finding 1) span the WHOLE PLAN, not just the
-        # anchored block: a coach adding a NEW block must stay reachable by
-        # tapping a chip — the athlete could never tap into it otherwise.
-        week_chip_groups = _week_chip_groups(plan_weeks, focus)
-
+        plan_weeks = weeks_by_plan[plan.pk]
+        block = focus.mesocycle
         cards.append(
             {
                 "id": plan.pk,
@@ -1380,9 +1530,15 @@ def athlete_home(user, focus_week_id=None):
                 "goal": plan.goal,
                 "coach": plan.coach.display_name(),
                 "block": block.name,
-                "sessions": sessions,
-                "grid": _athlete_block_grid(block, focus.pk),
-                "week_chip_groups": week_chip_groups,
+                "sessions": sessions_by_week.get(focus.pk, []),
+                "grid": _athlete_block_grid(
+                    block_weeks[block.pk], block_days.get(block.pk, []), focus.pk
+                ),
+                # Week chips (issue #456 Finding 1) span the WHOLE PLAN, not
+                # just the anchored block: a coach adding a NEW block must stay
+                # reachable by tapping a chip — the athlete could never tap
+                # into it otherwise.
+                "week_chip_groups": _week_chip_groups(plan_weeks, focus),
                 "chip_count": len(plan_weeks),
                 "awaiting": False,
             }
@@ -1584,6 +1740,9 @@ def athlete_log_payload(session_ctx):
     """
     return {
         "log_url": session_ctx["log_url"],
+        # Where the offline queue is flushed, every queued session in one POST.
+        "sync_url": reverse("meso:athlete_log_sync"),
+        "session": session_ctx["id"],
         # Where a manually-entered 1RM is persisted server-side (Phase 2).
         "one_rm_url": session_ctx["one_rm_url"],
         # Where the athlete's freeform sub-line cells are upserted (Phase 4a).
@@ -1747,3 +1906,49 @@ def tour_funnel(*, variant=None, since=None):
         "funnel": funnel,
         "total_events": qs.count(),
     }
+
+
+def query_profile(stats, budgets):
+    """Adapt the profiling middleware's per-view aggregates into dashboard rows.
+
+    ``stats`` is ``profiling.view_stats()`` (running totals per URL name) and
+    ``budgets`` the declared ``QUERY_BUDGETS``. Each row averages the totals
+    over the view's request count and, for a budgeted view, flags whether its
+    worst request went over. Rows are sorted by average SQL time, slowest
+    first — the order to go hunting in.
+
+    Contract (the template + tests read these exact keys): ``rows`` —
+    ``[{"view", "requests", "avg_queries", "max_queries", "avg_sql_ms",
+    "avg_python_ms", "avg_duplicates", "budget", "over_budget", "duplicates"}]``
+    with ``duplicates`` a ``[{"sql", "count"}]`` list, most repeated first;
+    ``over_budget`` — how many budgeted views went over; ``total_requests``.
+    """
+    rows = []
+    for view, row in stats.items():
+        requests = row["requests"] or 1
+        budget = budgets.get(view)
+        rows.append(
+            {
+                "view": view,
+                "requests": row["requests"],
+                "avg_queries": round(row["queries"] / requests, 1),
+                "max_queries": row["max_queries"],
+                "avg_sql_ms": round(row["sql_ms"] / requests, 1),
+                "avg_python_ms": round(row["python_ms"] / requests, 1),
+                "avg_duplicates": round(row["duplicate_queries"] / requests, 1),
+                "budget": budget,
+                "over_budget": budget is not None and row["max_queries"] > budget,
+                "duplicates": [
+                    {"sql": sql, "count": count}
+                    for sql, count in sorted(
+                        row["duplicates"].items(), key=lambda item: -item[1]
+                    )
+                ],
+            }
+        )
+    rows.sort(key=lambda r: (-r["avg_sql_ms"], r["view"]))
+    return {
+        "rows": rows,
+        "over_budget": sum(1 for r in rows if r["over_budget"]),
+        "total_requests": sum(r["requests"] for r in rows),
+    }
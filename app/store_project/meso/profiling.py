@@ -0,0 +1,206 @@
+"""Per-request SQL profiling for the meso views, and their declared query budgets.
+
+Most of the expensive meso reads (the athlete home, the roster, the designer's
+plan payload, session results) cost what their hidden N+1s cost, and a
+regression shows up as "the page got slower" long after the commit that caused
+it. Three pieces make that cost visible:
+
+- ``QueryProfileMiddleware`` wraps every request to a ``meso:`` view in a
+  ``connection.execute_wrapper`` and records the query count, the total SQL
+  time, the Python time (wall clock minus SQL) and the *duplicate* queries —
+  the same statement shape run more than once, an N+1's signature. Staff get
+  the numbers back as a ``Server-Timing`` header (browser devtools draw it in
+  the request's timing tab), and every request folds into a per-view aggregate
+  in the default cache that the staff ``QueryProfileView`` reads. Off unless
+  ``MESO_QUERY_PROFILING`` is set: the wrapper costs a ``perf_counter`` pair
+  and a list append per query, and the aggregate a cache round trip per request.
+- ``QUERY_BUDGETS`` declares the most queries each hot endpoint may run. The
+  dashboard flags views whose worst request went over, and the ``query_budget``
+  pytest fixture fails a test whose request does — so a new N+1 breaks CI
+  instead of production.
+- ``fingerprint`` reduces a statement to its shape (literals and ``IN`` lists
+  collapsed), which is what "duplicate" means above.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+STATS_KEY = "meso:qprof:views"
+
+# The most queries one request to each endpoint may run, keyed by URL name.
+# Fixed counts — these views read in a bounded number of queries however big
+# the roster, plan or log history is — set to the measured count plus a little
+# headroom. Raise one deliberately (and say why in the commit), never to make
+# a red test green.
+QUERY_BUDGETS = {
+    "meso:roster": 26,
+    "meso:athlete_home": 20,
+    "meso:designer_plan": 24,
+    "meso:results_session": 12,
+}
+
+# Duplicate fingerprints kept per view on the dashboard — the worst offenders
+# are what matter, and the aggregate lives in a small ``noeviction`` Redis.
+TOP_DUPLICATES = 5
+
+# The dashboard reading the aggregates stays out of them (its reset would
+# otherwise re-seed a row for itself).
+UNPROFILED_VIEWS = {"meso:query_profile"}
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """``sql`` reduced to its shape: literals → ``?``, ``IN`` lists → ``(...)``.
+
+    Two statements with the same fingerprint differ only in their parameters —
+    the same lookup run for different rows. Django hands the wrapper the
+    statement with ``%s`` placeholders, so the literal rewriting only matters for
+    raw SQL with values inlined.
+    """
+    shape = _STRINGS.sub("?", sql)
+    shape = _NUMBERS.sub("?", shape)
+    shape = _IN_LISTS.sub("(...)", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class QueryRecorder:
+    """A ``connection.execute_wrapper`` that keeps every statement and its duration."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def sql_seconds(self):
+        return sum(duration for _sql, duration in self.queries)
+
+    def duplicates(self):
+        """``{fingerprint: times run}`` for every shape run more than once."""
+        counts = Counter(fingerprint(sql) for sql, _duration in self.queries)
+        return {shape: n for shape, n in counts.items() if n > 1}
+
+    def profile(self, wall_seconds):
+        """The request's numbers: counts, SQL/Python milliseconds, duplicates."""
+        sql_ms = self.sql_seconds * 1000
+        duplicates = self.duplicates()
+        return {
+            "queries": self.count,
+            "sql_ms": sql_ms,
+            "python_ms": max(wall_seconds * 1000 - sql_ms, 0.0),
+            # Extra runs beyond the first of each repeated shape — the queries
+            # a batched read would save.
+            "duplicate_queries": sum(n - 1 for n in duplicates.values()),
+            "duplicates": duplicates,
+        }
+
+
+@contextmanager
+def record_queries():
+    """Record the queries run inside the block; yields the ``QueryRecorder``."""
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        yield recorder
+
+
+def server_timing(profile):
+    """The ``Server-Timing`` header value for one request's ``profile``."""
+    queries = profile["queries"]
+    desc = f"{queries} quer{'y' if queries == 1 else 'ies'}"
+    if profile["duplicate_queries"]:
+        desc += f", {profile['duplicate_queries']} duplicate"
+    return (
+        f'db;dur={profile["sql_ms"]:.1f};desc="{desc}", '
+        f'app;dur={profile["python_ms"]:.1f};desc="Python"'
+    )
+
+
+def record(view_name, profile):
+    """Fold one request's ``profile`` into ``view_name``'s running aggregate.
+
+    A read-modify-write of one cache entry: two requests finishing at the same
+    instant can drop a sample, which a sampling profiler can live with (an
+    atomic counter per metric would cost five round trips a request).
+    """
+    stats = cache.get(STATS_KEY) or {}
+    row = stats.get(view_name) or {
+        "requests": 0,
+        "queries": 0,
+        "max_queries": 0,
+        "sql_ms": 0.0,
+        "python_ms": 0.0,
+        "duplicate_queries": 0,
+        "duplicates": {},
+    }
+    row["requests"] += 1
+    row["queries"] += profile["queries"]
+    row["max_queries"] = max(row["max_queries"], profile["queries"])
+    row["sql_ms"] += profile["sql_ms"]
+    row["python_ms"] += profile["python_ms"]
+    row["duplicate_queries"] += profile["duplicate_queries"]
+    duplicates = Counter(row["duplicates"])
+    duplicates.update(profile["duplicates"])
+    row["duplicates"] = dict(duplicates.most_common(TOP_DUPLICATES))
+    stats[view_name] = row
+    cache.set(STATS_KEY, stats, timeout=None)
+
+
+def view_stats():
+    """Every profiled view's aggregate, ``{view_name: row}`` (see ``record``)."""
+    return cache.get(STATS_KEY) or {}
+
+
+def reset_stats():
+    cache.delete(STATS_KEY)
+
+
+class QueryProfileMiddleware:
+    """Profile every request that resolves to a ``meso:`` view (see module docs).
+
+    The setting is read per request, so profiling can be switched on without a
+    restart in tests (``settings`` fixture) and is a single attribute check when
+    off. Requests outside the meso namespace run unwrapped in effect — they're
+    timed, then dropped, since the namespace is only known after resolving.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.MESO_QUERY_PROFILING:
+            return self.get_response(request)
+        start = time.perf_counter()
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+        if (
+            match is None
+            or match.namespace != "meso"
+            or match.view_name in UNPROFILED_VIEWS
+        ):
+            return response
+        profile = recorder.profile(time.perf_counter() - start)
+        record(match.view_name, profile)
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            response["Server-Timing"] = server_timing(profile)
+        return response
@@ -0,0 +1,58 @@
+"""Cache of the scored session results, keyed by the log they score.
+
+The coach's results screen (``ResultsView``) and the athlete profile's "Latest
+session" card (``presenters._profile_results``) both score the athlete's newest
+*done* log for a session against its prescription (``presenters.
+session_results``): the session's cells and sub-lines, the log's sets, the PR
+ledger's flags. A logged session is re-read far more often than it changes, so
+the scored payload is cached in the default (Redis) cache, one entry per
+session, stamped with everything it was built from —
+
+- the log's pk and ``updated_at``: the log endpoint saves the log before it
+  replaces the sets, so a re-log (or a newer log taking over) restamps it;
+- the log's ``records_at``: a PR-ledger rebuild can re-flag a log's records
+  without saving the log itself;
+- the plan's ``edit_version``: a coach edit to the prescription re-scores it.
+
+A stamp mismatch is a miss that overwrites the entry in place (never a delete),
+as in ``grid_cache``. A hit costs the one query that finds the log.
+``MESO_RESULTS_CACHE_TTL`` bounds how long an entry can outlive a write outside
+those paths (an admin edit to a set, a renamed athlete); 0 disables the cache.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import presenters
+
+
+def results_cache_key(session_id):
+    return f"meso:results:{session_id}"
+
+
+def _stamp(session, log):
+    version = session.week.mesocycle.plan.edit_version
+    if log is None:
+        return (None, None, None, version)
+    return (log.pk, log.updated_at, log.records_at, version)
+
+
+def session_results(session, log=None):
+    """``presenters.session_results(session)``, from cache when current.
+
+    ``log`` is the session's newest done log when the caller already holds it
+    (the profile card finds it first); otherwise it's looked up here.
+    """
+    timeout = settings.MESO_RESULTS_CACHE_TTL
+    if not timeout:
+        return presenters.session_results(session, log=log)
+    if log is None:
+        log = presenters.results_log(session)
+    stamp = _stamp(session, log)
+    key = results_cache_key(session.pk)
+    entry = cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    results = presenters.session_results(session, log=log)
+    cache.set(key, (stamp, results), timeout=timeout)
+    return results
@@ -17,6 +17,7 @@ athlete actually did last time, per lift) is derived from real logged sets here
 from collections import Counter
 from collections import defaultdict
 
+from django.db.models import Q
 from django.urls import reverse
 
 from . import models
@@ -107,13 +108,17 @@ def _agent_reply_for_batch(batch):
         message["error"] = True
         return message
     if batch.status == Status.DRAFTING:
-        # A run still in flight at render time. Carry the status URL so the
-        # front-end can resume polling and replace this placeholder when the
-        # batch lands; the note is the fallback if the run never resolves.
+        # A run still in flight at render time. Carry the status (and status
+        # stream) URLs so the front-end can resume waiting and replace this
+        # placeholder when the batch lands; the note is the fallback if the run
+        # never resolves.
         message["text"] = _DRAFTING_NOTE
         message["pollUrl"] = reverse(
             "meso:api_batch_status", kwargs={"batch_id": batch.pk}
         )
+        message["eventsUrl"] = reverse(
+            "meso:api_batch_events", kwargs={"batch_id": batch.pk}
+        )
         return message
 
     changes = [serialize_proposed_change(c) for c in batch.changes.all()]
@@ -146,7 +151,7 @@ def serialize_chat_thread(plan):
     return thread
 
 
-def serialize_session(session):
+def serialize_session(session, cells=None, line_cells=None):
     """One training day (a column in the coach designer grid).
 
     Returns every live cell (``session.cells()``, the P0 fixed-lineup cutover) —
@@ -155,9 +160,17 @@ def serialize_session(session):
     means the row/day id-sets the designer renders match the reorder/move
     endpoints exactly. Athlete-facing surfaces use ``trainable_cells()`` instead,
     so a skipped lift is never presented as loggable.
+
+    ``cells`` / ``line_cells`` stand in for ``session.cells()`` /
+    ``session.line_cells()`` when the caller already loaded them for many
+    sessions at once (``serialize_week_snapshots``); same rows, same order.
     """
+    if cells is None:
+        cells = session.cells()
+    if line_cells is None:
+        line_cells = session.line_cells()
     lines_by_slot = defaultdict(list)
-    for line_cell in session.line_cells():
+    for line_cell in line_cells:
         lines_by_slot[line_cell.exercise_slot_id].append(line_cell)
     return {
         "id": session.pk,
@@ -166,7 +179,7 @@ def serialize_session(session):
         "bias": session.bias,
         "exercises": [
             serialize_prescription(c, lines_by_slot.get(c.exercise_slot_id, ()))
-            for c in session.cells()
+            for c in cells
         ],
     }
 
@@ -229,6 +242,18 @@ def _phase_states(mesocycles, current_mesocycle):
     return states
 
 
+def _week_snapshot_meta(week):
+    """The week-level half of a delivery snapshot (its meta, no grid)."""
+    return {
+        "id": week.pk,
+        "index": week.index,
+        "phase": week.phase,
+        "volume": week.volume,
+        "intensity": week.intensity,
+        "is_deload": week.is_deload,
+    }
+
+
 def serialize_week_snapshot(week):
     """A self-contained snapshot of a week, for a ``WeekDelivery`` payload.
 
@@ -236,22 +261,62 @@ def serialize_week_snapshot(week):
     delivery can diff against it ("changes since last delivery"). Only live
     sessions (and, via ``serialize_session``'s ``session.cells()``, live
     exercise rows) are included (soft delete, designer framework Phase 0).
+    Snapshotting several weeks at once? ``serialize_week_snapshots`` builds the
+    same payloads in a fixed number of queries.
     """
     return {
-        "week": {
-            "id": week.pk,
-            "index": week.index,
-            "phase": week.phase,
-            "volume": week.volume,
-            "intensity": week.intensity,
-            "is_deload": week.is_deload,
-        },
+        "week": _week_snapshot_meta(week),
         "sessions": [
             serialize_session(s) for s in week.sessions.filter(deleted_at__isnull=True)
         ],
     }
 
 
+def serialize_week_snapshots(weeks):
+    """``serialize_week_snapshot`` for many weeks, keyed by week pk.
+
+    Delivering a block snapshots every one of its weeks; the one-week builder
+    costs a sessions query per week plus two cell queries (and a slot lookup)
+    per session, so delivery time grew with the block's size. This loads the
+    weeks' live sessions (with their slots) and every live-row cell in two
+    queries and groups them in memory — the payloads are identical, dict for
+    dict, to ``serialize_week_snapshot``'s.
+    """
+    weeks = list(weeks)
+    sessions_by_week = defaultdict(list)
+    for session in models.Session.objects.filter(
+        week__in=weeks, deleted_at__isnull=True
+    ).select_related("session_slot"):
+        sessions_by_week[session.week_id].append(session)
+    # Keyed (week, day): the row-order line-0 cells and the sub-line stack,
+    # exactly what ``session.cells()`` / ``session.line_cells()`` return.
+    cells = defaultdict(list)
+    line_cells = defaultdict(list)
+    for cell in (
+        models.Prescription.objects.filter(
+            week__in=weeks, exercise_slot__deleted_at__isnull=True
+        )
+        .select_related("exercise_slot")
+        .order_by("exercise_slot__order", "line")
+    ):
+        key = (cell.week_id, cell.exercise_slot.session_slot_id)
+        (cells if cell.line == 0 else line_cells)[key].append(cell)
+    return {
+        week.pk: {
+            "week": _week_snapshot_meta(week),
+            "sessions": [
+                serialize_session(
+                    s,
+                    cells=cells[(week.pk, s.session_slot_id)],
+                    line_cells=line_cells[(week.pk, s.session_slot_id)],
+                )
+                for s in sessions_by_week[week.pk]
+            ],
+        }
+        for week in weeks
+    }
+
+
 # Prescription fields a coach cares about when reviewing "what changed", with the
 # label the deliver screen shows. ``name`` first so a rename reads as the headline
 # change; ``tag`` last (it's only present when the row carries one). Text-first
@@ -484,9 +549,7 @@ def serialize_recent_logs(plan, *, limit=5, sets_cap=24):
     capped (``limit`` sessions, ``sets_cap`` sets each) to keep the context small.
     """
     logs = (
-        models.SessionLog.objects.filter(
-            session__week__mesocycle__plan=plan, athlete=plan.athlete
-        )
+        models.SessionLog.objects.filter(plan=plan, athlete=plan.athlete)
         .select_related("session")
         .prefetch_related("sets__prescription")
         .order_by("-date", "-created_at")[:limit]
@@ -589,7 +652,7 @@ def last_logged_labels(plan, prescriptions, unit):
         return {}
     logged_sets = (
         models.LoggedSet.objects.filter(
-            session_log__session__week__mesocycle__plan=plan,
+            session_log__plan=plan,
             session_log__athlete=plan.athlete,
             session_log__status=models.SessionLog.Status.DONE,
         )
@@ -718,11 +781,48 @@ def serialize_plan_history(plan):
     }
 
 
-def serialize_plan(plan, week=None):
+def lift_overlays(plan, prescriptions):
+    """``{prescription pk: overlay}`` — the log-derived values over a grid's lifts.
+
+    Each overlay holds the "last time" label (``last``) and the athlete's
+    stored 1RM (``one_rm`` + ``one_rm_source``), each only when there is one;
+    a lift with neither is absent. These move with every log, unlike the grid
+    they're laid over — the agent sends them apart from its cached grid.
+    """
+    # Light up the "last time" column from real logs (athlete Phase 3): one
+    # query over the plan's logged sets, mapped onto the rendered prescriptions.
+    last_map = last_logged_labels(plan, prescriptions, plan.unit)
+    # The athlete's persisted, log-derived 1RM per lift, so the coach sees what
+    # a %1RM target translates to when prescribing one. Local import:
+    # ``one_rm`` imports this module.
+    from .one_rm import one_rm_values
+
+    one_rm_map = one_rm_values(plan.athlete, prescriptions, plan.unit)
+    overlays = {}
+    for presc in prescriptions:
+        overlay = {}
+        label = last_map.get(presc.pk)
+        if label:
+            overlay["last"] = label
+        one_rm = one_rm_map.get(presc.pk)
+        if one_rm is not None:
+            overlay["one_rm"] = _fmt_num(one_rm.value)
+            # The coach designer distinguishes a log-derived estimate from a
+            # value the coach/athlete set, and repaints it after an edit (1RM
+            # Phase 3 — the editable %1RM badge).
+            overlay["one_rm_source"] = one_rm.source
+        if overlay:
+            overlays[presc.pk] = overlay
+    return overlays
+
+
+def serialize_plan(plan, week=None, *, overlays=True):
     """Serialize ``plan`` to the designer's ``program``/``weeks``/``phases`` shape.
 
     ``week`` optionally pins which week populates ``program``/``weeks``;
     otherwise the flagged current week (or the plan's first) is used.
+    ``overlays=False`` leaves out the log-derived ``lift_overlays``, so the
+    payload only moves with the plan's own edits.
     """
     open_week = current_week(plan, week)
     current_mesocycle = open_week.mesocycle if open_week else None
@@ -734,29 +834,11 @@ def serialize_plan(plan, week=None):
         # time" / 1RM overlays below.
         sessions = list(open_week.sessions.filter(deleted_at__isnull=True))
         program = [serialize_session(s) for s in sessions]
-        prescriptions = [c for s in sessions for c in s.cells()]
-        # Light up the "last time" column from real logs (athlete Phase 3):
-        # one query over the plan's logged sets, mapped onto the rendered
-        # prescriptions.
-        last_map = last_logged_labels(plan, prescriptions, plan.unit)
-        # The athlete's persisted, log-derived 1RM per lift, so the coach sees
-        # what a %1RM target translates to when prescribing one. Local import:
-        # ``one_rm`` imports this module.
-        from .one_rm import one_rm_values
-
-        one_rm_map = one_rm_values(plan.athlete, prescriptions, plan.unit)
-        for session_data in program:
-            for exercise in session_data["exercises"]:
-                label = last_map.get(exercise["id"])
-                if label:
-                    exercise["last"] = label
-                one_rm = one_rm_map.get(exercise["id"])
-                if one_rm is not None:
-                    exercise["one_rm"] = _fmt_num(one_rm.value)
-                    # The coach designer distinguishes a log-derived estimate
-                    # from a value the coach/athlete set, and repaints it after
-                    # an edit (1RM Phase 3 — the editable %1RM badge).
-                    exercise["one_rm_source"] = one_rm.source
+        if overlays:
+            by_id = lift_overlays(plan, [c for s in sessions for c in s.cells()])
+            for session_data in program:
+                for exercise in session_data["exercises"]:
+                    exercise.update(by_id.get(exercise["id"], {}))
         week_strip = [
             serialize_week(w)
             for w in current_mesocycle.weeks.filter(deleted_at__isnull=True)
@@ -814,6 +896,105 @@ def _pick_session_id(slot_id, sessions_by_slot, anchor_week_id, weeks):
     return None
 
 
+def _grid_sessions_by_slot(week_ids, slot_ids):
+    """``{slot_id: {week_id: session_id}}`` over the live sessions — one query."""
+    sessions_by_slot = defaultdict(dict)
+    for sess in models.Session.objects.filter(
+        week_id__in=week_ids, session_slot_id__in=slot_ids, deleted_at__isnull=True
+    ):
+        sessions_by_slot[sess.session_slot_id][sess.week_id] = sess.pk
+    return sessions_by_slot
+
+
+def _grid_cells(exercise_slot_ids, week_ids):
+    """Every cell of the given rows × weeks — all lines — in one query.
+
+    Grouped by (slot, week) into ``(line-0 cells, sub-line lists)`` so each
+    row's dense ``cells`` map is built without a per-row lookup.
+    ``select_related("exercise_slot")`` keeps the resolving
+    ``.exercise_id``/``.name`` property reads from being an N+1 (one query
+    per cell).
+    """
+    cells_by_key = {}
+    lines_by_key = defaultdict(list)
+    for cell in (
+        models.Prescription.objects.filter(
+            exercise_slot_id__in=exercise_slot_ids, week_id__in=week_ids
+        )
+        .select_related("exercise_slot")
+        .order_by("line")
+    ):
+        if cell.line == 0:
+            cells_by_key[(cell.exercise_slot_id, cell.week_id)] = cell
+        else:
+            lines_by_key[(cell.exercise_slot_id, cell.week_id)].append(cell)
+    return cells_by_key, lines_by_key
+
+
+def _grid_row(exercise_slot, weeks, cells_by_key, lines_by_key):
+    """One grid row: the slot's row columns + its dense per-week ``cells``."""
+    cells = {}
+    for week in weeks:
+        cell = cells_by_key.get((exercise_slot.pk, week.pk))
+        if cell is None:
+            continue
+        cells[str(week.pk)] = {
+            "prescription_id": cell.pk,
+            "text": cell.text,
+            "skipped": cell.skipped,
+            # The row's freeform sub-line stack for this week (Phase
+            # 2a): id included so the table can patch a sub-line by pk;
+            # blank sub-lines are kept here (unlike athlete-facing
+            # serialization) so the editor can show a cleared line
+            # in place rather than collapsing the stack.
+            "lines": [
+                {"id": lc.pk, "line": lc.line, "text": lc.text}
+                for lc in lines_by_key.get((exercise_slot.pk, week.pk), [])
+            ],
+        }
+    return {
+        "exercise_slot_id": exercise_slot.pk,
+        "name": exercise_slot.name,
+        "exercise_id": exercise_slot.exercise_id,
+        "order": exercise_slot.order,
+        "tags": list(exercise_slot.tags or []),
+        # Per-exercise columns (Phase 2a, D2): Tempo / Rest /
+        # instructions live on the row, not per week.
+        "tempo": exercise_slot.tempo,
+        "rest": exercise_slot.rest,
+        "note": exercise_slot.note,
+        "cells": cells,
+    }
+
+
+def _grid_day_header(slot, sessions_by_slot, weeks):
+    """One grid day's own fields — everything but its ``rows``."""
+    current_week_id = weeks[0].pk if weeks else None
+    return {
+        "session_slot_id": slot.pk,
+        "session_id": _pick_session_id(
+            slot.pk, sessions_by_slot, current_week_id, weeks
+        ),
+        # Per-week session pks for this day (Codex #455 A2 review
+        # finding 2) — reuses ``sessions_by_slot`` (already loaded
+        # above for ``_pick_session_id``, no extra query), keyed by
+        # ``str(week_id)`` so a day-reorder client can look up its
+        # OWN current-week session id instead of trusting
+        # ``session_id`` above, which can silently be a FALLBACK to
+        # a different (non-current) week's session when the current
+        # week's was independently soft-deleted. A week missing a
+        # live session for this slot has no entry.
+        "session_ids": {
+            str(week_id): session_pk
+            for week_id, session_pk in sessions_by_slot.get(slot.pk, {}).items()
+        },
+        "day_number": slot.day_number,
+        "name": slot.name,
+        "bias": slot.bias,
+        "order": slot.order,
+    }
+
+
 def serialize_mesocycle_grid(mesocycle):
     """The P1 multi-week table: every live day × row × week cell, densely.
 
@@ -837,7 +1018,6 @@ def serialize_mesocycle_grid(mesocycle):
     plan = mesocycle.plan
     weeks = list(mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index"))
     week_ids = [w.pk for w in weeks]
-    current_week_id = weeks[0].pk if weeks else None
 
     session_slots = list(
         mesocycle.session_slots.filter(deleted_at__isnull=True).order_by(
@@ -849,107 +1029,28 @@ def serialize_mesocycle_grid(mesocycle):
     # session_id resolution: one query over every live session for this
     # block's live slots/weeks, grouped ``slot_id -> {week_id: session_id}``
     # so ``_pick_session_id`` can prefer the current week per slot.
-    sessions_by_slot = defaultdict(dict)
-    for sess in models.Session.objects.filter(
-        week_id__in=week_ids, session_slot_id__in=slot_ids, deleted_at__isnull=True
-    ):
-        sessions_by_slot[sess.session_slot_id][sess.week_id] = sess.pk
+    sessions_by_slot = _grid_sessions_by_slot(week_ids, slot_ids)
 
     exercise_slots = list(
         models.ExerciseSlot.objects.filter(
             session_slot_id__in=slot_ids, deleted_at__isnull=True
         ).order_by("order")
     )
-    exercise_slot_ids = [e.pk for e in exercise_slots]
     rows_by_slot = defaultdict(list)
     for exercise_slot in exercise_slots:
         rows_by_slot[exercise_slot.session_slot_id].append(exercise_slot)
-
-    # One query for every live cell in the block — all lines — grouped by
-    # (slot, week) into ``{line-0 cell, sub-line list}`` so each row's dense
-    # ``cells`` map is built without a per-row lookup.
-    # ``select_related("exercise_slot")`` keeps the resolving
-    # ``.exercise_id``/``.name`` property reads from being an N+1 (one query
-    # per cell).
-    cells_by_key = {}
-    lines_by_key = defaultdict(list)
-    for cell in (
-        models.Prescription.objects.filter(
-            exercise_slot_id__in=exercise_slot_ids, week_id__in=week_ids
-        )
-        .select_related("exercise_slot")
-        .order_by("line")
-    ):
-        if cell.line == 0:
-            cells_by_key[(cell.exercise_slot_id, cell.week_id)] = cell
-        else:
-            lines_by_key[(cell.exercise_slot_id, cell.week_id)].append(cell)
-
-    days = []
-    for slot in session_slots:
-        rows = []
-        for exercise_slot in rows_by_slot.get(slot.pk, []):
-            cells = {}
-            for week in weeks:
-                cell = cells_by_key.get((exercise_slot.pk, week.pk))
-                if cell is None:
-                    continue
-                cell_data = {
-                    "prescription_id": cell.pk,
-                    "text": cell.text,
-                    "skipped": cell.skipped,
-                    # The row's freeform sub-line stack for this week (Phase
-                    # 2a): id included so the table can patch a sub-line by pk;
-                    # blank sub-lines are kept here (unlike athlete-facing
-                    # serialization) so the editor can show a cleared line
-                    # in place rather than collapsing the stack.
-                    "lines": [
-                        {"id": lc.pk, "line": lc.line, "text": lc.text}
-                        for lc in lines_by_key.get((exercise_slot.pk, week.pk), [])
-                    ],
-                }
-                cells[str(week.pk)] = cell_data
-            rows.append(
-                {
-                    "exercise_slot_id": exercise_slot.pk,
-                    "name": exercise_slot.name,
-                    "exercise_id": exercise_slot.exercise_id,
-                    "order": exercise_slot.order,
-                    "tags": list(exercise_slot.tags or []),
-                    # Per-exercise columns (Phase 2a, D2): Tempo / Rest /
-                    # instructions live on the row, not per week.
-                    "tempo": exercise_slot.tempo,
-                    "rest": exercise_slot.rest,
-                    "note": exercise_slot.note,
-                    "cells": cells,
-                }
-            )
-        days.append(
-            {
-                "session_slot_id": slot.pk,
-                "session_id": _pick_session_id(
-                    slot.pk, sessions_by_slot, current_week_id, weeks
-                ),
-                # Per-week session pks for this day (Codex #455 A2 review
-                # finding 2) — reuses ``sessions_by_slot`` (already loaded
-                # above for ``_pick_session_id``, no extra query), keyed by
-                # ``str(week_id)`` so a day-reorder client can look up its
-                # OWN current-week session id instead of trusting
-                # ``session_id`` above, which can silently be a FALLBACK to
-                # a different (non-current) week's session when the current
-                # week's was independently soft-deleted. A week missing a
-                # live session for this slot has no entry.
-                "session_ids": {
-                    str(week_id): session_pk
-                    for week_id, session_pk in sessions_by_slot.get(slot.pk, {}).items()
-                },
-                "day_number": slot.day_number,
-                "name": slot.name,
-                "bias": slot.bias,
-                "order": slot.order,
-                "rows": rows,
-            }
-        )
+    cells_by_key, lines_by_key = _grid_cells([e.pk for e in exercise_slots], week_ids)
+
+    days = [
+        {
+            **_grid_day_header(slot, sessions_by_slot, weeks),
+            "rows": [
+                _grid_row(exercise_slot, weeks, cells_by_key, lines_by_key)
+                for exercise_slot in rows_by_slot.get(slot.pk, [])
+            ],
+        }
+        for slot in session_slots
+    ]
 
     # Issue #455 phase A5: the macrocycle rail, scoped so THIS mesocycle (the
     # block the grid renders) is the "current" one — mirrors serialize_plan's
@@ -991,6 +1092,92 @@ def serialize_mesocycle_grid(mesocycle):
         ],
         "days": days,
         "history": serialize_plan_history(plan),
+        # The grid version (``Plan.edit_version``) this payload reflects — the
+        # designer keeps it so a later ``serialize_grid_patch`` reply can be
+        # told apart from a stale one.
+        "version": plan.edit_version,
+    }
+
+
+def serialize_grid_patch(plan, mesocycle, *, rows=(), days=(), day_headers=()):
+    """Just the part of ``serialize_mesocycle_grid`` one write changed.
+
+    The designer's patch-response mode: a write that touched one row (a cell
+    skip, a fill, a sub-line) or one or two days (an added/moved/reordered
+    row) answers with those pieces only, so its reply is O(rows touched), not
+    O(block), and the client merges it into the grid it already holds.
+
+    - ``rows`` — exercise-slot pks whose whole row (columns + every cell) is
+      re-serialized; each entry carries its ``session_slot_id`` so the client
+      can place it.
+    - ``days`` — session-slot pks whose day is re-serialized *with* its full
+      ``rows`` list (the client replaces the day's rows wholesale — row
+      add/move/reorder).
+    - ``day_headers`` — session-slot pks whose day fields only (``order``,
+      ``name``, session ids) are re-serialized, rows left as the client has
+      them (a day reorder).
+
+    A requested row or day that is no longer live lands in
+    ``removed_rows``/``removed_days``. Rows and days carry the same fields, in
+    the same shape, as the full grid; ``version`` is the plan's
+    ``edit_version`` after the write, i.e. the version a full refetch would
+    report now.
+    """
+    weeks = list(mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index"))
+    week_ids = [w.pk for w in weeks]
+    row_ids = set(rows)
+    full_day_ids = set(days)
+    day_ids = full_day_ids | set(day_headers)
+
+    live_slots = list(
+        mesocycle.session_slots.filter(
+            pk__in=day_ids, deleted_at__isnull=True
+        ).order_by("order", "day_number")
+    )
+    live_slot_ids = {slot.pk for slot in live_slots}
+    sessions_by_slot = _grid_sessions_by_slot(week_ids, live_slot_ids)
+
+    exercise_slots = list(
+        models.ExerciseSlot.objects.filter(
+            Q(pk__in=row_ids) | Q(session_slot_id__in=full_day_ids & live_slot_ids),
+            session_slot__mesocycle=mesocycle,
+            session_slot__deleted_at__isnull=True,
+            deleted_at__isnull=True,
+        ).order_by("order")
+    )
+    cells_by_key, lines_by_key = _grid_cells([e.pk for e in exercise_slots], week_ids)
+    rows_by_slot = defaultdict(list)
+    for exercise_slot in exercise_slots:
+        rows_by_slot[exercise_slot.session_slot_id].append(exercise_slot)
+
+    patch_days = []
+    for slot in live_slots:
+        day = _grid_day_header(slot, sessions_by_slot, weeks)
+        if slot.pk in full_day_ids:
+            day["rows"] = [
+                _grid_row(exercise_slot, weeks, cells_by_key, lines_by_key)
+                for exercise_slot in rows_by_slot.get(slot.pk, [])
+            ]
+        patch_days.append(day)
+
+    # Rows already carried inside a full day aren't repeated on their own.
+    covered = full_day_ids & live_slot_ids
+    patch_rows = [
+        {
+            "session_slot_id": exercise_slot.session_slot_id,
+            **_grid_row(exercise_slot, weeks, cells_by_key, lines_by_key),
+        }
+        for exercise_slot in exercise_slots
+        if exercise_slot.pk in row_ids and exercise_slot.session_slot_id not in covered
+    ]
+    live_row_ids = {exercise_slot.pk for exercise_slot in exercise_slots}
+    return {
+        "version": plan.edit_version,
+        "mesocycle_id": mesocycle.pk,
+        "days": patch_days,
+        "rows": patch_rows,
+        "removed_days": sorted(day_ids - live_slot_ids),
+        "removed_rows": sorted(row_ids - live_row_ids),
     }
 
 
@@ -1000,7 +1187,8 @@ def serialize_agent_block(plan, mesocycle):
     Every live week of ``mesocycle`` with its full session/cell grid (numbers
     incl. ``rest``) plus the week's phase/volume/intensity/deload flags — so the
     agent programs progression across the block, not one week in isolation.
-    Reuses ``serialize_week_snapshot`` verbatim. A cell's pk is stable, so ids
+    Reuses the delivery snapshot verbatim (``serialize_week_snapshots``, the
+    whole block in a fixed number of queries). A cell's pk is stable, so ids
     here match ``serialize_plan``'s single-week ``program`` — any id the agent
     returns resolves the same either way.
 
@@ -1016,6 +1204,6 @@ def serialize_agent_block(plan, mesocycle):
     """
     if mesocycle is None:
         return {"name": "", "weeks": []}
-    weeks = mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index")
-    serialized = [serialize_week_snapshot(w) for w in weeks]
-    return {"name": mesocycle.name, "weeks": serialized}
+    weeks = list(mesocycle.weeks.filter(deleted_at__isnull=True).order_by("index"))
+    snapshots = serialize_week_snapshots(weeks)
+    return {"name": mesocycle.name, "weeks": [snapshots[w.pk] for w in weeks]}
@@ -11,6 +11,9 @@ date-less; docs/meso/remove-current-week-plan.md §4a, decided 2026-07-18):
   pill's tone-band input;
 - ``adherence.link_session_count`` — distinct DONE sessions in a rolling
   window (default 14d), the profile's secondary chip;
+- ``adherence.link_cadences`` — both signals for a whole list of links in one
+  grouped query, what the roster reads (its query count can't grow with the
+  roster);
 - ``adherence.recent_logs`` / ``presenters.roster_activity`` — the coach's
   athletes' most recent completed sessions, scoped to active links
   (untouched by this rework — already fully date-less).
@@ -22,6 +25,8 @@ athlete only ever counts their own logs.
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -35,6 +40,7 @@ from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import SessionLogFactory
 from store_project.meso.factories import WeekFactory
 from store_project.meso.models import CoachAthlete
+from store_project.meso.models import CoachSubscription
 from store_project.meso.models import Plan
 from store_project.meso.models import SessionLog
 from store_project.users.factories import UserFactory
@@ -224,6 +230,51 @@ class TestLinkSessionCount:
 # -- recent_logs (unchanged — already fully date-less) ------------------------
 
 
+class TestLinkCadences:
+    def test_matches_the_single_link_helpers(self):
+        coach = UserFactory()
+        fresh = CoachAthleteFactory(coach=coach)
+        stale = CoachAthleteFactory(coach=coach)
+        idle = CoachAthleteFactory(coach=coach)
+        _done_log(fresh)
+        _done_log(fresh)
+        _done_log(stale, days_ago=20)
+        delivered_week(idle, sessions=1, done=0)
+
+        cadences = adherence.link_cadences([fresh, stale, idle])
+
+        for link in (fresh, stale, idle):
+            assert cadences[link.pk].recency_days == adherence.link_recency_days(link)
+            assert cadences[link.pk].session_count == adherence.link_session_count(link)
+        assert cadences[fresh.pk].session_count == 2
+        assert cadences[stale.pk].recency_days == 20
+        assert cadences[stale.pk].session_count == 0
+        assert cadences[idle.pk] == adherence.NO_CADENCE
+
+    def test_ignores_another_athletes_logs_and_archived_plans(self):
+        rel = CoachAthleteFactory()
+        week = delivered_week(rel, sessions=1, done=0)
+        SessionLogFactory(
+            session=week.sessions.first(),
+            athlete=UserFactory(),
+            status=SessionLog.Status.DONE,
+        )
+        delivered_week(rel, sessions=1, done=1, archived=True)
+        assert adherence.link_cadences([rel])[rel.pk] == adherence.NO_CADENCE
+
+    def test_one_query_for_many_links(self, django_assert_num_queries):
+        links = [CoachAthleteFactory() for _ in range(4)]
+        for link in links:
+            _done_log(link)
+        with django_assert_num_queries(1):
+            cadences = adherence.link_cadences(links)
+        assert all(c.recency_days == 0 for c in cadences.values())
+
+    def test_no_links_no_query(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert adherence.link_cadences([]) == {}
+
+
 class TestRecentLogs:
     def test_only_done_logs(self):
         rel = CoachAthleteFactory()
@@ -410,3 +461,22 @@ class TestRosterViewAdherence:
         resp = client.get(reverse("meso:roster"))
         assert resp.status_code == 200
         assert "No sessions yet" in resp.content.decode()
+
+    def test_roster_query_count_does_not_grow_with_the_roster(self, client):
+        coach = UserFactory()
+        CoachProfileFactory(user=coach)
+        client.force_login(coach)
+
+        def roster_queries():
+            with CaptureQueriesContext(connection) as queries:
+                assert client.get(reverse("meso:roster")).status_code == 200
+            return len(queries)
+
+        # Start past the free seat cap: crossing it adds the (fixed) suspended-
+        # link lookups, which isn't growth with the roster.
+        for _ in range(CoachSubscription.FREE_SEAT_LIMIT + 1):
+            _done_log(CoachAthleteFactory(coach=coach))
+        baseline = roster_queries()
+        for _ in range(5):
+            _done_log(CoachAthleteFactory(coach=coach))
+        assert roster_queries() == baseline
@@ -96,6 +96,9 @@ class TestAgentEndpoint:
         assert data["ok"] is True
         assert data["status"] == AgentProposalBatch.Status.DRAFTING
         assert data["status_url"] == status_url(data["batch_id"])
+        assert data["events_url"] == reverse(
+            "meso:api_batch_events", kwargs={"batch_id": data["batch_id"]}
+        )
         # The job ran inline (MESO_AGENT_RUN_SYNC), so the row is already resolved.
         batch = AgentProposalBatch.objects.get(pk=data["batch_id"])
         assert batch.coach == plan.coach
@@ -9,6 +9,8 @@ reach a persisted change, so it surfaces as a *responsiveness* failure, never a
 """
 
 import io
+import json
+import threading
 
 import pytest
 from django.core.management import call_command
@@ -152,3 +154,149 @@ class TestEvalCommand:
     def test_errors_when_no_plan_exists(self):
         with pytest.raises(CommandError):
             call_command("meso_agent_eval", dry_run=True)
+
+
+class CountingClient(evals.ScriptedEvalClient):
+    """The scripted client, counting its calls and reporting a token usage."""
+
+    model = "counting-eval"
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def propose(self, *, context, instruction):
+        with self._lock:
+            self.calls.append(instruction)
+        if "fail" in instruction:
+            raise RuntimeError("provider is down")
+        return client_module.ProposalResult(
+            data=super().propose(context=context, instruction=instruction),
+            usage=client_module.RunUsage(
+                input_tokens=100, output_tokens=20, api_calls=1
+            ),
+        )
+
+
+def scenario():
+    plan, _, _ = make_plan()
+    ContraindicationFactory(
+        athlete=plan.athlete, text="L knee — avoid deep knee flexion under load"
+    )
+    return plan, plan.mesocycles.first()
+
+
+class TestRunCorpus:
+    def test_parallel_run_matches_the_serial_harness(self):
+        plan, mesocycle = scenario()
+        client = CountingClient()
+        results = evals.run_corpus(
+            plan, evals.GOLDEN_CASES, client=client, mesocycle=mesocycle, workers=4
+        )
+        assert [r.case for r in results] == evals.GOLDEN_CASES
+        assert all(r.passed for r in results)
+        assert sorted(client.calls) == sorted(
+            case.instruction for case in evals.GOLDEN_CASES
+        )
+        assert all(r.usage.input_tokens == 100 and not r.cached for r in results)
+
+    def test_a_recorded_response_replays_without_a_call(self, tmp_path):
+        plan, mesocycle = scenario()
+        path = tmp_path / "responses.json"
+        cache = evals.ResponseCache(path)
+        evals.run_corpus(
+            plan,
+            evals.GOLDEN_CASES,
+            client=CountingClient(),
+            mesocycle=mesocycle,
+            cache=cache,
+        )
+        cache.save()
+
+        client = CountingClient()
+        results = evals.run_corpus(
+            plan,
+            evals.GOLDEN_CASES,
+            client=client,
+            mesocycle=mesocycle,
+            cache=evals.ResponseCache(path),
+        )
+        assert client.calls == []
+        assert all(r.passed and r.cached for r in results)
+        # Nothing was spent on a replay.
+        assert all(r.usage.input_tokens == 0 for r in results)
+
+    def test_a_prompt_change_misses_the_cache(self, monkeypatch):
+        plan, mesocycle = scenario()
+        cache = evals.ResponseCache("unused.json")
+        cases = evals.GOLDEN_CASES[:1]
+        evals.run_corpus(
+            plan, cases, client=CountingClient(), mesocycle=mesocycle, cache=cache
+        )
+        monkeypatch.setattr(
+            client_module, "SYSTEM_PROMPT", client_module.SYSTEM_PROMPT + " Be terse."
+        )
+        client = CountingClient()
+        evals.run_corpus(plan, cases, client=client, mesocycle=mesocycle, cache=cache)
+        assert len(client.calls) == 1
+
+    def test_a_failed_call_fails_only_its_case_and_is_not_recorded(self):
+        plan, mesocycle = scenario()
+        cases = [
+            evals.GoldenCase(name="boom", instruction="fail please"),
+            *evals.GOLDEN_CASES[:1],
+        ]
+        cache = evals.ResponseCache("unused.json")
+        results = evals.run_corpus(
+            plan, cases, client=CountingClient(), mesocycle=mesocycle, cache=cache
+        )
+        assert not results[0].passed
+        assert "provider is down" in results[0].failures[0]
+        assert results[1].passed
+        assert len(cache.entries) == 1
+
+    def test_report_carries_latency_and_usage_per_case(self):
+        plan, mesocycle = scenario()
+        results = evals.run_corpus(
+            plan, evals.GOLDEN_CASES, client=CountingClient(), mesocycle=mesocycle
+        )
+        report = evals.corpus_report(
+            results, model="counting-eval", plan=plan, mesocycle=mesocycle
+        )
+        assert report["passed"]
+        assert [c["name"] for c in report["cases"]] == [
+            case.name for case in evals.GOLDEN_CASES
+        ]
+        first = report["cases"][0]
+        assert first["input_tokens"] == 100 and first["output_tokens"] == 20
+        assert first["latency_ms"] >= 0 and first["cached"] is False
+        assert report["totals"]["input_tokens"] == 100 * len(evals.GOLDEN_CASES)
+
+
+class TestEvalCommandReport:
+    def test_json_report_on_stdout(self):
+        plan, _ = scenario()
+        out = io.StringIO()
+        call_command(
+            "meso_agent_eval", dry_run=True, plan_id=plan.pk, report="-", stdout=out
+        )
+        report = json.loads(out.getvalue())
+        assert report["passed"] and report["plan"] == plan.pk
+        assert len(report["cases"]) == len(evals.GOLDEN_CASES)
+
+    def test_a_second_run_replays_every_case(self, tmp_path):
+        plan, _ = scenario()
+        responses = tmp_path / "responses.json"
+        report = tmp_path / "report.json"
+        for _ in range(2):
+            call_command(
+                "meso_agent_eval",
+                dry_run=True,
+                plan_id=plan.pk,
+                response_cache=str(responses),
+                report=str(report),
+                stdout=io.StringIO(),
+            )
+        assert json.loads(report.read_text())["totals"]["cached"] == len(
+            evals.GOLDEN_CASES
+        )
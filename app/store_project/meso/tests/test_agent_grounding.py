@@ -4,6 +4,11 @@
 logged sessions (``recent_logs``) so a progression/deload proposal can anchor on
 what the athlete actually did, not just the prescribed plan. The summary is
 scoped to the plan's athlete and this plan's sessions, newest first, and capped.
+
+The logs ride in the context's volatile suffix: the stable prefix (coach style,
+athlete, plan, block) is the same bytes run to run — the client's prompt-cached
+block — and its plan/block grids are memoized until the plan or the athlete
+moves.
 """
 
 import datetime
@@ -11,7 +16,11 @@ import datetime
 import pytest
 from django.utils import timezone
 
+from store_project.meso import home_cache
+from store_project.meso import one_rm
+from store_project.meso.agent import client as client_module
 from store_project.meso.agent import service
+from store_project.meso.factories import ContraindicationFactory
 from store_project.meso.factories import LoggedSetFactory
 from store_project.meso.factories import MesocycleFactory
 from store_project.meso.factories import SessionLogFactory
@@ -19,6 +28,9 @@ from store_project.meso.factories import WeekFactory
 from store_project.meso.models import SessionLog
 from store_project.meso.tests._helpers import day
 from store_project.meso.tests._helpers import presc
+from store_project.meso.tests.test_agent_usage import FakeAnthropic
+from store_project.meso.tests.test_agent_usage import FakeMessage
+from store_project.meso.tests.test_agent_usage import FakeUsage
 from store_project.meso.tests.test_agent_validation import make_plan
 
 pytestmark = pytest.mark.django_db
@@ -205,3 +217,99 @@ def test_recent_logs_are_capped_and_newest_first():
     assert len(logs) == service.RECENT_LOG_LIMIT
     # Newest first.
     assert logs[0]["date"] == "2026-06-08"
+
+
+# -- stable prefix + memo ----------------------------------------------------
+
+
+def _explode(*args, **kwargs):
+    raise AssertionError("the block was re-serialized")
+
+
+def test_stable_prefix_is_the_same_bytes_when_only_logs_change():
+    plan, session, _ = make_plan()
+    meso = plan.mesocycles.first()
+    before = client_module.user_content(service.build_context(plan, meso), "go")
+    SessionLogFactory(session=session, athlete=plan.athlete)
+    after = client_module.user_content(service.build_context(plan, meso), "go")
+
+    assert after[0] == before[0]
+    assert after[0]["cache_control"] == {"type": "ephemeral"}
+    assert after[1] != before[1]
+    assert "cache_control" not in after[1]
+
+
+def test_the_client_sends_the_split_user_turn():
+    plan, _, _ = make_plan()
+    context = service.build_context(plan, plan.mesocycles.first())
+    sdk = FakeAnthropic(
+        FakeMessage(data={"summary": "", "changes": []}, usage=FakeUsage())
+    )
+    agent = client_module.MesoAgentClient(api_key="x", model="claude-opus-4-8")
+    agent._client = sdk
+    agent.propose(context=context, instruction="Add a deload.")
+
+    content = sdk.messages.kwargs["messages"][0]["content"]
+    assert content == client_module.user_content(context, "Add a deload.")
+    assert content[1]["text"].endswith("Coach instruction:\nAdd a deload.")
+
+
+def test_the_block_is_memoized_per_plan_version(monkeypatch):
+    plan, _, _ = make_plan()
+    meso = plan.mesocycles.first()
+    warm = service.build_context(plan, meso)
+    monkeypatch.setattr(service.serializers, "serialize_agent_block", _explode)
+    assert service.build_context(plan, meso)["block"] == warm["block"]
+
+    plan.touch()
+    with pytest.raises(AssertionError):
+        service.build_context(plan, meso)
+
+
+def test_an_athlete_write_keeps_the_memo(monkeypatch):
+    plan, _, _ = make_plan()
+    meso = plan.mesocycles.first()
+    warm = service.build_context(plan, meso)
+    home_cache.bump(plan.athlete.pk)  # a log or a 1RM
+    monkeypatch.setattr(service.serializers, "serialize_agent_block", _explode)
+    assert service.build_context(plan, meso)["block"] == warm["block"]
+
+
+def test_a_logged_lift_moves_only_the_suffix():
+    plan, session, presc = make_plan()
+    meso = plan.mesocycles.first()
+    before = client_module.user_content(service.build_context(plan, meso), "go")
+
+    log = SessionLogFactory(
+        session=session, athlete=plan.athlete, status=SessionLog.Status.DONE
+    )
+    LoggedSetFactory(session_log=log, prescription=presc, reps="5", load="100")
+    one_rm.refresh_one_rms(plan.athlete, [presc], plan.unit, log=log)
+    context = service.build_context(plan, meso)
+    after = client_module.user_content(context, "go")
+
+    assert after[0]["text"] == before[0]["text"]
+    overlay = context["lift_history"][str(presc.pk)]
+    assert overlay["last"]
+    assert overlay["one_rm"]
+    assert '"lift_history"' in after[1]["text"]
+    assert '"last"' not in after[0]["text"]
+
+
+def test_a_new_contraindication_is_never_served_stale():
+    plan, _, _ = make_plan()
+    meso = plan.mesocycles.first()
+    service.build_context(plan, meso)
+    ContraindicationFactory(athlete=plan.athlete, text="No overhead pressing")
+    context = service.build_context(plan, meso)
+    assert context["athlete"]["contraindications"] == ["No overhead pressing"]
+
+
+def test_memo_disabled_by_a_zero_ttl(settings, monkeypatch):
+    settings.MESO_AGENT_CONTEXT_CACHE_TTL = 0
+    plan, _, _ = make_plan()
+    meso = plan.mesocycles.first()
+    service.build_context(plan, meso)
+    monkeypatch.setattr(service.serializers, "serialize_agent_block", _explode)
+    with pytest.raises(AssertionError):
+        service.build_context(plan, meso)
@@ -7,14 +7,21 @@ review) or ``failed`` (with the reason recorded). ``dispatch_proposal`` runs the
 job inline under the test setting ``MESO_AGENT_RUN_SYNC`` so these never spawn a
 worker or touch the network — the client is a fake.
 
-The non-sync path enqueues the job on the django-q cluster (``async_task``). The
-test settings run django-q in ``sync`` mode, so an enqueued task executes
-in-process; the queue tests below assert the enqueue is deferred to commit, that
-the dotted path resolves and runs end to end, and that a broker failure resolves
-the batch instead of stranding it ``drafting``.
+The non-sync path enqueues the job on the agent's own django-q cluster
+(``async_task``). The test settings run django-q in ``sync`` mode, so an
+enqueued task executes in-process; the queue tests below assert the enqueue is
+deferred to commit, that the dotted path resolves and runs end to end, and that a
+broker failure resolves the batch instead of stranding it ``drafting`` — and that
+the worker claims interactive runs before evals, spreads itself across coaches,
+holds a coach to their concurrency cap (leaving a delayed retry for what it
+holds back), and stamps the queue depth and wait.
 """
 
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
+from django_q.models import Schedule
 
 from store_project.meso.agent import jobs
 from store_project.meso.agent import service
@@ -170,7 +177,9 @@ class TestDispatch:
         settings.MESO_AGENT_RUN_SYNC = False
         enqueued = []
         monkeypatch.setattr(
-            jobs, "async_task", lambda func, *args: enqueued.append((func, args))
+            jobs,
+            "async_task",
+            lambda func, *args, **kwargs: enqueued.append((func, args, kwargs)),
         )
         plan, _, _ = make_plan()
         batch = service.create_drafting_batch(
@@ -182,7 +191,9 @@ class TestDispatch:
             # Deferred — nothing enqueued until the surrounding block commits.
             assert enqueued == []
 
-        assert enqueued == [(jobs.RUN_PROPOSAL_TASK, (batch.pk,))]
+        assert enqueued == [
+            (jobs.RUN_PROPOSAL_TASK, (batch.pk,), {"cluster": jobs.AGENT_CLUSTER})
+        ]
 
     def test_queued_dispatch_runs_the_job_via_django_q_sync(
         self, settings, monkeypatch, django_capture_on_commit_callbacks
@@ -215,7 +226,7 @@ class TestDispatch:
         # (the frontend would poll it forever). Resolve it to ``failed`` instead.
         settings.MESO_AGENT_RUN_SYNC = False
 
-        def boom(func, *args):
+        def boom(func, *args, **kwargs):
             raise RuntimeError("broker is down")
 
         monkeypatch.setattr(jobs, "async_task", boom)
@@ -230,3 +241,164 @@ class TestDispatch:
         batch.refresh_from_db()
         assert batch.status == AgentProposalBatch.Status.FAILED
         assert batch.error
+
+
+def drafting(trigger=AgentProposalBatch.Trigger.MANUAL, plan=None):
+    plan = plan or make_plan()[0]
+    return service.create_drafting_batch(
+        plan,
+        "go",
+        coach=plan.coach,
+        mesocycle=plan.mesocycles.first(),
+        trigger=trigger,
+    )
+
+
+def start(batch, ago=timedelta(0)):
+    AgentProposalBatch.objects.filter(pk=batch.pk).update(
+        started_at=timezone.now() - ago
+    )
+
+
+class TestQueue:
+    def test_interactive_runs_go_before_evals(self):
+        evaluation = drafting(AgentProposalBatch.Trigger.EVAL)
+        draft = drafting(AgentProposalBatch.Trigger.DRAFT)
+        assert jobs.claim_next() == draft.pk
+        assert jobs.claim_next() == evaluation.pk
+        assert jobs.claim_next() is None
+
+    def test_the_coach_with_fewer_runs_in_flight_goes_first(self, settings):
+        settings.MESO_AGENT_COACH_CONCURRENCY = 2
+        busy = drafting()
+        start(busy)
+        older = drafting(plan=busy.plan)
+        newer = drafting()
+        assert jobs.claim_next() == newer.pk
+        assert jobs.claim_next() == older.pk
+
+    def test_a_coach_at_the_cap_waits(self, settings):
+        settings.MESO_AGENT_COACH_CONCURRENCY = 1
+        busy = drafting()
+        start(busy)
+        waiting = drafting(plan=busy.plan)
+        assert jobs.claim_next() is None
+        settings.MESO_AGENT_COACH_CONCURRENCY = 0
+        assert jobs.claim_next() == waiting.pk
+
+    def test_a_run_past_the_timeout_frees_its_slot(self, settings):
+        settings.MESO_AGENT_COACH_CONCURRENCY = 1
+        dead = drafting()
+        start(dead, ago=timedelta(seconds=settings.Q_CLUSTER.get("timeout", 300) + 1))
+        waiting = drafting(plan=dead.plan)
+        assert jobs.claim_next() == waiting.pk
+
+    def test_a_claim_is_taken_once_and_records_the_wait(self):
+        batch = drafting()
+        assert jobs.claim_next() == batch.pk
+        assert jobs.claim_next() is None
+        batch.refresh_from_db()
+        assert batch.started_at is not None
+        assert batch.queue_wait_ms is not None
+
+    def test_dispatch_records_the_depth(self, settings, monkeypatch):
+        settings.MESO_AGENT_RUN_SYNC = False
+        monkeypatch.setattr(jobs, "async_task", lambda *args, **kwargs: None)
+        drafting()
+        start(drafting())
+        resolved = drafting()
+        AgentProposalBatch.objects.filter(pk=resolved.pk).update(
+            status=AgentProposalBatch.Status.PENDING
+        )
+        batch = drafting()
+        jobs.dispatch_proposal(batch.pk)
+        batch.refresh_from_db()
+        assert batch.queue_depth == 2
+
+    def test_the_inline_path_stamps_the_queue_fields_too(self):
+        plan, _, presc = make_plan()
+        batch = drafting(plan=plan)
+        jobs.dispatch_proposal(batch.pk, client=FakeClient(one_swap(presc)))
+        batch.refresh_from_db()
+        assert batch.queue_depth == 0
+        assert batch.started_at is not None
+        assert batch.queue_wait_ms is not None
+        assert batch.duration_ms is not None
+
+    def test_a_finished_run_picks_up_the_capped_batch(self, settings, monkeypatch):
+        # Two runs from one coach at a cap of one: the first ticket runs the
+        # older, and its follow-up ticket (run in-process by django-q's sync
+        # mode) runs the other once the slot is free.
+        from store_project.meso.agent import client as client_module
+
+        settings.MESO_AGENT_COACH_CONCURRENCY = 1
+        plan, _, presc = make_plan()
+        monkeypatch.setattr(
+            client_module, "get_default_client", lambda: FakeClient(one_swap(presc))
+        )
+        first = drafting(plan=plan)
+        second = drafting(plan=plan)
+
+        jobs.run_queued_proposal(first.pk)
+
+        assert set(
+            AgentProposalBatch.objects.filter(pk__in=[first.pk, second.pk]).values_list(
+                "status", flat=True
+            )
+        ) == {AgentProposalBatch.Status.PENDING}
+
+    def test_an_empty_queue_runs_nothing(self):
+        assert jobs.run_queued_proposal(0) is None
+        assert not Schedule.objects.filter(name=jobs.REQUEUE_SCHEDULE).exists()
+
+    def test_a_capped_ticket_leaves_a_delayed_retry(self, settings):
+        # The run holding the slot may never finish (a worker killed at the
+        # timeout runs no ``finally``), so the turned-away ticket schedules its
+        # own retry on the agent cluster — one, however many are turned away.
+        settings.MESO_AGENT_COACH_CONCURRENCY = 1
+        settings.MESO_AGENT_REQUEUE_DELAY = 45
+        busy = drafting()
+        start(busy)
+        held = drafting(plan=busy.plan)
+        before = timezone.now()
+
+        assert jobs.run_queued_proposal(held.pk) is None
+        assert jobs.run_queued_proposal(held.pk) is None
+
+        retry = Schedule.objects.get(name=jobs.REQUEUE_SCHEDULE)
+        assert retry.func == jobs.RUN_PROPOSAL_TASK
+        assert retry.args == repr((held.pk,))
+        assert retry.cluster == jobs.AGENT_CLUSTER
+        assert retry.schedule_type == Schedule.ONCE
+        assert retry.next_run >= before + timedelta(seconds=45)
+        held.refresh_from_db()
+        assert held.started_at is None
+
+    def test_the_retry_runs_the_batch_once_the_slot_expires(
+        self, settings, monkeypatch
+    ):
+        from django_q.scheduler import scheduler
+
+        from store_project.meso.agent import client as client_module
+
+        settings.MESO_AGENT_COACH_CONCURRENCY = 1
+        plan, _, presc = make_plan()
+        monkeypatch.setattr(
+            client_module, "get_default_client", lambda: FakeClient(one_swap(presc))
+        )
+        monkeypatch.setattr("django_q.scheduler.Conf.CLUSTER_NAME", jobs.AGENT_CLUSTER)
+        dead = drafting(plan=plan)
+        start(dead)
+        held = drafting(plan=plan)
+        jobs.run_queued_proposal(held.pk)
+
+        # The stuck run ages past the task timeout and its retry comes due.
+        start(dead, ago=timedelta(seconds=settings.Q_CLUSTER.get("timeout", 300) + 1))
+        Schedule.objects.filter(name=jobs.REQUEUE_SCHEDULE).update(
+            next_run=timezone.now() - timedelta(seconds=1)
+        )
+        scheduler()
+
+        held.refresh_from_db()
+        assert held.status == AgentProposalBatch.Status.PENDING
+        assert not Schedule.objects.filter(name=jobs.REQUEUE_SCHEDULE).exists()
@@ -220,6 +220,25 @@ class TestAggregation:
         assert t.total_tokens == 110 + 55 + 20 + 300
         assert t.cost == Decimal("0.03")
 
+    def test_cache_hit_ratio_is_cached_input_over_all_input(self):
+        start, end = report_mod.month_bounds(2026, 6)
+        plan = PlanFactory()
+        _at(
+            start + timedelta(days=1),
+            plan=plan,
+            coach=plan.relationship.coach,
+            input_tokens=100,
+            output_tokens=50,
+            cache_creation_input_tokens=100,
+            cache_read_input_tokens=600,
+        )
+        t = report_mod.build_report(start=start, end=end).totals
+        assert t.prompt_tokens == 800
+        assert t.cache_hit_ratio == 0.75
+
+    def test_cache_hit_ratio_is_none_without_input(self):
+        assert report_mod.Totals().cache_hit_ratio is None
+
     def test_unknown_model_cost_is_not_counted_as_zero(self):
         start, end = report_mod.month_bounds(2026, 6)
         plan = PlanFactory()
@@ -434,6 +453,7 @@ class TestCommand:
         assert "2026-06" in body
         assert coach.display_name() in body
         assert "[FLAG]" in body
+        assert "cache hits" in body
 
     def test_empty_month_reports_no_runs(self):
         out = StringIO()
@@ -456,6 +476,7 @@ class TestCommand:
         )
         data = json.loads(out.getvalue())
         assert data["totals"]["runs"] == 1
+        assert data["totals"]["cache_hit_ratio"] is None  # no tokens recorded
         # Cost rides as a string (Decimal-safe); the DB field keeps 6 places.
         assert Decimal(data["totals"]["cost"]) == Decimal("0.10")
         assert len(data["coaches"]) == 1
@@ -0,0 +1,182 @@
+"""The monthly agent usage rollups (``billing.usage_rollup``).
+
+Pins the contract: a resolved run is counted in its (month, coach, athlete,
+model, trigger, tier) row exactly once — by the agent service as it resolves,
+or by the catch-up ahead of a report read — a drafting run isn't counted until
+it resolves, the report reads the rollups at a cost independent of the month's
+run count, and the rebuild command recounts a month from the ledger.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from store_project.meso.agent import service
+from store_project.meso.billing import agent_usage_report as report_mod
+from store_project.meso.billing import usage_rollup
+from store_project.meso.factories import AgentProposalBatchFactory
+from store_project.meso.factories import PlanFactory
+from store_project.meso.models import AgentProposalBatch
+from store_project.meso.models import AgentUsageRollup
+from store_project.meso.models import CoachSubscription
+from store_project.meso.tests.test_agent_jobs import one_swap
+from store_project.meso.tests.test_agent_service import FakeClient
+from store_project.meso.tests.test_agent_validation import make_plan
+
+pytestmark = pytest.mark.django_db
+
+JUNE = report_mod.month_bounds(2026, 6)
+
+
+def _at(when, **kw):
+    """Build a batch then stamp its auto-add ``created_at`` to ``when``."""
+    batch = AgentProposalBatchFactory(**kw)
+    AgentProposalBatch.objects.filter(pk=batch.pk).update(created_at=when)
+    batch.refresh_from_db()
+    return batch
+
+
+def _in_june(plan, days=1, **kw):
+    return _at(
+        JUNE[0] + timedelta(days=days), plan=plan, coach=plan.relationship.coach, **kw
+    )
+
+
+class TestRecord:
+    def test_a_run_is_counted_once(self):
+        plan = PlanFactory()
+        batch = _in_june(plan, input_tokens=10, estimated_cost_usd=Decimal("0.5"))
+        assert usage_rollup.record(batch)
+        assert not usage_rollup.record(batch)
+        usage_rollup.catch_up()
+        row = AgentUsageRollup.objects.get()
+        assert (row.runs, row.input_tokens, row.cost) == (1, 10, Decimal("0.5"))
+        assert row.month == JUNE[0].date()
+        assert row.athlete_id == plan.relationship.athlete_id
+
+    def test_the_service_counts_a_run_as_it_resolves(self):
+        plan, _, presc = make_plan()
+        batch = service.create_drafting_batch(
+            plan, "go", coach=plan.coach, mesocycle=plan.mesocycles.first()
+        )
+        assert not AgentUsageRollup.objects.exists()
+        service.run_proposal_job(batch.pk, client=FakeClient(one_swap(presc)))
+        batch.refresh_from_db()
+        assert batch.usage_rolled_up
+        assert AgentUsageRollup.objects.get().runs == 1
+
+    def test_a_failed_run_is_counted(self):
+        plan, _, _ = make_plan()
+        batch = service.create_drafting_batch(
+            plan, "go", coach=plan.coach, mesocycle=plan.mesocycles.first()
+        )
+
+        class BoomClient:
+            model = "claude-opus-4-8"
+
+            def propose(self, *, context, instruction):
+                raise RuntimeError("provider is down")
+
+        service.run_proposal_job(batch.pk, client=BoomClient())
+        row = AgentUsageRollup.objects.get()
+        assert (row.runs, row.model) == (1, "claude-opus-4-8")
+
+
+class TestCatchUp:
+    def test_counts_resolved_runs_and_leaves_drafting_ones(self):
+        plan = PlanFactory()
+        _in_june(plan, input_tokens=5)
+        _in_june(plan, input_tokens=7)
+        drafting = _in_june(plan, status=AgentProposalBatch.Status.DRAFTING)
+        assert usage_rollup.catch_up() == 2
+        assert usage_rollup.catch_up() == 0
+        row = AgentUsageRollup.objects.get()
+        assert (row.runs, row.input_tokens) == (2, 12)
+        drafting.refresh_from_db()
+        assert not drafting.usage_rolled_up
+
+    def test_statuses_of_one_tier_share_a_row(self):
+        plan = PlanFactory()
+        _in_june(plan, billing_status=CoachSubscription.Status.ACTIVE)
+        _in_june(plan, billing_status=CoachSubscription.Status.PAST_DUE)
+        _in_june(plan, billing_status=CoachSubscription.Status.TRIALING)
+        usage_rollup.catch_up()
+        assert dict(AgentUsageRollup.objects.values_list("tier", "runs")) == {
+            report_mod.PAID: 2,
+            report_mod.FREE_TRIAL: 1,
+        }
+
+    def test_unpriced_runs_are_counted_apart(self):
+        plan = PlanFactory()
+        _in_june(plan, estimated_cost_usd=Decimal("1.25"))
+        _in_june(plan, estimated_cost_usd=None)
+        usage_rollup.catch_up()
+        row = AgentUsageRollup.objects.get()
+        assert (row.cost, row.unknown_cost_runs) == (Decimal("1.25"), 1)
+
+    def test_is_bounded_to_the_window(self):
+        plan = PlanFactory()
+        _in_june(plan)
+        _at(JUNE[1], plan=plan, coach=plan.relationship.coach)  # July
+        assert usage_rollup.catch_up(start=JUNE[0], end=JUNE[1]) == 1
+
+
+class TestReport:
+    def test_cost_does_not_grow_with_the_runs(self):
+        def queries(n):
+            plan = PlanFactory()
+            for day in range(n):
+                _in_june(plan, days=day)
+            report_mod.build_report(start=JUNE[0], end=JUNE[1])  # catch up
+            with CaptureQueriesContext(connection) as captured:
+                report = report_mod.build_report(start=JUNE[0], end=JUNE[1])
+            AgentProposalBatch.objects.all().delete()
+            AgentUsageRollup.objects.all().delete()
+            return len(captured), report.totals.runs
+
+        few, few_runs = queries(2)
+        many, many_runs = queries(12)
+        assert (few_runs, many_runs) == (2, 12)
+        assert many == few
+
+    def test_a_run_resolved_after_a_read_reaches_the_next_read(self):
+        plan = PlanFactory()
+        drafting = _in_june(plan, status=AgentProposalBatch.Status.DRAFTING)
+        assert report_mod.build_report(start=JUNE[0], end=JUNE[1]).totals.runs == 0
+        AgentProposalBatch.objects.filter(pk=drafting.pk).update(
+            status=AgentProposalBatch.Status.FAILED
+        )
+        assert report_mod.build_report(start=JUNE[0], end=JUNE[1]).totals.runs == 1
+
+
+class TestRebuildCommand:
+    def test_recounts_the_month_from_the_ledger(self):
+        plan = PlanFactory()
+        _in_june(plan, input_tokens=10)
+        july = _at(JUNE[1], plan=plan, coach=plan.relationship.coach)
+        usage_rollup.catch_up()
+        AgentUsageRollup.objects.update(runs=99)
+
+        out = StringIO()
+        call_command("meso_agent_usage_rollup", month="2026-06", stdout=out)
+
+        assert "Rolled up 1 agent run(s) for 2026-06." in out.getvalue()
+        runs = dict(AgentUsageRollup.objects.values_list("month", "runs"))
+        assert runs[JUNE[0].date()] == 1
+        # Other months are left alone.
+        assert runs[usage_rollup.month_of(july.created_at)] == 99
+
+    def test_rebuilds_every_month_by_default(self):
+        plan = PlanFactory()
+        _in_june(plan)
+        _at(JUNE[1], plan=plan, coach=plan.relationship.coach)
+        call_command("meso_agent_usage_rollup", stdout=StringIO())
+        assert sorted(AgentUsageRollup.objects.values_list("runs", flat=True)) == [
+            1,
+            1,
+        ]
@@ -21,9 +21,12 @@ import json
 from types import SimpleNamespace
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from store_project.meso import views
 from store_project.meso.agent import service
 from store_project.meso.factories import CoachAthleteFactory
 from store_project.meso.factories import MesocycleFactory
@@ -31,6 +34,7 @@ from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import WeekFactory
 from store_project.meso.models import CoachAthlete
 from store_project.meso.models import LoggedSet
+from store_project.meso.models import PersonalRecordEntry
 from store_project.meso.models import Plan
 from store_project.meso.models import SessionLog
 from store_project.meso.serializers import serialize_recent_logs
@@ -382,6 +386,105 @@ class TestLogWrite:
         assert log.sets.count() == 0
 
 
+# -- set diff --------------------------------------------------------------
+
+
+def _sets(s, squat_rpe="8", rdl_load="80"):
+    return [
+        {"prescription": s.squat.pk, "set_number": 1, "reps": "6", "load": "70"},
+        {
+            "prescription": s.squat.pk,
+            "set_number": 2,
+            "reps": "6",
+            "load": "70",
+            "rpe": squat_rpe,
+        },
+        {"prescription": s.rdl.pk, "set_number": 1, "reps": "8", "load": rdl_load},
+    ]
+
+
+def _ids(log):
+    return dict(((ls.prescription_id, ls.set_number), ls.pk) for ls in log.sets.all())
+
+
+class TestLogDiff:
+    """A re-save writes only the sets that changed, and refreshes their lifts.
+
+    Sets are matched by (prescription, set number); an unchanged set keeps its
+    row, and the PR ledger and 1RMs are refreshed only for the lifts touched.
+    """
+
+    def test_unchanged_and_edited_sets_keep_their_ids(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        post(client, s.session, {"sets": _sets(s)})
+        log = SessionLog.objects.get(athlete=s.athlete)
+        before = _ids(log)
+        resave = _sets(s, squat_rpe="9")[:2] + [
+            {"prescription": s.squat.pk, "set_number": 3, "reps": "5", "load": "70"}
+        ]
+        assert post(client, s.session, {"sets": resave}).status_code == 200
+        after = _ids(log)
+        assert after[(s.squat.pk, 1)] == before[(s.squat.pk, 1)]
+        assert after[(s.squat.pk, 2)] == before[(s.squat.pk, 2)]
+        assert LoggedSet.objects.get(pk=after[(s.squat.pk, 2)]).rpe == "9"
+        assert (s.rdl.pk, 1) not in after  # dropped
+        assert (s.squat.pk, 3) in after  # added
+
+    def test_an_identical_resave_writes_no_rows(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        post(client, s.session, {"sets": _sets(s)})
+        with CaptureQueriesContext(connection) as queries:
+            assert post(client, s.session, {"sets": _sets(s)}).status_code == 200
+        writes = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+            and ("meso_loggedset" in q["sql"] or "meso_sessionlog" in q["sql"])
+        ]
+        assert writes == []
+
+    def test_a_set_edit_refreshes_only_its_lift(self, client, monkeypatch):
+        s = seed()
+        client.force_login(s.athlete)
+        post(client, s.session, {"sets": _sets(s)})
+        refreshed = []
+        monkeypatch.setattr(
+            views,
+            "record_log",
+            lambda log, prescriptions, unit: refreshed.append(
+                {p.pk for p in prescriptions}
+            ),
+        )
+        post(client, s.session, {"sets": _sets(s, rdl_load="90")})
+        assert refreshed == [{s.rdl.pk}]
+
+    def test_a_status_flip_refreshes_every_lift(self, client, monkeypatch):
+        s = seed()
+        client.force_login(s.athlete)
+        post(client, s.session, {"sets": _sets(s)})
+        refreshed = []
+        monkeypatch.setattr(
+            views,
+            "record_log",
+            lambda log, prescriptions, unit: refreshed.append(
+                {p.pk for p in prescriptions}
+            ),
+        )
+        post(client, s.session, {"status": "pending", "sets": _sets(s)})
+        assert refreshed == [{s.squat.pk, s.rdl.pk}]
+
+    def test_a_record_keeps_its_set_through_another_edit(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        post(client, s.session, {"sets": _sets(s)})
+        entry = PersonalRecordEntry.objects.get(athlete=s.athlete, name="RDL")
+        post(client, s.session, {"sets": _sets(s, squat_rpe="9.5")})
+        entry.refresh_from_db()
+        assert LoggedSet.objects.filter(pk=entry.logged_set_id).exists()
+
+
 # -- validation ------------------------------------------------------------
 
 
@@ -19,12 +19,17 @@ delivery is a one-time notify + snapshot, never a visibility gate.
 
 import json
 from datetime import timedelta
+from io import StringIO
 from types import SimpleNamespace
 
 import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from store_project.meso import presenters
 from store_project.meso.factories import CoachAthleteFactory
 from store_project.meso.factories import CoachProfileFactory
 from store_project.meso.factories import MesocycleFactory
@@ -723,6 +728,46 @@ class TestPlanWideChips:
 # -- athlete session detail ------------------------------------------------
 
 
+class TestHomeQueries:
+    """``athlete_home`` loads every card in bulk — flat in the number of plans."""
+
+    def home_queries(self, athlete):
+        with CaptureQueriesContext(connection) as queries:
+            presenters.athlete_home(athlete)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_plans(self):
+        athlete = UserFactory()
+        seed_block(athlete=athlete)
+        seed(athlete=athlete, delivered=False)
+        baseline = self.home_queries(athlete)
+        for _ in range(4):
+            seed_block(athlete=athlete, sub_second="Sub: goblet squat")
+        seed(athlete=athlete)
+        cards = presenters.athlete_home(athlete)
+        assert len(cards) == 7
+        assert self.home_queries(athlete) == baseline
+
+    def test_bench_command_reports_each_size_and_keeps_nothing(self):
+        plans = Plan.objects.count()
+        out = StringIO()
+        call_command(
+            "meso_bench_athlete_home",
+            "--plans",
+            "1",
+            "3",
+            "--opens=1",
+            "--weeks=2",
+            "--days=2",
+            "--rows=2",
+            stdout=out,
+        )
+        lines = [line for line in out.getvalue().splitlines() if "queries/open" in line]
+        assert [line.split()[0] for line in lines] == ["1", "3"]
+        assert lines[0].split()[2] == lines[1].split()[2]
+        assert Plan.objects.count() == plans
+
+
 class TestAthleteSession:
     def test_requires_login(self, client):
         s = seed()
@@ -10,25 +10,37 @@ Covered here:
 
 - ``Plan.duplicate_for`` copies the whole *live* tree (blocks, days, rows —
   tempo/rest/note/tags included — weeks, sessions, and every cell's line
-  stack), resets ``delivered_at``, and skips soft-deleted rows;
+  stack), resets ``delivered_at``, and skips soft-deleted rows — in a fixed
+  number of statements (``meso_bench_duplicate`` compares the old path);
 - the copy is independent: edits on either side never touch the other;
 - ``POST plan/<id>/batch-deliver/`` creates + delivers one ACTIVE copy per
   picked client (weeks stamped, ``WeekDelivery`` snapshots written, one
   block-level email each), leaving the source plan's weeks unstamped;
+- the fan-out is a queued job (``delivery.run_batch_delivery``): the request
+  only records the ``BatchDelivery``, each client commits on its own so one
+  failure keeps the rest, and the status endpoint reports per-client progress;
 - scoping: non-owner coaches 403; foreign / own-athlete / unknown picks are
   dropped; an empty or all-invalid selection delivers nothing;
 - the deliver screen offers the coach's *other* active athletes as batch
   candidates.
 """
 
+from io import StringIO
+
 import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from store_project.meso import views
+from store_project.meso import delivery
 from store_project.meso.factories import CoachAthleteFactory
 from store_project.meso.factories import MesocycleFactory
 from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import WeekFactory
+from store_project.meso.models import BatchDelivery
+from store_project.meso.models import BatchDeliveryTarget
+from store_project.meso.models import CoachAthlete
 from store_project.meso.models import CoachSubscription
 from store_project.meso.models import Plan
 from store_project.meso.models import Prescription
@@ -153,6 +165,44 @@ class TestDuplicateFor:
             ("Block 2", 1),
         ]
 
+    def test_copy_is_a_fixed_number_of_statements(self):
+        def statements(plan):
+            other = CoachAthleteFactory(coach=plan.coach, athlete=UserFactory())
+            with CaptureQueriesContext(connection) as queries:
+                plan.duplicate_for(other)
+            return len(queries)
+
+        small, _ = seed_source()
+        large, _ = seed_source()
+        for order in (1, 2, 3):
+            meso = MesocycleFactory(plan=large, name=f"Block {order}", order=order)
+            for index in (1, 2, 3):
+                week = WeekFactory(mesocycle=meso, index=index)
+                for number in (1, 2):
+                    session = day(week, day_number=number)
+                    presc_(session, name="Squat", text="5 x 5")
+                    presc_(session, name="Bench", text="3 x 8")
+        # One read + one write per level, whatever the tree's size.
+        assert statements(large) == statements(small)
+
+    def test_bench_command_compares_both_engines_and_keeps_nothing(self):
+        plans = Plan.objects.count()
+        out = StringIO()
+        call_command(
+            "meso_bench_duplicate",
+            "--copies=2",
+            "--blocks=2",
+            "--weeks=2",
+            "--days=2",
+            "--rows=2",
+            stdout=out,
+        )
+        report = out.getvalue()
+        assert "row-by-row" in report
+        assert "set-based" in report
+        assert "Speed-up" in report
+        assert Plan.objects.count() == plans
+
 
 class TestBatchDeliverEndpoint:
     def url(self, plan):
@@ -387,7 +437,7 @@ class TestTargetWeekForBatchCopy:
 
     def test_no_source_block_returns_none(self):
         plan, _cell = seed_source(coach=comp(UserFactory()))
-        assert views._target_week_for_batch_copy(plan, None) is None
+        assert delivery.target_week_for_batch_copy(plan, None) is None
 
     def test_matching_order_returns_that_blocks_first_live_week(self):
         plan, _cell = seed_source(coach=comp(UserFactory()))
@@ -395,10 +445,10 @@ class TestTargetWeekForBatchCopy:
         week2 = WeekFactory(mesocycle=meso2, index=1)
 
         block1 = plan.mesocycles.get(order=0)
-        result = views._target_week_for_batch_copy(plan, block1)
+        result = delivery.target_week_for_batch_copy(plan, block1)
         assert result == block1.weeks.order_by("index").first()
 
-        result2 = views._target_week_for_batch_copy(plan, meso2)
+        result2 = delivery.target_week_for_batch_copy(plan, meso2)
         assert result2 == week2
 
     def test_copy_with_no_block_at_that_order_degrades_to_none(self):
@@ -409,7 +459,7 @@ class TestTargetWeekForBatchCopy:
         other, _other_cell = seed_source(coach=comp(UserFactory()))  # order=0 only
 
         assert (
-            views._target_week_for_batch_copy(other, source.mesocycles.get(order=1))
+            delivery.target_week_for_batch_copy(other, source.mesocycles.get(order=1))
             is None
         )
 
@@ -422,6 +472,197 @@ class TestTargetWeekForBatchCopy:
         MesocycleFactory(plan=other, name="Block 2", order=1)  # no weeks
 
         assert (
-            views._target_week_for_batch_copy(other, source.mesocycles.get(order=1))
+            delivery.target_week_for_batch_copy(other, source.mesocycles.get(order=1))
             is None
         )
+
+
+class TestQueuedBatchDelivery:
+    """The fan-out runs as a django-q job, one transaction per client.
+
+    ``plan_batch_deliver`` records a ``BatchDelivery`` + one target per client
+    and queues ``delivery.run_batch_delivery`` on commit; the test settings run
+    django-q in sync mode, so executing the on-commit callbacks runs the job.
+    """
+
+    def url(self, plan):
+        return reverse("meso:plan_batch_deliver", kwargs={"plan_id": plan.pk})
+
+    def status_url(self, batch):
+        return reverse("meso:api_batch_delivery_status", kwargs={"batch_id": batch.pk})
+
+    def _plan_and_clients(self):
+        plan, _ = seed_source(coach=comp(UserFactory()))
+        rel_b = CoachAthleteFactory(
+            coach=plan.coach, athlete=UserFactory(name="Blake Doe")
+        )
+        rel_c = CoachAthleteFactory(
+            coach=plan.coach, athlete=UserFactory(name="Casey Roe")
+        )
+        return plan, rel_b, rel_c
+
+    def test_the_request_only_queues_the_work(self, client):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+
+        # No on-commit callbacks run: the job is never enqueued.
+        resp = client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+
+        assert resp.status_code == 302
+        batch = BatchDelivery.objects.get()
+        assert batch.status == BatchDelivery.Status.QUEUED
+        assert (batch.plan, batch.coach) == (plan, plan.coach)
+        assert batch.base_url == "http://testserver/"
+        assert sorted(batch.targets.values_list("relationship_id", "status")) == [
+            (rel_b.pk, BatchDeliveryTarget.Status.PENDING),
+            (rel_c.pk, BatchDeliveryTarget.Status.PENDING),
+        ]
+        assert rel_b.plans.count() == 0
+        assert rel_c.plans.count() == 0
+
+    def test_the_job_delivers_every_target_and_finishes_the_batch(
+        self, client, django_capture_on_commit_callbacks
+    ):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+
+        batch = BatchDelivery.objects.get()
+        assert batch.status == BatchDelivery.Status.DONE
+        assert batch.finished_at is not None
+        for target in batch.targets.all():
+            assert target.status == BatchDeliveryTarget.Status.DELIVERED
+            assert target.copy == target.relationship.plans.get()
+
+    def test_one_failed_client_does_not_roll_back_the_others(
+        self, client, mailoutbox, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        original = Plan.duplicate_for
+
+        def flaky(self, relationship, **kwargs):
+            copy = original(self, relationship, **kwargs)
+            if relationship.pk == rel_b.pk:
+                raise RuntimeError("disk full")
+            return copy
+
+        monkeypatch.setattr(Plan, "duplicate_for", flaky)
+        client.force_login(plan.coach)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+
+        batch = BatchDelivery.objects.get()
+        assert batch.status == BatchDelivery.Status.DONE
+        failed = batch.targets.get(relationship=rel_b)
+        assert failed.status == BatchDeliveryTarget.Status.FAILED
+        assert failed.error == "The copy could not be delivered."
+        assert failed.copy is None
+        # rel_b's half-made copy was rolled back; rel_c's committed.
+        assert rel_b.plans.count() == 0
+        delivered = batch.targets.get(relationship=rel_c)
+        assert delivered.status == BatchDeliveryTarget.Status.DELIVERED
+        copy_weeks = rel_c.plans.get().mesocycles.get().weeks.all()
+        assert WeekDelivery.objects.filter(week__in=copy_weeks).count() == 2
+        # Only the delivered client is nudged.
+        assert [m.to for m in mailoutbox] == [[rel_c.athlete.email]]
+
+    def test_a_client_ended_before_the_job_runs_gets_nothing(self, client):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+        client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+        batch = BatchDelivery.objects.get()
+        rel_b.status = CoachAthlete.Status.ENDED
+        rel_b.save(update_fields=["status"])
+
+        delivery.run_batch_delivery(batch.pk)
+
+        ended = batch.targets.get(relationship=rel_b)
+        assert ended.status == BatchDeliveryTarget.Status.FAILED
+        assert ended.error == "No longer an active client."
+        assert rel_b.plans.count() == 0
+        assert rel_c.plans.count() == 1
+
+    def test_a_rerun_does_not_copy_twice(self, client):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+        client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+        batch = BatchDelivery.objects.get()
+
+        delivery.run_batch_delivery(batch.pk)
+        delivery.run_batch_delivery(batch.pk)
+
+        assert rel_b.plans.count() == 1
+        assert rel_c.plans.count() == 1
+
+    def test_a_broker_failure_marks_the_batch_failed(
+        self, client, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        plan, rel_b, _rel_c = self._plan_and_clients()
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("broker down")
+
+        monkeypatch.setattr(delivery, "async_task", broken)
+        client.force_login(plan.coach)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(self.url(plan), {"relationships": [rel_b.pk]})
+
+        batch = BatchDelivery.objects.get()
+        assert batch.status == BatchDelivery.Status.FAILED
+        assert batch.error == "The delivery could not be queued."
+        assert rel_b.plans.count() == 0
+
+    def test_the_enqueued_task_path_resolves(self):
+        # django-q imports the dotted path in the worker; it must name the job.
+        module, _, name = delivery.RUN_BATCH_DELIVERY_TASK.rpartition(".")
+        assert module == delivery.__name__
+        assert getattr(delivery, name) is delivery.run_batch_delivery
+
+    def test_status_reports_per_client_progress(self, client):
+        plan, rel_b, rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+        client.post(self.url(plan), {"relationships": [rel_b.pk, rel_c.pk]})
+        batch = BatchDelivery.objects.get()
+
+        queued = client.get(self.status_url(batch)).json()
+        assert queued["status"] == "queued"
+        assert (queued["total"], queued["pending"], queued["delivered"]) == (2, 2, 0)
+
+        delivery.run_batch_delivery(batch.pk)
+        done = client.get(self.status_url(batch)).json()
+        assert done["status"] == "done"
+        assert (done["delivered"], done["failed"], done["pending"]) == (2, 0, 0)
+        by_name = {t["name"]: t for t in done["targets"]}
+        assert set(by_name) == {"Blake Doe", "Casey Roe"}
+        copy = rel_b.plans.get()
+        assert by_name["Blake Doe"]["plan_url"] == reverse(
+            "meso:designer_plan", kwargs={"plan_id": copy.pk}
+        )
+
+    def test_status_is_scoped_to_the_coach_who_started_it(self, client):
+        plan, rel_b, _rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+        client.post(self.url(plan), {"relationships": [rel_b.pk]})
+        batch = BatchDelivery.objects.get()
+
+        client.force_login(UserFactory())
+        assert client.get(self.status_url(batch)).status_code == 404
+
+    def test_deliver_screen_polls_a_batch_in_flight(self, client):
+        plan, rel_b, _rel_c = self._plan_and_clients()
+        client.force_login(plan.coach)
+        deliver_url = reverse("meso:deliver_plan", kwargs={"plan_id": plan.pk})
+        assert 'data-testid="batch-delivery-progress"' not in (
+            client.get(deliver_url).content.decode()
+        )
+
+        client.post(self.url(plan), {"relationships": [rel_b.pk]})
+        batch = BatchDelivery.objects.get()
+
+        body = client.get(deliver_url).content.decode()
+        assert 'data-testid="batch-delivery-progress"' in body
+        assert self.status_url(batch) in body
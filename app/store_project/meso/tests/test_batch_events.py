@@ -0,0 +1,237 @@
+"""The agent batch status stream (``views.batch_events`` + ``agent.events``).
+
+Pins the contract the designer relies on: the stream sends one ``status`` event
+once a batch has left ``drafting`` — at once when it already has, or when it's
+woken mid-wait — writes only keep-alive comments while the run drafts, and
+closes with a ``timeout`` event after ``MESO_AGENT_STREAM_TIMEOUT``. It's scoped
+like ``batch_status``, a worker past ``MESO_AGENT_STREAM_MAX`` open streams
+answers 503 (the client polls), and every path that resolves a batch announces
+it.
+
+On SQLite ``agent.events`` falls back to sleeping between status reads; the
+``LISTEN``/``NOTIFY`` round trip itself only runs on Postgres.
+"""
+
+import json
+from contextlib import contextmanager
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from store_project.meso.agent import events
+from store_project.meso.agent import jobs
+from store_project.meso.agent import service
+from store_project.meso.factories import AgentProposalBatchFactory
+from store_project.meso.models import AgentProposalBatch
+from store_project.meso.tests.test_agent_jobs import one_swap
+from store_project.meso.tests.test_agent_service import FakeClient
+from store_project.meso.tests.test_agent_validation import make_plan
+from store_project.users.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+DRAFTING = AgentProposalBatch.Status.DRAFTING
+
+
+def events_url(batch):
+    return reverse("meso:api_batch_events", kwargs={"batch_id": batch.pk})
+
+
+def read(response):
+    """The stream's SSE frames: ``(event, data)`` pairs, comments as ``(None, text)``."""
+    body = b"".join(response.streaming_content).decode()
+    frames = []
+    for block in filter(None, body.split("\n\n")):
+        if block.startswith(":"):
+            frames.append((None, block[1:].strip()))
+            continue
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        frames.append((fields["event"], json.loads(fields["data"])))
+    return frames
+
+
+@pytest.fixture
+def drafting(client):
+    plan, _, _ = make_plan()
+    client.force_login(plan.coach)
+    return AgentProposalBatchFactory(plan=plan, coach=plan.coach, status=DRAFTING)
+
+
+class TestStream:
+    def test_a_resolved_batch_is_sent_at_once(self, client, drafting):
+        AgentProposalBatch.objects.filter(pk=drafting.pk).update(
+            status=AgentProposalBatch.Status.PENDING
+        )
+        resp = client.get(events_url(drafting))
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"] == "text/event-stream"
+        assert resp["Cache-Control"] == "no-cache"
+        assert read(resp)[-1] == ("status", {"status": "pending"})
+
+    def test_a_batch_resolving_mid_wait_wakes_the_stream(
+        self, client, drafting, monkeypatch
+    ):
+        waits = []
+
+        @contextmanager
+        def listening(batch_id):
+            def wait(timeout):
+                waits.append(batch_id)
+                AgentProposalBatch.objects.filter(pk=batch_id).update(
+                    status=AgentProposalBatch.Status.FAILED
+                )
+                return True
+
+            yield wait
+
+        monkeypatch.setattr(events, "listening", listening)
+        frames = read(client.get(events_url(drafting)))
+
+        assert waits == [drafting.pk]
+        assert frames[-1] == ("status", {"status": "failed"})
+
+    def test_writes_keep_alives_while_drafting(
+        self, client, drafting, monkeypatch, settings
+    ):
+        settings.MESO_AGENT_STREAM_HEARTBEAT = 7
+        timeouts = []
+
+        @contextmanager
+        def listening(batch_id):
+            def wait(timeout):
+                timeouts.append(timeout)
+                if len(timeouts) == 2:
+                    AgentProposalBatch.objects.filter(pk=batch_id).update(
+                        status=AgentProposalBatch.Status.PENDING
+                    )
+                return False
+
+            yield wait
+
+        monkeypatch.setattr(events, "listening", listening)
+        frames = read(client.get(events_url(drafting)))
+
+        assert timeouts == [7, 7]
+        assert frames == [
+            (None, "drafting"),
+            (None, "keep-alive"),
+            (None, "keep-alive"),
+            ("status", {"status": "pending"}),
+        ]
+
+    def test_times_out_to_the_poll(self, client, drafting, settings):
+        settings.MESO_AGENT_STREAM_TIMEOUT = 0
+        frames = read(client.get(events_url(drafting)))
+        assert frames[-1] == ("timeout", {"status": "drafting"})
+
+
+class TestSlots:
+    def test_a_full_worker_sends_the_client_to_the_poll(
+        self, client, drafting, monkeypatch, settings
+    ):
+        settings.MESO_AGENT_STREAM_MAX = 2
+        monkeypatch.setattr(events, "_open_streams", 2)
+        resp = client.get(events_url(drafting))
+        assert resp.status_code == 503
+        assert not resp.streaming
+
+    def test_zero_turns_streaming_off(self, client, drafting, settings):
+        settings.MESO_AGENT_STREAM_MAX = 0
+        assert client.get(events_url(drafting)).status_code == 503
+
+    def test_a_stream_holds_its_slot_until_it_ends(self, client, drafting, monkeypatch):
+        held = []
+
+        @contextmanager
+        def listening(batch_id):
+            def wait(timeout):
+                held.append(events.open_streams())
+                AgentProposalBatch.objects.filter(pk=batch_id).update(
+                    status=AgentProposalBatch.Status.PENDING
+                )
+                return True
+
+            yield wait
+
+        monkeypatch.setattr(events, "listening", listening)
+        read(client.get(events_url(drafting)))
+
+        assert held == [1]
+        assert events.open_streams() == 0
+
+    def test_a_stream_closed_unread_frees_its_slot(self, client, drafting):
+        # The client went away before the server wrote a byte.
+        resp = client.get(events_url(drafting))
+        assert events.open_streams() == 1
+        resp.close()
+        resp.close()
+        assert events.open_streams() == 0
+
+
+class TestScope:
+    def test_foreign_batch_404(self, client, drafting):
+        client.force_login(UserFactory())
+        assert client.get(events_url(drafting)).status_code == 404
+
+    def test_requires_login(self, client, drafting):
+        client.logout()
+        resp = client.get(events_url(drafting))
+        assert resp.status_code == 302
+        assert "/accounts/login/" in resp.url
+
+    def test_post_not_allowed(self, client, drafting):
+        assert client.post(events_url(drafting)).status_code == 405
+
+
+class TestAnnounce:
+    @pytest.fixture
+    def announced(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(events, "notify", seen.append)
+        return seen
+
+    def test_a_resolved_run_is_announced(self, announced):
+        plan, _, presc = make_plan()
+        batch = service.create_drafting_batch(
+            plan, "go", coach=plan.coach, mesocycle=plan.mesocycles.first()
+        )
+        assert announced == []
+        service.run_proposal_job(batch.pk, client=FakeClient(one_swap(presc)))
+        assert announced == [batch.pk]
+
+    def test_a_failed_run_is_announced(self, announced):
+        plan, _, _ = make_plan()
+        batch = service.create_drafting_batch(
+            plan, "go", coach=plan.coach, mesocycle=plan.mesocycles.first()
+        )
+
+        class BoomClient:
+            model = "claude-opus-4-8"
+
+            def propose(self, *, context, instruction):
+                raise RuntimeError("provider is down")
+
+        service.run_proposal_job(batch.pk, client=BoomClient())
+        assert announced == [batch.pk]
+
+    def test_an_unqueued_run_is_announced(self, announced):
+        plan, _, _ = make_plan()
+        batch = AgentProposalBatchFactory(plan=plan, status=DRAFTING)
+        jobs._fail_unqueued(batch.pk)
+        assert announced == [batch.pk]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="LISTEN/NOTIFY is PostgreSQL-only; SQLite streams fall back to sleeping.",
+)
+class TestListenNotify:
+    def test_wakes_on_its_own_batch_only(self):
+        with events.listening(41) as wait:
+            events.notify(42)
+            assert not wait(0.2)
+            events.notify(41)
+            assert wait(5)
@@ -171,6 +171,9 @@ class TestSerializeChatThread:
         assert agent["pollUrl"] == reverse(
             "meso:api_batch_status", kwargs={"batch_id": batch.pk}
         )
+        assert agent["eventsUrl"] == reverse(
+            "meso:api_batch_events", kwargs={"batch_id": batch.pk}
+        )
         # A resolved batch never carries a poll URL — nothing left to poll.
         resolved_plan, _, _ = seed_plan()
         AgentProposalBatchFactory(
@@ -18,9 +18,14 @@ Three seams, mirroring the slice discipline:
   diff on a re-delivery), folded up into block-level ``is_redelivery`` /
   ``has_changes``;
 - ``DeliverView`` — the screen renders each week's diff on a re-delivery.
+
+``serialize_week_snapshots`` builds the same payloads for a whole block in a
+fixed number of queries — what ``plan_deliver`` records.
 """
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -30,9 +35,11 @@ from store_project.meso.factories import MesocycleFactory
 from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import WeekFactory
 from store_project.meso.models import Plan
+from store_project.meso.models import Prescription
 from store_project.meso.models import WeekDelivery
 from store_project.meso.serializers import diff_week_snapshots
 from store_project.meso.serializers import serialize_week_snapshot
+from store_project.meso.serializers import serialize_week_snapshots
 from store_project.users.factories import UserFactory
 
 from ._helpers import day
@@ -536,3 +543,89 @@ class TestDeliverScreenRendersDiff:
         assert "Volume" in body
         # The new value 0 is rendered, not the em-dash fallback.
         assert ">0</span>" in body
+
+
+# --------------------------------------------------------------------------- #
+# Block snapshot builder (single pass)                                         #
+# --------------------------------------------------------------------------- #
+
+
+def seed_block(weeks=2, days=2, rows=2):
+    """A block with sub-lines, a skip, a removed day and a removed row."""
+    plan, week1, session, cell = seed_plan()
+    meso = week1.mesocycle
+    week_rows = [week1] + [
+        WeekFactory(mesocycle=meso, index=i) for i in range(2, weeks + 1)
+    ]
+    slots = [session.session_slot] + [
+        day(week1, day_number=n, name=f"Day {n}").session_slot
+        for n in range(2, days + 1)
+    ]
+    for week in week_rows[1:]:
+        for slot in slots:
+            day(week, session_slot=slot)
+    for slot in slots:
+        for r in range(rows):
+            row = make_slot(session_slot=slot, name=f"Lift {slot.pk}-{r}")
+            for week in week_rows:
+                sub = presc_(exercise_slot=row, week=week, text=f"{r + 3} x 5")
+                Prescription.objects.create(
+                    exercise_slot=row, week=week, line=1, text="RPE 8"
+                )
+                Prescription.objects.create(
+                    exercise_slot=row, week=week, line=2, text=""
+                )
+    sub.skipped = True
+    sub.save(update_fields=["skipped"])
+    presc_(session, name="Retired").exercise_slot.soft_delete()
+    if days > 1:
+        week_rows[-1].sessions.filter(session_slot=slots[-1]).update(
+            deleted_at=timezone.now()
+        )
+    return plan, meso, week_rows
+
+
+class TestBlockSnapshots:
+    def test_payloads_match_the_one_week_builder(self):
+        _plan, _meso, weeks = seed_block(weeks=3, days=3)
+
+        snapshots = serialize_week_snapshots(weeks)
+
+        assert list(snapshots) == [w.pk for w in weeks]
+        for week in weeks:
+            assert snapshots[week.pk] == serialize_week_snapshot(week)
+
+    def test_queries_do_not_grow_with_the_block(self):
+        def queries_for(weeks, days, rows):
+            _plan, _meso, week_rows = seed_block(weeks=weeks, days=days, rows=rows)
+            with CaptureQueriesContext(connection) as queries:
+                serialize_week_snapshots(week_rows)
+            return len(queries)
+
+        assert queries_for(1, 1, 1) == queries_for(4, 3, 3)
+
+    def test_deliver_costs_the_same_for_any_block_size(self, client):
+        def deliver_queries(weeks, days, rows):
+            plan, _meso, _weeks = seed_block(weeks=weeks, days=days, rows=rows)
+            client.force_login(plan.relationship.coach)
+            url = reverse("meso:api_plan_deliver", kwargs={"plan_id": plan.pk})
+            with CaptureQueriesContext(connection) as queries:
+                assert client.post(url).status_code == 201
+            return len(queries)
+
+        assert deliver_queries(1, 1, 1) == deliver_queries(4, 3, 3)
+
+    def test_deliver_stamps_and_snapshots_every_live_week(self, client):
+        plan, meso, weeks = seed_block(weeks=3)
+        client.force_login(plan.relationship.coach)
+
+        resp = client.post(
+            reverse("meso:api_plan_deliver", kwargs={"plan_id": plan.pk})
+        )
+
+        assert resp.json()["week_count"] == 3
+        stamps = {w.delivered_at for w in meso.weeks.all()}
+        assert len(stamps) == 1 and None not in stamps
+        for week in weeks:
+            delivery = WeekDelivery.objects.get(week=week)
+            assert delivery.payload == serialize_week_snapshot(week)
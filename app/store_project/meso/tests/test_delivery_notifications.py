@@ -159,7 +159,7 @@ class TestDeliveryNotification:
 
         with (
             mock.patch(
-                "store_project.meso.views.send_block_delivered_email",
+                "store_project.meso.delivery.send_block_delivered_email",
                 side_effect=RuntimeError("SES is down"),
             ),
             django_capture_on_commit_callbacks(execute=True),
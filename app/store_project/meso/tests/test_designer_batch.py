@@ -0,0 +1,325 @@
+"""Batched designer writes (``plan_batch``).
+
+``useGrid`` debounces the coach's typing — cell text, row renames, sub-lines,
+Tempo/Rest/instructions — into one POST of ordered ops, applied under one plan
+lock as one undo step. Covers:
+
+- a mixed batch applies every op, in order, as one ``PlanAction`` and one
+  ``edit_version`` bump (and one undo reverts all of it);
+- validation is all-or-nothing — a bad op anywhere is a 400 naming its index,
+  with nothing written;
+- athlete-authored cells are reclaimed before the snapshot, as in
+  ``cell_line_write``;
+- a batch of no-ops records nothing; patch mode returns the touched rows;
+- the query count doesn't grow with the number of ops' targets.
+"""
+
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.factories import MesocycleFactory
+from store_project.meso.factories import PlanFactory
+from store_project.meso.factories import WeekFactory
+from store_project.meso.models import PlanAction
+from store_project.meso.models import Prescription
+
+from ._helpers import day
+from ._helpers import presc
+
+pytestmark = pytest.mark.django_db
+
+
+def seed_plan(days=2):
+    rel = CoachAthleteFactory()
+    plan = PlanFactory(relationship=rel)
+    meso = MesocycleFactory(plan=plan, order=0)
+    week = WeekFactory(mesocycle=meso, index=1)
+    cells = []
+    for number in range(1, days + 1):
+        session = day(week, day_number=number, name=f"Day {number}")
+        cells.append(presc(session, name=f"Lift {number}", text="3 x 10"))
+    return plan, week, cells
+
+
+def batch(client, plan, ops, *, status=200, **headers):
+    resp = client.post(
+        reverse("meso:api_plan_batch", kwargs={"plan_id": plan.pk}),
+        data=json.dumps({"ops": ops}),
+        content_type="application/json",
+        **headers,
+    )
+    assert resp.status_code == status, resp.content
+    return resp.json()
+
+
+def undo_depth(plan):
+    return PlanAction.objects.filter(plan=plan, stack=PlanAction.Stack.UNDO).count()
+
+
+class TestApply:
+    def test_a_mixed_batch_is_one_undo_step(self, client):
+        plan, week, (first, second) = seed_plan()
+        client.force_login(plan.relationship.coach)
+
+        body = batch(
+            client,
+            plan,
+            [
+                {"op": "prescription_patch", "id": first.pk, "text": "5 x 5"},
+                {"op": "prescription_patch", "id": first.pk, "name": "Back squat"},
+                {
+                    "op": "cell_line_write",
+                    "slot_id": first.exercise_slot_id,
+                    "week_id": week.pk,
+                    "line": 1,
+                    "text": "RPE 8",
+                },
+                {
+                    "op": "exercise_slot_patch",
+                    "slot_id": second.exercise_slot_id,
+                    "tempo": "3010",
+                },
+            ],
+        )
+        assert body["applied"] == 4
+        assert body["history"]["can_undo"] is True
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.text == "5 x 5"
+        assert first.exercise_slot.name == "Back squat"
+        assert second.exercise_slot.tempo == "3010"
+        sub_line = Prescription.objects.get(
+            exercise_slot=first.exercise_slot, week=week, line=1
+        )
+        assert sub_line.text == "RPE 8"
+        assert undo_depth(plan) == 1
+        assert PlanAction.objects.get(plan=plan).label == "Edited 2 exercises"
+        plan.refresh_from_db()
+        assert plan.edit_version == 1
+
+        resp = client.post(reverse("meso:api_plan_undo", kwargs={"plan_id": plan.pk}))
+        assert resp.status_code == 200
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.text == "3 x 10"
+        assert first.exercise_slot.name == "Lift 1"
+        assert second.exercise_slot.tempo == ""
+        assert not Prescription.objects.filter(
+            exercise_slot=first.exercise_slot, line=1
+        ).exists()
+
+    def test_ops_apply_in_order(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        batch(
+            client,
+            plan,
+            [
+                {"op": "prescription_patch", "id": cell.pk, "name": "Front squat"},
+                {"op": "prescription_patch", "id": cell.pk, "name": "Lift 1"},
+                {"op": "prescription_patch", "id": cell.pk, "text": "4 x 6"},
+                {"op": "prescription_patch", "id": cell.pk, "text": "4 x 8"},
+            ],
+        )
+        cell.refresh_from_db()
+        # The rename back is an edit too: it differs from the batch's own
+        # earlier rename, even though it matches the stored name.
+        assert cell.exercise_slot.name == "Lift 1"
+        assert cell.text == "4 x 8"
+        assert PlanAction.objects.get(plan=plan).label == "Edited Lift 1"
+
+    def test_a_batch_of_no_ops_records_nothing(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        body = batch(
+            client,
+            plan,
+            [
+                {"op": "prescription_patch", "id": cell.pk, "name": "Lift 1"},
+                {"op": "exercise_slot_patch", "slot_id": cell.exercise_slot_id},
+            ],
+        )
+        assert body["applied"] == 0
+        assert undo_depth(plan) == 0
+        plan.refresh_from_db()
+        assert plan.edit_version == 0
+
+    def test_an_athlete_authored_cell_is_reclaimed_before_the_snapshot(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        logged = Prescription.objects.create(
+            exercise_slot=cell.exercise_slot,
+            week=week,
+            line=1,
+            text="felt heavy",
+            athlete_authored=True,
+        )
+        client.force_login(plan.relationship.coach)
+        batch(
+            client,
+            plan,
+            [
+                {
+                    "op": "cell_line_write",
+                    "slot_id": cell.exercise_slot_id,
+                    "week_id": week.pk,
+                    "line": 1,
+                    "text": "Cue: brace",
+                }
+            ],
+        )
+        logged.refresh_from_db()
+        assert logged.text == "Cue: brace"
+        assert logged.athlete_authored is False
+
+        client.post(reverse("meso:api_plan_undo", kwargs={"plan_id": plan.pk}))
+        logged.refresh_from_db()
+        assert logged.text == "felt heavy"
+
+    def test_patch_mode_returns_the_touched_rows(self, client):
+        plan, week, (first, second) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        body = batch(
+            client,
+            plan,
+            [
+                {"op": "prescription_patch", "id": first.pk, "text": "5 x 5"},
+                {"op": "prescription_patch", "id": second.pk, "text": "5 x 3"},
+            ],
+            HTTP_X_MESO_RESPONSE="patch",
+        )
+        rows = body["grid_patch"]["rows"]
+        assert {r["exercise_slot_id"] for r in rows} == {
+            first.exercise_slot_id,
+            second.exercise_slot_id,
+        }
+        assert body["grid_patch"]["version"] == 1
+        assert body["applied"] == 2
+
+    def test_queries_do_not_grow_with_the_number_of_targets(self, client):
+        def ops_for(cells):
+            return [
+                {"op": "prescription_patch", "id": c.pk, "text": "1 x 1"} for c in cells
+            ]
+
+        plan, week, cells = seed_plan(days=6)
+        client.force_login(plan.relationship.coach)
+        with CaptureQueriesContext(connection) as small:
+            batch(client, plan, ops_for(cells[:2]))
+        with CaptureQueriesContext(connection) as large:
+            batch(client, plan, ops_for(cells))
+        # Only the per-op UPDATEs scale (4 more cells, 4 more queries); the
+        # lookups, the snapshot and the touch are one apiece.
+        assert len(large) - len(small) <= 4
+
+
+class TestValidation:
+    @pytest.mark.parametrize(
+        ("op", "error"),
+        [
+            ({"op": "delete_everything", "id": 1}, "op must be one of"),
+            ({"op": "prescription_patch", "id": "1"}, "id must be an integer"),
+            ({"op": "prescription_patch", "id": 0, "text": "x"}, "No such cell"),
+            ({"op": "exercise_slot_patch", "slot_id": 0}, "No such exercise row"),
+        ],
+    )
+    def test_a_bad_op_rejects_the_whole_batch(self, client, op, error):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        body = batch(
+            client,
+            plan,
+            [{"op": "prescription_patch", "id": cell.pk, "text": "5 x 5"}, op],
+            status=400,
+        )
+        assert body["index"] == 1
+        assert error in body["error"]
+        cell.refresh_from_db()
+        assert cell.text == "3 x 10"
+        assert undo_depth(plan) == 0
+
+    def test_field_errors_match_the_single_endpoints(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        slot_id = cell.exercise_slot_id
+        cases = [
+            ({"op": "prescription_patch", "id": cell.pk, "text": 5}, "text must be"),
+            (
+                {"op": "prescription_patch", "id": cell.pk, "name": "x" * 256},
+                "name is too long",
+            ),
+            (
+                {"op": "cell_line_write", "slot_id": slot_id, "week_id": week.pk},
+                "line must be",
+            ),
+            (
+                {
+                    "op": "cell_line_write",
+                    "slot_id": slot_id,
+                    "week_id": week.pk + 999,
+                    "line": 1,
+                    "text": "",
+                },
+                "live week of this block",
+            ),
+            (
+                {"op": "exercise_slot_patch", "slot_id": slot_id, "rest": "x" * 65},
+                "rest is too long",
+            ),
+        ]
+        for op, error in cases:
+            body = batch(client, plan, [op], status=400)
+            assert body["index"] == 0
+            assert error in body["error"]
+
+    def test_a_week_of_another_block_is_rejected(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        other_week = WeekFactory(
+            mesocycle=MesocycleFactory(plan=plan, order=1), index=1
+        )
+        client.force_login(plan.relationship.coach)
+        body = batch(
+            client,
+            plan,
+            [
+                {
+                    "op": "cell_line_write",
+                    "slot_id": cell.exercise_slot_id,
+                    "week_id": other_week.pk,
+                    "line": 0,
+                    "text": "x",
+                }
+            ],
+            status=400,
+        )
+        assert "live week of this block" in body["error"]
+
+    @pytest.mark.parametrize("ops", [[], None, {"op": "prescription_patch"}])
+    def test_ops_must_be_a_non_empty_list(self, client, ops):
+        plan, week, cells = seed_plan()
+        client.force_login(plan.relationship.coach)
+        body = batch(client, plan, ops, status=400)
+        assert body["error"] == "ops must be a non-empty list."
+
+    def test_the_batch_size_is_capped(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(plan.relationship.coach)
+        ops = [{"op": "prescription_patch", "id": cell.pk, "text": "1"}] * 201
+        body = batch(client, plan, ops, status=400)
+        assert "At most 200 ops" in body["error"]
+
+    def test_another_coachs_plan_is_forbidden(self, client):
+        plan, week, (cell, _other) = seed_plan()
+        client.force_login(CoachAthleteFactory().coach)
+        resp = client.post(
+            reverse("meso:api_plan_batch", kwargs={"plan_id": plan.pk}),
+            data=json.dumps(
+                {"ops": [{"op": "prescription_patch", "id": cell.pk, "text": "x"}]}
+            ),
+            content_type="application/json",
+        )
+        assert resp.status_code == 403
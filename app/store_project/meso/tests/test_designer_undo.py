@@ -47,6 +47,10 @@ from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import ProposedChangeFactory
 from store_project.meso.factories import SessionLogFactory
 from store_project.meso.factories import WeekFactory
+from store_project.meso.history import action_snapshot
+from store_project.meso.history import record_plan_action
+from store_project.meso.history import restore_plan_snapshot
+from store_project.meso.history import serialize_plan_snapshot
 from store_project.meso.models import ExerciseSlot
 from store_project.meso.models import LoggedSet
 from store_project.meso.models import Plan
@@ -206,8 +210,8 @@ class TestRecording:
         assert seqs == list(range(seqs[0], seqs[0] + 7))
         assert redo_actions(plan).count() == 0
         for action in actions:
-            assert isinstance(action.snapshot, dict)
-            assert action.snapshot  # never an empty snapshot
+            assert isinstance(action_snapshot(action), dict)
+            assert action_snapshot(action)  # never an empty snapshot
             assert action.label  # every action carries a human label
         # The three deletes are the last three actions; their labels read as
         # deletions (loose pin — exact wording is the implementer's).
@@ -224,7 +228,7 @@ class TestRecording:
         patch(client, plan, cell, text="4 x 6, RPE 9, 90")
 
         action = undo_actions(plan).get()
-        cell_rows = action.snapshot["cells"]
+        cell_rows = action_snapshot(action)["cells"]
         entry = next(r for r in cell_rows if r["pk"] == cell.pk)
         # The snapshot holds the state BEFORE the mutation.
         assert entry["text"] == "4 x 6, RPE 7, 70"
@@ -233,7 +237,7 @@ class TestRecording:
         assert entry["line"] == 0
         assert entry["skipped"] is False
 
-        slot_rows = action.snapshot["exercise_slots"]
+        slot_rows = action_snapshot(action)["exercise_slots"]
         slot_entry = next(r for r in slot_rows if r["pk"] == cell.exercise_slot_id)
         assert slot_entry["name"] == "Box Squat"
         assert slot_entry["deleted_at"] is None
@@ -250,7 +254,7 @@ class TestRecording:
         assert resp.status_code == 200
 
         action = undo_actions(plan).order_by("-seq").first()
-        weeks = action.snapshot["weeks"]
+        weeks = action_snapshot(action)["weeks"]
         entry = next(w for w in weeks if w["pk"] == week2.pk)
         # Pre-mutation: the week was still live when the snapshot was taken.
         assert entry["deleted_at"] is None
@@ -510,6 +514,149 @@ class TestHistoryCap:
         assert first_seq not in seqs
 
 
+# ---------------------------------------------------------------------------
+# Delta snapshots — hot writes record only the region they touch
+# ---------------------------------------------------------------------------
+
+
+class TestDeltaSnapshots:
+    def test_cell_edit_records_only_its_own_row(self, client):
+        plan, week, session, cell = seed_plan()
+        other_day = day(week, day_number=2, name="Upper")
+        other = presc(other_day, name="Bench")
+        client.force_login(plan.relationship.coach)
+        patch(client, plan, cell, text="4 x 6, RPE 9, 90")
+
+        snapshot = action_snapshot(undo_actions(plan).get())
+        assert snapshot["scope"] == {"rows": [cell.exercise_slot_id], "days": []}
+        assert [r["pk"] for r in snapshot["exercise_slots"]] == [cell.exercise_slot_id]
+        assert [r["pk"] for r in snapshot["cells"]] == [cell.pk]
+        assert snapshot["weeks"] == []
+        assert snapshot["session_slots"] == []
+        assert other.pk not in {r["pk"] for r in snapshot["cells"]}
+
+    def test_undo_of_a_delta_leaves_rows_outside_its_region_alone(self, client):
+        plan, week, session, cell = seed_plan()
+        other_day = day(week, day_number=2, name="Upper")
+        other = presc(other_day, name="Bench", text="3 x 10")
+        client.force_login(plan.relationship.coach)
+        patch(client, plan, cell, text="4 x 6, RPE 9, 90")
+        # A write the op-log never saw (e.g. an athlete-side change or a
+        # concurrent admin fix) outside the delta's region survives its undo.
+        Prescription.objects.filter(pk=other.pk).update(text="5 x 5")
+
+        assert client.post(undo_url(plan)).status_code == 200
+        cell.refresh_from_db()
+        other.refresh_from_db()
+        assert cell.text == "4 x 6, RPE 7, 70"
+        assert other.text == "5 x 5"
+        # The redo row mirrors the same region.
+        assert action_snapshot(redo_actions(plan).get())["scope"] == {
+            "rows": [cell.exercise_slot_id],
+            "days": [],
+        }
+
+    def test_cross_day_move_undo_and_redo(self, client):
+        plan, week, session, cell = seed_plan()
+        target = day(week, day_number=2, name="Upper")
+        bench = presc(target, name="Bench", order=0)
+        client.force_login(plan.relationship.coach)
+        resp = post_json(
+            client,
+            reverse(
+                "meso:api_prescription_move",
+                kwargs={"plan_id": plan.pk, "pk": cell.pk},
+            ),
+            {"session_id": target.pk, "index": 0},
+        )
+        assert resp.status_code == 200
+        snapshot = action_snapshot(undo_actions(plan).get())
+        assert snapshot["scope"]["days"] == sorted(
+            [session.session_slot_id, target.session_slot_id]
+        )
+
+        assert client.post(undo_url(plan)).status_code == 200
+        moved = ExerciseSlot.objects.get(pk=cell.exercise_slot_id)
+        assert moved.session_slot_id == session.session_slot_id
+        assert moved.deleted_at is None
+        assert ExerciseSlot.objects.get(pk=bench.exercise_slot_id).order == 0
+
+        assert client.post(redo_url(plan)).status_code == 200
+        moved.refresh_from_db()
+        assert moved.session_slot_id == target.session_slot_id
+        assert moved.order == 0
+        assert moved.deleted_at is None
+
+    def test_legacy_full_snapshot_row_still_restores(self, client):
+        # Rows written before deltas carry no ``scope`` — they replay through
+        # the plan-wide path, and their redo mirror is plan-wide too.
+        plan, week, session, cell = seed_plan()
+        client.force_login(plan.relationship.coach)
+        record_plan_action(plan, "Edited Box Squat")
+        Prescription.objects.filter(pk=cell.pk).update(text="1 x 1")
+        assert "scope" not in action_snapshot(undo_actions(plan).get())
+
+        assert client.post(undo_url(plan)).status_code == 200
+        cell.refresh_from_db()
+        assert cell.text == "4 x 6, RPE 7, 70"
+        redo = action_snapshot(redo_actions(plan).get())
+        assert "scope" not in redo
+        assert {r["pk"] for r in redo["weeks"]} == {week.pk}
+
+
+class TestBatchedRestore:
+    def _wide_plan(self):
+        """A plan with six days × four rows, so a no-op row write would show."""
+        plan, week, session, cell = seed_plan()
+        for number in range(2, 7):
+            other = day(week, day_number=number, name=f"Day {number}")
+            for _ in range(4):
+                presc(other)
+        return plan, week, session, cell
+
+    def test_restore_writes_only_the_rows_that_differ(self):
+        plan, week, session, cell = self._wide_plan()
+        snapshot = serialize_plan_snapshot(plan)
+        Prescription.objects.filter(pk=cell.pk).update(text="1 x 1")
+
+        assert restore_plan_snapshot(plan, snapshot) == 1
+        cell.refresh_from_db()
+        assert cell.text == "4 x 6, RPE 7, 70"
+        # Restoring onto an already-matching plan writes nothing at all.
+        assert restore_plan_snapshot(plan, snapshot) == 0
+
+    def test_restore_query_count_does_not_grow_with_the_plan(
+        self, django_assert_max_num_queries
+    ):
+        plan, week, session, cell = self._wide_plan()
+        snapshot = serialize_plan_snapshot(plan)
+        Prescription.objects.filter(
+            exercise_slot__session_slot__mesocycle__plan=plan
+        ).update(text="changed")
+        ExerciseSlot.objects.filter(session_slot__mesocycle__plan=plan).update(
+            name="renamed"
+        )
+        # Loads + one bulk UPDATE per changed-field group + cleanup — not a
+        # save() per row (21 cells and 21 rows changed here).
+        with django_assert_max_num_queries(16):
+            touched = restore_plan_snapshot(plan, snapshot)
+        assert touched == 42
+        assert not Prescription.objects.filter(text="changed").exists()
+
+    def test_recreated_and_stray_cells_count_as_touched(self):
+        plan, week, session, cell = seed_plan()
+        snapshot = serialize_plan_snapshot(plan)
+        Prescription.objects.create(
+            exercise_slot=cell.exercise_slot, week=week, line=1, text="stray"
+        )
+        cell_pk = cell.pk
+        Prescription.objects.filter(pk=cell_pk).delete()
+
+        assert restore_plan_snapshot(plan, snapshot) == 2
+        assert Prescription.objects.get(pk=cell_pk).text == "4 x 6, RPE 7, 70"
+        assert not Prescription.objects.filter(text="stray").exists()
+
+
 # ---------------------------------------------------------------------------
 # batch_apply — one snapshot for the whole batch
 # ---------------------------------------------------------------------------
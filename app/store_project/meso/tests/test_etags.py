@@ -0,0 +1,206 @@
+"""Conditional GET on the re-requested meso reads (``meso.etags``).
+
+Pins the contract for each endpoint: a revalidation carrying the ETag it was
+given is a bodiless 304 until a write the payload reflects — a designer edit,
+a log, a 1RM, a proposal landing or a change decided, a tour step — and the
+304 is answered before the serializer runs.
+"""
+
+import pytest
+from django.urls import reverse
+
+from store_project.meso import etags
+from store_project.meso import tour
+from store_project.meso.factories import AgentProposalBatchFactory
+from store_project.meso.factories import CoachProfileFactory
+from store_project.meso.factories import MesocycleFactory
+from store_project.meso.factories import ProposedChangeFactory
+from store_project.meso.models import AgentProposalBatch
+from store_project.meso.tests.test_athlete_surface import seed
+
+pytestmark = pytest.mark.django_db
+
+
+def _revalidate(client, url, etag):
+    return client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+
+def _week_url(s):
+    return reverse(
+        "meso:api_week_view", kwargs={"plan_id": s.plan.pk, "week_id": s.week.pk}
+    )
+
+
+def _explode(*args, **kwargs):
+    raise AssertionError("the serializer ran for a 304")
+
+
+class TestDesigner:
+    def test_grid_is_a_304_until_an_edit(self, client):
+        s = seed()
+        client.force_login(s.coach)
+        url = reverse("meso:api_mesocycle_grid", kwargs={"plan_id": s.plan.pk})
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first["ETag"]
+        assert "no-cache" in first["Cache-Control"]
+
+        again = _revalidate(client, url, etag)
+        assert again.status_code == 304
+        assert again.content == b""
+
+        s.plan.touch()
+        assert _revalidate(client, url, etag).status_code == 200
+
+    def test_blocks_are_tagged_apart(self, client):
+        s = seed()
+        other = MesocycleFactory(plan=s.plan, order=1)
+        client.force_login(s.coach)
+        url = reverse("meso:api_mesocycle_grid", kwargs={"plan_id": s.plan.pk})
+        etag = client.get(url)["ETag"]
+        assert etag == etags.grid_etag(s.meso, s.plan)
+        assert (
+            _revalidate(client, f"{url}?mesocycle={other.pk}", etag).status_code == 200
+        )
+
+    def test_week_304_skips_the_serializer(self, client, monkeypatch):
+        s = seed()
+        client.force_login(s.coach)
+        etag = client.get(_week_url(s))["ETag"]
+        monkeypatch.setattr("store_project.meso.views.serialize_plan", _explode)
+        assert _revalidate(client, _week_url(s), etag).status_code == 304
+
+    def test_week_follows_the_athletes_logs(self, client):
+        s = seed()
+        client.force_login(s.coach)
+        etag = client.get(_week_url(s))["ETag"]
+        client.force_login(s.athlete)
+        logged = client.post(
+            reverse("meso:athlete_log_session", kwargs={"pk": s.session.pk}),
+            data={"sets": [{"prescription": s.presc.pk, "reps": "6", "load": "70"}]},
+            content_type="application/json",
+        )
+        assert logged.status_code == 200
+        client.force_login(s.coach)
+        fresh = _revalidate(client, _week_url(s), etag)
+        assert fresh.status_code == 200
+        assert fresh.json()["program"][0]["exercises"][0]["last"]
+
+    def test_week_follows_a_coach_1rm(self, client):
+        s = seed()
+        client.force_login(s.coach)
+        etag = client.get(_week_url(s))["ETag"]
+        resp = client.post(
+            reverse(
+                "meso:api_coach_set_one_rm",
+                kwargs={"plan_id": s.plan.pk, "pk": s.presc.pk},
+            ),
+            data={"value": "140"},
+            content_type="application/json",
+        )
+        assert resp.status_code == 200
+        assert _revalidate(client, _week_url(s), etag).status_code == 200
+
+    def test_another_coach_still_gets_a_403(self, client):
+        s = seed()
+        client.force_login(s.coach)
+        etag = client.get(_week_url(s))["ETag"]
+        client.force_login(seed().coach)
+        assert _revalidate(client, _week_url(s), etag).status_code == 403
+
+    def test_no_etag_when_disabled(self, client, settings):
+        settings.MESO_ETAG_TTL = 0
+        s = seed()
+        client.force_login(s.coach)
+        assert "ETag" not in client.get(_week_url(s))
+
+
+class TestProposalBatch:
+    def _url(self, batch):
+        return reverse("meso:api_batch_status", kwargs={"batch_id": batch.pk})
+
+    def test_drafting_polls_are_304s_until_it_lands(
+        self, client, django_assert_num_queries
+    ):
+        s = seed()
+        batch = AgentProposalBatchFactory(
+            plan=s.plan, status=AgentProposalBatch.Status.DRAFTING
+        )
+        client.force_login(s.coach)
+        etag = client.get(self._url(batch))["ETag"]
+        with django_assert_num_queries(2):  # the user, the batch
+            assert _revalidate(client, self._url(batch), etag).status_code == 304
+
+        ProposedChangeFactory(batch=batch)
+        batch.status = AgentProposalBatch.Status.PENDING
+        batch.save(update_fields=["status"])
+        landed = _revalidate(client, self._url(batch), etag)
+        assert landed.status_code == 200
+        assert len(landed.json()["changes"]) == 1
+
+    def test_a_decided_change_is_a_new_etag(self, client):
+        s = seed()
+        change = ProposedChangeFactory(batch=AgentProposalBatchFactory(plan=s.plan))
+        client.force_login(s.coach)
+        url = self._url(change.batch)
+        etag = client.get(url)["ETag"]
+        assert _revalidate(client, url, etag).status_code == 304
+        change.status = change.Status.APPROVED
+        change.save(update_fields=["status"])
+        assert _revalidate(client, url, etag).status_code == 200
+
+
+class TestTourConfig:
+    def test_a_step_change_is_a_new_etag(self, client):
+        coach = CoachProfileFactory(tour_state={"step": 0, "status": "active"}).user
+        client.force_login(coach)
+        url = reverse("meso:tour_config")
+        etag = client.get(url)["ETag"]
+        assert _revalidate(client, url, etag).status_code == 304
+        tour.set_step(coach.coach_profile, 1)
+        assert _revalidate(client, url, etag).status_code == 200
+
+    def test_a_new_plan_is_a_new_etag(self, client, django_capture_on_commit_callbacks):
+        s = seed()
+        CoachProfileFactory(user=s.coach, tour_state={"step": 0, "status": "active"})
+        client.force_login(s.coach)
+        url = reverse("meso:tour_config")
+        etag = client.get(url)["ETag"]
+        with django_capture_on_commit_callbacks(execute=True):
+            s.plan.touch()
+        assert _revalidate(client, url, etag).status_code == 200
+
+
+class TestAthleteSession:
+    def _url(self, s):
+        return reverse("meso:athlete_session", kwargs={"pk": s.session.pk})
+
+    def test_revalidation_is_a_304_until_a_1rm(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        first = client.get(self._url(s))
+        assert first.status_code == 200
+        etag = first["ETag"]
+        assert _revalidate(client, self._url(s), etag).status_code == 304
+
+        resp = client.post(
+            reverse("meso:athlete_set_one_rm", kwargs={"pk": s.session.pk}),
+            data={"prescription": s.presc.pk, "value": "140"},
+            content_type="application/json",
+        )
+        assert resp.status_code == 200
+        assert _revalidate(client, self._url(s), etag).status_code == 200
+
+    def test_a_coach_edit_is_a_new_etag(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        etag = client.get(self._url(s))["ETag"]
+        s.plan.touch()
+        assert _revalidate(client, self._url(s), etag).status_code == 200
+
+    def test_a_foreign_session_is_still_a_404(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        etag = client.get(self._url(s))["ETag"]
+        client.force_login(seed().athlete)
+        assert _revalidate(client, self._url(s), etag).status_code == 404
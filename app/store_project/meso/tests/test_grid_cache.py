@@ -0,0 +1,170 @@
+"""Versioned grid payload cache (``meso.grid_cache``).
+
+``api_mesocycle_grid`` serves the block's JSON body from the cache while the
+plan's ``edit_version`` is unchanged, and every designer write bumps that
+version (``Plan.touch``). Covers:
+
+- a repeat load is a hit whose body is byte-identical to the miss's, and
+  skips the serializer's queries;
+- cell, sub-line, add-row and undo writes invalidate it (the next load sees
+  the edit — and the new undo/redo state);
+- the counters and ``meso_grid_cache_stats``; ``MESO_GRID_CACHE_TTL=0``.
+"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.grid_cache import grid_cache_stats
+from store_project.meso.models import Prescription
+
+pytestmark = pytest.mark.django_db
+
+
+def _seeded_plan():
+    """An owned plan with a two-day, two-week block (``test_mesocycle_grid_endpoint``)."""
+    link = CoachAthleteFactory()
+    plan = link.create_plan()
+    meso = plan.mesocycles.get()
+    meso.append_week()
+    return link, plan, meso
+
+
+def _grid(client, plan):
+    resp = client.get(reverse("meso:api_mesocycle_grid", kwargs={"plan_id": plan.pk}))
+    assert resp.status_code == 200
+    return resp
+
+
+def _first_cell(plan):
+    return (
+        Prescription.objects.filter(
+            exercise_slot__session_slot__mesocycle__plan=plan, line=0
+        )
+        .order_by("week__index", "pk")
+        .first()
+    )
+
+
+def _cell_text(body, cell):
+    for day_data in body["days"]:
+        for row in day_data["rows"]:
+            data = row["cells"].get(str(cell.week_id))
+            if data and data["prescription_id"] == cell.pk:
+                return data
+    raise AssertionError("cell not in the grid")
+
+
+def _post(client, url, payload=None):
+    resp = client.post(
+        url, data=json.dumps(payload or {}), content_type="application/json"
+    )
+    assert resp.status_code in (200, 201), resp.content
+    return resp
+
+
+class TestGridCache:
+    def test_a_repeat_load_is_a_byte_identical_hit(
+        self, client, django_assert_max_num_queries
+    ):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        first = _grid(client, plan)
+        # Session + user + plan + block only: none of the serializer's queries.
+        with django_assert_max_num_queries(4):
+            second = _grid(client, plan)
+        assert second.content == first.content
+        assert second["Content-Type"] == "application/json"
+        assert grid_cache_stats()["hits"] == 1
+        assert grid_cache_stats()["misses"] == 1
+
+    def test_an_explicit_mesocycle_is_cached_too(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        url = reverse("meso:api_mesocycle_grid", kwargs={"plan_id": plan.pk})
+        first = client.get(url, {"mesocycle": meso.pk})
+        second = client.get(url, {"mesocycle": meso.pk})
+        assert second.content == first.content
+        assert grid_cache_stats()["hits"] == 1
+
+    def test_a_cell_patch_invalidates_the_cached_grid(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        assert _grid(client, plan).json()["history"]["can_undo"] is False
+
+        _post(
+            client,
+            reverse(
+                "meso:api_prescription_patch",
+                kwargs={"plan_id": plan.pk, "pk": cell.pk},
+            ),
+            {"text": "5 x 5"},
+        )
+        plan.refresh_from_db()
+        assert plan.edit_version == 1
+        body = _grid(client, plan).json()
+        assert _cell_text(body, cell)["text"] == "5 x 5"
+        assert body["history"]["can_undo"] is True
+        assert grid_cache_stats()["misses"] == 2
+
+    def test_a_sub_line_write_invalidates_the_cached_grid(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        _grid(client, plan)
+
+        _post(
+            client,
+            reverse(
+                "meso:api_cell_line_write",
+                kwargs={"plan_id": plan.pk, "slot_id": cell.exercise_slot_id},
+            ),
+            {"week_id": cell.week_id, "line": 1, "text": "Swap: DB press"},
+        )
+        lines = _cell_text(_grid(client, plan).json(), cell)["lines"]
+        assert [ln["text"] for ln in lines] == ["Swap: DB press"]
+
+    def test_adding_a_row_and_undoing_it_invalidate_the_cached_grid(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        session = plan.mesocycles.get().weeks.order_by("index")[0].sessions.first()
+
+        def row_count():
+            body = _grid(client, plan).json()
+            return sum(len(d["rows"]) for d in body["days"])
+
+        before = row_count()
+        _post(
+            client,
+            reverse(
+                "meso:api_session_add_exercise",
+                kwargs={"plan_id": plan.pk, "pk": session.pk},
+            ),
+        )
+        assert row_count() == before + 1
+        _post(client, reverse("meso:api_plan_undo", kwargs={"plan_id": plan.pk}))
+        assert row_count() == before
+
+    def test_a_zero_ttl_disables_the_cache(self, client, settings):
+        settings.MESO_GRID_CACHE_TTL = 0
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        _grid(client, plan)
+        _grid(client, plan)
+        assert grid_cache_stats() == {"hits": 0, "misses": 0, "hit_rate": None}
+
+    def test_stats_command_reports_and_resets(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        for _ in range(4):
+            _grid(client, plan)
+
+        out = StringIO()
+        call_command("meso_grid_cache_stats", "--reset", stdout=out)
+        assert "3 hit(s), 1 miss(es), hit rate 75%" in out.getvalue()
+        assert grid_cache_stats()["hits"] == 0
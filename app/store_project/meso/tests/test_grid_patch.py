@@ -0,0 +1,270 @@
+"""Patch-response mode for the designer's grid writes (``serialize_grid_patch``).
+
+A write sent with ``X-Meso-Response: patch`` answers with just the rows/days it
+changed (``grid_patch``) instead of a full re-serialization; ``useGrid`` merges
+it into the grid it holds. Covers:
+
+- each opted-in endpoint's patch, merged the way the client merges it, equals
+  a fresh ``api_mesocycle_grid`` read (the merge is lossless);
+- a cell-scoped patch carries one row however big the block is;
+- removed rows/days and day-header-only patches;
+- without the header every endpoint keeps its old reply.
+"""
+
+import json
+
+import pytest
+from django.urls import reverse
+
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.models import Prescription
+
+pytestmark = pytest.mark.django_db
+
+PATCH = {"HTTP_X_MESO_RESPONSE": "patch"}
+
+
+def _seeded_plan(extra_weeks=1):
+    """An owned plan: the two-day scaffold block plus ``extra_weeks`` weeks."""
+    link = CoachAthleteFactory()
+    plan = link.create_plan()
+    meso = plan.mesocycles.get()
+    for _ in range(extra_weeks):
+        meso.append_week()
+    return link, plan, meso
+
+
+def _grid(client, plan):
+    resp = client.get(reverse("meso:api_mesocycle_grid", kwargs={"plan_id": plan.pk}))
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def _post(client, name, payload=None, *, patch=True, **kwargs):
+    resp = client.post(
+        reverse(f"meso:{name}", kwargs=kwargs),
+        data=json.dumps(payload) if payload is not None else None,
+        content_type="application/json",
+        **(PATCH if patch else {}),
+    )
+    assert resp.status_code in (200, 201), resp.content
+    return resp.json()
+
+
+def _merge(grid, patch):
+    """The client's merge (``mergeGridPatch`` in ``lib/grid.ts``), in Python."""
+    removed_rows = set(patch["removed_rows"])
+    removed_days = set(patch["removed_days"])
+    days = {d["session_slot_id"]: dict(d) for d in grid["days"]}
+    for day_id in removed_days:
+        days.pop(day_id, None)
+    for header in patch["days"]:
+        day = days.get(header["session_slot_id"], {"rows": []})
+        days[header["session_slot_id"]] = {
+            **day,
+            **header,
+            "rows": header.get("rows", day["rows"]),
+        }
+    incoming = {r["exercise_slot_id"]: r for r in patch["rows"]}
+    for day in days.values():
+        day["rows"] = [
+            r
+            for r in day["rows"]
+            if r["exercise_slot_id"] not in removed_rows
+            and r["exercise_slot_id"] not in incoming
+        ]
+    for row in patch["rows"]:
+        row = dict(row)
+        days[row.pop("session_slot_id")]["rows"].append(row)
+    for day in days.values():
+        day["rows"].sort(key=lambda r: r["order"])
+    merged = dict(grid)
+    merged["days"] = sorted(days.values(), key=lambda d: (d["order"], d["day_number"]))
+    merged["version"] = patch["version"]
+    return merged
+
+
+def _comparable(grid):
+    return {key: grid[key] for key in ("days", "weeks", "version")}
+
+
+def _first_cell(plan):
+    return (
+        Prescription.objects.filter(
+            exercise_slot__session_slot__mesocycle__plan=plan, line=0
+        )
+        .order_by("week__index", "exercise_slot__session_slot__order")
+        .first()
+    )
+
+
+class TestPatchesMergeToTheFullGrid:
+    def test_fill(self, client):
+        link, plan, meso = _seeded_plan(extra_weeks=2)
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        Prescription.objects.filter(pk=cell.pk).update(text="5 x 5")
+        before = _grid(client, plan)
+
+        body = _post(client, "api_prescription_fill", {}, plan_id=plan.pk, pk=cell.pk)
+        assert body["filled"] == 2
+        patch = body["grid_patch"]
+        assert [r["exercise_slot_id"] for r in patch["rows"]] == [cell.exercise_slot_id]
+        assert patch["days"] == []
+        assert _comparable(_merge(before, patch)) == _comparable(_grid(client, plan))
+
+    def test_skip_and_sub_line_write(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        grid = _grid(client, plan)
+
+        body = _post(
+            client,
+            "api_prescription_skip",
+            {"skipped": True},
+            plan_id=plan.pk,
+            pk=cell.pk,
+        )
+        grid = _merge(grid, body["grid_patch"])
+        body = _post(
+            client,
+            "api_cell_line_write",
+            {"week_id": cell.week_id, "line": 1, "text": "Swap: DB press"},
+            plan_id=plan.pk,
+            slot_id=cell.exercise_slot_id,
+        )
+        assert body["cell"]["text"] == "Swap: DB press"
+        grid = _merge(grid, body["grid_patch"])
+        assert _comparable(grid) == _comparable(_grid(client, plan))
+
+    def test_add_and_delete_a_row(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        session = cell.week.sessions.get(session_slot=cell.exercise_slot.session_slot)
+        grid = _grid(client, plan)
+
+        body = _post(client, "api_session_add_exercise", plan_id=plan.pk, pk=session.pk)
+        assert body["prescription"]["id"]
+        [new_row] = body["grid_patch"]["rows"]
+        assert new_row["session_slot_id"] == session.session_slot_id
+        grid = _merge(grid, body["grid_patch"])
+        assert _comparable(grid) == _comparable(_grid(client, plan))
+
+        body = _post(client, "api_prescription_delete", plan_id=plan.pk, pk=cell.pk)
+        assert body["grid_patch"]["removed_rows"] == [cell.exercise_slot_id]
+        assert body["grid_patch"]["rows"] == []
+        grid = _merge(grid, body["grid_patch"])
+        assert _comparable(grid) == _comparable(_grid(client, plan))
+
+    def test_move_a_row_across_days(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        target = cell.week.sessions.exclude(
+            session_slot=cell.exercise_slot.session_slot
+        ).first()
+        grid = _grid(client, plan)
+
+        body = _post(
+            client,
+            "api_prescription_move",
+            {"session_id": target.pk, "index": 0},
+            plan_id=plan.pk,
+            pk=cell.pk,
+        )
+        patch = body["grid_patch"]
+        # Both days, each with its full (renumbered) row list.
+        assert len(patch["days"]) == 2
+        assert all("rows" in d for d in patch["days"])
+        assert patch["rows"] == []
+        assert _comparable(_merge(grid, patch)) == _comparable(_grid(client, plan))
+
+    def test_reorder_rows_and_days(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        week = meso.weeks.order_by("index").first()
+        session = week.sessions.order_by("session_slot__order").first()
+        _post(client, "api_session_add_exercise", plan_id=plan.pk, pk=session.pk)
+        grid = _grid(client, plan)
+
+        cell_ids = [c.pk for c in session.cells()]
+        body = _post(
+            client,
+            "api_session_reorder",
+            {"order": cell_ids[::-1]},
+            plan_id=plan.pk,
+            pk=session.pk,
+        )
+        grid = _merge(grid, body["grid_patch"])
+
+        session_ids = list(
+            week.sessions.order_by("session_slot__order").values_list("pk", flat=True)
+        )
+        body = _post(
+            client,
+            "api_week_reorder_sessions",
+            {"order": session_ids[::-1]},
+            plan_id=plan.pk,
+            week_id=week.pk,
+        )
+        patch = body["grid_patch"]
+        # Day headers only: the days' rows didn't change, so none are sent.
+        assert len(patch["days"]) == 2
+        assert not any("rows" in d for d in patch["days"])
+        grid = _merge(grid, patch)
+        assert _comparable(grid) == _comparable(_grid(client, plan))
+
+
+class TestPatchShape:
+    def test_a_cell_patch_is_one_row_whatever_the_block_size(self, client):
+        link, plan, meso = _seeded_plan(extra_weeks=5)
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        body = _post(
+            client,
+            "api_prescription_skip",
+            {"skipped": True},
+            plan_id=plan.pk,
+            pk=cell.pk,
+        )
+        patch = body["grid_patch"]
+        assert len(patch["rows"]) == 1
+        assert patch["days"] == []
+        assert patch["mesocycle_id"] == meso.pk
+        assert body["history"]["can_undo"] is True
+
+    def test_the_patch_version_is_the_version_a_refetch_reports(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        assert _grid(client, plan)["version"] == 0
+        body = _post(
+            client,
+            "api_prescription_skip",
+            {"skipped": True},
+            plan_id=plan.pk,
+            pk=cell.pk,
+        )
+        assert body["grid_patch"]["version"] == 1
+        assert _grid(client, plan)["version"] == 1
+
+    def test_without_the_header_replies_are_unchanged(self, client):
+        link, plan, meso = _seeded_plan()
+        client.force_login(link.coach)
+        cell = _first_cell(plan)
+        body = _post(
+            client,
+            "api_prescription_skip",
+            {"skipped": True},
+            patch=False,
+            plan_id=plan.pk,
+            pk=cell.pk,
+        )
+        assert set(body) == {"ok", "history"}
+        body = _post(
+            client, "api_prescription_delete", patch=False, plan_id=plan.pk, pk=cell.pk
+        )
+        assert "grid_patch" not in body
+        assert "program" in body
@@ -0,0 +1,160 @@
+"""The per-athlete athlete-home cache and its ETag (``meso.home_cache``).
+
+Pins the contract: a warm home is served without rebuilding the cards, every
+write the home shows — a plan edit or delivery (``Plan.save``), a link change
+(``CoachAthlete.save``), a log — bumps the athlete's generation so the next
+open rebuilds, and the page's ETag turns a revalidation into a bodiless 304
+until one of those bumps.
+"""
+
+import pytest
+from django.contrib.messages import constants as message_levels
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from store_project.meso import home_cache
+from store_project.meso.models import SessionLog
+from store_project.meso.tests.test_athlete_surface import HOME
+from store_project.meso.tests.test_athlete_surface import seed
+
+pytestmark = pytest.mark.django_db
+
+
+def _log(client, s):
+    return client.post(
+        reverse("meso:athlete_log_session", kwargs={"pk": s.session.pk}),
+        data={"sets": [{"prescription": s.presc.pk, "reps": "6", "load": "70"}]},
+        content_type="application/json",
+    )
+
+
+class TestCards:
+    def test_warm_home_is_served_without_queries(self, django_assert_num_queries):
+        s = seed()
+        cold = home_cache.home_cards(s.athlete)
+        with django_assert_num_queries(0):
+            assert home_cache.home_cards(s.athlete) == cold
+
+    def test_a_plan_write_rebuilds(self, django_capture_on_commit_callbacks):
+        s = seed()
+        home_cache.home_cards(s.athlete)
+        with django_capture_on_commit_callbacks(execute=True):
+            s.plan.title = "Strength Block"
+            s.plan.save(update_fields=["title"])
+        assert home_cache.home_cards(s.athlete)[0]["title"] == "Strength Block"
+
+    def test_a_plan_autosave_bumps_only_on_commit(
+        self, django_capture_on_commit_callbacks, django_assert_num_queries
+    ):
+        s = seed()
+        plan = type(s.plan).objects.get(pk=s.plan.pk)  # relationship not loaded
+        before = home_cache.generation(s.athlete.pk)
+        coach_before = home_cache.generation(s.rel.coach_id)
+        # The F() bump, the athlete/coach ids, the reload.
+        with django_capture_on_commit_callbacks() as callbacks:
+            with django_assert_num_queries(3):
+                plan.touch()
+        assert home_cache.generation(s.athlete.pk) == before
+        assert len(callbacks) == 1
+        callbacks[0]()
+        assert home_cache.generation(s.athlete.pk) != before
+        assert home_cache.generation(s.rel.coach_id) != coach_before
+
+    def test_ending_the_link_rebuilds(self):
+        s = seed()
+        assert home_cache.home_cards(s.athlete)
+        s.rel.end()
+        assert home_cache.home_cards(s.athlete) == []
+
+    def test_logging_rebuilds(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        assert home_cache.home_cards(s.athlete)[0]["sessions"][0]["status"] == "pending"
+        assert _log(client, s).status_code == 200
+        assert home_cache.home_cards(s.athlete)[0]["sessions"][0]["status"] == "done"
+
+    def test_week_anchors_are_cached_apart(self):
+        s = seed()
+        bare = home_cache.home_cards(s.athlete)
+        other = home_cache.home_cards(s.athlete, focus_week_id=s.week.pk)
+        assert bare[0]["sessions"] == other[0]["sessions"]
+        assert home_cache.cards_key(s.athlete.pk, None) != home_cache.cards_key(
+            s.athlete.pk, s.week.pk
+        )
+
+    def test_disabled_by_a_zero_ttl(self, settings):
+        settings.MESO_HOME_CACHE_TTL = 0
+        s = seed()
+        home_cache.home_cards(s.athlete)
+        with CaptureQueriesContext(connection) as queries:
+            home_cache.home_cards(s.athlete)
+        assert len(queries) > 0
+
+    def test_a_lost_generation_never_matches_an_old_entry(self):
+        s = seed()
+        home_cache.home_cards(s.athlete)
+        stamped = home_cache.generation(s.athlete.pk)
+        home_cache.cache.delete(home_cache.generation_key(s.athlete.pk))
+        assert home_cache.generation(s.athlete.pk) != stamped
+
+
+class TestETag:
+    def test_revalidation_is_a_304_until_a_bump(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        first = client.get(HOME)
+        assert first.status_code == 200
+        etag = first["ETag"]
+        assert "no-cache" in first["Cache-Control"]
+
+        again = client.get(HOME, HTTP_IF_NONE_MATCH=etag)
+        assert again.status_code == 304
+        assert again.content == b""
+
+        assert _log(client, s).status_code == 200
+        fresh = client.get(HOME, HTTP_IF_NONE_MATCH=etag)
+        assert fresh.status_code == 200
+        assert fresh["ETag"] != etag
+        assert SessionLog.objects.filter(athlete=s.athlete).exists()
+
+    def test_a_new_login_gets_a_new_etag(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        etag = client.get(HOME)["ETag"]
+        client.logout()
+        client.force_login(s.athlete)
+        assert client.get(HOME, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_the_week_anchor_is_part_of_the_etag(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        etag = client.get(HOME)["ETag"]
+        resp = client.get(f"{HOME}?week={s.week.pk}", HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 200
+
+    def test_a_queued_message_always_renders(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        etag = client.get(HOME)["ETag"]
+        # Any flash queued for the next page (e.g. after accepting an invite).
+        storage = CookieStorage(RequestFactory().get(HOME))
+        client.cookies[storage.cookie_name] = storage._encode(
+            [Message(message_levels.SUCCESS, "Welcome aboard")]
+        )
+        resp = client.get(HOME, HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 200
+
+    def test_no_etag_when_disabled(self, client, settings):
+        settings.MESO_HOME_CACHE_TTL = 0
+        s = seed()
+        client.force_login(s.athlete)
+        assert "ETag" not in client.get(HOME)
+
+    def test_service_worker_revalidates_with_the_etag(self, client):
+        body = client.get(reverse("meso:service_worker")).content.decode()
+        assert '"If-None-Match": etag' in body
+        assert "response.status === 304" in body
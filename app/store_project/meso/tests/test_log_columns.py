@@ -0,0 +1,136 @@
+"""The denormalized ``SessionLog`` plan columns (``plan`` / ``relationship`` / ``unit``).
+
+The hot log reads filter on these instead of the four-table
+session → week → mesocycle → plan join, so they must never disagree with it.
+These pin: ``SessionLog.save`` fills them (a legacy row on its next save too),
+``Plan.save`` carries a unit change down (and re-keys the moved logs' lift
+bests and records), migration 0051 backfills unfilled
+rows, and ``meso_log_columns`` repairs and verifies them.
+"""
+
+import importlib
+from io import StringIO
+
+import pytest
+from django.apps import apps as global_apps
+from django.core.management import call_command
+from django.utils import timezone
+
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.factories import LoggedSetFactory
+from store_project.meso.factories import MesocycleFactory
+from store_project.meso.factories import PlanFactory
+from store_project.meso.factories import SessionLogFactory
+from store_project.meso.factories import WeekFactory
+from store_project.meso.models import PersonalRecordEntry
+from store_project.meso.models import Plan
+from store_project.meso.models import SessionLog
+from store_project.meso.models import Unit
+from store_project.meso.personal_records import personal_records
+from store_project.meso.personal_records import rebuild_records
+
+from ._helpers import day
+from ._helpers import presc as build_presc
+
+pytestmark = pytest.mark.django_db
+
+
+def make_log(*, unit=Unit.KILOGRAMS):
+    """A done log on a one-session plan in ``unit``."""
+    rel = CoachAthleteFactory()
+    plan = PlanFactory(relationship=rel, status=Plan.Status.ACTIVE, unit=unit)
+    meso = MesocycleFactory(plan=plan, order=0)
+    week = WeekFactory(mesocycle=meso, index=1, delivered_at=timezone.now())
+    session = day(week, day_number=1, name="Lower")
+    return SessionLogFactory(
+        session=session, athlete=rel.athlete, status=SessionLog.Status.DONE
+    )
+
+
+def blank_columns(log):
+    """Wipe a log's columns the way a pre-0050 row has them."""
+    SessionLog.objects.filter(pk=log.pk).update(plan=None, relationship=None, unit="")
+    log.refresh_from_db()
+
+
+def assert_filled(log):
+    log.refresh_from_db()
+    plan = log.session.week.mesocycle.plan
+    assert (log.plan_id, log.relationship_id, log.unit) == (
+        plan.pk,
+        plan.relationship_id,
+        plan.unit,
+    )
+
+
+class TestFilledOnWrite:
+    def test_new_log_copies_its_sessions_plan(self):
+        log = make_log(unit=Unit.POUNDS)
+        assert_filled(log)
+        assert log.unit == Unit.POUNDS
+
+    def test_legacy_row_fills_on_a_partial_save(self):
+        log = make_log()
+        blank_columns(log)
+        log.notes = "felt good"
+        log.save(update_fields=["notes"])
+        assert_filled(log)
+
+    def test_plan_unit_change_carries_down(self):
+        log = make_log()
+        plan = log.plan
+        plan.unit = Unit.POUNDS
+        plan.save(update_fields=["unit"])
+        log.refresh_from_db()
+        assert log.unit == Unit.POUNDS
+
+    def test_plan_unit_change_moves_the_records(self):
+        log = make_log()
+        presc = build_presc(log.session, name="Back Squat")
+        LoggedSetFactory(session_log=log, prescription=presc, reps="1", load="100")
+        rebuild_records(log.athlete, Unit.KILOGRAMS)
+
+        plan = log.plan
+        plan.unit = Unit.POUNDS
+        plan.save(update_fields=["unit"])
+
+        assert personal_records(log.athlete, unit=Unit.KILOGRAMS) == {}
+        moved = personal_records(log.athlete, unit=Unit.POUNDS)
+        assert moved["name:back squat"].session_log_id == log.pk
+        assert list(
+            PersonalRecordEntry.objects.filter(session_log=log).values_list(
+                "unit", flat=True
+            )
+        ) == [Unit.POUNDS]
+
+    def test_unrelated_plan_save_leaves_logs_alone(self, django_assert_num_queries):
+        plan = make_log().plan
+        plan.title = "Renamed"
+        with django_assert_num_queries(1):
+            plan.save(update_fields=["title"])
+
+
+class TestBackfill:
+    def test_migration_fills_unfilled_rows(self):
+        log = make_log(unit=Unit.POUNDS)
+        blank_columns(log)
+        mig = importlib.import_module(
+            "store_project.meso.migrations.0051_backfill_session_log_plan_columns"
+        )
+        mig.backfill(global_apps, None)
+        assert_filled(log)
+
+    def test_command_verifies_and_repairs(self):
+        log = make_log()
+        blank_columns(log)
+
+        out = StringIO()
+        call_command("meso_log_columns", "--verify", stdout=out)
+        assert f"session log {log.pk}" in out.getvalue()
+        assert "1 drifted session log(s)." in out.getvalue()
+
+        call_command("meso_log_columns", stdout=StringIO())
+        assert_filled(log)
+        out = StringIO()
+        call_command("meso_log_columns", "--verify", stdout=out)
+        assert "0 drifted session log(s)." in out.getvalue()
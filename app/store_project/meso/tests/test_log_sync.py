@@ -0,0 +1,212 @@
+"""The PWA's bulk offline log sync (``views.athlete_log_sync``).
+
+Pins the contract: a queue of session logs lands in one request with one PR/1RM
+recompute per unit, each item validated and scoped exactly as the single log
+endpoint would, reported one result per item — applied, superseded by a later
+item for the same session, a duplicate of an already-applied key, or rejected —
+and an applied key is never applied twice.
+"""
+
+import pytest
+from django.urls import reverse
+
+from store_project.meso import home_cache
+from store_project.meso import presenters
+from store_project.meso import views
+from store_project.meso.models import AthleteOneRm
+from store_project.meso.models import LoggedSet
+from store_project.meso.models import SessionLog
+from store_project.meso.tests.test_athlete_surface import seed
+from store_project.meso.tests.test_athlete_surface import seed_two_block
+
+pytestmark = pytest.mark.django_db
+
+SYNC_URL = reverse("meso:athlete_log_sync")
+
+
+def item(key, session, load="100", date="2026-10-01", status="done"):
+    presc = session.trainable_cells().first()
+    return {
+        "key": key,
+        "session": session.pk,
+        "status": status,
+        "date": date,
+        "sets": [
+            {"prescription": presc.pk, "set_number": 1, "reps": "5", "load": load}
+        ],
+    }
+
+
+def sync(client, *logs):
+    return client.post(
+        SYNC_URL, data={"logs": list(logs)}, content_type="application/json"
+    )
+
+
+@pytest.fixture
+def synced(client, django_capture_on_commit_callbacks):
+    """POST a sync with its on-commit receipts written, as in production."""
+
+    def post(*logs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return sync(client, *logs)
+
+    return post
+
+
+class TestApply:
+    def test_applies_every_log_in_one_request(self, client, synced):
+        s = seed_two_block()
+        client.force_login(s.athlete)
+        resp = synced(item("a", s.sa1), item("b", s.sb1, load="80"))
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [(r["key"], r["ok"]) for r in results] == [("a", True), ("b", True)]
+        assert results[0]["log"]["sets"][0]["load"] == "100"
+        assert SessionLog.objects.filter(athlete=s.athlete).count() == 2
+        # Both lifts' 1RMs came out of the one recompute.
+        assert set(
+            AthleteOneRm.objects.filter(athlete=s.athlete).values_list(
+                "name", flat=True
+            )
+        ) == {"Back Squat", "Bench Press"}
+        assert results[0]["new_records"] and results[1]["new_records"]
+
+    def test_one_recompute_per_unit(self, client, synced, monkeypatch):
+        s = seed_two_block()
+        client.force_login(s.athlete)
+        calls = []
+        rebuild = views.rebuild_records
+        monkeypatch.setattr(
+            views,
+            "rebuild_records",
+            lambda athlete, unit: calls.append(unit) or rebuild(athlete, unit),
+        )
+        synced(item("a", s.sa1), item("b", s.sa2), item("c", s.sb1))
+        assert calls == [s.plan.unit]
+
+    def test_records_follow_the_log_dates_not_the_queue_order(self, client, synced):
+        s = seed_two_block()
+        client.force_login(s.athlete)
+        later = item("later", s.sa2, load="110", date="2026-10-08")
+        earlier = item("earlier", s.sa1, load="100", date="2026-10-01")
+        results = synced(later, earlier).json()["results"]
+        by_key = {r["key"]: r["new_records"] for r in results}
+        assert by_key["earlier"][0]["previous"] is None
+        assert by_key["later"][0]["previous"] is not None
+
+    def test_invalidates_the_athlete_and_coach_homes(self, client, synced):
+        s = seed()
+        client.force_login(s.athlete)
+        before = (
+            home_cache.generation(s.athlete.pk),
+            home_cache.generation(s.coach.pk),
+        )
+        synced(item("a", s.session))
+        after = (
+            home_cache.generation(s.athlete.pk),
+            home_cache.generation(s.coach.pk),
+        )
+        assert after[0] != before[0] and after[1] != before[1]
+
+    def test_the_later_item_for_a_session_wins(self, client, synced):
+        s = seed()
+        client.force_login(s.athlete)
+        first = item("first", s.session, load="90", status="pending")
+        second = item("second", s.session, load="95")
+        results = synced(first, second).json()["results"]
+        assert results[0]["superseded"] and results[0]["ok"]
+        assert "new_records" not in results[0]
+        log = SessionLog.objects.get(athlete=s.athlete)
+        assert log.status == SessionLog.Status.DONE
+        assert list(log.sets.values_list("load", flat=True)) == ["95"]
+        assert results[0]["log"]["id"] == results[1]["log"]["id"] == log.pk
+
+
+class TestIdempotency:
+    def test_a_retried_key_is_a_duplicate(self, client, synced):
+        s = seed()
+        client.force_login(s.athlete)
+        stale = item("k", s.session, load="90")
+        synced(stale)
+        # A newer save lands through the log endpoint; the lost-response retry
+        # of the stale queue must not roll it back.
+        client.post(
+            reverse("meso:athlete_log_session", kwargs={"pk": s.session.pk}),
+            data={"sets": [{"prescription": s.presc.pk, "reps": "5", "load": "120"}]},
+            content_type="application/json",
+        )
+        result = synced(stale).json()["results"][0]
+        assert result["ok"] and result["duplicate"]
+        assert result["log"]["sets"][0]["load"] == "120"
+        assert LoggedSet.objects.get().load == "120"
+
+    def test_no_receipts_when_disabled(self, client, synced, settings):
+        settings.MESO_LOG_SYNC_RECEIPT_TTL = 0
+        s = seed()
+        client.force_login(s.athlete)
+        synced(item("k", s.session))
+        assert "duplicate" not in synced(item("k", s.session)).json()["results"][0]
+
+    def test_a_rolled_back_sync_leaves_no_receipt(self, client):
+        s = seed()
+        client.force_login(s.athlete)
+        sync(client, item("k", s.session))  # on-commit callbacks never run
+        assert views.cache.get(views.log_sync_receipt_key(s.athlete.pk, "k")) is None
+
+
+class TestRejection:
+    def test_a_foreign_session_is_rejected_alone(self, client, synced):
+        s = seed()
+        other = seed()
+        client.force_login(s.athlete)
+        results = synced(item("mine", s.session), item("theirs", other.session)).json()[
+            "results"
+        ]
+        assert results[0]["ok"]
+        assert results[1] == {
+            "key": "theirs",
+            "session": other.session.pk,
+            "ok": False,
+            "log": None,
+            "error": "Unknown session.",
+        }
+        assert not SessionLog.objects.filter(athlete=other.athlete).exists()
+
+    def test_an_invalid_body_carries_the_log_endpoints_message(self, client, synced):
+        s = seed()
+        client.force_login(s.athlete)
+        bad = {**item("bad", s.session), "status": "skipped"}
+        result = synced(bad).json()["results"][0]
+        assert not result["ok"]
+        assert result["error"] == "status must be 'pending' or 'done'."
+        assert not SessionLog.objects.exists()
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"logs": "nope"},
+            {"logs": ["nope"]},
+            {"logs": [{"session": 1}]},
+            {"logs": [{"key": "a", "session": "1"}]},
+            {"logs": [{"key": "a", "session": 1}, {"key": "a", "session": 2}]},
+            {"logs": [{"key": str(i), "session": 1} for i in range(51)]},
+        ],
+    )
+    def test_a_malformed_batch_is_a_400(self, client, body):
+        s = seed()
+        client.force_login(s.athlete)
+        resp = client.post(SYNC_URL, data=body, content_type="application/json")
+        assert resp.status_code == 400
+
+    def test_requires_login(self, client):
+        assert sync(client).status_code == 302
+
+
+def test_the_logger_payload_carries_the_sync_url():
+    s = seed()
+    ctx = presenters.athlete_session(s.session, s.athlete)
+    payload = presenters.athlete_log_payload(ctx)
+    assert payload["sync_url"] == SYNC_URL
+    assert payload["session"] == s.session.pk
@@ -9,18 +9,24 @@ the designer when prescribing a %1RM.
 
 These tests pin: the lift-identity key + uniqueness, the Epley derivation
 (matching ``meso_athlete.js`` exactly), the refresh-on-log write path, the read
-helper, the log-endpoint integration, the presenter/serializer threading, and
-the backfill of existing history. See ``docs/archive/meso/one-rm-plan.md``.
+helper, the log-endpoint integration, the presenter/serializer threading, the
+backfill of existing history, and the materialized per-unit ``LiftBest`` rows a
+log save folds into (plus ``meso_lift_bests`` backfill/verify). See
+``docs/archive/meso/one-rm-plan.md``.
 """
 
 import datetime
 import importlib
 import json
 from decimal import Decimal
+from io import StringIO
 
 import pytest
 from django.apps import apps as global_apps
+from django.core.management import call_command
 from django.db import IntegrityError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -36,6 +42,7 @@ from store_project.meso.factories import WeekFactory
 from store_project.meso.models import AthleteOneRm
 from store_project.meso.models import CoachAthlete
 from store_project.meso.models import CoachSubscription
+from store_project.meso.models import LiftBest
 from store_project.meso.models import Plan
 from store_project.meso.models import SessionLog
 from store_project.meso.models import Unit
@@ -1037,3 +1044,163 @@ class TestSerializerCarriesSource:
         row = data["program"][0]["exercises"][0]
         assert row["one_rm"] == "140"
         assert row["one_rm_source"] == "manual"
+
+
+# -- materialized per-unit bests (LiftBest) --------------------------------
+
+
+def done_set(prescription, reps, load):
+    return {
+        "prescription": prescription.pk,
+        "set_number": 1,
+        "reps": reps,
+        "load": load,
+        "rpe": "8",
+    }
+
+
+class TestLiftBests:
+    def squat_session(self, athlete, unit=Unit.KILOGRAMS):
+        _, session, (squat,) = make_session(
+            athlete, unit=unit, prescriptions=[{"name": "Back Squat"}]
+        )
+        return session, squat
+
+    def test_a_log_save_materializes_the_best_set(self, client):
+        athlete = UserFactory()
+        session, squat = self.squat_session(athlete)
+        client.force_login(athlete)
+
+        post_log(client, session, {"sets": [done_set(squat, "1", "150")]})
+
+        best = LiftBest.objects.get(athlete=athlete)
+        assert (best.key, best.unit, best.value) == (
+            "name:back squat",
+            Unit.KILOGRAMS,
+            150,
+        )
+        assert best.logged_set.load == "150"
+        assert best.session_log.session == session
+
+    def test_a_heavier_set_elsewhere_raises_it_without_a_rescan(
+        self, client, monkeypatch
+    ):
+        athlete = UserFactory()
+        first, first_squat = self.squat_session(athlete)
+        second, second_squat = self.squat_session(athlete)
+        client.force_login(athlete)
+        post_log(client, first, {"sets": [done_set(first_squat, "1", "150")]})
+
+        def no_rescan(*args, **kwargs):
+            raise AssertionError("history was rescanned")
+
+        monkeypatch.setattr(meso_one_rm, "rebuild_lift_bests", no_rescan)
+        post_log(client, second, {"sets": [done_set(second_squat, "1", "160")]})
+        # Editing a session that doesn't hold the best — still no rescan.
+        post_log(client, first, {"sets": [done_set(first_squat, "1", "140")]})
+
+        best = LiftBest.objects.get(athlete=athlete)
+        assert best.value == 160
+        row = AthleteOneRm.objects.get(athlete=athlete)
+        assert row.value == Decimal("160.00")
+
+    def test_editing_the_best_set_rescans_to_the_next_best(self, client):
+        athlete = UserFactory()
+        first, first_squat = self.squat_session(athlete)
+        second, second_squat = self.squat_session(athlete)
+        client.force_login(athlete)
+        post_log(client, first, {"sets": [done_set(first_squat, "1", "150")]})
+        post_log(client, second, {"sets": [done_set(second_squat, "1", "140")]})
+
+        post_log(client, first, {"sets": [done_set(first_squat, "1", "100")]})
+
+        best = LiftBest.objects.get(athlete=athlete)
+        assert best.value == 140
+        assert best.session_log.session == second
+        assert AthleteOneRm.objects.get(athlete=athlete).value == Decimal("140.00")
+
+    def test_a_deleted_best_is_rescanned_on_the_next_save(self, client):
+        athlete = UserFactory()
+        first, first_squat = self.squat_session(athlete)
+        second, second_squat = self.squat_session(athlete)
+        client.force_login(athlete)
+        post_log(client, first, {"sets": [done_set(first_squat, "1", "150")]})
+        SessionLog.objects.filter(session=first).delete()
+        assert LiftBest.objects.get(athlete=athlete).is_stale
+
+        post_log(client, second, {"sets": [done_set(second_squat, "1", "120")]})
+
+        best = LiftBest.objects.get(athlete=athlete)
+        assert best.value == 120
+        assert not best.is_stale
+
+    def test_bests_are_kept_per_unit(self, client):
+        athlete = UserFactory()
+        kg, kg_squat = self.squat_session(athlete)
+        lb, lb_squat = self.squat_session(athlete, unit=Unit.POUNDS)
+        client.force_login(athlete)
+        post_log(client, kg, {"sets": [done_set(kg_squat, "1", "150")]})
+        post_log(client, lb, {"sets": [done_set(lb_squat, "1", "300")]})
+
+        assert dict(
+            LiftBest.objects.filter(athlete=athlete).values_list("unit", "value")
+        ) == {Unit.KILOGRAMS: 150, Unit.POUNDS: 300}
+
+    def test_a_save_does_not_grow_with_history(self, client):
+        def save_queries(history):
+            athlete = UserFactory()
+            session, squat = self.squat_session(athlete)
+            for load in range(100, 100 + history):
+                old, old_squat = self.squat_session(athlete)
+                log_session(athlete, old, [(old_squat, 1, "1", str(load), "8")])
+            meso_one_rm.rebuild_lift_bests(athlete, Unit.KILOGRAMS)
+            client.force_login(athlete)
+            with CaptureQueriesContext(connection) as queries:
+                post_log(client, session, {"sets": [done_set(squat, "1", "90")]})
+            return len(queries)
+
+        assert save_queries(1) == save_queries(12)
+
+
+class TestLiftBestsCommand:
+    def test_backfill_builds_rows_from_history(self):
+        athlete = UserFactory()
+        _, session, (squat, bench) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}, {"name": "Bench"}]
+        )
+        log_session(
+            athlete,
+            session,
+            [(squat, 1, "1", "150", "9"), (bench, 1, "BW", "BW", "")],
+        )
+        out = StringIO()
+
+        call_command("meso_lift_bests", stdout=out)
+
+        assert "1 athlete/unit pair(s)" in out.getvalue()
+        assert LiftBest.objects.get(athlete=athlete, key="name:back squat").value == 150
+        assert not LiftBest.objects.filter(athlete=athlete, key="name:bench").exists()
+
+    def test_verify_reports_drift_and_changes_nothing(self):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        log_session(athlete, session, [(squat, 1, "1", "150", "9")])
+        meso_one_rm.rebuild_lift_bests(athlete, Unit.KILOGRAMS)
+        # A designer rename moves the history to another lift key.
+        squat.exercise_slot.name = "Front Squat"
+        squat.exercise_slot.save(update_fields=["name"])
+
+        out = StringIO()
+        call_command("meso_lift_bests", "--verify", stdout=out)
+        report = out.getvalue()
+        assert "name:back squat: stored 150.0, derived None" in report
+        assert "name:front squat: stored None, derived 150.0" in report
+        assert "2 drifted lift(s)" in report
+        assert not LiftBest.objects.filter(key="name:front squat").exists()
+
+        call_command("meso_lift_bests", stdout=StringIO())
+        out = StringIO()
+        call_command("meso_lift_bests", "--verify", stdout=out)
+        assert "0 drifted lift(s)" in out.getvalue()
@@ -10,12 +10,18 @@ set on which date produced the best, and (b) new-PR detection.
 These tests pin: the Epley tie, best-per-lift with provenance, lift-identity
 keying (catalog FK vs case-folded name), unit scoping, DONE-only, non-numeric
 skipping, and ``new_records_in`` true/false/tie against the best EXCLUDING the
-session under test.
+session under test — then the persisted ledger (``PersonalRecordEntry``) the
+log endpoint writes and the reads look up, its catch-up for factory-made logs,
+and the ``meso_personal_records`` backfill.
 """
 
 import datetime
+import json
+from io import StringIO
 
 import pytest
+from django.core.management import call_command
+from django.urls import reverse
 from django.utils import timezone
 
 from store_project.meso import personal_records as pr
@@ -26,6 +32,7 @@ from store_project.meso.factories import PlanFactory
 from store_project.meso.factories import SessionLogFactory
 from store_project.meso.factories import WeekFactory
 from store_project.meso.models import CoachAthlete
+from store_project.meso.models import PersonalRecordEntry
 from store_project.meso.models import Plan
 from store_project.meso.models import SessionLog
 from store_project.meso.models import Unit
@@ -306,3 +313,300 @@ class TestNewRecordsIn:
         )
         log = log_session(athlete, session, [(squat, 1, "AMRAP", "BW", "9")])
         assert pr.new_records_in(log) == []
+
+
+# -- the persisted ledger ---------------------------------------------------
+
+
+def post_log(client, session, rows, *, status="done", date=None):
+    """Log ``(presc, set_no, reps, load, rpe)`` rows through the log endpoint."""
+    return client.post(
+        reverse("meso:athlete_log_session", kwargs={"pk": session.pk}),
+        data=json.dumps(
+            {
+                "status": status,
+                **({"date": date.isoformat()} if date else {}),
+                "sets": [
+                    {
+                        "prescription": presc.pk,
+                        "set_number": set_number,
+                        "reps": reps,
+                        "load": load,
+                        "rpe": rpe,
+                    }
+                    for presc, set_number, reps, load, rpe in rows
+                ],
+            }
+        ),
+        content_type="application/json",
+    )
+
+
+class TestLedger:
+    def test_log_endpoint_writes_the_record(self, client):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+
+        resp = post_log(client, session, [(squat, 1, "1", "160", "9")])
+
+        assert resp.json()["new_records"][0]["name"] == "Back Squat"
+        entry = PersonalRecordEntry.objects.get(athlete=athlete)
+        assert (entry.key, entry.value, entry.previous) == (
+            "name:back squat",
+            160,
+            None,
+        )
+        log = SessionLog.objects.get(athlete=athlete)
+        assert log.records_at is not None
+        assert entry.session_log == log
+
+    def test_previous_comes_from_the_other_sessions_best(self, client):
+        athlete = UserFactory()
+        _, first, (squat_a,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        _, second, (squat_b,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+        post_log(client, first, [(squat_a, 1, "1", "150", "9")])
+
+        resp = post_log(client, second, [(squat_b, 1, "1", "160", "9")])
+
+        (record,) = resp.json()["new_records"]
+        log = SessionLog.objects.get(session=second)
+        assert [(r.value, r.previous) for r in pr.new_records_in(log)] == [(160, 150)]
+        assert record["name"] == "Back Squat"
+
+    def test_resave_replaces_the_sessions_record(self, client):
+        athlete = UserFactory()
+        _, first, (squat_a,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        _, second, (squat_b,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+        post_log(client, first, [(squat_a, 1, "1", "150", "9")])
+        post_log(client, second, [(squat_b, 1, "1", "160", "9")])
+
+        # Re-saving the record-holding session rescans its prior best (150):
+        # 155 is still a record, 140 no longer is.
+        post_log(client, second, [(squat_b, 1, "1", "155", "9")])
+        log = SessionLog.objects.get(session=second)
+        assert [(r.value, r.previous) for r in pr.new_records_in(log)] == [(155, 150)]
+        post_log(client, second, [(squat_b, 1, "1", "140", "9")])
+        assert pr.new_records_in(log) == []
+        assert PersonalRecordEntry.objects.filter(session_log=log).count() == 0
+
+    def test_downgrade_to_a_draft_retracts_the_record(self, client):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+        post_log(client, session, [(squat, 1, "1", "160", "9")])
+
+        post_log(client, session, [(squat, 1, "1", "160", "9")], status="pending")
+
+        assert not PersonalRecordEntry.objects.filter(athlete=athlete).exists()
+
+    def test_a_record_stays_with_the_session_that_set_it(self, client):
+        athlete = UserFactory()
+        _, first, (squat_a,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        _, second, (squat_b,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+        post_log(client, first, [(squat_a, 1, "1", "150", "9")])
+        post_log(client, second, [(squat_b, 1, "1", "160", "9")])
+
+        first_log = SessionLog.objects.get(session=first)
+        assert [r.value for r in pr.new_records_in(first_log)] == [150]
+        standing = pr.personal_records(athlete, unit=Unit.KILOGRAMS)
+        assert standing["name:back squat"].e1rm == 160
+        history = PersonalRecordEntry.objects.filter(athlete=athlete).order_by("pk")
+        assert [(e.value, e.previous) for e in history] == [(150, None), (160, 150)]
+
+    def test_resaving_an_older_session_keeps_its_record(self, client):
+        athlete = UserFactory()
+        _, first, (squat_a,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        _, second, (squat_b,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        client.force_login(athlete)
+        post_log(client, first, [(squat_a, 1, "1", "150", "9")])
+        post_log(client, second, [(squat_b, 1, "1", "160", "9")])
+
+        # An RPE-only edit to the first session: it's still compared against
+        # what came before it, not the heavier session logged after.
+        post_log(client, first, [(squat_a, 1, "1", "150", "8")])
+
+        first_log = SessionLog.objects.get(session=first)
+        assert [(r.value, r.previous) for r in pr.new_records_in(first_log)] == [
+            (150, None)
+        ]
+        history = PersonalRecordEntry.objects.filter(athlete=athlete)
+        assert sorted((e.value, e.previous) for e in history) == [
+            (150, None),
+            (160, 150),
+        ]
+
+    def test_redating_a_session_before_a_record_replays_the_ledger(self, client):
+        athlete = UserFactory()
+        (_, first, (squat_a,)), (_, second, (squat_b,)) = [
+            make_session(athlete, prescriptions=[{"name": "Back Squat"}])
+            for _ in range(2)
+        ]
+        client.force_login(athlete)
+        today = timezone.localdate()
+        post_log(client, first, [(squat_a, 1, "1", "100", "9")], date=today)
+        post_log(client, second, [(squat_b, 1, "1", "110", "9")], date=today)
+
+        # The same sets, re-saved with only the date moved before the first.
+        resp = post_log(
+            client,
+            second,
+            [(squat_b, 1, "1", "110", "9")],
+            date=today - datetime.timedelta(days=5),
+        )
+
+        def ledger():
+            return sorted(
+                (e.session_log.session_id, e.value, e.previous)
+                for e in PersonalRecordEntry.objects.filter(athlete=athlete)
+            )
+
+        # Now logged first, the 110 is the record and the later 100 never was.
+        assert resp.status_code == 200
+        assert ledger() == [(second.pk, 110, None)]
+        pr.rebuild_records(athlete, Unit.KILOGRAMS)
+        assert ledger() == [(second.pk, 110, None)]
+
+    def test_a_backdated_session_earns_the_record_its_date_does(self, client):
+        athlete = UserFactory()
+        sessions = [
+            make_session(athlete, prescriptions=[{"name": "Back Squat"}])
+            for _ in range(3)
+        ]
+        client.force_login(athlete)
+        (_, first, (squat_a,)), (_, second, (squat_b,)) = sessions[:2]
+        post_log(client, first, [(squat_a, 1, "1", "150", "9")])
+        post_log(client, second, [(squat_b, 1, "1", "160", "9")])
+
+        # Logged last (an offline sync), dated before both.
+        _, backdated, (squat_c,) = sessions[2]
+        post_log(
+            client,
+            backdated,
+            [(squat_c, 1, "1", "155", "9")],
+            date=timezone.localdate() - datetime.timedelta(days=7),
+        )
+
+        def ledger():
+            return sorted(
+                (e.session_log.session_id, e.value, e.previous)
+                for e in PersonalRecordEntry.objects.filter(athlete=athlete)
+            )
+
+        # The backdated 155 is the first record, the later 150 no longer is,
+        # and 160 now beats 155 — exactly what a replay of the history writes.
+        expected = sorted([(backdated.pk, 155, None), (second.pk, 160, 155)])
+        assert ledger() == expected
+        pr.rebuild_records(athlete, Unit.KILOGRAMS)
+        assert ledger() == expected
+
+    def test_reads_are_lookups_once_recorded(self, django_assert_num_queries):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        for day_offset in range(5):
+            log = log_session(
+                athlete,
+                session,
+                [(squat, 1, "1", str(100 + day_offset), "9")],
+                date=datetime.date(2026, 1, 1 + day_offset),
+            )
+        pr.rebuild_records(athlete, Unit.KILOGRAMS)
+
+        # The catch-up check and the session's rows / the bests — however much
+        # history the athlete has.
+        with django_assert_num_queries(2):
+            assert [r.value for r in pr.new_records_in(log)] == [104]
+        with django_assert_num_queries(2):
+            assert pr.personal_records(athlete, unit=Unit.KILOGRAMS)
+
+    def test_factory_logs_are_caught_up_in_date_order(self):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        later = log_session(
+            athlete,
+            session,
+            [(squat, 1, "1", "160", "9")],
+            date=datetime.date(2026, 1, 8),
+        )
+        earlier = log_session(
+            athlete,
+            session,
+            [(squat, 1, "1", "150", "9")],
+            date=datetime.date(2026, 1, 1),
+        )
+
+        assert [(r.value, r.previous) for r in pr.new_records_in(later)] == [(160, 150)]
+        assert [r.previous for r in pr.new_records_in(earlier)] == [None]
+        assert not SessionLog.objects.filter(records_at__isnull=True).exists()
+
+
+class TestPersonalRecordsCommand:
+    def test_backfill_replays_history(self):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        log_session(
+            athlete,
+            session,
+            [(squat, 1, "1", "150", "9")],
+            date=datetime.date(2026, 1, 1),
+        )
+        log_session(
+            athlete,
+            session,
+            [(squat, 1, "1", "140", "9")],
+            date=datetime.date(2026, 1, 8),
+        )
+        out = StringIO()
+
+        call_command("meso_personal_records", stdout=out)
+
+        assert "1 athlete/unit pair(s) (1 record(s))" in out.getvalue()
+        assert PersonalRecordEntry.objects.get(athlete=athlete).value == 150
+
+    def test_verify_reports_drift(self):
+        athlete = UserFactory()
+        _, session, (squat,) = make_session(
+            athlete, prescriptions=[{"name": "Back Squat"}]
+        )
+        log = log_session(athlete, session, [(squat, 1, "1", "150", "9")])
+        pr.rebuild_records(athlete, Unit.KILOGRAMS)
+        # An edit outside the log endpoint leaves the stored best behind.
+        log.sets.update(load="170")
+
+        out = StringIO()
+        call_command("meso_personal_records", "--verify", stdout=out)
+        assert "name:back squat: stored 150.0, derived 170.0" in out.getvalue()
+
+        call_command("meso_personal_records", stdout=StringIO())
+        out = StringIO()
+        call_command("meso_personal_records", "--verify", stdout=out)
+        assert "0 drifted lift(s)" in out.getvalue()
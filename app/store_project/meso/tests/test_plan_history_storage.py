@@ -0,0 +1,189 @@
+"""Chunked undo/redo snapshot storage (``history.store_snapshot``).
+
+Every ``PlanAction`` stores a manifest of content-addressed, per-plan
+``PlanSnapshotChunk`` rows instead of its snapshot inline: identical row-level
+pieces of consecutive snapshots are stored once, optionally zlib-compressed,
+and pruned once no action references them. Covers:
+
+- round-tripping a snapshot through the store (both codecs);
+- dedupe across consecutive actions — only changed pieces are stored again;
+- pruning on redo invalidation and the undo cap;
+- legacy inline rows still undo, and ``meso_compact_plan_history`` converts
+  them (idempotently) and reports the space saved.
+"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.factories import MesocycleFactory
+from store_project.meso.factories import PlanFactory
+from store_project.meso.factories import WeekFactory
+from store_project.meso.history import UNDO_STACK_CAP
+from store_project.meso.history import action_snapshot
+from store_project.meso.history import create_plan_action
+from store_project.meso.history import serialize_plan_snapshot
+from store_project.meso.models import PlanAction
+from store_project.meso.models import PlanSnapshotChunk
+from store_project.meso.models import Prescription
+
+from ._helpers import day
+from ._helpers import presc
+
+pytestmark = pytest.mark.django_db
+
+
+def seed_plan(days=3):
+    rel = CoachAthleteFactory()
+    plan = PlanFactory(relationship=rel)
+    meso = MesocycleFactory(plan=plan, order=0)
+    week = WeekFactory(mesocycle=meso, index=1)
+    cells = []
+    for number in range(1, days + 1):
+        session = day(week, day_number=number, name=f"Day {number}")
+        cells.append(presc(session, name=f"Lift {number}", text="3 x 10"))
+    return plan, week, cells
+
+
+def patch(client, plan, cell, text):
+    resp = client.post(
+        reverse(
+            "meso:api_prescription_patch", kwargs={"plan_id": plan.pk, "pk": cell.pk}
+        ),
+        data=json.dumps({"text": text}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+
+
+def _sorted(snapshot):
+    return {
+        key: sorted(rows, key=lambda row: row["pk"]) if key != "scope" else rows
+        for key, rows in snapshot.items()
+    }
+
+
+class TestStore:
+    @pytest.mark.parametrize("codec", ["zlib", "raw"])
+    def test_snapshot_round_trips_through_the_store(self, settings, codec):
+        settings.MESO_SNAPSHOT_CODEC = codec
+        plan, week, cells = seed_plan()
+        snapshot = serialize_plan_snapshot(plan)
+        action = create_plan_action(
+            plan,
+            stack=PlanAction.Stack.UNDO,
+            seq=1,
+            label="Edited",
+            snapshot=snapshot,
+        )
+        action.refresh_from_db()
+        assert set(action.snapshot) == {"chunks"}
+        assert _sorted(action_snapshot(action)) == _sorted(snapshot)
+        assert {c.codec for c in PlanSnapshotChunk.objects.filter(plan=plan)} == {codec}
+
+    def test_consecutive_snapshots_share_their_unchanged_chunks(self, client):
+        plan, week, cells = seed_plan(days=4)
+        client.force_login(plan.relationship.coach)
+        # "Add a day" records a full snapshot. The second one holds everything
+        # the first did plus the first call's new day and its starter row.
+        add_day = reverse("meso:api_session_add", kwargs={"plan_id": plan.pk})
+        assert client.post(add_day).status_code == 201
+        first_count = PlanSnapshotChunk.objects.filter(plan=plan).count()
+        assert client.post(add_day).status_code == 201
+        second_count = PlanSnapshotChunk.objects.filter(plan=plan).count()
+
+        first, second = PlanAction.objects.filter(plan=plan).order_by("seq")
+        assert set(first.chunks.all()) < set(second.chunks.all())
+        # Exactly two new pieces: the new day (+ its session) and its row
+        # (+ its cell). Nothing already stored was written again.
+        assert second_count - first_count == 2
+
+    def test_chunks_are_pruned_when_redo_is_invalidated(self, client):
+        plan, week, cells = seed_plan()
+        client.force_login(plan.relationship.coach)
+        patch(client, plan, cells[0], "5 x 5")
+        patch(client, plan, cells[0], "4 x 4")
+        assert client.post(
+            reverse("meso:api_plan_undo", kwargs={"plan_id": plan.pk})
+        ).status_code == (200)
+        # A fresh edit drops the redo row — and with it any chunk only it used.
+        patch(client, plan, cells[1], "2 x 2")
+        referenced = set(
+            PlanAction.chunks.through.objects.filter(planaction__plan=plan).values_list(
+                "plansnapshotchunk_id", flat=True
+            )
+        )
+        stored = set(
+            PlanSnapshotChunk.objects.filter(plan=plan).values_list("pk", flat=True)
+        )
+        assert stored == referenced
+
+    def test_chunks_are_pruned_past_the_undo_cap(self, client):
+        plan, week, cells = seed_plan(days=1)
+        client.force_login(plan.relationship.coach)
+        for i in range(UNDO_STACK_CAP + 5):
+            patch(client, plan, cells[0], f"{i} x 5")
+        # One distinct chunk per remaining action (each captured a different
+        # pre-edit text); the trimmed actions' chunks are gone.
+        assert PlanSnapshotChunk.objects.filter(plan=plan).count() == UNDO_STACK_CAP
+
+
+class TestLegacyRows:
+    def _legacy_action(self, plan):
+        return PlanAction.objects.create(
+            plan=plan,
+            stack=PlanAction.Stack.UNDO,
+            seq=1,
+            label="Edited Lift 1",
+            snapshot=serialize_plan_snapshot(plan),
+        )
+
+    def test_an_inline_snapshot_still_undoes(self, client):
+        plan, week, cells = seed_plan()
+        self._legacy_action(plan)
+        Prescription.objects.filter(pk=cells[0].pk).update(text="1 x 1")
+        client.force_login(plan.relationship.coach)
+
+        resp = client.post(reverse("meso:api_plan_undo", kwargs={"plan_id": plan.pk}))
+        assert resp.status_code == 200
+        cells[0].refresh_from_db()
+        assert cells[0].text == "3 x 10"
+        # The redo mirror it pushed is stored chunked.
+        redo = PlanAction.objects.get(plan=plan, stack=PlanAction.Stack.REDO)
+        assert "chunks" in redo.snapshot
+
+    def test_compact_command_converts_inline_rows_and_reports_savings(self):
+        plan, week, cells = seed_plan()
+        legacy = self._legacy_action(plan)
+        inline = legacy.snapshot
+        PlanAction.objects.create(
+            plan=plan,
+            stack=PlanAction.Stack.UNDO,
+            seq=2,
+            label="Edited Lift 2",
+            snapshot=inline,
+        )
+
+        out = StringIO()
+        call_command("meso_compact_plan_history", "--dry-run", stdout=out)
+        assert "2 inline snapshot(s) to convert" in out.getvalue()
+        assert not PlanSnapshotChunk.objects.exists()
+
+        out = StringIO()
+        call_command("meso_compact_plan_history", stdout=out)
+        assert "Converted 2 snapshot(s) across 1 plan(s)" in out.getvalue()
+        assert "saved" in out.getvalue()
+        for action in PlanAction.objects.filter(plan=plan):
+            assert "chunks" in action.snapshot
+            assert _sorted(action_snapshot(action)) == _sorted(inline)
+        # Both rows share every chunk — the second snapshot cost nothing.
+        first, second = PlanAction.objects.filter(plan=plan).order_by("seq")
+        assert set(first.chunks.all()) == set(second.chunks.all())
+
+        out = StringIO()
+        call_command("meso_compact_plan_history", stdout=out)
+        assert "Converted 0 snapshot(s)" in out.getvalue()
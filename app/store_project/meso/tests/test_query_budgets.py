@@ -0,0 +1,252 @@
+"""Query budgets and per-view SQL profiling (``meso.profiling``).
+
+The hot endpoints — roster, athlete home, the designer's plan payload, session
+results — each declare the most queries one request may run
+(``profiling.QUERY_BUDGETS``); the ``query_budget`` fixture (root conftest)
+fails a request over it, and these tests drive every budgeted endpoint at two
+data sizes so an N+1 trips the budget as the data grows. Beside them: the
+statement fingerprinting, the profiling middleware (``Server-Timing`` header,
+per-view aggregates, off by default) and the staff dashboard that reads them.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.urls import resolve
+from django.urls import reverse
+from django.utils import timezone
+
+from store_project.meso import presenters
+from store_project.meso import profiling
+from store_project.meso import urls as meso_urls
+from store_project.meso.factories import CoachAthleteFactory
+from store_project.meso.factories import LoggedSetFactory
+from store_project.meso.factories import MesocycleFactory
+from store_project.meso.factories import PlanFactory
+from store_project.meso.factories import SessionLogFactory
+from store_project.meso.factories import WeekFactory
+from store_project.meso.models import Plan
+from store_project.meso.models import SessionLog
+from store_project.meso.personal_records import rebuild_records
+from store_project.users.factories import UserFactory
+
+from ._helpers import day
+from ._helpers import make_slot
+from ._helpers import presc
+
+pytestmark = pytest.mark.django_db
+
+
+def block(coach, *, weeks=2, days=2, lifts=2):
+    """A delivered ``weeks`` × ``days`` × ``lifts`` block for a new athlete.
+
+    The first week is fully logged (DONE, three sets a lift) and the athlete's
+    PR ledger replayed, so every read runs against a realistic history.
+    """
+    athlete = UserFactory()
+    rel = CoachAthleteFactory(coach=coach, athlete=athlete)
+    plan = PlanFactory(relationship=rel, status=Plan.Status.ACTIVE)
+    meso = MesocycleFactory(plan=plan, order=0)
+    now = timezone.now()
+    week_rows = [
+        WeekFactory(mesocycle=meso, index=n + 1, delivered_at=now) for n in range(weeks)
+    ]
+    sessions = []
+    for d in range(days):
+        first = day(week_rows[0], day_number=d + 1, name=f"Day {d + 1}")
+        rows = [make_slot(first, name=f"Lift {d}-{n}", order=n) for n in range(lifts)]
+        for week in week_rows:
+            session = (
+                first
+                if week is week_rows[0]
+                else day(week, session_slot=first.session_slot)
+            )
+            cells = [presc(exercise_slot=row, week=week) for row in rows]
+            sessions.append((session, cells))
+    for session, cells in sessions[:: len(week_rows)]:
+        log = SessionLogFactory(
+            session=session, athlete=athlete, status=SessionLog.Status.DONE
+        )
+        for cell in cells:
+            for n in range(3):
+                LoggedSetFactory(session_log=log, prescription=cell, set_number=n + 1)
+    rebuild_records(athlete, plan.unit)
+    return SimpleNamespace(athlete=athlete, rel=rel, plan=plan, session=sessions[0][0])
+
+
+# -- the budgeted endpoints --------------------------------------------------
+
+
+def test_every_budget_names_a_meso_route():
+    # A renamed URL would leave its budget silently unenforced on the dashboard.
+    names = {f"meso:{pattern.name}" for pattern in meso_urls.urlpatterns}
+    assert set(profiling.QUERY_BUDGETS) <= names
+
+
+class TestBudgets:
+    @pytest.mark.parametrize("athletes", [1, 4])
+    def test_roster(self, client, query_budget, athletes):
+        coach = UserFactory()
+        for _ in range(athletes):
+            block(coach)
+        client.force_login(coach)
+        with query_budget("meso:roster"):
+            assert client.get(reverse("meso:roster")).status_code == 200
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_athlete_home(self, client, query_budget, size):
+        s = block(UserFactory(), weeks=size + 1, days=size, lifts=size)
+        client.force_login(s.athlete)
+        with query_budget("meso:athlete_home"):
+            assert client.get(reverse("meso:athlete_home")).status_code == 200
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_designer_plan(self, client, query_budget, size):
+        coach = UserFactory()
+        s = block(coach, weeks=size + 1, days=size, lifts=size)
+        client.force_login(coach)
+        url = reverse("meso:designer_plan", kwargs={"plan_id": s.plan.pk})
+        with query_budget("meso:designer_plan"):
+            assert client.get(url).status_code == 200
+
+    @pytest.mark.parametrize("lifts", [1, 4])
+    def test_results_session(self, client, query_budget, lifts):
+        coach = UserFactory()
+        s = block(coach, lifts=lifts)
+        client.force_login(coach)
+        url = reverse("meso:results_session", kwargs={"session_id": s.session.pk})
+        with query_budget("meso:results_session"):
+            assert client.get(url).status_code == 200
+
+    def test_over_budget_fails_with_the_repeated_statements(
+        self, query_budget, monkeypatch
+    ):
+        monkeypatch.setitem(profiling.QUERY_BUDGETS, "meso:roster", 1)
+        with pytest.raises(pytest.fail.Exception) as failed:
+            with query_budget("meso:roster"):
+                for pk in (1, 2, 3):
+                    list(Plan.objects.filter(pk=pk))
+        message = str(failed.value)
+        assert "meso:roster ran 3 queries, over its budget of 1" in message
+        assert "x3 " in message
+
+
+# -- fingerprints ------------------------------------------------------------
+
+
+class TestFingerprint:
+    def test_parameters_and_literals_collapse(self):
+        assert profiling.fingerprint(
+            "SELECT * FROM t WHERE a = 'x' AND b = 42"
+        ) == profiling.fingerprint("SELECT * FROM t WHERE a = 'y''s' AND b = 7")
+
+    def test_in_lists_of_any_length_collapse(self):
+        assert (
+            profiling.fingerprint("SELECT 1 FROM t WHERE id IN (%s, %s, %s)")
+            == profiling.fingerprint("SELECT 1 FROM t WHERE id IN (%s, %s)")
+            == "SELECT ? FROM t WHERE id IN (...)"
+        )
+
+    def test_recorder_counts_repeats(self):
+        with profiling.record_queries() as recorder:
+            for pk in (1, 2):
+                list(Plan.objects.filter(pk=pk))
+            list(SessionLog.objects.all())
+        assert recorder.count == 3
+        assert list(recorder.duplicates().values()) == [2]
+        assert recorder.profile(1.0)["duplicate_queries"] == 1
+
+
+# -- the middleware ----------------------------------------------------------
+
+
+class TestMiddleware:
+    def test_off_by_default(self, client):
+        coach = UserFactory(is_staff=True)
+        client.force_login(coach)
+        resp = client.get(reverse("meso:roster"))
+        assert "Server-Timing" not in resp
+        assert profiling.view_stats() == {}
+
+    def test_staff_get_server_timing_and_views_aggregate(self, client, settings):
+        settings.MESO_QUERY_PROFILING = True
+        coach = UserFactory(is_staff=True)
+        block(coach)
+        client.force_login(coach)
+        for _ in range(2):
+            resp = client.get(reverse("meso:roster"))
+        assert resp["Server-Timing"].startswith("db;dur=")
+        assert "app;dur=" in resp["Server-Timing"]
+        row = profiling.view_stats()["meso:roster"]
+        assert row["requests"] == 2
+        assert row["max_queries"] >= row["queries"] / 2 > 0
+
+    def test_non_staff_get_no_header_but_still_count(self, client, settings):
+        settings.MESO_QUERY_PROFILING = True
+        coach = UserFactory()
+        client.force_login(coach)
+        resp = client.get(reverse("meso:roster"))
+        assert "Server-Timing" not in resp
+        assert profiling.view_stats()["meso:roster"]["requests"] == 1
+
+    def test_requests_outside_meso_are_not_recorded(self, client, settings):
+        settings.MESO_QUERY_PROFILING = True
+        client.get("/")
+        assert resolve("/").namespace != "meso"
+        assert profiling.view_stats() == {}
+
+
+# -- the dashboard -----------------------------------------------------------
+
+
+class TestDashboard:
+    def test_gate(self, client):
+        url = reverse("meso:query_profile")
+        assert client.get(url).status_code == 302
+        client.force_login(UserFactory())
+        assert client.get(url).status_code == 403
+
+    def test_rows_and_reset(self, client, settings):
+        settings.MESO_QUERY_PROFILING = True
+        client.force_login(UserFactory(is_staff=True))
+        client.get(reverse("meso:roster"))
+        resp = client.get(reverse("meso:query_profile"))
+        assert resp.status_code == 200
+        views = [row["view"] for row in resp.context["rows"]]
+        assert "meso:roster" in views
+
+        assert "meso:query_profile" not in views
+
+        client.post(reverse("meso:query_profile"))
+        assert profiling.view_stats() == {}
+
+    def test_presenter_flags_over_budget_views(self):
+        stats = {
+            "meso:roster": {
+                "requests": 2,
+                "queries": 50,
+                "max_queries": 40,
+                "sql_ms": 8.0,
+                "python_ms": 20.0,
+                "duplicate_queries": 6,
+                "duplicates": {"SELECT a": 2, "SELECT b": 4},
+            },
+            "meso:grid": {
+                "requests": 1,
+                "queries": 3,
+                "max_queries": 3,
+                "sql_ms": 1.0,
+                "python_ms": 2.0,
+                "duplicate_queries": 0,
+                "duplicates": {},
+            },
+        }
+        ctx = presenters.query_profile(stats, {"meso:roster": 30})
+        roster, grid = ctx["rows"]
+        assert roster["view"] == "meso:roster"
+        assert (roster["avg_queries"], roster["avg_sql_ms"]) == (25.0, 4.0)
+        assert roster["over_budget"] is True
+        assert [d["sql"] for d in roster["duplicates"]] == ["SELECT b", "SELECT a"]
+        assert grid["budget"] is None and grid["over_budget"] is False
+        assert ctx["over_budget"] == 1
+        assert ctx["total_requests"] == 3
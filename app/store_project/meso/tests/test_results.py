@@ -29,6 +29,7 @@ from store_project.meso.factories import WeekFactory
 from store_project.meso.models import CoachAthlete
 from store_project.meso.models import Plan
 from store_project.meso.models import SessionLog
+from store_project.meso.personal_records import record_log
 from store_project.meso.presenters import session_results
 from store_project.users.factories import UserFactory
 
@@ -429,18 +430,21 @@ class TestSessionResultsRecoversSubLineRpe:
             sub_line(cell, "RPE 6")
         sub_line(s.squat, "RPE 7")
         sub_line(s.rdl, "RPE 8")
-        log_session(
+        log = log_session(
             s, squat_sets=[("6", "70", "7")] * 3, rdl_sets=[("8", "80", "8")] * 3
         )
-
-        # 11: line-0 cells, sub-lines (ONE query for the whole session's
-        # sub-line stack, batched — the fix), the session log + its sets,
-        # session -> week -> mesocycle -> plan (4 unbatched FK hops), and
-        # new_records_in's per-lift lookups. The precise count matters less
-        # than that it's fixed regardless of prescription/sub-line count —
-        # 8 prescriptions here (2 seeded + 6 extra), each with its own
-        # sub-line, still costs exactly one sub-line query, not eight.
-        with django_assert_num_queries(11):
+        # A factory log skips the log endpoint's ledger write; record it the
+        # way the endpoint does so the count below is the steady state, not the
+        # one-off catch-up replay.
+        record_log(log, [s.squat, s.rdl], s.plan.unit)
+
+        # 5: the session's cells — line 0 and every sub-line in ONE query —
+        # the session log + its sets, and new_records_in's two ledger reads
+        # (the catch-up check and the session's entries). The precise count
+        # matters less than that it's fixed regardless of prescription/sub-line
+        # count — 8 prescriptions here (2 seeded + 6 extra), each with its own
+        # sub-line, still costs exactly one cell query, not eight.
+        with django_assert_num_queries(5):
             session_results(s.session)
 
 
@@ -0,0 +1,121 @@
+"""The scored session-results cache (``meso.results_cache``).
+
+Pins the contract: a warm results screen costs the one query that finds the
+log, and every write the score reflects — a re-log, a newer log, a coach edit
+to the prescription, a PR-ledger rebuild — restamps the entry so the next read
+re-scores. The profile's latest-session card reads through the same cache.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from store_project.meso import results_cache
+from store_project.meso.personal_records import rebuild_records
+from store_project.meso.personal_records import record_log
+from store_project.meso.tests.test_results import log_session
+from store_project.meso.tests.test_results import results_url
+from store_project.meso.tests.test_results import seed
+from store_project.meso.views import _coach_session_or_404
+
+pytestmark = pytest.mark.django_db
+
+
+def _session(s):
+    # The view's own lookup — week → plan → relationship → athlete loaded.
+    return _coach_session_or_404(s.coach, s.session.pk)
+
+
+def _logged(s, **sets):
+    log = log_session(s, **sets)
+    record_log(log, [s.squat, s.rdl], s.plan.unit)
+    return log
+
+
+class TestCache:
+    def test_a_warm_score_is_one_query(self, django_assert_num_queries):
+        s = seed()
+        _logged(s, squat_sets=[("6", "70", "7")] * 3)
+        cold = results_cache.session_results(_session(s))
+        session = _session(s)
+        with django_assert_num_queries(1):
+            assert results_cache.session_results(session) == cold
+
+    def test_a_held_log_is_not_looked_up_again(self, django_assert_num_queries):
+        s = seed()
+        log = _logged(s, squat_sets=[("6", "70", "7")])
+        results_cache.session_results(_session(s), log=log)
+        session = _session(s)
+        with django_assert_num_queries(0):
+            results_cache.session_results(session, log=log)
+
+    def test_a_relog_rescores(self, client):
+        s = seed()
+        _logged(s, squat_sets=[("6", "70", "7")])
+        assert results_cache.session_results(_session(s))["summary"]["completion"] < 100
+        client.force_login(s.athlete)
+        sets = [
+            {"prescription": p.pk, "set_number": n, "reps": "6", "load": "70"}
+            for p in (s.squat, s.rdl)
+            for n in (1, 2, 3)
+        ]
+        resp = client.post(
+            reverse("meso:athlete_log_session", kwargs={"pk": s.session.pk}),
+            data={"sets": sets},
+            content_type="application/json",
+        )
+        assert resp.status_code == 200
+        assert (
+            results_cache.session_results(_session(s))["summary"]["completion"] == 100
+        )
+
+    def test_a_coach_edit_rescores(self):
+        s = seed()
+        _logged(s, squat_sets=[("6", "70", "7")] * 3)
+        before = results_cache.session_results(_session(s))["rows"][0]["target"]
+        s.squat.text = "5 x 5, 80"
+        s.squat.save(update_fields=["text"])
+        s.plan.touch()
+        after = results_cache.session_results(_session(s))["rows"][0]["target"]
+        assert after != before
+
+    def test_a_ledger_rebuild_restamps(self):
+        s = seed()
+        log = _logged(s, squat_sets=[("6", "70", "7")])
+        stamped = results_cache._stamp(_session(s), log)
+        rebuild_records(s.athlete, s.plan.unit)
+        log.refresh_from_db()
+        assert results_cache._stamp(_session(s), log) != stamped
+
+    def test_an_unlogged_session_is_cached_too(self, django_assert_num_queries):
+        s = seed()
+        assert not results_cache.session_results(_session(s))["summary"]["logged_state"]
+        session = _session(s)
+        with django_assert_num_queries(1):
+            results_cache.session_results(session)
+
+    def test_disabled_by_a_zero_ttl(self, settings):
+        settings.MESO_RESULTS_CACHE_TTL = 0
+        s = seed()
+        _logged(s, squat_sets=[("6", "70", "7")])
+        results_cache.session_results(_session(s))
+        session = _session(s)
+        with CaptureQueriesContext(connection) as queries:
+            results_cache.session_results(session)
+        assert len(queries) > 1
+
+
+class TestScreens:
+    def test_results_and_profile_share_the_entry(self, client):
+        s = seed()
+        _logged(s, squat_sets=[("6", "70", "7")] * 3)
+        client.force_login(s.coach)
+        assert client.get(results_url(s.session)).status_code == 200
+        entry = results_cache.cache.get(results_cache.results_cache_key(s.session.pk))
+        assert entry is not None
+        profile = client.get(reverse("meso:athlete", kwargs={"pk": s.athlete.pk}))
+        assert profile.status_code == 200
+        card = profile.context["results_summary"]
+        assert card["completion"] == entry[1]["summary"]["completion"]
+        assert card["session_id"] == s.session.pk
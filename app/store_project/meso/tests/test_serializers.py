@@ -592,6 +592,7 @@ class TestSerializeMesocycleGrid:
             "weeks",
             "days",
             "history",
+            "version",
         }
 
     def test_mesocycle_envelope(self):
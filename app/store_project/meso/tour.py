@@ -501,7 +501,7 @@ def _self_has_log(user):
         and SessionLog.objects.filter(
             athlete=user,
             status=SessionLog.Status.DONE,
-            session__week__mesocycle__plan=plan,
+            plan=plan,
         ).exists()
     )
 
@@ -31,6 +31,9 @@ urlpatterns = [
     path("usage/", UsageDashboardView.as_view(), name="usage_dashboard"),
     # Owner-facing guided-tour funnel dashboard (#441 P3-6) — staff-gated, all-coach.
     path("tour/funnel/", views.TourFunnelView.as_view(), name="tour_funnel"),
+    # Staff per-view SQL profile (query budgets, N+1 fingerprints) — the read
+    # side of ``profiling.QueryProfileMiddleware``.
+    path("usage/queries/", views.QueryProfileView.as_view(), name="query_profile"),
     path("designer/<int:plan_id>/", MesoDesignerView.as_view(), name="designer_plan"),
     path("review/", ChangeReviewView.as_view(), name="review"),
     path(
@@ -67,6 +70,12 @@ urlpatterns = [
         views.athlete_log_session,
         name="athlete_log_session",
     ),
+    # The PWA's offline queue, flushed in one request (idempotency-keyed).
+    path(
+        "api/me/logs/sync/",
+        views.athlete_log_sync,
+        name="athlete_log_sync",
+    ),
     # Set/clear the athlete's manual 1RM for a lift (Phase 2 — server-persisted).
     path(
         "api/me/session/<int:pk>/one-rm/",
@@ -262,6 +271,13 @@ urlpatterns = [
         views.exercise_slot_patch,
         name="api_exercise_slot_patch",
     ),
+    # The debounced typing path: an ordered list of the three writes above
+    # (cell patch, sub-line, row columns) applied as one undo step.
+    path(
+        "api/plan/<int:plan_id>/batch/",
+        views.plan_batch,
+        name="api_plan_batch",
+    ),
     # One-week exceptions: skip / fill-across-weeks (P2, issue #440). The swap
     # endpoint is retired (Phase 2a): a substitution is sub-line text now.
     path(
@@ -286,6 +302,12 @@ urlpatterns = [
         views.plan_batch_deliver,
         name="plan_batch_deliver",
     ),
+    # ... which runs as a queued job; the deliver screen polls its progress.
+    path(
+        "api/batch-delivery/<int:batch_id>/status/",
+        views.batch_delivery_status,
+        name="api_batch_delivery_status",
+    ),
     # Agent proposal engine (agent slice Phase 1; async + status poll Phase 4).
     path(
         "api/plan/<int:plan_id>/agent/",
@@ -297,6 +319,12 @@ urlpatterns = [
         views.batch_status,
         name="api_batch_status",
     ),
+    # ... or, instead of polling, one server-sent-events stream per draft.
+    path(
+        "api/batch/<int:batch_id>/events/",
+        views.batch_events,
+        name="api_batch_events",
+    ),
     # Review gate: approve/reject + apply (agent slice Phase 2).
     path(
         "api/change/<int:pk>/status/",
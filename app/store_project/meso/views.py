@@ -2,6 +2,7 @@ import datetime
 import ipaddress
 import json
 import logging
+import time
 from urllib.parse import urlencode
 from urllib.parse import urlparse
 
@@ -21,11 +22,13 @@ from django.core.validators import validate_email
 from django.db import transaction
 from django.db.models import Count
 from django.db.models import Max
+from django.db.models import Q
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
@@ -33,36 +36,51 @@ from django.template.loader import render_to_string
 from django.templatetags.static import static
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET
 from django.views.decorators.http import require_POST
 from django.views.generic import TemplateView
 
-from store_project.notifications.emails import send_block_delivered_email
 from store_project.notifications.emails import send_coach_invite_email
 from store_project.notifications.emails import send_coach_request_email
 
 from . import adherence as meso_adherence
+from . import delivery as meso_delivery
 from . import demo as meso_demo
+from . import etags as meso_etags
+from . import home_cache as meso_home_cache
 from . import one_rm as meso_one_rm
 from . import presenters
+from . import profiling as meso_profiling
 from . import push as meso_push
+from . import results_cache as meso_results_cache
 from . import sandbox as meso_sandbox
 from . import tour as meso_tour
 from .agent import apply as agent_apply
 from .agent import client as agent_client
+from .agent import events as agent_events
 from .agent import jobs as agent_jobs
 from .agent import service as agent_service
 from .billing import access as billing_access
 from .billing import agent_usage_report as usage_report
 from .billing import stripe_gateway as billing_gateway
 from .billing import webhooks as billing_webhooks
+from .grid_cache import grid_payload
+from .grid_cache import grid_response
 from .history import HistoryUnavailable
+from .history import action_snapshot
+from .history import create_plan_action
+from .history import delta_scope
+from .history import prune_snapshot_chunks
 from .history import record_plan_action
 from .history import restore_plan_snapshot
 from .history import serialize_plan_snapshot
 from .models import AgentProposalBatch
+from .models import BatchDelivery
+from .models import BatchDeliveryTarget
 from .models import CoachAthlete
 from .models import CoachInvite
 from .models import CoachProfile
@@ -81,12 +99,14 @@ from .models import Session
 from .models import SessionLog
 from .models import SessionSlot
 from .models import Week
-from .models import WeekDelivery
+from .personal_records import new_records_by_log
 from .personal_records import new_records_in
+from .personal_records import rebuild_records
+from .personal_records import record_log
 from .serializers import current_week
 from .serializers import first_live_week
 from .serializers import serialize_chat_thread
-from .serializers import serialize_mesocycle_grid
+from .serializers import serialize_grid_patch
 from .serializers import serialize_new_record
 from .serializers import serialize_plan
 from .serializers import serialize_plan_history
@@ -94,9 +114,6 @@ from .serializers import serialize_prescription
 from .serializers import serialize_proposed_change
 from .serializers import serialize_session
 from .serializers import serialize_session_log
-from .serializers import serialize_week_snapshot
-from .unsubscribe import athlete_opted_out
-from .unsubscribe import make_unsubscribe_token
 from .unsubscribe import resolve_unsubscribe_user
 from .unsubscribe import set_delivery_email_opt_out
 
@@ -185,7 +202,7 @@ def _coach_session_or_404(user, pk):
         Session.objects.filter(
             pk=pk, week__mesocycle__plan__in=Plan.objects.for_coach(user)
         )
-        .select_related("week__mesocycle__plan__relationship")
+        .select_related("week__mesocycle__plan__relationship__athlete")
         .first()
     )
     if session is None:
@@ -203,7 +220,7 @@ def _coach_latest_logged_session(user):
     """
     log = (
         SessionLog.objects.filter(
-            session__week__mesocycle__plan__in=Plan.objects.for_coach(user),
+            plan__in=Plan.objects.for_coach(user),
             status=SessionLog.Status.DONE,
         )
         .select_related("session")
@@ -258,7 +275,7 @@ class MesoDesignerView(LoginRequiredMixin, TemplateView):
         # island instead, per CONTRACT.md).
         mesocycle = _default_grid_mesocycle(plan)
         if mesocycle is not None:
-            ctx["grid_data"] = serialize_mesocycle_grid(mesocycle)
+            ctx["grid_data"] = grid_payload(mesocycle)
         # The persisted agent conversation, rebuilt from this plan's proposal
         # batches so the chat survives a reload (the JS hydrates ``messages``
         # from it, falling back to the greeting when empty).
@@ -364,6 +381,10 @@ class RosterView(TemplateView):
             .exclude(status=Plan.Status.ARCHIVED)
             .values_list("relationship_id", flat=True)
         )
+        # Cadence signal (§4a, decided 2026-07-18): days since each athlete's
+        # last done log, read-side over their own logs — one grouped query for
+        # the whole roster; ``None`` renders as "No sessions yet".
+        cadences = meso_adherence.link_cadences(links)
         athletes = [
             presenters.roster_athlete(
                 link.athlete,
@@ -371,10 +392,7 @@ class RosterView(TemplateView):
                 demo=link.is_demo,
                 self_link=link.is_self,
                 has_working_plan=link.pk in have_plan,
-                # Cadence signal (§4a, decided 2026-07-18): days since the
-                # athlete's last done log, read-side over their own logs;
-                # ``None`` renders as "No sessions yet".
-                recency_days=meso_adherence.link_recency_days(link),
+                recency_days=cadences[link.pk].recency_days,
             )
             for link in links
         ]
@@ -642,6 +660,47 @@ class TourFunnelView(UserPassesTestMixin, TemplateView):
         return ctx
 
 
+class QueryProfileView(UserPassesTestMixin, TemplateView):
+    """Staff per-view SQL profile: query counts, SQL vs. Python time, N+1s.
+
+    The read side of ``profiling.QueryProfileMiddleware``: one row per meso URL
+    name with its averaged query count, worst request, SQL and Python time, the
+    duplicate-query shapes it keeps repeating, and its declared budget
+    (``profiling.QUERY_BUDGETS``) with over-budget views flagged. Empty until
+    ``MESO_QUERY_PROFILING`` is switched on; a POST clears the aggregates so a
+    fix can be measured from a clean slate.
+
+    Gate mirrors ``UsageDashboardView``: anonymous bounces to login, an
+    authenticated non-staff user gets a flat 403.
+    """
+
+    template_name = "meso/query_profile.html"
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def handle_no_permission(self):
+        if self.request.user.is_authenticated:
+            raise PermissionDenied
+        return super().handle_no_permission()
+
+    def post(self, request, *args, **kwargs):
+        meso_profiling.reset_stats()
+        messages.success(request, "Cleared the query profile.")
+        return redirect("meso:query_profile")
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["active"] = "query_profile"
+        ctx["profiling_enabled"] = settings.MESO_QUERY_PROFILING
+        ctx.update(
+            presenters.query_profile(
+                meso_profiling.view_stats(), meso_profiling.QUERY_BUDGETS
+            )
+        )
+        return ctx
+
+
 class CoachBillingView(LoginRequiredMixin, TemplateView):
     """Coach-facing billing & plan page (agent-usage — coach surface).
 
@@ -1132,10 +1191,18 @@ def tour_config(request):
     ``{}`` for a coach with no ``CoachProfile`` (``build_config`` returns
     ``None`` there — the driver treats an empty/steps-less config as "no tour"
     and simply leaves the card where it is).
+
+    Conditional (``etags.tour_etag``): a refresh after a fetch action that
+    didn't move the coach's ``tour_state`` or data is a 304.
     """
     variant = meso_tour.variant_for(request.user)
+    profile = CoachProfile.objects.filter(user=request.user).first()
+    etag = meso_etags.tour_etag(request.user, variant, profile)
+    not_modified = meso_etags.not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     config = meso_tour.build_config(request.user, variant)
-    return JsonResponse(config if config is not None else {})
+    return meso_etags.tagged(JsonResponse(config if config is not None else {}), etag)
 
 
 @require_GET
@@ -1222,21 +1289,25 @@ def _athlete_session_or_404(user, pk):
     live rows. Already-logged history is untouched — those reads go through
     ``SessionLog``/``LoggedSet``, never this lookup.
     """
-    session = (
-        Session.objects.filter(
-            pk=pk,
-            week__mesocycle__plan__in=_athlete_plans(user),
-            deleted_at__isnull=True,
-            week__deleted_at__isnull=True,
-        )
-        .select_related("week__mesocycle__plan__relationship")
-        .first()
-    )
+    session = _athlete_sessions(user).filter(pk=pk).first()
     if session is None:
         raise Http404("Unknown session")
     return session
 
 
+def _athlete_sessions(user):
+    """The live sessions ``_athlete_session_or_404`` scopes an athlete to.
+
+    A queryset, so the bulk log sync resolves a whole batch of session ids
+    under the same rule in one query.
+    """
+    return Session.objects.filter(
+        week__mesocycle__plan__in=_athlete_plans(user),
+        deleted_at__isnull=True,
+        week__deleted_at__isnull=True,
+    ).select_related("week__mesocycle__plan__relationship")
+
+
 class AthleteHomeView(LoginRequiredMixin, TemplateView):
     """The athlete's training home: their live programs, free navigation.
 
@@ -1251,15 +1322,34 @@ class AthleteHomeView(LoginRequiredMixin, TemplateView):
 
     template_name = "meso/athlete_home.html"
 
+    def _focus_week_id(self):
+        try:
+            return int(self.request.GET.get("week", ""))
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, request, *args, **kwargs):
+        # Conditional GET: the ETag comes off the athlete's home generation
+        # (``home_cache``), so the service worker's revalidation on every app
+        # open is a 304 with no body until a coach edit, link change or log
+        # bumps it. A page with a flash message waiting always renders — a 304
+        # would leave the message queued for the next page instead.
+        etag = meso_home_cache.home_etag(request, self._focus_week_id())
+        if etag is not None and not len(messages.get_messages(request)):
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+        response = super().get(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx["active"] = "training"
-        try:
-            focus_week_id = int(self.request.GET.get("week", ""))
-        except (TypeError, ValueError):
-            focus_week_id = None
-        ctx["plans"] = presenters.athlete_home(
-            self.request.user, focus_week_id=focus_week_id
+        ctx["plans"] = meso_home_cache.home_cards(
+            self.request.user, focus_week_id=self._focus_week_id()
         )
         # Pending coach links (N4 Phase 2): invites awaiting my reply + requests
         # I've sent + the request-a-coach form all live on this surface.
@@ -1289,10 +1379,21 @@ class AthleteSessionView(LoginRequiredMixin, TemplateView):
 
     template_name = "meso/athlete_session.html"
 
+    def get(self, request, *args, **kwargs):
+        # Conditional GET (``etags.session_etag``), as on the home: the
+        # service worker's revalidation is a 304 until the plan, a log or a 1RM
+        # changes — and a page with a flash message waiting always renders.
+        self.athlete_session = _athlete_session_or_404(request.user, kwargs["pk"])
+        etag = meso_etags.session_etag(request, self.athlete_session)
+        if not len(messages.get_messages(request)):
+            not_modified = meso_etags.not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
+        return meso_etags.tagged(super().get(request, *args, **kwargs), etag)
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        session = _athlete_session_or_404(self.request.user, kwargs["pk"])
-        sess = presenters.athlete_session(session, self.request.user)
+        sess = presenters.athlete_session(self.athlete_session, self.request.user)
         ctx["active"] = "training"
         ctx["session"] = sess
         ctx["log_data"] = presenters.athlete_log_payload(sess)
@@ -1325,8 +1426,9 @@ def athlete_log_session(request, pk):
     unknown session is a flat 404, never a silent write. The body is fully
     validated *before* any write, so a bad request is a 400 that persists
     nothing; the write itself is idempotent (re-logging updates the one log,
-    replacing its set rows rather than appending). These are the first real rows
-    ``serialize_recent_logs`` grounds the agent on.
+    diffing its set rows against the posted ones rather than appending).
+    These are the first real rows ``serialize_recent_logs`` grounds the agent
+    on.
     """
     session = _athlete_session_or_404(request.user, pk)
     try:
@@ -1335,84 +1437,35 @@ def athlete_log_session(request, pk):
         return HttpResponseBadRequest("Malformed JSON.")
     if not isinstance(payload, dict):
         return HttpResponseBadRequest("Expected a JSON object.")
-
-    status = payload.get("status", SessionLog.Status.DONE)
-    if status not in (SessionLog.Status.PENDING, SessionLog.Status.DONE):
-        return HttpResponseBadRequest("status must be 'pending' or 'done'.")
-
-    # An explicit date is honored; a missing one defaults to today only when
-    # *creating* the log — re-saving an existing log without a date keeps its
-    # original date so editing a set days later doesn't move the workout (which
-    # would reorder recent-log grounding). ``explicit_date`` is None when none
-    # was sent.
-    raw_date = payload.get("date")
-    explicit_date = None
-    if raw_date not in (None, ""):
-        if not isinstance(raw_date, str):
-            return HttpResponseBadRequest("date must be an ISO date string.")
-        try:
-            explicit_date = datetime.date.fromisoformat(raw_date)
-        except ValueError:
-            return HttpResponseBadRequest("date must be an ISO date (YYYY-MM-DD).")
-
-    notes = payload.get("notes", "")
-    if not isinstance(notes, str):
-        return HttpResponseBadRequest("notes must be a string.")
-
-    cleaned_sets, error = _clean_logged_sets(payload.get("sets", []), session)
+    trainable = list(session.trainable_cells())
+    cleaned, error = _clean_log_payload(payload, trainable)
     if error is not None:
         return error
 
     with transaction.atomic():
-        log = (
-            SessionLog.objects.filter(session=session, athlete=request.user)
-            .order_by("-created_at")
-            .first()
-        )
-        if log is None:
-            log = SessionLog(session=session, athlete=request.user)
-        log.status = status
-        if explicit_date is not None:
-            log.date = explicit_date
-        elif log.date is None:  # first save (or a log never dated) → stamp today
-            log.date = timezone.localdate()
-        # else: a re-save with no date keeps the existing workout date.
-        log.notes = notes
-        log.save()
-        # Replace only the rows the logger can re-post: sets whose prescription
-        # cell is TRAINABLE in this session (``session.trainable_cells()`` — live
-        # and non-skipped, the exact set the logger renders). A set logged against
-        # a since-deleted/hidden/skipped cell — or one orphaned by an old hard
-        # delete — is history, not draft state; wiping it here would silently
-        # destroy the athlete's record on their next save (e.g. a row the coach
-        # marked skipped after the athlete already logged it).
-        log.sets.filter(
-            prescription_id__in=[p.pk for p in session.trainable_cells()]
-        ).delete()
-        LoggedSet.objects.bulk_create(
-            [
-                LoggedSet(
-                    session_log=log,
-                    prescription_id=cs["prescription_id"],
-                    set_number=cs["set_number"],
-                    reps=cs["reps"],
-                    load=cs["load"],
-                    rpe=cs["rpe"],
-                )
-                for cs in cleaned_sets
-            ]
-        )
+        log, affected = _write_session_log(request.user, session, cleaned, trainable)
+        affected = [p for p in trainable if p.pk in affected]
         # Refresh the athlete's persisted 1RM for this session's lifts from their
         # *completed* logs. Run on every save, not only a done one: derivation
         # counts done logs only, so refreshing after a done→pending downgrade (this
         # session is no longer a finished performance) clears an estimate that's
-        # now unsupported. Recomputes from scratch — a heavier set raises it, an
-        # edit that drops the PR lowers it, a removed basis clears it.
-        meso_one_rm.refresh_one_rms(
-            request.user,
-            list(session.trainable_cells()),
-            session.week.mesocycle.plan.unit,
-        )
+        # now unsupported. A heavier set raises it, an edit that drops the PR
+        # lowers it, a removed basis clears it — folded into the materialized
+        # per-unit bests, rescanning history only for a lift whose best set this
+        # save replaced. The PR ledger is written first: it reads the prior best
+        # off the bests before this log is folded into them. Only the lifts the
+        # save touched (``_write_session_log``'s ``affected``) are refreshed —
+        # an RPE edit to one set leaves every other lift's records and 1RM be.
+        if affected:
+            unit = session.week.mesocycle.plan.unit
+            record_log(log, affected, unit)
+            meso_one_rm.refresh_one_rms(request.user, affected, unit, log=log)
+        # The log flips the session done on the athlete's home, can move its
+        # scroll hint and set a record — invalidate their cached home. The
+        # coach's generation keys their tour config (``etags``), whose results
+        # step reads whether any of their athletes has logged.
+        meso_home_cache.bump(request.user.pk)
+        meso_home_cache.bump(session.week.mesocycle.plan.relationship.coach_id)
     # #441 P3-5: the results step auto-advances once the coach *completes* one of
     # their own self-link sessions. Gated on the step's own predicate so a
     # ``pending`` "save progress" — or a done log the coach makes as an athlete
@@ -1420,8 +1473,8 @@ def athlete_log_session(request, pk):
     # results.
     meso_tour.advance_self_step_if_complete(request.user, "results")
     # Phase 4c: the lifts in this session that beat the athlete's prior best, so
-    # the logger can celebrate a PR the instant it's logged. Pure detection off
-    # the just-committed rows — DONE-only, so a "Save progress" draft returns [].
+    # the logger can celebrate a PR the instant it's logged — the ledger rows
+    # ``record_log`` just wrote. DONE-only, so a "Save progress" draft returns [].
     new_records = new_records_in(log)
     return JsonResponse(
         {
@@ -1432,6 +1485,165 @@ def athlete_log_session(request, pk):
     )
 
 
+# The most session logs one bulk sync may carry — a week or two of offline
+# training is a handful; a larger body is a runaway queue, refused whole.
+MAX_SYNC_LOGS = 50
+
+# The longest idempotency key a queued log may carry (the PWA sends a UUID).
+MAX_SYNC_KEY_LENGTH = 64
+
+
+def log_sync_receipt_key(user_id, key):
+    return f"meso:logsync:{user_id}:{key}"
+
+
+@login_required
+@require_POST
+def athlete_log_sync(request):
+    """Apply a queue of offline session logs in one request (the PWA's flush).
+
+    The logger queues a save it couldn't send (``meso_athlete.js``) and used to
+    replay the queue one ``athlete_log_session`` POST at a time — a request, a
+    transaction, a PR-ledger write and a 1RM refresh per session. This takes the
+    whole queue::
+
+        {"logs": [{"key": "<uuid>", "session": 12, "status": "done",
+                   "date": "2026-10-01", "notes": "", "sets": [...]}, ...]}
+
+    Each item is the log endpoint's body plus its ``session`` and a
+    client-chosen idempotency ``key``, validated exactly as that endpoint does
+    (``_clean_log_payload``) and scoped the same way (``_athlete_sessions``).
+    An item that fails is reported, not fatal — the others still land, and the
+    client drops the rejected one rather than retrying it forever. When two
+    items target one session the later wins; the earlier is reported
+    ``superseded``.
+
+    Every write runs in one transaction, followed by a single PR/1RM recompute
+    per unit: the ledger is replayed from history (``rebuild_records`` — so
+    offline logs arriving out of date order still get the records their dates
+    earn) and the 1RMs read off the rebuilt bests. An applied key is
+    remembered for ``MESO_LOG_SYNC_RECEIPT_TTL`` seconds once the transaction
+    commits; a retried flush whose response was lost is answered ``duplicate``
+    without re-applying a stale state over a newer save.
+
+    Returns ``{"ok": true, "results": [...]}`` in request order, each result
+    ``{key, session, ok, log}`` plus ``new_records``, ``duplicate``,
+    ``superseded`` or ``error``.
+    """
+    try:
+        payload = json.loads(request.body or "{}")
+    except json.JSONDecodeError:
+        return HttpResponseBadRequest("Malformed JSON.")
+    if not isinstance(payload, dict):
+        return HttpResponseBadRequest("Expected a JSON object.")
+    items = payload.get("logs")
+    if not isinstance(items, list):
+        return HttpResponseBadRequest("logs must be a list.")
+    if len(items) > MAX_SYNC_LOGS:
+        return HttpResponseBadRequest(f"At most {MAX_SYNC_LOGS} logs per sync.")
+
+    user = request.user
+    results = []
+    for item in items:
+        if not isinstance(item, dict):
+            return HttpResponseBadRequest("Each log must be a JSON object.")
+        key, session_id = item.get("key"), item.get("session")
+        if not isinstance(key, str) or not 0 < len(key) <= MAX_SYNC_KEY_LENGTH:
+            return HttpResponseBadRequest(
+                f"Each log needs a key of at most {MAX_SYNC_KEY_LENGTH} characters."
+            )
+        if isinstance(session_id, bool) or not isinstance(session_id, int):
+            return HttpResponseBadRequest("Each log needs an integer session.")
+        results.append({"key": key, "session": session_id, "ok": False, "log": None})
+    if len({r["key"] for r in results}) != len(results):
+        return HttpResponseBadRequest("Log keys must be unique.")
+
+    ttl = settings.MESO_LOG_SYNC_RECEIPT_TTL
+    receipts = (
+        cache.get_many([log_sync_receipt_key(user.pk, r["key"]) for r in results])
+        if ttl
+        else {}
+    )
+    sessions = _athlete_sessions(user).in_bulk({r["session"] for r in results})
+
+    # Validate every item before any write. ``pending`` maps a session to the
+    # index of its last applicable item — the one that wins.
+    cleaned_by_index = {}
+    trainable_by_session = {}
+    pending = {}
+    for index, (item, result) in enumerate(zip(items, results)):
+        receipt = receipts.get(log_sync_receipt_key(user.pk, result["key"]))
+        if receipt is not None:
+            result.update(ok=True, duplicate=True, log=receipt)
+            continue
+        session = sessions.get(result["session"])
+        if session is None:
+            result["error"] = "Unknown session."
+            continue
+        if session.pk not in trainable_by_session:
+            trainable_by_session[session.pk] = list(session.trainable_cells())
+        cleaned, error = _clean_log_payload(item, trainable_by_session[session.pk])
+        if error is not None:
+            result["error"] = error.content.decode()
+            continue
+        cleaned_by_index[index] = cleaned
+        if session.pk in pending:
+            results[pending[session.pk]]["superseded"] = True
+        pending[session.pk] = index
+
+    logs = {}
+    if pending:
+        with transaction.atomic():
+            trainable_by_unit = {}
+            for session_id, index in pending.items():
+                session = sessions[session_id]
+                trainable = trainable_by_session[session_id]
+                logs[session_id], _affected = _write_session_log(
+                    user, session, cleaned_by_index[index], trainable
+                )
+                unit = session.week.mesocycle.plan.unit
+                trainable_by_unit.setdefault(unit, []).extend(trainable)
+            # The one recompute: replay the ledger and bests per unit, then
+            # persist the 1RMs off the rebuilt bests (see ``refresh_one_rms``).
+            for unit in sorted(trainable_by_unit):
+                rebuild_records(user, unit)
+                meso_one_rm.refresh_one_rms(
+                    user, trainable_by_unit[unit], unit, rebuilt=True
+                )
+            meso_home_cache.bump(user.pk)
+            for coach_id in {
+                sessions[session_id].week.mesocycle.plan.relationship.coach_id
+                for session_id in pending
+            }:
+                meso_home_cache.bump(coach_id)
+            applied = {}
+            for index in cleaned_by_index:
+                result = results[index]
+                result.update(ok=True, log=logs[result["session"]].pk)
+                applied[log_sync_receipt_key(user.pk, result["key"])] = result["log"]
+            if ttl:
+                transaction.on_commit(lambda: cache.set_many(applied, timeout=ttl))
+        meso_tour.advance_self_step_if_complete(user, "results")
+
+    new_records = new_records_by_log(logs.values())
+    serialized = {
+        log.pk: serialize_session_log(log)
+        for log in SessionLog.objects.filter(
+            pk__in={r["log"] for r in results if r.get("log") is not None}
+        )
+    }
+    for result in results:
+        if result.get("log") is None:
+            continue
+        result["log"] = serialized.get(result["log"])
+        if not result.get("duplicate") and not result.get("superseded"):
+            result["new_records"] = [
+                serialize_new_record(r)
+                for r in new_records.get(result["log"]["id"], [])
+            ]
+    return JsonResponse({"ok": True, "results": results})
+
+
 @login_required
 @require_POST
 def athlete_set_one_rm(request, pk):
@@ -1475,6 +1687,9 @@ def athlete_set_one_rm(request, pk):
         value,
         session.week.mesocycle.plan.unit,
     )
+    # The 1RM shows on the session page and the designer's week; both ETags
+    # (``etags``) follow the athlete's generation.
+    meso_home_cache.bump(request.user.pk)
     return JsonResponse(
         {
             "ok": True,
@@ -1563,7 +1778,128 @@ def athlete_cell_write(request, pk):
     )
 
 
-def _clean_logged_sets(raw_sets, session):
+def _clean_log_payload(payload, trainable):
+    """Validate one log body for a session, or return a 400.
+
+    Returns ``(cleaned, None)`` on success or ``(None, HttpResponseBadRequest)``.
+    ``trainable`` is the session's ``trainable_cells()`` — the only rows a set
+    may reference. ``cleaned`` carries the ``status``, the explicit ``date``
+    (``None`` when none was sent), the ``notes`` and the cleaned ``sets``.
+    """
+    status = payload.get("status", SessionLog.Status.DONE)
+    if status not in (SessionLog.Status.PENDING, SessionLog.Status.DONE):
+        return None, HttpResponseBadRequest("status must be 'pending' or 'done'.")
+
+    # An explicit date is honored; a missing one defaults to today only when
+    # *creating* the log (``_write_session_log``) — re-saving an existing log
+    # without a date keeps its original date so editing a set days later
+    # doesn't move the workout (which would reorder recent-log grounding).
+    raw_date = payload.get("date")
+    explicit_date = None
+    if raw_date not in (None, ""):
+        if not isinstance(raw_date, str):
+            return None, HttpResponseBadRequest("date must be an ISO date string.")
+        try:
+            explicit_date = datetime.date.fromisoformat(raw_date)
+        except ValueError:
+            return None, HttpResponseBadRequest(
+                "date must be an ISO date (YYYY-MM-DD)."
+            )
+
+    notes = payload.get("notes", "")
+    if not isinstance(notes, str):
+        return None, HttpResponseBadRequest("notes must be a string.")
+
+    cleaned_sets, error = _clean_logged_sets(payload.get("sets", []), trainable)
+    if error is not None:
+        return None, error
+    return {
+        "status": status,
+        "date": explicit_date,
+        "notes": notes,
+        "sets": cleaned_sets,
+    }, None
+
+
+def _write_session_log(athlete, session, cleaned, trainable):
+    """Upsert ``athlete``'s log for ``session`` from a cleaned body.
+
+    Returns ``(log, affected)``: ``affected`` is the ids of the trainable
+    prescriptions whose lifts the save can have moved — those with a set
+    inserted, edited or removed, or every one when the log is new, its status
+    flipped (a DONE log's sets count toward bests, a pending one's don't) or
+    its date moved (the PR ledger replays history in date order). The caller refreshes the PR ledger and 1RMs for those lifts only
+    (the bulk sync rebuilds them wholesale instead). Runs inside the caller's
+    transaction.
+    """
+    log = (
+        SessionLog.objects.filter(session=session, athlete=athlete)
+        .order_by("-created_at")
+        .first()
+    )
+    created = log is None
+    if created:
+        log = SessionLog(session=session, athlete=athlete)
+    previous = (log.status, log.date, log.notes)
+    log.status = cleaned["status"]
+    if cleaned["date"] is not None:
+        log.date = cleaned["date"]
+    elif log.date is None:  # first save (or a log never dated) → stamp today
+        log.date = timezone.localdate()
+    # else: a re-save with no date keeps the existing workout date.
+    log.notes = cleaned["notes"]
+    if created:
+        log.save()
+    # Diff only the rows the logger can re-post: sets whose prescription cell
+    # is TRAINABLE in this session (``session.trainable_cells()`` — live and
+    # non-skipped, the exact set the logger renders). A set logged against a
+    # since-deleted/hidden/skipped cell — or one orphaned by an old hard
+    # delete — is history, not draft state; touching it here would silently
+    # destroy the athlete's record on their next save (e.g. a row the coach
+    # marked skipped after the athlete already logged it).
+    #
+    # Matched by (prescription, set_number): an unchanged set keeps its row
+    # and id — the PR ledger's and ``LiftBest``'s ``logged_set`` stay put —
+    # an edited one is updated in place, and only a new or dropped set is
+    # inserted or deleted.
+    existing = {}
+    stray = []
+    if not created:
+        for ls in log.sets.filter(prescription_id__in=[p.pk for p in trainable]):
+            key = (ls.prescription_id, ls.set_number)
+            if key in existing:
+                stray.append(ls)  # a duplicate from before the uniqueness check
+            else:
+                existing[key] = ls
+    creates, updates, changed = [], [], set()
+    for cs in cleaned["sets"]:
+        key = (cs["prescription_id"], cs["set_number"])
+        ls = existing.pop(key, None)
+        if ls is None:
+            creates.append(LoggedSet(session_log=log, **cs))
+        elif any(getattr(ls, field) != cs[field] for field in LOG_SET_FIELDS):
+            for field in LOG_SET_FIELDS:
+                setattr(ls, field, cs[field])
+            updates.append(ls)
+        else:
+            continue
+        changed.add(cs["prescription_id"])
+    deletes = [*existing.values(), *stray]
+    changed.update(ls.prescription_id for ls in deletes)
+    if deletes:
+        LoggedSet.objects.filter(pk__in=[ls.pk for ls in deletes]).delete()
+    LoggedSet.objects.bulk_update(updates, list(LOG_SET_FIELDS))
+    LoggedSet.objects.bulk_create(creates)
+    # Saved when anything moved, so ``updated_at`` (the results cache's stamp)
+    # follows a set-only edit too; a byte-identical re-save writes nothing.
+    if not created and (changed or previous != (log.status, log.date, log.notes)):
+        log.save()
+    if created or previous[:2] != (log.status, log.date):
+        return log, {p.pk for p in trainable}
+    return log, changed
+
+
+def _clean_logged_sets(raw_sets, trainable):
     """Validate the posted ``sets`` against this session, or return a 400.
 
     Returns ``(cleaned, None)`` on success or ``(None, HttpResponseBadRequest)``.
@@ -1574,7 +1910,7 @@ def _clean_logged_sets(raw_sets, session):
     if not isinstance(raw_sets, list):
         return None, HttpResponseBadRequest("sets must be a list.")
     # Only trainable rows are postable — the logger never renders a skipped cell.
-    allowed_ids = {p.pk for p in session.trainable_cells()}
+    allowed_ids = {p.pk for p in trainable}
     cleaned = []
     seen = set()
     for position, raw in enumerate(raw_sets, start=1):
@@ -2356,21 +2692,47 @@ def _touch_plan(plan):
     The autosave/deliver endpoints write *child* rows (prescriptions, weeks),
     which would otherwise leave ``Plan.modified`` stale — and ``_coach_working_plan``
     orders the bare designer/deliver redirect target by it. ``modified`` is
-    ``auto_now``, so saving the field stamps it now.
+    ``auto_now``, so saving the field stamps it now. ``Plan.touch`` also bumps
+    ``edit_version``, which invalidates the plan's cached grid payload
+    (``grid_cache``) — every endpoint that edits what the grid shows ends here.
     """
-    plan.save(update_fields=["modified"])
+    plan.touch()
 
 
-def _cell_or_404(plan, pk):
-    """A live ``Prescription`` cell of ``plan`` by pk, or ``Http404`` (P0).
+def _wants_grid_patch(request):
+    """Whether the designer asked for a patch reply (``X-Meso-Response: patch``).
 
-    The fixed-lineup analogue of the old flat per-week prescription lookup: a
-    cell is live iff its ``ExerciseSlot``, that slot's ``SessionSlot``, and
-    its own ``Week`` are all live, and the slot's mesocycle belongs to ``plan``.
+    Opt-in per request, so every existing caller (and test) keeps the reply
+    it always had; ``useGrid`` sends the header on the structural writes it
+    merges locally instead of refetching the whole grid.
     """
-    return get_object_or_404(
-        Prescription,
-        pk=pk,
+    return request.headers.get("X-Meso-Response") == "patch"
+
+
+def _grid_patch_response(
+    plan, mesocycle, *, rows=(), days=(), day_headers=(), status=200, **extra
+):
+    """A write's patch-mode reply: ``extra`` + the changed grid slice + history.
+
+    ``rows``/``days``/``day_headers`` are the same regions the write recorded
+    for undo (``delta_scope``) — see ``serialize_grid_patch``.
+    """
+    return JsonResponse(
+        {
+            "ok": True,
+            **extra,
+            "grid_patch": serialize_grid_patch(
+                plan, mesocycle, rows=rows, days=days, day_headers=day_headers
+            ),
+            "history": serialize_plan_history(plan),
+        },
+        status=status,
+    )
+
+
+def _live_cells(plan):
+    """``plan``'s live ``Prescription`` cells (see ``_cell_or_404``)."""
+    return Prescription.objects.filter(
         exercise_slot__session_slot__mesocycle__plan=plan,
         exercise_slot__deleted_at__isnull=True,
         exercise_slot__session_slot__deleted_at__isnull=True,
@@ -2378,6 +2740,16 @@ def _cell_or_404(plan, pk):
     )
 
 
+def _cell_or_404(plan, pk):
+    """A live ``Prescription`` cell of ``plan`` by pk, or ``Http404`` (P0).
+
+    The fixed-lineup analogue of the old flat per-week prescription lookup: a
+    cell is live iff its ``ExerciseSlot``, that slot's ``SessionSlot``, and
+    its own ``Week`` are all live, and the slot's mesocycle belongs to ``plan``.
+    """
+    return get_object_or_404(_live_cells(plan), pk=pk)
+
+
 def _session_for_cell(cell):
     """The live (week × day) ``Session`` a cell belongs to (P0).
 
@@ -2390,56 +2762,78 @@ def _session_for_cell(cell):
     )
 
 
-@login_required
-@require_POST
-def prescription_patch(request, plan_id, pk):
-    """Patch one prescription cell (or a small batch of cells)."""
-    plan, forbidden = _editable_plan_or_response(request, plan_id)
-    if forbidden is not None:
-        return forbidden
-    cell = _cell_or_404(plan, pk)
-    try:
-        payload = json.loads(request.body or "{}")
-    except json.JSONDecodeError:
-        return HttpResponseBadRequest("Malformed JSON.")
-    if not isinstance(payload, dict):
-        return HttpResponseBadRequest("Expected a JSON object.")
+def _clean_cell_patch(payload, current_name):
+    """Validate a ``prescription_patch`` body → ``(updates, name_edit, error)``.
 
+    ``updates`` maps the ``PATCHABLE_FIELDS`` present to their new values;
+    ``name_edit`` is the row's new name, or None. ``name`` is identity — the
+    block-shared ``ExerciseSlot``'s (P0 fixed lineup; the one-week swap fields
+    are gone, Phase 2a — a substitution is sub-line text now). The React client
+    echoes the name on every blur, so it's an edit only when it differs from
+    ``current_name``. ``error`` is the 400 message, or None. Shared by
+    ``prescription_patch`` and ``plan_batch``.
+    """
     updates = {}
     for field, max_length in PATCHABLE_FIELDS.items():
         if field not in payload:
             continue
         value = payload[field]
         if not isinstance(value, str):
-            return HttpResponseBadRequest(f"{field} must be a string.")
+            return None, None, f"{field} must be a string."
         if len(value) > max_length:
-            return HttpResponseBadRequest(f"{field} is too long.")
+            return None, None, f"{field} is too long."
         updates[field] = value
 
-    # ``name`` is identity — the block-shared ``ExerciseSlot``'s (P0 fixed
-    # lineup; the one-week swap fields are gone, Phase 2a — a substitution is
-    # sub-line text now). The React client echoes the name on every blur, so
-    # treat it as an edit only when it actually differs.
     name_edit = None
     if "name" in payload:
         value = payload["name"]
         if not isinstance(value, str):
-            return HttpResponseBadRequest("name must be a string.")
+            return None, None, "name must be a string."
         if len(value) > 255:
-            return HttpResponseBadRequest("name is too long.")
-        if value != cell.name:
+            return None, None, "name is too long."
+        if value != current_name:
             name_edit = value
+    return updates, name_edit, None
+
+
+def _apply_cell_patch(cell, updates, name_edit):
+    """Write a ``_clean_cell_patch`` result onto ``cell`` (and its row's name)."""
+    if updates:
+        for field, value in updates.items():
+            setattr(cell, field, value)
+        cell.save(update_fields=list(updates))
+    if name_edit is not None:
+        cell.exercise_slot.name = name_edit
+        cell.exercise_slot.save(update_fields=["name"])
+
+
+@login_required
+@require_POST
+def prescription_patch(request, plan_id, pk):
+    """Patch one prescription cell (or a small batch of cells)."""
+    plan, forbidden = _editable_plan_or_response(request, plan_id)
+    if forbidden is not None:
+        return forbidden
+    cell = _cell_or_404(plan, pk)
+    try:
+        payload = json.loads(request.body or "{}")
+    except json.JSONDecodeError:
+        return HttpResponseBadRequest("Malformed JSON.")
+    if not isinstance(payload, dict):
+        return HttpResponseBadRequest("Expected a JSON object.")
+
+    updates, name_edit, error = _clean_cell_patch(payload, cell.name)
+    if error:
+        return HttpResponseBadRequest(error)
 
     if updates or name_edit is not None:
         with transaction.atomic():
-            record_plan_action(plan, f"Edited {cell.name or 'exercise'}")
-            if updates:
-                for field, value in updates.items():
-                    setattr(cell, field, value)
-                cell.save(update_fields=list(updates))
-            if name_edit is not None:
-                cell.exercise_slot.name = name_edit
-                cell.exercise_slot.save(update_fields=["name"])
+            record_plan_action(
+                plan,
+                f"Edited {cell.name or 'exercise'}",
+                scope=delta_scope(rows=[cell.exercise_slot_id]),
+            )
+            _apply_cell_patch(cell, updates, name_edit)
             _touch_plan(plan)
     # Row-level reply + refreshed history: this endpoint records an undo action
     # but doesn't re-serialize the plan, so without `history` the client's undo
@@ -2471,9 +2865,15 @@ def prescription_delete(request, plan_id, pk):
     cell = _cell_or_404(plan, pk)
     week = cell.week
     with transaction.atomic():
-        record_plan_action(plan, f"Deleted {cell.name or 'exercise'}")
+        record_plan_action(
+            plan,
+            f"Deleted {cell.name or 'exercise'}",
+            scope=delta_scope(rows=[cell.exercise_slot_id]),
+        )
         cell.exercise_slot.soft_delete()
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(plan, week.mesocycle, rows=[cell.exercise_slot_id])
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
 
@@ -2563,13 +2963,23 @@ def session_add_exercise(request, plan_id, pk):
             if target_week is not None
             else "Added exercise"
         )
-        record_plan_action(plan, label)
+        record_plan_action(
+            plan, label, scope=delta_scope(days=[session.session_slot_id])
+        )
         exercise_slot, cells_by_week = _new_block_wide_row(
             session, week_id_only=target_week.pk if target_week is not None else None
         )
         target_id = target_week.pk if target_week is not None else session.week_id
         cell = cells_by_week.get(target_id)
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan,
+            session.week.mesocycle,
+            rows=[exercise_slot.pk],
+            status=201,
+            prescription=serialize_prescription(cell),
+        )
     # Row-level reply + refreshed history (see prescription_patch).
     return JsonResponse(
         {
@@ -2692,7 +3102,11 @@ def session_delete(request, plan_id, pk):
     )
     week = session.week
     with transaction.atomic():
-        record_plan_action(plan, f"Deleted Day {session.day_number}")
+        record_plan_action(
+            plan,
+            f"Deleted Day {session.day_number}",
+            scope=delta_scope(days=[session.session_slot_id]),
+        )
         session.session_slot.soft_delete()
         _touch_plan(plan)
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
@@ -2771,11 +3185,19 @@ def session_reorder(request, plan_id, pk):
                 },
                 status=400,
             )
-        record_plan_action(plan, "Reordered exercises")
+        record_plan_action(
+            plan,
+            "Reordered exercises",
+            scope=delta_scope(days=[session.session_slot_id]),
+        )
         slot_id_by_cell = {c.pk: c.exercise_slot_id for c in live}
         for index, cell_id in enumerate(order):
             ExerciseSlot.objects.filter(pk=slot_id_by_cell[cell_id]).update(order=index)
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan, week.mesocycle, days=[session.session_slot_id]
+        )
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
 
@@ -2788,7 +3210,8 @@ def week_view(request, plan_id, week_id):
     targets — so it is scoped by ownership only (404/403), **not** billing-gated:
     an over-limit coach keeps read access to every week. A week that isn't this
     plan's is a flat 404. Returns the same ``serialize_plan`` shape the page hydrates
-    from, pinned to ``week`` (``viewing`` reports it back).
+    from, pinned to ``week`` (``viewing`` reports it back). Conditional
+    (``etags.week_etag``): re-opening an unchanged week is a 304.
     """
     plan, forbidden = _coach_plan_or_forbidden(request, plan_id)
     if forbidden is not None:
@@ -2796,7 +3219,13 @@ def week_view(request, plan_id, week_id):
     week = get_object_or_404(
         Week, pk=week_id, mesocycle__plan=plan, deleted_at__isnull=True
     )
-    return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
+    etag = meso_etags.week_etag(plan, week)
+    not_modified = meso_etags.not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return meso_etags.tagged(
+        JsonResponse({"ok": True, **serialize_plan(plan, week=week)}), etag
+    )
 
 
 def _default_grid_mesocycle(plan):
@@ -2829,7 +3258,8 @@ def api_mesocycle_grid(request, plan_id):
     ``?mesocycle=<id>`` views another block of the same plan (404 for one
     that doesn't belong to it, 400 for a non-integer). A plan with no block at
     all is a 404; a block with no materialized weeks yet returns a valid,
-    empty-ish grid.
+    empty-ish grid. Conditional (``etags.grid_etag``): a re-fetch between two
+    edits is a 304 that skips even the ``grid_cache`` lookup.
     """
     plan, forbidden = _coach_plan_or_forbidden(request, plan_id)
     if forbidden is not None:
@@ -2841,11 +3271,18 @@ def api_mesocycle_grid(request, plan_id):
         except (TypeError, ValueError):
             return HttpResponseBadRequest("mesocycle must be an integer.")
         mesocycle = get_object_or_404(Mesocycle, pk=mesocycle_id, plan=plan)
+        # The cache key's version comes off ``mesocycle.plan`` — hand it the
+        # plan just loaded rather than letting it lazily refetch.
+        mesocycle.plan = plan
     else:
         mesocycle = _default_grid_mesocycle(plan)
         if mesocycle is None:
             raise Http404("This plan has no block yet.")
-    return JsonResponse({"ok": True, **serialize_mesocycle_grid(mesocycle)})
+    etag = meso_etags.grid_etag(mesocycle, plan)
+    not_modified = meso_etags.not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return meso_etags.tagged(grid_response(mesocycle), etag)
 
 
 @login_required
@@ -3015,6 +3452,11 @@ def week_reorder_sessions(request, plan_id, week_id):
                 order=index
             )
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        # Only the days' own ``order`` moved — their rows are untouched.
+        return _grid_patch_response(
+            plan, week.mesocycle, day_headers=list(slot_id_by_session.values())
+        )
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
 
@@ -3038,10 +3480,11 @@ def _undo_redo_week_response(plan, week_id):
 def api_plan_undo(request, plan_id):
     """Pop the plan's most recent undo action and restore it (Phase 1 op-log).
 
-    Every mutating designer endpoint records one ``PlanAction`` — a plan-wide
-    snapshot of editable state taken just before its write (``history.py``).
-    This pops the max-seq undo row, pushes its mirror-image redo row (same
-    seq+label, snapshot = the *current* state, so redo can put it right back),
+    Every mutating designer endpoint records one ``PlanAction`` — a snapshot
+    of editable state taken just before its write, plan-wide or a delta over
+    the region the write touches (``history.py``). This pops the max-seq undo
+    row, pushes its mirror-image redo row (same seq+label, snapshot = the
+    *current* state of the same region, so redo can put it right back),
     and restores the popped snapshot — flipping fields/``deleted_at`` only,
     never hard-deleting or recreating a row, so an undone add redoes onto the
     same pk and an undone delete resurfaces with its athlete's logs untouched.
@@ -3056,6 +3499,7 @@ def api_plan_undo(request, plan_id):
     week_id, bad = _body_week_id(request)
     if bad is not None:
         return bad
+    started = time.monotonic()
     try:
         with transaction.atomic():
             Plan.objects.select_for_update().filter(pk=plan.pk).first()
@@ -3068,20 +3512,32 @@ def api_plan_undo(request, plan_id):
                 return JsonResponse(
                     {"ok": False, "error": "Nothing to undo"}, status=400
                 )
-            redo_snapshot = serialize_plan_snapshot(plan)
-            restore_snapshot, seq, label = popped.snapshot, popped.seq, popped.label
+            # The mirror row covers the same region as the popped one (the
+            # whole plan for a full/legacy snapshot, its scope for a delta).
+            restore_snapshot = action_snapshot(popped)
+            redo_snapshot = serialize_plan_snapshot(
+                plan, scope=restore_snapshot.get("scope")
+            )
+            seq, label = popped.seq, popped.label
             popped.delete()
-            PlanAction.objects.create(
-                plan=plan,
+            create_plan_action(
+                plan,
                 stack=PlanAction.Stack.REDO,
                 seq=seq,
                 label=label,
                 snapshot=redo_snapshot,
             )
-            restore_plan_snapshot(plan, restore_snapshot)
+            prune_snapshot_chunks(plan)
+            touched = restore_plan_snapshot(plan, restore_snapshot)
             _touch_plan(plan)
     except HistoryUnavailable:
         return JsonResponse({"ok": False, "error": "History unavailable"}, status=409)
+    logger.info(
+        "Plan %s undo restored %s row(s) in %d ms.",
+        plan.pk,
+        touched,
+        int((time.monotonic() - started) * 1000),
+    )
     week = _undo_redo_week_response(plan, week_id)
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
@@ -3096,6 +3552,7 @@ def api_plan_redo(request, plan_id):
     week_id, bad = _body_week_id(request)
     if bad is not None:
         return bad
+    started = time.monotonic()
     try:
         with transaction.atomic():
             Plan.objects.select_for_update().filter(pk=plan.pk).first()
@@ -3108,20 +3565,30 @@ def api_plan_redo(request, plan_id):
                 return JsonResponse(
                     {"ok": False, "error": "Nothing to redo"}, status=400
                 )
-            undo_snapshot = serialize_plan_snapshot(plan)
-            restore_snapshot, seq, label = popped.snapshot, popped.seq, popped.label
+            restore_snapshot = action_snapshot(popped)
+            undo_snapshot = serialize_plan_snapshot(
+                plan, scope=restore_snapshot.get("scope")
+            )
+            seq, label = popped.seq, popped.label
             popped.delete()
-            PlanAction.objects.create(
-                plan=plan,
+            create_plan_action(
+                plan,
                 stack=PlanAction.Stack.UNDO,
                 seq=seq,
                 label=label,
                 snapshot=undo_snapshot,
             )
-            restore_plan_snapshot(plan, restore_snapshot)
+            prune_snapshot_chunks(plan)
+            touched = restore_plan_snapshot(plan, restore_snapshot)
             _touch_plan(plan)
     except HistoryUnavailable:
         return JsonResponse({"ok": False, "error": "History unavailable"}, status=409)
+    logger.info(
+        "Plan %s redo restored %s row(s) in %d ms.",
+        plan.pk,
+        touched,
+        int((time.monotonic() - started) * 1000),
+    )
     week = _undo_redo_week_response(plan, week_id)
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
@@ -3200,7 +3667,13 @@ def prescription_move(request, plan_id, pk):
     with transaction.atomic():
         # Lock ordering: plan first (see session_add).
         Plan.objects.select_for_update().filter(pk=plan.pk).first()
-        record_plan_action(plan, f"Moved {cell.name or 'exercise'}")
+        # Both days are in the region: the row leaves one and lands on the
+        # other, and a delta must cover its rows before AND after (history.py).
+        record_plan_action(
+            plan,
+            f"Moved {cell.name or 'exercise'}",
+            scope=delta_scope(days=[source_slot.pk, target_slot.pk]),
+        )
         es = cell.exercise_slot
         if target_slot.pk == source_slot.pk:
             siblings = list(
@@ -3236,6 +3709,10 @@ def prescription_move(request, plan_id, pk):
             for new_order, row in enumerate(source_rows):
                 ExerciseSlot.objects.filter(pk=row.pk).update(order=new_order)
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan, week.mesocycle, days=[source_slot.pk, target_slot.pk]
+        )
     return JsonResponse({"ok": True, **serialize_plan(plan, week=week)})
 
 
@@ -3291,14 +3768,110 @@ def prescription_skip(request, plan_id, pk):
 
     with transaction.atomic():
         record_plan_action(
-            plan, f"Skipped {cell.name}" if skipped else f"Restored {cell.name}"
+            plan,
+            f"Skipped {cell.name}" if skipped else f"Restored {cell.name}",
+            scope=delta_scope(rows=[cell.exercise_slot_id]),
         )
         cell.skipped = skipped
         cell.save(update_fields=["skipped"])
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan, cell.week.mesocycle, rows=[cell.exercise_slot_id]
+        )
     return JsonResponse({"ok": True, "history": serialize_plan_history(plan)})
 
 
+def _live_exercise_slots(plan):
+    """``plan``'s live ``ExerciseSlot`` rows — a live slot on a live day."""
+    return ExerciseSlot.objects.filter(
+        session_slot__mesocycle__plan=plan,
+        deleted_at__isnull=True,
+        session_slot__deleted_at__isnull=True,
+    )
+
+
+def _clean_cell_line(payload):
+    """Validate a ``cell_line_write`` body → ``((week_id, line, text), error)``.
+
+    Checks shapes and caps only; whether ``week_id`` is a live week of the
+    row's block is the caller's lookup. ``error`` is the 400 message, or None.
+    """
+    week_id = payload.get("week_id")
+    if not isinstance(week_id, int) or isinstance(week_id, bool):
+        return None, "week_id must be an integer."
+    line = payload.get("line")
+    if not isinstance(line, int) or isinstance(line, bool) or line < 0:
+        return None, "line must be a non-negative integer."
+    if line > MAX_CELL_LINE:
+        return None, "line is too large."
+    text = payload.get("text")
+    if not isinstance(text, str):
+        return None, "text must be a string."
+    if len(text) > PATCHABLE_FIELDS["text"]:
+        return None, "text is too long."
+    return (week_id, line, text), None
+
+
+def _reclaim_athlete_cells(keys):
+    """Flip athlete-authored cells at ``(slot_id, week_id, line)`` keys to coach.
+
+    Reclaim-then-snapshot (Phase 4a review): a coach edit reclaims an
+    athlete-authored cell back into coach history. The flag flip is persisted
+    ALONE, *before* ``record_plan_action``, so the snapshot holds this cell as
+    a coach cell still carrying the athlete's original text — a later coach
+    undo then RESTORES that text (as a coach-owned cell) instead of
+    hard-deleting the reclaimed row (which a snapshot taken while the cell was
+    still athlete-authored would have omitted entirely). One UPDATE however
+    many keys.
+    """
+    match = Q()
+    for slot_id, week_id, line in keys:
+        match |= Q(exercise_slot_id=slot_id, week_id=week_id, line=line)
+    if match:
+        Prescription.objects.filter(match, athlete_authored=True).update(
+            athlete_authored=False
+        )
+
+
+def _write_cell_line(slot, week, line, text):
+    """Upsert the ``(slot, week, line)`` cell's text; returns the cell."""
+    cell, _created = Prescription.objects.get_or_create(
+        exercise_slot=slot, week=week, line=line
+    )
+    cell.text = text
+    # A coach edit reclaims an athlete-authored cell (Phase 4a) back into
+    # coach history — from here on it's snapshotted and undoable again.
+    cell.athlete_authored = False
+    cell.save(update_fields=["text", "athlete_authored"])
+    return cell
+
+
+def _clean_slot_patch(payload):
+    """Validate an ``exercise_slot_patch`` body → ``(updates, error)``.
+
+    ``updates`` maps the ``SLOT_PATCHABLE_FIELDS`` present to their values;
+    unknown keys are ignored. ``error`` is the 400 message, or None.
+    """
+    updates = {}
+    for field, max_length in SLOT_PATCHABLE_FIELDS.items():
+        if field not in payload:
+            continue
+        value = payload[field]
+        if not isinstance(value, str):
+            return None, f"{field} must be a string."
+        if len(value) > max_length:
+            return None, f"{field} is too long."
+        updates[field] = value
+    return updates, None
+
+
+def _apply_slot_patch(slot, updates):
+    for field, value in updates.items():
+        setattr(slot, field, value)
+    slot.save(update_fields=list(updates))
+
+
 @login_required
 @require_POST
 def cell_line_write(request, plan_id, slot_id):
@@ -3319,83 +3892,46 @@ def cell_line_write(request, plan_id, slot_id):
     plan, forbidden = _editable_plan_or_response(request, plan_id)
     if forbidden is not None:
         return forbidden
-    slot = get_object_or_404(
-        ExerciseSlot,
-        pk=slot_id,
-        session_slot__mesocycle__plan=plan,
-        deleted_at__isnull=True,
-        session_slot__deleted_at__isnull=True,
-    )
+    slot = get_object_or_404(_live_exercise_slots(plan), pk=slot_id)
     payload, bad = _json_object_body(request)
     if bad is not None:
         return bad
 
-    week_id = payload.get("week_id")
-    if not isinstance(week_id, int) or isinstance(week_id, bool):
-        return JsonResponse(
-            {"ok": False, "error": "week_id must be an integer."}, status=400
-        )
-    week = Week.objects.filter(
-        pk=week_id,
-        mesocycle=slot.session_slot.mesocycle,
-        deleted_at__isnull=True,
-    ).first()
-    if week is None:
-        return JsonResponse(
-            {"ok": False, "error": "week_id must be a live week of this block."},
-            status=400,
-        )
-    line = payload.get("line")
-    if not isinstance(line, int) or isinstance(line, bool) or line < 0:
-        return JsonResponse(
-            {"ok": False, "error": "line must be a non-negative integer."}, status=400
-        )
-    if line > MAX_CELL_LINE:
-        return JsonResponse({"ok": False, "error": "line is too large."}, status=400)
-    text = payload.get("text")
-    if not isinstance(text, str):
-        return JsonResponse(
-            {"ok": False, "error": "text must be a string."}, status=400
-        )
-    if len(text) > PATCHABLE_FIELDS["text"]:
-        return JsonResponse({"ok": False, "error": "text is too long."}, status=400)
+    cleaned, error = _clean_cell_line(payload)
+    if error is None:
+        week_id, line, text = cleaned
+        week = Week.objects.filter(
+            pk=week_id,
+            mesocycle=slot.session_slot.mesocycle,
+            deleted_at__isnull=True,
+        ).first()
+        if week is None:
+            error = "week_id must be a live week of this block."
+    if error:
+        return JsonResponse({"ok": False, "error": error}, status=400)
 
     with transaction.atomic():
-        existing = Prescription.objects.filter(
-            exercise_slot=slot, week=week, line=line
-        ).first()
-        if existing is not None and existing.athlete_authored:
-            # Reclaim-then-snapshot (Phase 4a review): a coach edit reclaims an
-            # athlete-authored cell back into coach history. Persist the flag
-            # flip ALONE first, so ``record_plan_action`` snapshots this cell as
-            # a coach cell still holding the athlete's original text — a later
-            # coach undo then RESTORES that text (as a coach-owned cell) instead
-            # of hard-deleting the reclaimed row (which the snapshot, taken while
-            # the cell was still athlete-authored, would have omitted entirely).
-            existing.athlete_authored = False
-            existing.save(update_fields=["athlete_authored"])
-        record_plan_action(plan, f"Edited {slot.name or 'exercise'}")
-        cell, _created = Prescription.objects.get_or_create(
-            exercise_slot=slot, week=week, line=line
+        _reclaim_athlete_cells([(slot.pk, week.pk, line)])
+        record_plan_action(
+            plan,
+            f"Edited {slot.name or 'exercise'}",
+            scope=delta_scope(rows=[slot.pk]),
         )
-        cell.text = text
-        # A coach edit reclaims an athlete-authored cell (Phase 4a) back into
-        # coach history — from here on it's snapshotted and undoable again.
-        cell.athlete_authored = False
-        cell.save(update_fields=["text", "athlete_authored"])
+        cell = _write_cell_line(slot, week, line, text)
         _touch_plan(plan)
+    cell_data = {
+        "id": cell.pk,
+        "exercise_slot_id": slot.pk,
+        "week_id": week.pk,
+        "line": cell.line,
+        "text": cell.text,
+    }
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan, week.mesocycle, rows=[slot.pk], cell=cell_data
+        )
     return JsonResponse(
-        {
-            "ok": True,
-            "cell": {
-                "id": cell.pk,
-                "exercise_slot_id": slot.pk,
-                "week_id": week.pk,
-                "line": cell.line,
-                "text": cell.text,
-            },
-            "history": serialize_plan_history(plan),
-        }
+        {"ok": True, "cell": cell_data, "history": serialize_plan_history(plan)}
     )
 
 
@@ -3412,38 +3948,23 @@ def exercise_slot_patch(request, plan_id, slot_id):
     plan, forbidden = _editable_plan_or_response(request, plan_id)
     if forbidden is not None:
         return forbidden
-    slot = get_object_or_404(
-        ExerciseSlot,
-        pk=slot_id,
-        session_slot__mesocycle__plan=plan,
-        deleted_at__isnull=True,
-        session_slot__deleted_at__isnull=True,
-    )
+    slot = get_object_or_404(_live_exercise_slots(plan), pk=slot_id)
     payload, bad = _json_object_body(request)
     if bad is not None:
         return bad
 
-    updates = {}
-    for field, max_length in SLOT_PATCHABLE_FIELDS.items():
-        if field not in payload:
-            continue
-        value = payload[field]
-        if not isinstance(value, str):
-            return JsonResponse(
-                {"ok": False, "error": f"{field} must be a string."}, status=400
-            )
-        if len(value) > max_length:
-            return JsonResponse(
-                {"ok": False, "error": f"{field} is too long."}, status=400
-            )
-        updates[field] = value
+    updates, error = _clean_slot_patch(payload)
+    if error:
+        return JsonResponse({"ok": False, "error": error}, status=400)
 
     if updates:
         with transaction.atomic():
-            record_plan_action(plan, f"Edited {slot.name or 'exercise'}")
-            for field, value in updates.items():
-                setattr(slot, field, value)
-            slot.save(update_fields=list(updates))
+            record_plan_action(
+                plan,
+                f"Edited {slot.name or 'exercise'}",
+                scope=delta_scope(rows=[slot.pk]),
+            )
+            _apply_slot_patch(slot, updates)
             _touch_plan(plan)
     return JsonResponse(
         {
@@ -3459,6 +3980,191 @@ def exercise_slot_patch(request, plan_id, slot_id):
     )
 
 
+# One debounce window of designer typing is a few dozen edits; the cap keeps
+# a buggy client from holding the plan lock for an unbounded batch.
+MAX_BATCH_OPS = 200
+
+# ``plan_batch`` op type → the key naming its target (a cell pk for the
+# per-cell patch, an ``ExerciseSlot`` pk for the row-addressed writes).
+BATCH_OP_TARGETS = {
+    "prescription_patch": "id",
+    "cell_line_write": "slot_id",
+    "exercise_slot_patch": "slot_id",
+}
+
+
+def _batch_op_error(index, error):
+    return JsonResponse(
+        {"ok": False, "index": index, "error": f"ops[{index}]: {error}"}, status=400
+    )
+
+
+@login_required
+@require_POST
+def plan_batch(request, plan_id):
+    """Apply an ordered list of designer edits as ONE write (one undo step).
+
+    The designer's typing path: instead of a POST per keystroke-blur — each
+    taking the plan lock, recording its own ``PlanAction`` and bumping
+    ``edit_version`` — ``useGrid`` debounces its cell / sub-line / row-column
+    edits and flushes them here. Body ``{"ops": [...]}``, applied in order;
+    each op is the matching single endpoint's body plus its target:
+
+    - ``{"op": "prescription_patch", "id": <cell pk>, "text"?, "name"?}``
+    - ``{"op": "cell_line_write", "slot_id", "week_id", "line", "text"}``
+    - ``{"op": "exercise_slot_patch", "slot_id", "tempo"?, "rest"?, "note"?}``
+
+    All-or-nothing: every op is validated (same rules and messages as its
+    endpoint) before anything is written, and the first bad one is a 400
+    ``{"ok": false, "index", "error"}`` with nothing applied. Then one
+    transaction: one reclaim UPDATE for athlete-authored cells, one
+    ``record_plan_action`` scoped to every touched row, the writes, one
+    ``_touch_plan``. Reply ``{"ok", "applied", "history"}`` (``applied``
+    counts the ops that changed something; a batch of no-ops records no undo
+    step) — plus ``grid_patch`` for the touched rows in patch mode.
+    """
+    plan, forbidden = _editable_plan_or_response(request, plan_id)
+    if forbidden is not None:
+        return forbidden
+    payload, bad = _json_object_body(request)
+    if bad is not None:
+        return bad
+    ops = payload.get("ops")
+    if not isinstance(ops, list) or not ops:
+        return JsonResponse(
+            {"ok": False, "error": "ops must be a non-empty list."}, status=400
+        )
+    if len(ops) > MAX_BATCH_OPS:
+        return JsonResponse(
+            {"ok": False, "error": f"At most {MAX_BATCH_OPS} ops per batch."},
+            status=400,
+        )
+    for index, op in enumerate(ops):
+        if not isinstance(op, dict) or op.get("op") not in BATCH_OP_TARGETS:
+            return _batch_op_error(
+                index, f"op must be one of {', '.join(BATCH_OP_TARGETS)}."
+            )
+        target = op.get(BATCH_OP_TARGETS[op["op"]])
+        if not isinstance(target, int) or isinstance(target, bool):
+            return _batch_op_error(
+                index, f"{BATCH_OP_TARGETS[op['op']]} must be an integer."
+            )
+
+    # Resolve every target up front — one query per kind, not one per op. A
+    # cell's row is shared with any row-addressed op on the same slot, so
+    # successive edits of one row act on one instance.
+    cells = {
+        cell.pk: cell
+        for cell in _live_cells(plan)
+        .filter(pk__in=[op["id"] for op in ops if op["op"] == "prescription_patch"])
+        .select_related("exercise_slot__session_slot")
+    }
+    slots = {
+        slot.pk: slot
+        for slot in _live_exercise_slots(plan)
+        .filter(pk__in=[op["slot_id"] for op in ops if "slot_id" in op])
+        .select_related("session_slot")
+    }
+    for cell in cells.values():
+        cell.exercise_slot = slots.setdefault(cell.exercise_slot_id, cell.exercise_slot)
+    weeks = {
+        week.pk: week
+        for week in Week.objects.filter(
+            pk__in=[
+                op["week_id"]
+                for op in ops
+                if op["op"] == "cell_line_write" and isinstance(op.get("week_id"), int)
+            ],
+            mesocycle__plan=plan,
+            deleted_at__isnull=True,
+        )
+    }
+
+    steps = []
+    names = {}  # row pk → its name as of the ops validated so far
+    for index, op in enumerate(ops):
+        kind = op["op"]
+        if kind == "prescription_patch":
+            cell = cells.get(op["id"])
+            if cell is None:
+                return _batch_op_error(index, "No such cell.")
+            current = names.get(cell.exercise_slot_id, cell.name)
+            updates, name_edit, error = _clean_cell_patch(op, current)
+            if error:
+                return _batch_op_error(index, error)
+            if name_edit is not None:
+                names[cell.exercise_slot_id] = name_edit
+            if updates or name_edit is not None:
+                steps.append((kind, cell.exercise_slot, (cell, updates, name_edit)))
+            continue
+        slot = slots.get(op["slot_id"])
+        if slot is None:
+            return _batch_op_error(index, "No such exercise row.")
+        if kind == "cell_line_write":
+            cleaned, error = _clean_cell_line(op)
+            if error:
+                return _batch_op_error(index, error)
+            week_id, line, text = cleaned
+            week = weeks.get(week_id)
+            if week is None or week.mesocycle_id != slot.session_slot.mesocycle_id:
+                return _batch_op_error(
+                    index, "week_id must be a live week of this block."
+                )
+            steps.append((kind, slot, (week, line, text)))
+        else:
+            updates, error = _clean_slot_patch(op)
+            if error:
+                return _batch_op_error(index, error)
+            if updates:
+                steps.append((kind, slot, updates))
+
+    touched = {}  # row pk → row, first-touched order
+    for _kind, slot, _args in steps:
+        touched.setdefault(slot.pk, slot)
+    if steps:
+        if len(touched) == 1:
+            [row] = touched.values()
+            label = f"Edited {row.name or 'exercise'}"
+        else:
+            label = f"Edited {len(touched)} exercises"
+        with transaction.atomic():
+            _reclaim_athlete_cells(
+                (slot.pk, args[0].pk, args[1])
+                for kind, slot, args in steps
+                if kind == "cell_line_write"
+            )
+            record_plan_action(plan, label, scope=delta_scope(rows=list(touched)))
+            for kind, slot, args in steps:
+                if kind == "prescription_patch":
+                    _apply_cell_patch(*args)
+                elif kind == "cell_line_write":
+                    _write_cell_line(slot, *args)
+                else:
+                    _apply_slot_patch(slot, args)
+            _touch_plan(plan)
+    if touched and _wants_grid_patch(request):
+        # A batch comes from one open grid, i.e. one block; patch that one.
+        first = next(iter(touched.values()))
+        block_id = first.session_slot.mesocycle_id
+        return _grid_patch_response(
+            plan,
+            first.session_slot.mesocycle,
+            rows=[
+                pk
+                for pk, slot in touched.items()
+                if slot.session_slot.mesocycle_id == block_id
+            ],
+            applied=len(steps),
+        )
+    return JsonResponse(
+        {
+            "ok": True,
+            "applied": len(steps),
+            "history": serialize_plan_history(plan),
+        }
+    )
+
+
 @login_required
 @require_POST
 def prescription_fill(request, plan_id, pk):
@@ -3506,7 +4212,11 @@ def prescription_fill(request, plan_id, pk):
     max_source_line = max(source_lines) if source_lines else 0
 
     with transaction.atomic():
-        record_plan_action(plan, f"Filled {cell.name} across weeks")
+        record_plan_action(
+            plan,
+            f"Filled {cell.name} across weeks",
+            scope=delta_scope(rows=[cell.exercise_slot_id]),
+        )
         for week in target_weeks:
             for line, text in source_lines.items():
                 target, _created = Prescription.objects.get_or_create(
@@ -3521,6 +4231,13 @@ def prescription_fill(request, plan_id, pk):
                 line__gt=max_source_line,
             ).exclude(text="").update(text="")
         _touch_plan(plan)
+    if _wants_grid_patch(request):
+        return _grid_patch_response(
+            plan,
+            cell.week.mesocycle,
+            rows=[cell.exercise_slot_id],
+            filled=len(target_weeks),
+        )
     return JsonResponse(
         {
             "ok": True,
@@ -3565,6 +4282,8 @@ def coach_set_one_rm(request, plan_id, pk):
         return HttpResponseBadRequest("value must be a positive number or blank.")
 
     row = meso_one_rm.set_manual_one_rm(plan.athlete, prescription, value, plan.unit)
+    # Repaints the athlete's session page and this week (``etags``) too.
+    meso_home_cache.bump(plan.athlete.pk)
     return JsonResponse(
         {
             "ok": True,
@@ -3616,15 +4335,9 @@ def plan_deliver(request, plan_id):
         return HttpResponseBadRequest("This plan has no week to deliver.")
     block = target_week.mesocycle
     now = timezone.now()
-    live_weeks = list(block.weeks.filter(deleted_at__isnull=True))
-    for week in live_weeks:
-        week.delivered_at = now
-        week.save(update_fields=["delivered_at"])
-        WeekDelivery.objects.create(
-            week=week, delivered_at=now, payload=serialize_week_snapshot(week)
-        )
+    week_count = meso_delivery.stamp_block(block, now)
     _touch_plan(plan)
-    _notify_athlete_block_delivered(request, plan, block, len(live_weeks))
+    _notify_athlete_block_delivered(request, plan, block, week_count)
     # #441 P3-5: the deliver step auto-advances the moment the coach delivers
     # their *own* self-link block — gated on the step's predicate so delivering
     # for another athlete they coach doesn't skip it. A no-op unless parked on
@@ -3635,44 +4348,12 @@ def plan_deliver(request, plan_id):
             "ok": True,
             "delivered_at": now.isoformat(),
             "mesocycle": {"id": block.pk, "name": block.name},
-            "week_count": len(live_weeks),
+            "week_count": week_count,
         },
         status=201,
     )
 
 
-def _target_week_for_batch_copy(copy, source_block):
-    """Map the coach's *viewed* block onto one just-duplicated batch copy.
-
-    remove-current-week-plan.md §2.6 FIX 1: before this branch,
-    ``Plan.duplicate_for`` mirrored ``is_current`` onto the copy, so
-    ``current_week(copy)`` inherited whichever block the coach had open on the
-    source plan. That mirror is gone, so left to its own default
-    ``current_week(copy)`` always resolves to the copy's FIRST live block —
-    a coach batch-delivering from block 2's deliver screen would silently
-    stamp + notify every recipient about block 1 instead, with no visible
-    signal.
-
-    ``duplicate_for`` preserves both ``mesocycle.order`` and week ``index``
-    verbatim (it deep-copies the whole live tree in ``order``/``index``
-    sequence onto fresh rows), so "the copy's block at the same ``order`` as
-    the block the coach was viewing" IS that block — just re-homed onto new
-    pks. Map by position, never by pk.
-
-    Returns the copy's matching block's first live week, or ``None`` when
-    there is no ``source_block`` (no explicit/valid ``week_id`` was posted) or
-    the copy has nothing at that ``order`` / that block has no live week of
-    its own. The latter shouldn't normally happen — ``duplicate_for`` mirrors
-    every block unconditionally — but a concurrent edit to the source plan
-    mid-batch is a real, if rare, race; callers degrade to
-    ``current_week(copy)`` rather than error.
-    """
-    if source_block is None:
-        return None
-    copy_block = copy.mesocycles.filter(order=source_block.order).first()
-    return first_live_week(copy_block)
-
-
 @login_required
 @require_POST
 def plan_batch_deliver(request, plan_id):
@@ -3684,8 +4365,9 @@ def plan_batch_deliver(request, plan_id):
     each gets their own ``Plan.duplicate_for`` copy — fully independent and
     live-editable per client from that moment on. Each copy's TARGET block —
     the one the coach was viewing on the source plan's deliver screen, see
-    ``_target_week_for_batch_copy`` — is stamped + snapshotted exactly like an
-    individual deliver (P3), and each athlete gets the one block-level nudge.
+    ``delivery.target_week_for_batch_copy`` — is stamped + snapshotted exactly
+    like an individual deliver (P3), and each athlete gets the one block-level
+    nudge.
 
     Form POST from the deliver screen (``relationships`` = checkbox ids, plus
     a hidden ``week_id`` mirroring ``deliver.week_id`` — the block the
@@ -3696,11 +4378,14 @@ def plan_batch_deliver(request, plan_id):
     presence in the POST is a stale/forged form, not a flow to
     error-message. ``week_id`` gets the same treatment: it must resolve to a
     live week of *this* plan or it's ignored (a foreign/other-plan id is a
-    stale/forged form too, never honoured) — see the resolution below. The
-    whole fan-out runs in one explicit ``transaction.atomic()``
-    (``ATOMIC_REQUESTS`` is inert in this deployment, and a half-delivered
-    batch would be worse than a clean retry); notifications ride
-    ``transaction.on_commit`` so a rollback never nudges.
+    stale/forged form too, never honoured) — see the resolution below.
+
+    The fan-out itself runs off the request thread: this view only records a
+    ``BatchDelivery`` with one ``BatchDeliveryTarget`` per client and queues
+    ``delivery.run_batch_delivery`` on the django-q cluster (a whole roster of
+    copies outran the gunicorn timeout). Each client's copy commits on its own,
+    so one failure doesn't undo the others; the deliver screen polls
+    ``batch_delivery_status`` for per-client progress.
     """
     plan, forbidden = _editable_plan_or_response(request, plan_id)
     if forbidden is not None:
@@ -3752,33 +4437,61 @@ def plan_batch_deliver(request, plan_id):
     if not targets:
         messages.error(request, "No deliverable clients in that selection.")
         return _back()
-    delivered_names = []
     with transaction.atomic():
-        for relationship in targets:
-            copy = plan.duplicate_for(relationship, status=Plan.Status.ACTIVE)
-            target_week = _target_week_for_batch_copy(
-                copy, source_block
-            ) or current_week(copy)
-            block = target_week.mesocycle
-            now = timezone.now()
-            live_weeks = list(block.weeks.filter(deleted_at__isnull=True))
-            for week in live_weeks:
-                week.delivered_at = now
-                week.save(update_fields=["delivered_at"])
-                WeekDelivery.objects.create(
-                    week=week,
-                    delivered_at=now,
-                    payload=serialize_week_snapshot(week),
-                )
-            _notify_athlete_block_delivered(request, copy, block, len(live_weeks))
-            delivered_names.append(relationship.athlete.display_name())
-    messages.success(
-        request,
-        f"Delivered an independent copy to {', '.join(delivered_names)}.",
-    )
+        batch = BatchDelivery.objects.create(
+            plan=plan,
+            coach=request.user,
+            source_block=source_block,
+            base_url=request.build_absolute_uri("/"),
+        )
+        BatchDeliveryTarget.objects.bulk_create(
+            [BatchDeliveryTarget(batch=batch, relationship=rel) for rel in targets]
+        )
+        meso_delivery.dispatch_batch_delivery(batch.pk)
+    names = ", ".join(rel.athlete.display_name() for rel in targets)
+    messages.success(request, f"Delivering an independent copy to {names}.")
     return _back()
 
 
+@login_required
+@require_GET
+def batch_delivery_status(request, batch_id):
+    """Poll a batch-deliver job: the batch's state plus one entry per client.
+
+    Scoped to a batch the requester started (404 otherwise). ``queued`` /
+    ``running`` while the job works; ``done`` once every client is resolved
+    (each ``delivered`` — with a link to their copy — or ``failed`` with the
+    reason); ``failed`` with ``error`` when the job itself couldn't run.
+    """
+    batch = get_object_or_404(BatchDelivery, pk=batch_id, coach=request.user)
+    targets = []
+    counts = dict.fromkeys(BatchDeliveryTarget.Status.values, 0)
+    for target in batch.targets.select_related("relationship__athlete"):
+        counts[target.status] += 1
+        entry = {
+            "relationship_id": target.relationship_id,
+            "name": target.relationship.athlete.display_name(),
+            "status": target.status,
+        }
+        if target.copy_id is not None:
+            entry["plan_url"] = reverse(
+                "meso:designer_plan", kwargs={"plan_id": target.copy_id}
+            )
+        if target.error:
+            entry["error"] = target.error
+        targets.append(entry)
+    data = {
+        "ok": True,
+        "status": batch.status,
+        "total": len(targets),
+        **counts,
+        "targets": targets,
+    }
+    if batch.error:
+        data["error"] = batch.error
+    return JsonResponse(data)
+
+
 @login_required
 @require_POST
 def template_use(request, plan_id):
@@ -3833,68 +4546,15 @@ def template_use(request, plan_id):
 
 
 def _notify_athlete_block_delivered(request, plan, mesocycle, week_count):
-    """Best-effort: ONE email + ONE push that a whole **block** was delivered.
-
-    The deliver nudge (P3; per-week notification retired with the 2d live+notify
-    model): the deliver path nudges about the whole mesocycle at once, so the
-    athlete gets a single "your new block is ready" heads-up — not one
-    notification per week. Sandbox-gated at the coach check, deferred
-    to ``transaction.on_commit`` (under ``ATOMIC_REQUESTS`` a rolled-back deliver
-    must not notify a false "your block is ready"), and each channel is
-    independently best-effort — a failure in one is swallowed and logged, never a
-    500 or a rolled-back deliver, and never blocks the other.
-
-    Sandbox gate (S4): a sandbox coach's deliveries never notify — there is no
-    real person behind a seeded demo athlete.
+    """The block-delivered email + push, linked back to this request's host.
+
+    See ``delivery.notify_block_delivered`` — sandbox-gated, deferred to
+    ``transaction.on_commit``, and best-effort per channel.
     """
-    if meso_sandbox.is_sandbox(plan.coach):
-        return
-    home_url = request.build_absolute_uri(reverse("meso:athlete_home"))
-    unsubscribe_url = request.build_absolute_uri(
-        reverse(
-            "meso:unsubscribe_delivery_email",
-            kwargs={"token": make_unsubscribe_token(plan.athlete)},
-        )
+    meso_delivery.notify_block_delivered(
+        plan, mesocycle, week_count, base_url=request.build_absolute_uri("/")
     )
 
-    def _send():
-        try:
-            # The athlete can opt out of delivery emails (the email's
-            # List-Unsubscribe link). Push is a separate, browser-opt-in channel
-            # and is never gated by the email opt-out.
-            if not athlete_opted_out(plan.athlete):
-                send_block_delivered_email(
-                    athlete=plan.athlete,
-                    coach=plan.coach,
-                    plan=plan,
-                    week_count=week_count,
-                    home_url=home_url,
-                    unsubscribe_url=unsubscribe_url,
-                )
-        except Exception:  # mail is best-effort; never fail a delivery on it
-            logger.exception(
-                "Failed to send block delivery email for plan %s mesocycle %s",
-                plan.pk,
-                mesocycle.pk,
-            )
-        try:
-            meso_push.notify_block_delivered(
-                athlete=plan.athlete,
-                coach=plan.coach,
-                plan=plan,
-                mesocycle=mesocycle,
-                week_count=week_count,
-                home_url=home_url,
-            )
-        except Exception:  # push is best-effort too; never fail a delivery on it
-            logger.exception(
-                "Failed to send block delivery push for plan %s mesocycle %s",
-                plan.pk,
-                mesocycle.pk,
-            )
-
-    transaction.on_commit(_send)
-
 
 @csrf_exempt
 def unsubscribe_delivery_email(request, token):
@@ -3922,9 +4582,10 @@ def unsubscribe_delivery_email(request, token):
 # Runs the Claude proposal engine for an owned plan and persists a reviewable
 # batch (the coach still approves at the review gate). Phase 4 runs it off the
 # request thread: the endpoint creates a ``drafting`` batch, dispatches the job,
-# and returns 202 + a ``status_url``; the frontend polls ``batch_status`` until
-# the batch resolves to ``pending`` (changes + review link) or ``failed`` (with
-# the reason). Returns 503 — before creating a batch — when no API key is
+# and returns 202 + a ``status_url`` / ``events_url``; the frontend waits on the
+# ``batch_events`` stream (falling back to polling ``batch_status``) until the
+# batch resolves to ``pending`` (changes + review link) or ``failed`` (with the
+# reason). Returns 503 — before creating a batch — when no API key is
 # configured, so the feature degrades cleanly in envs without creds.
 
 MAX_INSTRUCTION_LENGTH = 2000
@@ -4069,6 +4730,9 @@ def agent_propose(request, plan_id):
             "status_url": reverse(
                 "meso:api_batch_status", kwargs={"batch_id": batch.pk}
             ),
+            "events_url": reverse(
+                "meso:api_batch_events", kwargs={"batch_id": batch.pk}
+            ),
         },
         status=202,
     )
@@ -4082,8 +4746,15 @@ def batch_status(request, batch_id):
     Scoped to a batch the requester coaches (404 otherwise). ``drafting`` while
     the job runs; ``pending`` with the serialized changes + a review link once it
     lands; ``failed`` with the reason when the provider/run failed.
+
+    Conditional (``etags.proposal_batch_etag``): every poll while the job runs
+    is a 304 until the batch lands.
     """
     batch = _coach_batch_or_404(request, batch_id)
+    etag = meso_etags.proposal_batch_etag(batch)
+    not_modified = meso_etags.not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     data = {"ok": True, "status": batch.status, "summary": batch.summary}
     if batch.status == AgentProposalBatch.Status.FAILED:
         data["error"] = batch.error
@@ -4094,7 +4765,70 @@ def batch_status(request, batch_id):
             data["review_url"] = reverse(
                 "meso:review_batch", kwargs={"batch_id": batch.pk}
             )
-    return JsonResponse(data)
+    return meso_etags.tagged(JsonResponse(data), etag)
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@login_required
+@require_GET
+@transaction.non_atomic_requests
+def batch_events(request, batch_id):
+    """Stream a proposal batch's state as server-sent events until it resolves.
+
+    The push counterpart of ``batch_status``: one long-lived request per draft
+    instead of a poll every 1.5s. Scoped like it (404 otherwise). Sends a single
+    ``status`` event (``{"status": ...}``) once the batch leaves ``drafting`` —
+    at once if it already has — and closes; the client then reads the result
+    from ``batch_status``. While the run drafts it only writes a keep-alive
+    comment every ``MESO_AGENT_STREAM_HEARTBEAT`` seconds, and after
+    ``MESO_AGENT_STREAM_TIMEOUT`` it sends a ``timeout`` event and closes, so
+    the client falls back to polling.
+
+    Sleeps on ``agent.events`` between reads (a Postgres ``LISTEN`` the agent
+    service's ``NOTIFY`` wakes). Outside ``ATOMIC_REQUESTS``: notifications only
+    reach a session between transactions, and each re-read must see the run's
+    commit. A 503 when this worker already holds ``MESO_AGENT_STREAM_MAX``
+    streams; the client polls instead.
+    """
+    batch = _coach_batch_or_404(request, batch_id)
+    timeout = settings.MESO_AGENT_STREAM_TIMEOUT
+    heartbeat = settings.MESO_AGENT_STREAM_HEARTBEAT
+    drafting = AgentProposalBatch.Status.DRAFTING
+    current = AgentProposalBatch.objects.filter(pk=batch.pk).values_list(
+        "status", flat=True
+    )
+
+    def stream():
+        deadline = time.monotonic() + timeout
+        # Flush the headers through any proxy before the first wait.
+        yield ": drafting\n\n"
+        with agent_events.listening(batch.pk) as wait:
+            while True:
+                status = current.first()
+                if status != drafting:
+                    yield _sse("status", {"status": status})
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    yield _sse("timeout", {"status": status})
+                    return
+                if not wait(min(remaining, heartbeat)):
+                    yield ": keep-alive\n\n"
+
+    slotted = agent_events.claim_slot(stream())
+    if slotted is None:
+        return JsonResponse(
+            {"ok": False, "error": "Too many open status streams; poll instead."},
+            status=503,
+        )
+    response = StreamingHttpResponse(slotted, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Tell an nginx in front not to buffer the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
 
 
 # -- review gate: approve/reject + apply (agent slice Phase 2 — B6) --------
@@ -4538,6 +5272,25 @@ class DeliverView(LoginRequiredMixin, TemplateView):
             .select_related("athlete")
             .order_by("athlete__name", "athlete__email")
         ]
+        # A batch-deliver still queued/running (the coach was just redirected
+        # back from ``plan_batch_deliver``): the screen polls its progress.
+        batch = (
+            BatchDelivery.objects.filter(
+                plan=plan,
+                coach=self.request.user,
+                status__in=[
+                    BatchDelivery.Status.QUEUED,
+                    BatchDelivery.Status.RUNNING,
+                ],
+            )
+            .only("pk")
+            .first()
+        )
+        ctx["batch_delivery_status_url"] = (
+            reverse("meso:api_batch_delivery_status", kwargs={"batch_id": batch.pk})
+            if batch is not None
+            else None
+        )
         return ctx
 
     def _target_week(self, plan):
@@ -4586,5 +5339,5 @@ class ResultsView(LoginRequiredMixin, TemplateView):
         ctx = super().get_context_data(**kwargs)
         session = _coach_session_or_404(self.request.user, kwargs["session_id"])
         ctx["active"] = "roster"
-        ctx.update(presenters.session_results(session))
+        ctx.update(meso_results_cache.session_results(session))
         return ctx
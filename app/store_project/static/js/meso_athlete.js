@@ -70,6 +70,28 @@ function notifyTourRefresh() {
   }
 }
 
+// A fresh idempotency key for a queued save. `crypto.randomUUID` is missing
+// outside a secure context (a LAN dev server), where a random string will do.
+function newSyncKey() {
+  if (typeof crypto !== "undefined" && typeof crypto.randomUUID === "function") {
+    return crypto.randomUUID();
+  }
+  return Date.now().toString(36) + "-" + Math.random().toString(36).slice(2);
+}
+
+// A queued save in the bulk sync's shape. An item stashed before the sync
+// endpoint existed is just `{url, body}`: its session id is read off the log
+// URL (api/me/session/<id>/log/) and it gets a key on its first flush.
+function syncItem(item) {
+  if (item.key && item.session != null) return item;
+  const match = /\/session\/(\d+)\/log\/?$/.exec(item.url || "");
+  return {
+    ...item,
+    key: item.key || newSyncKey(),
+    session: item.session != null ? item.session : match && Number(match[1]),
+  };
+}
+
 // The athlete's freeform sub-line stack per exercise is capped at this many
 // lines (matches the server's MAX_CELL_LINE) so `addLine` can't fabricate an
 // unbounded stack.
@@ -78,6 +100,8 @@ const MAX_CELL_LINE = 20;
 function createLogger() {
   return {
     logUrl: "",
+    syncUrl: "", // where the offline queue is flushed in one request (the bulk sync)
+    sessionId: null,
     oneRmUrl: "", // where a manually-entered 1RM is persisted server-side (Phase 2)
     cellUrl: "", // where the athlete's freeform sub-line cells are upserted (Phase 4a)
     csrf: "",
@@ -102,6 +126,8 @@ function createLogger() {
         return;
       }
       this.logUrl = data.log_url;
+      this.syncUrl = data.sync_url || "";
+      this.sessionId = data.session;
       this.oneRmUrl = data.one_rm_url || "";
       this.cellUrl = data.cell_url || "";
       this.status = data.status;
@@ -294,7 +320,10 @@ function createLogger() {
     // ---- offline queue (S7) ----
     // A tiny localStorage-backed outbox keyed by the session's log URL: one
     // pending save per session (the latest supersedes an earlier queued one), so
-    // replaying after reconnect can't pile up duplicate writes.
+    // replaying after reconnect can't pile up duplicate writes. Each item carries
+    // its session id and a fresh idempotency key: the whole queue is flushed in
+    // one POST to the bulk sync endpoint, which answers a key it already applied
+    // as a duplicate rather than replaying a stale save over a newer one.
     queueKey: "meso-log-queue",
 
     readQueue() {
@@ -315,52 +344,74 @@ function createLogger() {
 
     enqueue(payload) {
       const queue = this.readQueue().filter((item) => item.url !== this.logUrl);
-      queue.push({ url: this.logUrl, body: payload });
+      queue.push({
+        key: newSyncKey(),
+        session: this.sessionId,
+        url: this.logUrl,
+        body: payload,
+      });
       this.writeQueue(queue);
     },
 
-    // Replay queued saves. Items that still fail (offline, or the server errored)
-    // stay queued for the next attempt. Uses the live CSRF token, never a stale
-    // stored one.
+    // Replay queued saves, all of them in one sync request. Nothing is dropped
+    // unless the server answered for it: an item it applied (or already had) is
+    // done, one it rejected would fail the same way forever. On a network error,
+    // a bounce to login or a server error the whole queue stays for the next
+    // attempt. Uses the live CSRF token, never a stale stored one.
     async flushQueue() {
-      const queue = this.readQueue();
-      if (!queue.length) return;
-      const remaining = [];
+      const queue = this.readQueue().map(syncItem);
+      if (!queue.length || !this.syncUrl) return;
+      // Persist the keys first, so a retry (and the re-read below) reuses them.
+      this.writeQueue(queue);
+      let res;
+      try {
+        res = await fetch(this.syncUrl, {
+          method: "POST",
+          headers: {
+            "Content-Type": "application/json",
+            "X-CSRFToken": this.csrf,
+          },
+          body: JSON.stringify({
+            logs: queue.map((item) => ({
+              ...item.body,
+              key: item.key,
+              session: item.session,
+            })),
+          }),
+        });
+      } catch (netErr) {
+        return; // still offline — keep it all for next time
+      }
+      // A redirect means we were bounced to login (expired session); res.ok is
+      // true for the login HTML but nothing was saved — keep it all queued so a
+      // real re-login + flush delivers it instead of dropping the workout.
+      let data;
+      try {
+        if (res.redirected || !res.ok) throw new Error("Sync failed: " + res.status);
+        data = await res.json();
+      } catch (e) {
+        return;
+      }
+      const answered = new Set();
       let flushedMine = false;
-      for (const item of queue) {
-        let res;
-        try {
-          res = await fetch(item.url, {
-            method: "POST",
-            headers: {
-              "Content-Type": "application/json",
-              "X-CSRFToken": this.csrf,
-            },
-            body: JSON.stringify(item.body),
-          });
-        } catch (netErr) {
-          remaining.push(item); // still offline — keep it for next time
+      for (const result of data.results || []) {
+        answered.add(result.key);
+        if (!result.ok) {
+          console.error("Queued log rejected", result.error);
           continue;
         }
-        // A redirect means we were bounced to login (expired session); res.ok is
-        // true for the login HTML but the log was never saved — keep it queued
-        // so a real re-login + flush delivers it instead of dropping the workout.
-        if (res.redirected || !res.ok) {
-          remaining.push(item);
+        if (result.session !== this.sessionId || result.superseded || !result.log) {
           continue;
         }
-        if (item.url === this.logUrl) {
-          try {
-            const data = await res.json();
-            this.status = data.log.status;
-            this.syncFromLog(data.log);
-            this.newRecords = data.new_records || []; // a PR beaten offline still lands
-            flushedMine = true;
-          } catch (e) {
-            /* synced server-side regardless; UI reconciles on next load */
-          }
-        }
+        this.status = result.log.status;
+        this.syncFromLog(result.log);
+        this.newRecords = result.new_records || []; // a PR beaten offline still lands
+        flushedMine = true;
       }
+      // Re-read: a save queued while the sync was in flight must survive it.
+      const remaining = this.readQueue()
+        .map(syncItem)
+        .filter((item) => !answered.has(item.key));
       this.writeQueue(remaining);
       // If this session's queued save went through, clear the "will sync" hint.
       if (flushedMine && !remaining.some((i) => i.url === this.logUrl)) {
@@ -2,7 +2,8 @@
  * (stamp the target week + snapshot). `weekId` is the week the screen targets
  * (the current week, or the ?week= the coach picked); sending it lets a coach
  * deliver a built-ahead week without first making it current. Scheduling and
- * push/email notifications arrive with the athlete app.
+ * push/email notifications arrive with the athlete app. A batch-deliver in
+ * flight (`batchStatusUrl`) is polled for per-client progress.
  */
 // Issue #451: after a fetch action that can auto-advance the guided tour
 // server-side (delivering the coach's own self-link block), nudge the
@@ -20,7 +21,12 @@ function notifyTourRefresh() {
   }
 }
 
-function createMesoDeliver(planId, csrf, weekId) {
+// Batch-deliver runs as a queued job: the screen the coach is redirected back
+// to polls the batch's status endpoint until every client is resolved.
+const BATCH_POLL_MS = 2000;
+const BATCH_ACTIVE = ["queued", "running"];
+
+function createMesoDeliver(planId, csrf, weekId, batchStatusUrl = null) {
   return {
     planId: planId,
     csrf: csrf,
@@ -28,6 +34,37 @@ function createMesoDeliver(planId, csrf, weekId) {
     delivered: false,
     sending: false,
     error: false,
+    // The in-flight batch delivery's status URL (null when there is none) and
+    // its latest polled payload: {status, total, delivered, failed, pending,
+    // targets: [{name, status, plan_url?, error?}]}.
+    batchStatusUrl: batchStatusUrl,
+    batch: null,
+    batchError: false,
+    init() {
+      if (this.batchStatusUrl) this.pollBatch();
+    },
+    get batchActive() {
+      return this.batch == null || BATCH_ACTIVE.includes(this.batch.status);
+    },
+    // Fetch the batch's progress once, and schedule the next poll while the
+    // job is still queued/running. A failed poll stops polling (the flash
+    // already told the coach the copies are on their way).
+    async pollBatch() {
+      try {
+        const res = await fetch(this.batchStatusUrl, {
+          headers: { Accept: "application/json" },
+        });
+        if (!res.ok) throw new Error("Request failed: " + res.status);
+        this.batch = await res.json();
+      } catch (e) {
+        this.batchError = true;
+        console.error("Batch delivery status failed", e);
+        return;
+      }
+      if (this.batchActive) {
+        setTimeout(() => this.pollBatch(), BATCH_POLL_MS);
+      }
+    },
     async deliver() {
       this.sending = true;
       this.error = false;
@@ -71,5 +108,5 @@ if (
 // Test hook: expose the factory to Node-based runners (vitest). Skipped in the
 // browser, where `module` is undefined.
 if (typeof module !== "undefined" && module.exports) {
-  module.exports = { createMesoDeliver };
+  module.exports = { createMesoDeliver, BATCH_POLL_MS };
 }
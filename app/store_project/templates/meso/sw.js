@@ -8,10 +8,13 @@
  *       * navigations (HTML): network-first, falling back to the last-good
  *         cached page for that URL, then to the offline page. This is what lets
  *         the athlete re-open a session they viewed online and keep logging when
- *         the gym wifi drops.
+ *         the gym wifi drops. A cached page with an ETag (the athlete home, a
+ *         session page) is revalidated with If-None-Match, and a 304 serves the
+ *         cached copy.
  *       * same-origin static GETs: stale-while-revalidate from the cache.
  *       * POSTs (logging): never intercepted — the page's own offline queue owns
- *         writes (more reliable on iOS than the Background Sync API).
+ *         writes (more reliable on iOS than the Background Sync API) and flushes
+ *         them in one request to the bulk log sync (api/me/logs/sync/).
  *   - push / notificationclick: render + route delivery notifications (S3).
  */
 
@@ -57,6 +60,19 @@ function isNavigation(request) {
   );
 }
 
+// Fetch a navigation, conditionally when our cached copy carries an ETag: a
+// page that hasn't changed comes back as a bodiless 304 (cheap over a flaky gym
+// connection) and the caller serves the copy. A navigate-mode Request can't
+// take extra headers, so the conditional fetch is rebuilt from the URL.
+function revalidate(request, cached) {
+  const etag = cached && cached.headers.get("ETag");
+  if (!etag) return fetch(request);
+  return fetch(request.url, {
+    credentials: "same-origin",
+    headers: { "If-None-Match": etag },
+  });
+}
+
 self.addEventListener("fetch", (event) => {
   const { request } = event;
 
@@ -75,23 +91,25 @@ self.addEventListener("fetch", (event) => {
       return;
     }
     event.respondWith(
-      fetch(request)
-        .then((response) => {
-          // Cache a copy of the rendered page so it re-opens offline next time —
-          // but only a genuine 200. After the session expires the fetch follows
-          // the login redirect; caching that would overwrite the last-good
-          // athlete page with a login screen, breaking offline reopen.
-          if (response.ok && !response.redirected) {
-            const copy = response.clone();
-            caches.open(CACHE).then((cache) => cache.put(request, copy));
-          }
-          return response;
-        })
-        .catch(() =>
-          caches
-            .match(request)
-            .then((cached) => cached || caches.match(OFFLINE_URL)),
-        ),
+      caches.match(request).then((cached) =>
+        revalidate(request, cached)
+          .then((response) => {
+            // The server says our copy is still current (the home's and session
+            // pages' ETags — see meso/home_cache.py and meso/etags.py): serve
+            // it, no body crossed the wire.
+            if (response.status === 304 && cached) return cached;
+            // Cache a copy of the rendered page so it re-opens offline next time —
+            // but only a genuine 200. After the session expires the fetch follows
+            // the login redirect; caching that would overwrite the last-good
+            // athlete page with a login screen, breaking offline reopen.
+            if (response.ok && !response.redirected) {
+              const copy = response.clone();
+              caches.open(CACHE).then((cache) => cache.put(request, copy));
+            }
+            return response;
+          })
+          .catch(() => cached || caches.match(OFFLINE_URL)),
+      ),
     );
     return;
   }
@@ -264,9 +264,10 @@ describe("table view (issue #455 phase A5: the only view left besides periodizat
 });
 
 // Phase 2a text-first wiring: the ghost sub-line input routes through
-// gridState.writeCellLine (POST row/<slot>/cell/) and a row-column edit
-// through gridState.patchRowColumns (POST row/<slot>/) — pinned here because
-// MesoTable only reaches those verbs through DesignerRoot's wiring.
+// gridState.writeCellLine (a `cell_line_write` op) and a row-column edit
+// through gridState.patchRowColumns (an `exercise_slot_patch` op), both sent
+// in the debounced batch/ POST — pinned here because MesoTable only reaches
+// those verbs through DesignerRoot's wiring.
 describe("Phase 2a: sub-line + row-column wiring", () => {
   function mountIsland() {
     jsonScript("meso-grid-data", gridPayload());
@@ -279,30 +280,34 @@ describe("Phase 2a: sub-line + row-column wiring", () => {
     return fetchMock;
   }
 
-  it("committing the ghost sub-line input POSTs {week_id, line, text} to row/<slot>/cell/", async () => {
+  it("committing the ghost sub-line input batches a {slot_id, week_id, line, text} write", async () => {
     const user = userEvent.setup();
     const fetchMock = mountIsland();
 
     await user.type(screen.getByTestId("cell-line-new-100"), "RPE 8");
     await user.tab();
 
-    await waitFor(() => expect(fetchMock).toHaveBeenCalledWith("/meso/api/plan/7/row/9/cell/", expect.anything()));
-    const call = fetchMock.mock.calls.find((c) => c[0] === "/meso/api/plan/7/row/9/cell/")!;
-    expect(JSON.parse((call[1] as RequestInit).body as string)).toEqual({ week_id: 1, line: 1, text: "RPE 8" });
+    await waitFor(() => expect(fetchMock).toHaveBeenCalledWith("/meso/api/plan/7/batch/", expect.anything()));
+    const call = fetchMock.mock.calls.find((c) => c[0] === "/meso/api/plan/7/batch/")!;
+    expect(JSON.parse((call[1] as RequestInit).body as string)).toEqual({
+      ops: [{ op: "cell_line_write", slot_id: 9, week_id: 1, line: 1, text: "RPE 8" }],
+    });
     // The optimistic repaint promotes the ghost's text to a real sub-line input.
     expect(screen.getByTestId("cell-line-100-1")).toHaveValue("RPE 8");
   });
 
-  it("committing a Tempo edit POSTs the partial patch to row/<slot>/", async () => {
+  it("committing a Tempo edit batches the partial row patch", async () => {
     const user = userEvent.setup();
     const fetchMock = mountIsland();
 
     await user.type(screen.getByTestId("row-tempo-9"), "31X1");
     await user.tab();
 
-    await waitFor(() => expect(fetchMock).toHaveBeenCalledWith("/meso/api/plan/7/row/9/", expect.anything()));
-    const call = fetchMock.mock.calls.find((c) => c[0] === "/meso/api/plan/7/row/9/")!;
-    expect(JSON.parse((call[1] as RequestInit).body as string)).toEqual({ tempo: "31X1" });
+    await waitFor(() => expect(fetchMock).toHaveBeenCalledWith("/meso/api/plan/7/batch/", expect.anything()));
+    const call = fetchMock.mock.calls.find((c) => c[0] === "/meso/api/plan/7/batch/")!;
+    expect(JSON.parse((call[1] as RequestInit).body as string)).toEqual({
+      ops: [{ op: "exercise_slot_patch", slot_id: 9, tempo: "31X1" }],
+    });
   });
 });
 
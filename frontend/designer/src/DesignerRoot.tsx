@@ -48,6 +48,7 @@ interface Hydrated {
   gridData: MesoGrid;
   initialMessages: ChatMessage[];
   initialResumeUrl: string | null;
+  initialResumeEventsUrl: string | null;
   flags: DesignerFlags;
 }
 
@@ -87,16 +88,18 @@ function readHydration(): Hydrated | null {
 
   let initialMessages: ChatMessage[] = [DEFAULT_GREETING];
   let initialResumeUrl: string | null = null;
+  let initialResumeEventsUrl: string | null = null;
   const threadEl = document.getElementById("meso-chat-thread");
   if (threadEl) {
     try {
-      const thread = JSON.parse(threadEl.textContent || "") as (ChatMessage & { pollUrl?: string })[];
+      const thread = JSON.parse(threadEl.textContent || "") as (ChatMessage & { pollUrl?: string; eventsUrl?: string })[];
       if (Array.isArray(thread) && thread.length) {
         const messages = [...thread];
         const last = messages[messages.length - 1];
         if (last && last.pollUrl) {
           messages.pop();
           initialResumeUrl = last.pollUrl;
+          initialResumeEventsUrl = last.eventsUrl ?? null;
         }
         initialMessages = messages;
       }
@@ -125,6 +128,7 @@ function readHydration(): Hydrated | null {
     gridData,
     initialMessages,
     initialResumeUrl,
+    initialResumeEventsUrl,
     flags,
   };
 }
@@ -174,6 +178,7 @@ export function DesignerRoot() {
     mesocycleId,
     initialMessages: hydrated?.initialMessages ?? [DEFAULT_GREETING],
     initialResumeUrl: hydrated?.initialResumeUrl ?? null,
+    initialResumeEventsUrl: hydrated?.initialResumeEventsUrl ?? null,
   });
   const coachmarks = useCoachmarks();
 
@@ -30,6 +30,8 @@ export interface UseAgentChatOptions {
   mesocycleId: Id;
   initialMessages: ChatMessage[];
   initialResumeUrl: string | null;
+  /** The resumed batch's status stream, waited on before polling initialResumeUrl. */
+  initialResumeEventsUrl?: string | null;
 }
 
 // Each chip's label is sent verbatim as the agent instruction.
@@ -41,7 +43,8 @@ const CHIPS: { label: string }[] = [
 ];
 
 export function useAgentChat(options: UseAgentChatOptions) {
-  const { planId, csrf, mesocycleId, initialMessages, initialResumeUrl } = options;
+  const { planId, csrf, mesocycleId, initialMessages, initialResumeUrl, initialResumeEventsUrl } =
+    options;
 
   const [messages, setMessages] = useState<ChatMessage[]>(initialMessages);
   const [inputText, setInputText] = useState("");
@@ -90,7 +93,7 @@ export function useAgentChat(options: UseAgentChatOptions) {
           pushAgent({ text: agentErrorText(res.status, data), error: true });
           return;
         }
-        await pollBatch(data.status_url, { onMessage: pushAgent });
+        await pollBatch(data.status_url, { eventsUrl: data.events_url, onMessage: pushAgent });
       } catch (err) {
         console.error("Agent request failed", err);
         pushAgent({
@@ -147,6 +150,7 @@ export function useAgentChat(options: UseAgentChatOptions) {
       setAgentTyping(true);
       try {
         await pollBatch(initialResumeUrl, {
+          eventsUrl: initialResumeEventsUrl,
           onMessage: (msg) => {
             if (!cancelled) pushAgent(msg);
           },
@@ -1,13 +1,14 @@
 // Specs for useGrid (P1 multi-week table) — a self-contained state-owning
 // hook for MesoTable. Cell edits (patchCell/renameExercise) are optimistic +
 // fire-and-forget, mirroring useAutosave's semantics (CONTRACT.md
-// "useAutosave") — no rollback on failure. Structural verbs (add/remove
+// "useAutosave") — no rollback on failure — and debounced into one batch/
+// POST (`flushEdits` sends the queue now). Structural verbs (add/remove
 // day|week|exercise, undo/redo) POST then refetch the whole grid (GET
 // grid/), mirroring usePlanData/useReorder's ref-guard idiom so concurrent
 // structural ops can't race.
 import { act, renderHook, waitFor } from "@testing-library/react";
-import { useGrid } from "./useGrid";
-import type { GridCell, GridDay, GridRow, GridWeek, MesoGrid } from "../lib/api";
+import { EDIT_BATCH_DEBOUNCE_MS, EDIT_BATCH_MAX_WAIT_MS, useGrid } from "./useGrid";
+import type { GridCell, GridDay, GridPatch, GridRow, GridWeek, MesoGrid } from "../lib/api";
 
 function week(overrides: Partial<GridWeek> = {}): GridWeek {
   return {
@@ -116,13 +117,17 @@ describe("patchCell", () => {
       result.current.patchCell(100, { text: "4 x 6, RPE 9" });
     });
 
-    // Optimistic: reflected immediately, before the fetch resolves.
+    // Optimistic: reflected immediately — the POST waits for the debounce.
     expect(result.current.grid?.days[0]?.rows[0]?.cells["1"]?.text).toBe("4 x 6, RPE 9");
+    expect(globalThis.fetch).not.toHaveBeenCalled();
+    await act(async () => {
+      await result.current.flushEdits();
+    });
     expect(globalThis.fetch).toHaveBeenCalledTimes(1);
     const [url, opts] = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls[0]!;
-    expect(url).toBe("/meso/api/plan/7/prescription/100/");
+    expect(url).toBe("/meso/api/plan/7/batch/");
     expect(opts.method).toBe("POST");
-    expect(sentBody()).toEqual({ text: "4 x 6, RPE 9" });
+    expect(sentBody()).toEqual({ ops: [{ op: "prescription_patch", id: 100, text: "4 x 6, RPE 9" }] });
 
     await waitFor(() => expect(result.current.history.can_undo).toBe(true));
     expect(result.current.history.undo_label).toBe("Edited Squat");
@@ -202,9 +207,14 @@ describe("renameExercise", () => {
     });
 
     expect(result.current.grid?.days[0]?.rows[0]?.name).toBe("Front Squat");
+    await act(async () => {
+      await result.current.flushEdits();
+    });
     const [url, opts] = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls[0]!;
-    expect(url).toBe("/meso/api/plan/7/prescription/100/"); // week[0]'s cell
-    expect(JSON.parse(opts.body as string)).toEqual({ name: "Front Squat" });
+    expect(url).toBe("/meso/api/plan/7/batch/");
+    expect(JSON.parse(opts.body as string)).toEqual({
+      ops: [{ op: "prescription_patch", id: 100, name: "Front Squat" }], // week[0]'s cell
+    });
     await waitFor(() => expect(result.current.history.undo_label).toBe("Renamed Squat"));
   });
 });
@@ -226,10 +236,13 @@ describe("writeCellLine", () => {
 
     // Optimistic: the sub-line appears immediately, before the fetch resolves.
     expect(result.current.grid?.days[0]?.rows[0]?.cells["1"]?.lines).toEqual([{ line: 1, text: "RPE 8" }]);
+    await act(async () => {
+      await result.current.flushEdits();
+    });
     const [url, opts] = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls[0]!;
-    expect(url).toBe("/meso/api/plan/7/row/9/cell/");
+    expect(url).toBe("/meso/api/plan/7/batch/");
     expect(opts.method).toBe("POST");
-    expect(sentBody()).toEqual({ week_id: 1, line: 1, text: "RPE 8" });
+    expect(sentBody()).toEqual({ ops: [{ op: "cell_line_write", slot_id: 9, week_id: 1, line: 1, text: "RPE 8" }] });
     await waitFor(() => expect(result.current.history.undo_label).toBe("Edited Squat"));
   });
 
@@ -284,7 +297,7 @@ describe("writeCellLine", () => {
     ]);
   });
 
-  it("line 0 updates cell.text locally (the prescription line, no sub-line entry)", () => {
+  it("line 0 updates cell.text locally (the prescription line, no sub-line entry)", async () => {
     const { result } = setup();
     globalThis.fetch = vi.fn().mockResolvedValue(res({ ok: true })) as unknown as typeof fetch;
 
@@ -294,7 +307,10 @@ describe("writeCellLine", () => {
 
     expect(result.current.grid?.days[0]?.rows[0]?.cells["1"]?.text).toBe("4 x 6");
     expect(result.current.grid?.days[0]?.rows[0]?.cells["1"]?.lines).toEqual([]);
-    expect(sentBody()).toEqual({ week_id: 1, line: 0, text: "4 x 6" });
+    await act(async () => {
+      await result.current.flushEdits();
+    });
+    expect(sentBody().ops).toEqual([{ op: "cell_line_write", slot_id: 9, week_id: 1, line: 0, text: "4 x 6" }]);
   });
 
   it("console.errors on failure without rolling back the optimistic update", async () => {
@@ -323,10 +339,13 @@ describe("patchRowColumns", () => {
     });
 
     expect(result.current.grid?.days[0]?.rows[0]?.tempo).toBe("31X1");
+    await act(async () => {
+      await result.current.flushEdits();
+    });
     const [url, opts] = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls[0]!;
-    expect(url).toBe("/meso/api/plan/7/row/9/");
+    expect(url).toBe("/meso/api/plan/7/batch/");
     expect(opts.method).toBe("POST");
-    expect(sentBody()).toEqual({ tempo: "31X1" });
+    expect(sentBody()).toEqual({ ops: [{ op: "exercise_slot_patch", slot_id: 9, tempo: "31X1" }] });
     await waitFor(() => expect(result.current.history.undo_label).toBe("Edited Squat"));
   });
 
@@ -811,7 +830,7 @@ describe("fillAcrossWeeks", () => {
   it("flushes a pending cell autosave before POSTing fill/, so fill never races a stale value to the server", async () => {
     // Codex P2: fill/ makes the server copy the source cell's ALREADY-STORED
     // DB values to sibling weeks. If a coach edits then immediately fills,
-    // fill must wait for the edit's autosave POST to land first.
+    // fill must send the queued edit and wait for it to land first.
     const { result } = setup();
     let resolvePatch!: (v: unknown) => void;
     const fetchMock = vi.fn();
@@ -823,20 +842,19 @@ describe("fillAcrossWeeks", () => {
     );
     globalThis.fetch = fetchMock as unknown as typeof fetch;
 
-    // Kick off the cell autosave (fire-and-forget) — its POST is now in flight.
+    // Queue the cell autosave (fire-and-forget) — still inside the debounce.
     act(() => {
       result.current.patchCell(100, { text: "4 x 5" });
     });
-    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock).not.toHaveBeenCalled();
 
-    // Trigger fill while the autosave is still unresolved.
+    // Trigger fill: it sends the queued edit at once, then blocks on it.
     let fillDone!: Promise<void>;
     act(() => {
       fillDone = result.current.fillAcrossWeeks(100);
     });
 
-    // fill is blocked on flushPendingWrites() — the fill/ POST must NOT have
-    // been sent yet, even though fillAcrossWeeks has already been called.
+    // The batch is in flight; the fill/ POST must NOT have been sent yet.
     expect(fetchMock).toHaveBeenCalledTimes(1);
 
     // Now let the pending autosave land, queuing up fill's own POST + refetch.
@@ -849,12 +867,127 @@ describe("fillAcrossWeeks", () => {
     });
 
     expect(fetchMock).toHaveBeenCalledTimes(3);
-    expect(fetchMock.mock.calls[0]![0]).toBe("/meso/api/plan/7/prescription/100/"); // the autosave
+    expect(fetchMock.mock.calls[0]![0]).toBe("/meso/api/plan/7/batch/"); // the autosave
     expect(fetchMock.mock.calls[1]![0]).toBe("/meso/api/plan/7/prescription/100/fill/"); // fill only after
     expect(fetchMock.mock.calls[2]![0]).toBe("/meso/api/plan/7/grid/"); // then the refetch
   });
 });
 
+describe("edit batching", () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  function twoRowGrid() {
+    return grid({
+      weeks: [week({ id: 1 }), week({ id: 2, label: "Wk 2" })],
+      days: [
+        day({
+          rows: [
+            row({
+              exercise_slot_id: 9,
+              cells: { "1": cell({ prescription_id: 100 }), "2": cell({ prescription_id: 101 }) },
+            }),
+            row({ exercise_slot_id: 10, cells: { "1": cell({ prescription_id: 200 }) } }),
+          ],
+        }),
+      ],
+    });
+  }
+
+  it("sends a burst of edits as ONE batch/ POST once the coach pauses, coalescing per target", async () => {
+    vi.useFakeTimers();
+    const { result } = setup(twoRowGrid());
+    const fetchMock = vi.fn().mockResolvedValue(res({ ok: true, applied: 4 }));
+    globalThis.fetch = fetchMock as unknown as typeof fetch;
+
+    act(() => {
+      result.current.patchCell(100, { text: "4 x 5" });
+      result.current.patchCell(200, { text: "3 x 8" });
+      result.current.patchCell(100, { text: "4 x 6" });
+      result.current.renameExercise(9, "Front Squat");
+      result.current.patchRowColumns(10, { tempo: "3010" });
+      result.current.patchRowColumns(10, { rest: "2 min" });
+      result.current.writeCellLine(9, 2, 1, "RPE 8");
+      result.current.writeCellLine(9, 2, 1, "RPE 9");
+    });
+    act(() => {
+      vi.advanceTimersByTime(EDIT_BATCH_DEBOUNCE_MS - 1);
+    });
+    expect(fetchMock).not.toHaveBeenCalled();
+
+    await act(async () => {
+      vi.advanceTimersByTime(1);
+    });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock.mock.calls[0]![0]).toBe("/meso/api/plan/7/batch/");
+    // First-edit order; the last value typed into each target wins.
+    expect(sentBody().ops).toEqual([
+      { op: "prescription_patch", id: 100, text: "4 x 6", name: "Front Squat" },
+      { op: "prescription_patch", id: 200, text: "3 x 8" },
+      { op: "exercise_slot_patch", slot_id: 10, tempo: "3010", rest: "2 min" },
+      { op: "cell_line_write", slot_id: 9, week_id: 2, line: 1, text: "RPE 9" },
+    ]);
+  });
+
+  it("each edit restarts the debounce, but a queued edit never waits past the max wait", async () => {
+    vi.useFakeTimers();
+    const { result } = setup();
+    const fetchMock = vi.fn().mockResolvedValue(res({ ok: true }));
+    globalThis.fetch = fetchMock as unknown as typeof fetch;
+
+    const step = EDIT_BATCH_DEBOUNCE_MS / 2;
+    let elapsed = 0;
+    while (elapsed + step < EDIT_BATCH_MAX_WAIT_MS) {
+      act(() => {
+        result.current.patchCell(100, { text: `${elapsed}` });
+        vi.advanceTimersByTime(step);
+      });
+      elapsed += step;
+    }
+    expect(fetchMock).not.toHaveBeenCalled();
+
+    await act(async () => {
+      vi.advanceTimersByTime(EDIT_BATCH_MAX_WAIT_MS - elapsed);
+    });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it("a structural verb sends queued edits before its own POST", async () => {
+    const { result } = setup();
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(res({ ok: true })) // the batch
+      .mockResolvedValueOnce(res({ ok: true })) // the delete (no patch -> refetch)
+      .mockResolvedValueOnce(res({ ok: true, ...grid() })); // refetch
+    globalThis.fetch = fetchMock as unknown as typeof fetch;
+
+    act(() => {
+      result.current.patchCell(100, { text: "5 x 5" });
+    });
+    await act(async () => {
+      await result.current.removeExercise(9);
+    });
+
+    expect(fetchMock.mock.calls[0]![0]).toBe("/meso/api/plan/7/batch/");
+    expect(fetchMock.mock.calls[1]![0]).toBe("/meso/api/plan/7/prescription/100/delete/");
+  });
+
+  it("sends queued edits when the designer unmounts", () => {
+    const { result, unmount } = setup();
+    const fetchMock = vi.fn().mockResolvedValue(res({ ok: true }));
+    globalThis.fetch = fetchMock as unknown as typeof fetch;
+
+    act(() => {
+      result.current.patchRowColumns(9, { note: "brace" });
+    });
+    unmount();
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(sentBody().ops).toEqual([{ op: "exercise_slot_patch", slot_id: 9, note: "brace" }]);
+  });
+});
+
 describe("addExerciseThisWeek", () => {
   it("POSTs {week_id} to session/{sessionId}/exercise/, then refetches the grid", async () => {
     const initial = grid();
@@ -945,3 +1078,71 @@ describe("concurrency guard covers the new P2 verbs", () => {
     expect(result.current.busy).toBe(false);
   });
 });
+
+describe("patch-response mode", () => {
+  function patch(overrides: Partial<GridPatch> = {}): GridPatch {
+    return {
+      version: 4,
+      mesocycle_id: 1,
+      days: [],
+      rows: [],
+      removed_days: [],
+      removed_rows: [],
+      ...overrides,
+    };
+  }
+
+  const history = { can_undo: true, can_redo: false, undo_label: "Skipped Squat", redo_label: null };
+
+  it("asks for a patch and merges it instead of refetching the grid", async () => {
+    const { result } = setup(grid({ version: 3 }));
+    const skippedRow = { ...row({ cells: { "1": cell({ skipped: true }) } }), session_slot_id: 1 };
+    globalThis.fetch = vi
+      .fn()
+      .mockResolvedValueOnce(res({ ok: true, grid_patch: patch({ rows: [skippedRow] }), history })) as unknown as typeof fetch;
+
+    await act(async () => {
+      await result.current.skipCell(100, true);
+    });
+
+    const calls = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls;
+    expect(calls).toHaveLength(1); // no GET grid/
+    expect(calls[0]![1].headers["X-Meso-Response"]).toBe("patch");
+    expect(result.current.grid?.days[0]?.rows[0]?.cells["1"]?.skipped).toBe(true);
+    expect(result.current.grid?.version).toBe(4);
+    expect(result.current.history.undo_label).toBe("Skipped Squat");
+    expect(result.current.grid?.history.undo_label).toBe("Skipped Squat");
+  });
+
+  it("merges an added row into its day", async () => {
+    const initial = grid({ version: 3 });
+    const { result } = setup(initial);
+    const added = { ...row({ exercise_slot_id: 20, name: "New exercise", order: 1 }), session_slot_id: 1 };
+    globalThis.fetch = vi
+      .fn()
+      .mockResolvedValueOnce(res({ ok: true, grid_patch: patch({ rows: [added] }), history })) as unknown as typeof fetch;
+
+    await act(async () => {
+      await result.current.addExercise(initial.days[0]!);
+    });
+
+    expect(globalThis.fetch).toHaveBeenCalledTimes(1);
+    expect(result.current.grid?.days[0]?.rows.map((r) => r.name)).toEqual(["Squat", "New exercise"]);
+  });
+
+  it("falls back to a refetch when the patch is older than the held grid", async () => {
+    const { result } = setup(grid({ version: 5 }));
+    globalThis.fetch = vi
+      .fn()
+      .mockResolvedValueOnce(res({ ok: true, grid_patch: patch({ version: 4 }), history }))
+      .mockResolvedValueOnce(res({ ok: true, ...grid({ version: 6 }) })) as unknown as typeof fetch;
+
+    await act(async () => {
+      await result.current.fillAcrossWeeks(100);
+    });
+
+    const calls = (globalThis.fetch as ReturnType<typeof vi.fn>).mock.calls;
+    expect(calls[1]![0]).toBe("/meso/api/plan/7/grid/");
+    expect(result.current.grid?.version).toBe(6);
+  });
+});
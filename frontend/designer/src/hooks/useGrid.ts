@@ -7,23 +7,46 @@
 // AthletePreview too, via the pure `lib/grid.ts` helpers `gridToProgram`/
 // `cycleLabelFromGrid`.
 //
-// Cell edits (patchCell/renameExercise) are optimistic + fire-and-forget,
-// mirroring useAutosave's semantics (CONTRACT.md "useAutosave") — updated in
-// local state immediately, POSTed without being awaited by the caller, and
-// NOT rolled back on failure (only console.error'd), same as persistRow. Each
-// in-flight autosave POST is tracked in `pendingWritesRef` so fillAcrossWeeks
-// can flush (await) them before it fills — the fill endpoint copies the
-// source cell's already-committed DB values, so an in-flight edit must land
-// first or the fill can copy stale data (Codex P2).
+// Cell edits (patchCell/renameExercise/writeCellLine/patchRowColumns) are
+// optimistic + fire-and-forget, mirroring useAutosave's semantics
+// (CONTRACT.md "useAutosave") — updated in local state immediately, sent
+// without being awaited by the caller, and NOT rolled back on failure (only
+// console.error'd), same as persistRow. They are not POSTed one by one: each
+// queues a `BatchOp`, coalesced per target (the last text typed into a cell
+// wins), and the queue is flushed as ONE `batch/` POST once the coach pauses
+// (`EDIT_BATCH_DEBOUNCE_MS`, at most `EDIT_BATCH_MAX_WAIT_MS` after the first
+// queued edit) — one plan lock and one undo step server-side instead of one
+// per blur. Each in-flight batch POST is tracked in `pendingWritesRef`, and
+// every structural verb flushes (and awaits) queued + in-flight edits before
+// it POSTs — e.g. the fill endpoint copies the source cell's already-committed
+// DB values, so a pending edit must land first or the fill can copy stale data
+// (Codex P2), and a row delete must not strand a queued edit of that row.
 //
 // Structural verbs (add/remove day|week|exercise, undo/redo)
 // await their POST, then call refetchGrid() (a plain GET, mirroring
 // usePlanData's switchWeek) to re-sync the whole grid — mirroring
 // usePlanData/useReorder's ref-guard idiom, one shared in-flight guard across
 // every structural verb so a double-click can't race two refetches.
-import { useCallback, useRef, useState } from "react";
-import { apiPost } from "../lib/api";
-import type { GridCell, GridDay, GridHistory, GridRow, GridWeek, MesoGrid } from "../lib/api";
+//
+// Patch-response mode: the row-/day-scoped structural verbs (add/remove
+// exercise, reorder, skip, fill, add-this-week) send `GRID_PATCH_HEADERS`,
+// and the server answers with just the rows/days the write changed
+// (`grid_patch`). `adoptWriteReply` merges that into the held grid
+// (`mergeGridPatch`) instead of refetching the whole block, and only falls
+// back to refetchGrid() when the reply has no patch or it can't be merged.
+import { useCallback, useEffect, useRef, useState } from "react";
+import { apiPost, GRID_PATCH_HEADERS } from "../lib/api";
+import type {
+  BatchOp,
+  GridCell,
+  GridDay,
+  GridHistory,
+  GridPatchCarrier,
+  GridRow,
+  GridWeek,
+  MesoGrid,
+} from "../lib/api";
+import { mergeGridPatch } from "../lib/grid";
 
 export type Id = number | string;
 
@@ -48,6 +71,15 @@ interface GridHistoryCarrier {
   };
 }
 
+function toGridHistory(h: NonNullable<GridHistoryCarrier["history"]>): GridHistory {
+  return {
+    can_undo: h.can_undo,
+    can_redo: h.can_redo,
+    undo_label: h.undo_label ?? "",
+    redo_label: h.redo_label ?? "",
+  };
+}
+
 const EMPTY_GRID_HISTORY: GridHistory = {
   can_undo: false,
   can_redo: false,
@@ -55,6 +87,18 @@ const EMPTY_GRID_HISTORY: GridHistory = {
   redo_label: "",
 };
 
+/** Quiet period after the last cell edit before the queued edits are sent. */
+export const EDIT_BATCH_DEBOUNCE_MS = 400;
+/** Upper bound on how long a queued edit waits while the coach keeps typing. */
+export const EDIT_BATCH_MAX_WAIT_MS = 2000;
+
+/** Merge a new edit into the queued one for the same target (same key). Field
+ * patches accumulate (later fields win); a sub-line write replaces. */
+function mergeBatchOp(queued: BatchOp | undefined, next: BatchOp): BatchOp {
+  if (!queued || next.op === "cell_line_write") return next;
+  return { ...queued, ...next } as BatchOp;
+}
+
 export interface UseGridOptions {
   planId: Id;
   csrf: string;
@@ -176,6 +220,11 @@ function updateCellLineInGrid(
 export function useGrid(options: UseGridOptions) {
   const { planId, csrf, initialGrid } = options;
   const [grid, setGrid] = useState<MesoGrid | null>(initialGrid);
+  // The latest rendered grid, for merging a patch reply after an awaited POST
+  // — the verb's own `grid` closure can predate optimistic edits made while
+  // the POST was in flight, and a merge must not drop them.
+  const gridRef = useRef(grid);
+  gridRef.current = grid;
   const [history, setHistory] = useState<GridHistory>(initialGrid?.history ?? EMPTY_GRID_HISTORY);
 
   // One shared in-flight guard across every structural (refetch-driven) verb
@@ -184,26 +233,77 @@ export function useGrid(options: UseGridOptions) {
   const busyRef = useRef(false);
   const [busy, setBusy] = useState(false);
 
-  // In-flight cell-autosave POSTs (patchCell/renameExercise are fire-and-
-  // forget). fillAcrossWeeks reads the source cell's already-stored DB values
-  // server-side, so it must flush these first or it can copy stale data to
-  // sibling weeks when a coach edits then immediately fills (Codex P2).
+  // In-flight cell-autosave POSTs (the batched cell edits are fire-and-
+  // forget). Structural verbs read the grid's already-stored DB values
+  // server-side, so they flush these first (runStructural).
   const pendingWritesRef = useRef<Set<Promise<unknown>>>(new Set());
 
+  // Cell edits waiting for the next batch/ POST, keyed by target so repeated
+  // edits of one cell/row coalesce into one op (Map keeps first-edit order).
+  const queuedEditsRef = useRef<Map<string, BatchOp>>(new Map());
+  const flushTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const firstQueuedAtRef = useRef(0);
+
   const adoptGridHistory = useCallback((data: GridHistoryCarrier) => {
     const h = data?.history;
     if (!h) return;
-    setHistory({
-      can_undo: h.can_undo,
-      can_redo: h.can_redo,
-      undo_label: h.undo_label ?? "",
-      redo_label: h.redo_label ?? "",
-    });
+    setHistory(toGridHistory(h));
+  }, []);
+
+  // Send every queued edit now, as one batch/ POST (tracked like any other
+  // in-flight autosave). A no-op with nothing queued.
+  const flushEdits = useCallback(() => {
+    if (flushTimerRef.current != null) {
+      clearTimeout(flushTimerRef.current);
+      flushTimerRef.current = null;
+    }
+    const ops = [...queuedEditsRef.current.values()];
+    if (ops.length === 0) return Promise.resolve();
+    queuedEditsRef.current = new Map();
+    const write = apiPost(`/meso/api/plan/${planId}/batch/`, { ops }, csrf)
+      .then((data) => adoptGridHistory(data as GridHistoryCarrier))
+      .catch((err) => console.error("Cell autosave failed", err));
+    pendingWritesRef.current.add(write);
+    write.finally(() => pendingWritesRef.current.delete(write));
+    return write;
+  }, [planId, csrf, adoptGridHistory]);
+
+  const queueEdit = useCallback(
+    (key: string, op: BatchOp) => {
+      const queue = queuedEditsRef.current;
+      if (queue.size === 0) firstQueuedAtRef.current = Date.now();
+      queue.set(key, mergeBatchOp(queue.get(key), op));
+      if (flushTimerRef.current != null) clearTimeout(flushTimerRef.current);
+      const waited = Date.now() - firstQueuedAtRef.current;
+      if (waited >= EDIT_BATCH_MAX_WAIT_MS) {
+        void flushEdits();
+        return;
+      }
+      flushTimerRef.current = setTimeout(
+        () => void flushEdits(),
+        Math.min(EDIT_BATCH_DEBOUNCE_MS, EDIT_BATCH_MAX_WAIT_MS - waited),
+      );
+    },
+    [flushEdits],
+  );
+
+  // Don't strand queued edits: send them when the designer unmounts or the
+  // page is being left (the POST usually still completes on navigation).
+  const flushEditsRef = useRef(flushEdits);
+  flushEditsRef.current = flushEdits;
+  useEffect(() => {
+    const onPageHide = () => void flushEditsRef.current();
+    window.addEventListener("pagehide", onPageHide);
+    return () => {
+      window.removeEventListener("pagehide", onPageHide);
+      void flushEditsRef.current();
+    };
   }, []);
 
   const flushPendingWrites = useCallback(async () => {
+    void flushEdits();
     await Promise.allSettled([...pendingWritesRef.current]);
-  }, []);
+  }, [flushEdits]);
 
   const refetchGrid = useCallback(async () => {
     try {
@@ -225,6 +325,7 @@ export function useGrid(options: UseGridOptions) {
         weeks: data.weeks,
         days: data.days,
         history: data.history,
+        version: data.version,
       });
       setHistory(data.history);
     } catch (err) {
@@ -232,28 +333,55 @@ export function useGrid(options: UseGridOptions) {
     }
   }, [planId]);
 
-  const runStructural = useCallback(async (fn: () => Promise<void>) => {
-    if (busyRef.current) return;
-    busyRef.current = true;
-    setBusy(true);
-    try {
-      await fn();
-    } finally {
-      busyRef.current = false;
-      setBusy(false);
-    }
-  }, []);
+  // A patch-mode write's reply: merge its `grid_patch` into the held grid, or
+  // refetch when there's nothing mergeable (no patch — e.g. an older server —
+  // another block's, or one older than the grid already held).
+  const adoptWriteReply = useCallback(
+    async (data: unknown) => {
+      const reply = data as (GridPatchCarrier & GridHistoryCarrier) | null;
+      const current = gridRef.current;
+      const merged =
+        reply?.grid_patch && current ? mergeGridPatch(current, reply.grid_patch) : null;
+      if (!merged) {
+        await refetchGrid();
+        return;
+      }
+      const next = reply?.history ? { ...merged, history: toGridHistory(reply.history) } : merged;
+      gridRef.current = next;
+      setGrid(next);
+      adoptGridHistory(reply ?? {});
+    },
+    [refetchGrid, adoptGridHistory],
+  );
+
+  const runStructural = useCallback(
+    async (fn: () => Promise<void>) => {
+      if (busyRef.current) return;
+      busyRef.current = true;
+      setBusy(true);
+      try {
+        // Queued/in-flight cell edits land first: the structural write (and
+        // its undo snapshot) must see them, and a batch naming a row this
+        // verb is about to delete would fail whole. (Checked first so an idle
+        // grid's POST still goes out synchronously.)
+        if (queuedEditsRef.current.size > 0 || pendingWritesRef.current.size > 0) {
+          await flushPendingWrites();
+        }
+        await fn();
+      } finally {
+        busyRef.current = false;
+        setBusy(false);
+      }
+    },
+    [flushPendingWrites],
+  );
 
   const patchCell = useCallback(
     (cellId: Id, patch: GridCellPatch) => {
       setGrid((prev) => (prev ? updateCellInGrid(prev, cellId, patch) : prev));
-      const write = apiPost(`/meso/api/plan/${planId}/prescription/${cellId}/`, patch, csrf)
-        .then((data) => adoptGridHistory(data as GridHistoryCarrier))
-        .catch((err) => console.error("Cell autosave failed", err));
-      pendingWritesRef.current.add(write);
-      write.finally(() => pendingWritesRef.current.delete(write));
+      queueEdit(`cell:${cellId}`, { op: "prescription_patch", id: cellId, ...patch });
     },
-    [planId, csrf, adoptGridHistory],
+    [queueEdit],
   );
 
   const renameExercise = useCallback(
@@ -262,67 +390,67 @@ export function useGrid(options: UseGridOptions) {
       const cellId = rowIdentityCellId(grid?.weeks ?? [], row);
       if (cellId == null) return;
       setGrid((prev) => (prev ? updateRowInGrid(prev, exerciseSlotId, { name }) : prev));
-      const write = apiPost(`/meso/api/plan/${planId}/prescription/${cellId}/`, { name }, csrf)
-        .then((data) => adoptGridHistory(data as GridHistoryCarrier))
-        .catch((err) => console.error("Rename exercise failed", err));
-      pendingWritesRef.current.add(write);
-      write.finally(() => pendingWritesRef.current.delete(write));
+      queueEdit(`cell:${cellId}`, { op: "prescription_patch", id: cellId, name });
     },
-    [grid, planId, csrf, adoptGridHistory],
+    [grid, queueEdit],
   );
 
   // Phase 2a: write one freeform (week × line) sub-line of a row's stack —
   // addressed by (exercise_slot, week, line), not pk, since a sub-line cell
-  // may not exist yet (the server upserts via `cell_line_write`). Same
+  // may not exist yet (the server upserts, as `cell_line_write` does). Same
   // optimistic fire-and-forget shape as patchCell: local repaint immediately,
-  // POST not awaited, failure console.error'd. Line 0 routes here too when
-  // the caller has no pk handy, though patchCell (by pk) is the normal line-0
-  // path.
+  // queued for the next batch, failure console.error'd. Line 0 routes here
+  // too when the caller has no pk handy, though patchCell (by pk) is the
+  // normal line-0 path.
   const writeCellLine = useCallback(
     (exerciseSlotId: Id, weekId: Id, line: number, text: string) => {
       setGrid((prev) =>
         prev ? updateCellLineInGrid(prev, exerciseSlotId, weekId, line, text) : prev,
       );
-      const write = apiPost(
-        `/meso/api/plan/${planId}/row/${exerciseSlotId}/cell/`,
-        { week_id: weekId, line, text },
-        csrf,
-      )
-        .then((data) => adoptGridHistory(data as GridHistoryCarrier))
-        .catch((err) => console.error("Cell line write failed", err));
-      pendingWritesRef.current.add(write);
-      write.finally(() => pendingWritesRef.current.delete(write));
+      queueEdit(`line:${exerciseSlotId}:${weekId}:${line}`, {
+        op: "cell_line_write",
+        slot_id: exerciseSlotId,
+        week_id: weekId,
+        line,
+        text,
+      });
     },
-    [planId, csrf, adoptGridHistory],
+    [queueEdit],
   );
 
   // Phase 2a (D2): the per-exercise Tempo/Rest/instructions columns — row
-  // attributes on the block-shared ExerciseSlot, written through
-  // `exercise_slot_patch`. Same optimistic fire-and-forget shape as patchCell.
+  // attributes on the block-shared ExerciseSlot (`exercise_slot_patch`'s
+  // fields). Same optimistic fire-and-forget shape as patchCell.
   const patchRowColumns = useCallback(
     (exerciseSlotId: Id, patch: GridRowPatch) => {
       setGrid((prev) => (prev ? updateRowInGrid(prev, exerciseSlotId, patch) : prev));
-      const write = apiPost(`/meso/api/plan/${planId}/row/${exerciseSlotId}/`, patch, csrf)
-        .then((data) => adoptGridHistory(data as GridHistoryCarrier))
-        .catch((err) => console.error("Row columns autosave failed", err));
-      pendingWritesRef.current.add(write);
-      write.finally(() => pendingWritesRef.current.delete(write));
+      queueEdit(`row:${exerciseSlotId}`, {
+        op: "exercise_slot_patch",
+        slot_id: exerciseSlotId,
+        ...patch,
+      });
     },
-    [planId, csrf, adoptGridHistory],
+    [queueEdit],
   );
 
   const addExercise = useCallback(
     (day: GridDay) =>
       runStructural(async () => {
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/session/${day.session_id}/exercise/`, null, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/session/${day.session_id}/exercise/`,
+            null,
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Add exercise failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   const removeExercise = useCallback(
@@ -331,15 +459,21 @@ export function useGrid(options: UseGridOptions) {
         const row = findRow(grid, exerciseSlotId);
         const cellId = firstWeekCellId(grid, row);
         if (cellId == null) return;
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/prescription/${cellId}/delete/`, null, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/prescription/${cellId}/delete/`,
+            null,
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Remove exercise failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [grid, planId, csrf, runStructural, refetchGrid],
+    [grid, planId, csrf, runStructural, adoptWriteReply],
   );
 
   const addDay = useCallback(
@@ -417,8 +551,9 @@ export function useGrid(options: UseGridOptions) {
 
   // Issue #455 phase A2 (drag reordering): same STRUCTURAL shape as every
   // verb above — the server owns the authoritative order (block-wide P0
-  // ExerciseSlot/SessionSlot.order), so these await their POST then
-  // refetch the whole grid, sharing busyRef. useTableReorder (the pure
+  // ExerciseSlot/SessionSlot.order), so these await their POST then adopt
+  // its reply — the reordered day(s) as a grid patch, or a whole-grid
+  // refetch when there's no mergeable patch — sharing busyRef. useTableReorder (the pure
   // drag-event translator) builds `order` from the CURRENT week's live
   // cell/session ids and calls these two verbs — see its own header for the
   // payload contract (mirrors views.py session_reorder/week_reorder_sessions
@@ -428,29 +563,41 @@ export function useGrid(options: UseGridOptions) {
   const reorderExercises = useCallback(
     (sessionId: Id, order: number[]) =>
       runStructural(async () => {
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/session/${sessionId}/reorder/`, { order }, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/session/${sessionId}/reorder/`,
+            { order },
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Reorder exercises failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   const reorderDays = useCallback(
     (weekId: Id, order: number[]) =>
       runStructural(async () => {
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/week/${weekId}/reorder/`, { order }, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/week/${weekId}/reorder/`,
+            { order },
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Reorder days failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   // Issue #455 phase A2.5 (menu-based cross-day move): closes the parity gap
@@ -460,54 +607,73 @@ export function useGrid(options: UseGridOptions) {
   // Same STRUCTURAL shape as add/removeExercise|Day|Week above — the grid
   // (not just one cell) can change shape/content in ways only the server
   // knows (fill rewrites whole stacks, add-this-week creates a new
-  // slot+cells) so these await their POST then refetch, sharing busyRef.
+  // slot+cells) so these await their POST then adopt its reply (the changed
+  // row as a grid patch, else a refetch), sharing busyRef.
   // (The one-week swap verb is gone — Phase 2a: a substitution is sub-line
   // text, written through writeCellLine above.)
 
   const skipCell = useCallback(
     (cellId: number, skipped: boolean) =>
       runStructural(async () => {
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/prescription/${cellId}/skip/`, { skipped }, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/prescription/${cellId}/skip/`,
+            { skipped },
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Skip cell failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   const fillAcrossWeeks = useCallback(
     (cellId: number) =>
       runStructural(async () => {
-        // Flush any in-flight cell autosave first — fill copies the source
-        // cell's ALREADY-STORED DB values server-side, so a just-edited cell
-        // must finish committing or the fill can copy stale data (Codex P2).
-        await flushPendingWrites();
+        // runStructural has flushed any queued/in-flight cell autosave —
+        // fill copies the source cell's ALREADY-STORED DB values server-side,
+        // so a just-edited cell must finish committing or the fill can copy
+        // stale data (Codex P2).
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/prescription/${cellId}/fill/`, {}, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/prescription/${cellId}/fill/`,
+            {},
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Fill across weeks failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid, flushPendingWrites],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   const addExerciseThisWeek = useCallback(
     (day: GridDay, weekId: number) =>
       runStructural(async () => {
+        let reply: unknown;
         try {
-          await apiPost(`/meso/api/plan/${planId}/session/${day.session_id}/exercise/`, { week_id: weekId }, csrf);
+          reply = await apiPost(
+            `/meso/api/plan/${planId}/session/${day.session_id}/exercise/`,
+            { week_id: weekId },
+            csrf,
+            GRID_PATCH_HEADERS,
+          );
         } catch (err) {
           console.error("Add exercise this week failed", err);
           return;
         }
-        await refetchGrid();
+        await adoptWriteReply(reply);
       }),
-    [planId, csrf, runStructural, refetchGrid],
+    [planId, csrf, runStructural, adoptWriteReply],
   );
 
   const undo = useCallback(
@@ -564,5 +730,6 @@ export function useGrid(options: UseGridOptions) {
     undo,
     redo,
     refetchGrid,
+    flushEdits,
   };
 }
@@ -1,9 +1,17 @@
 // Ported from frontend/meso.test.js's "agentErrorText" / "batchMessage" /
 // "pollBatch" describe-blocks, adapted to the dependency-injected function
 // signature (no `createMeso()` instance — fetch/sleep/message-sink are
-// passed explicitly). Same assertions, same edge cases.
+// passed explicitly). Same assertions, same edge cases. The waitForBatch
+// specs (the status stream in front of the poll) inject a fake EventSource.
 import { beforeEach, describe, expect, it, vi } from "vitest";
-import { agentErrorText, batchMessage, pollBatch, type AgentMessage } from "./agent";
+import {
+  agentErrorText,
+  batchMessage,
+  pollBatch,
+  waitForBatch,
+  type AgentMessage,
+  type BatchEventSource,
+} from "./agent";
 
 function res({ ok = true, status = 200, body = {} } = {}) {
   return { ok, status, json: async () => body };
@@ -124,3 +132,112 @@ describe("pollBatch", () => {
     expect(last()?.text).toMatch(/taking longer than expected/);
   });
 });
+
+// A scripted EventSource: records its url and listeners so a spec can emit
+// server events (or an error) by hand, and whether the hook closed it.
+class FakeEventSource implements BatchEventSource {
+  listeners: Record<string, ((event: MessageEvent) => void)[]> = {};
+  onerror: ((event: Event) => void) | null = null;
+  closed = false;
+  constructor(public url: string) {}
+  addEventListener(type: string, listener: (event: MessageEvent) => void) {
+    (this.listeners[type] ||= []).push(listener);
+  }
+  emit(type: string, data: unknown) {
+    const event = { data: JSON.stringify(data) } as MessageEvent;
+    (this.listeners[type] || []).forEach((listener) => listener(event));
+  }
+  close() {
+    this.closed = true;
+  }
+}
+
+function fakeSources() {
+  const sources: FakeEventSource[] = [];
+  const eventSourceImpl = (url: string) => {
+    const source = new FakeEventSource(url);
+    sources.push(source);
+    return source;
+  };
+  return { sources, eventSourceImpl };
+}
+
+describe("waitForBatch", () => {
+  it("resolves true once the stream reports a resolved status", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    const waiting = waitForBatch("/events/", eventSourceImpl);
+    expect(sources[0]!.url).toBe("/events/");
+    sources[0]!.emit("status", { status: "drafting" });
+    sources[0]!.emit("status", { status: "pending" });
+    await expect(waiting).resolves.toBe(true);
+    expect(sources[0]!.closed).toBe(true);
+  });
+
+  it("resolves false on a server timeout", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    const waiting = waitForBatch("/events/", eventSourceImpl);
+    sources[0]!.emit("timeout", { status: "drafting" });
+    await expect(waiting).resolves.toBe(false);
+    expect(sources[0]!.closed).toBe(true);
+  });
+
+  it("resolves false (rather than reconnecting) on a stream error", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    const waiting = waitForBatch("/events/", eventSourceImpl);
+    sources[0]!.onerror?.(new Event("error"));
+    await expect(waiting).resolves.toBe(false);
+    expect(sources[0]!.closed).toBe(true);
+  });
+
+  it("resolves false without a stream url or an EventSource", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    await expect(waitForBatch(null, eventSourceImpl)).resolves.toBe(false);
+    await expect(waitForBatch("/events/", undefined)).resolves.toBe(false);
+    expect(sources).toHaveLength(0);
+  });
+});
+
+describe("pollBatch with a status stream", () => {
+  const instantSleep = () => Promise.resolve();
+
+  it("waits on the stream, then fetches the resolved batch once", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    const fetchImpl = vi
+      .fn()
+      .mockResolvedValue(res({ body: { status: "pending", summary: "Done.", changes: [] } }));
+    const messages: AgentMessage[] = [];
+    const polling = pollBatch("/status/", {
+      eventsUrl: "/events/",
+      eventSourceImpl,
+      fetchImpl,
+      sleep: instantSleep,
+      onMessage: (m) => messages.push(m),
+    });
+    await Promise.resolve();
+    expect(fetchImpl).not.toHaveBeenCalled();
+    sources[0]!.emit("status", { status: "pending" });
+    await polling;
+    expect(fetchImpl).toHaveBeenCalledTimes(1);
+    expect(messages).toHaveLength(1);
+  });
+
+  it("falls back to polling when the stream errors", async () => {
+    const { sources, eventSourceImpl } = fakeSources();
+    const fetchImpl = vi
+      .fn()
+      .mockResolvedValueOnce(res({ body: { status: "drafting" } }))
+      .mockResolvedValueOnce(res({ body: { status: "failed", error: "model refused" } }));
+    const messages: AgentMessage[] = [];
+    const polling = pollBatch("/status/", {
+      eventsUrl: "/events/",
+      eventSourceImpl,
+      fetchImpl,
+      sleep: instantSleep,
+      onMessage: (m) => messages.push(m),
+    });
+    sources[0]!.onerror?.(new Event("error"));
+    await polling;
+    expect(fetchImpl).toHaveBeenCalledTimes(2);
+    expect(messages[0]!.text).toBe("model refused");
+  });
+});
@@ -4,7 +4,9 @@
 // refactored here into a dependency-injected function: no `this`, every
 // side effect (network, sleep, message delivery) comes in via `options` so
 // the hook (useAgentChat) supplies the real fetch/timers and the specs can
-// inject fakes without a component instance.
+// inject fakes without a component instance. waitForBatch puts the batch's
+// server-sent-events stream in front of the poll: one long-lived request
+// while the run drafts, then a single status fetch to render it.
 
 /** One change chip in a resolved agent batch (inert until applied at review). */
 export interface ChatChange {
@@ -62,7 +64,67 @@ export function batchMessage(data: BatchStatusData): AgentMessage {
   };
 }
 
+/** The slice of `EventSource` waitForBatch uses (so specs can inject a fake). */
+export interface BatchEventSource {
+  addEventListener(type: string, listener: (event: MessageEvent) => void): void;
+  onerror: ((event: Event) => void) | null;
+  close(): void;
+}
+
+export type BatchEventSourceFactory = (url: string) => BatchEventSource;
+
+const defaultEventSource: BatchEventSourceFactory | undefined =
+  typeof EventSource === "undefined" ? undefined : (url) => new EventSource(url);
+
+/**
+ * Waits on a batch's status stream (`batch_events`) until the run leaves
+ * `drafting`. Resolves `true` once the stream reports a resolved status, and
+ * `false` — meaning "poll instead" — when there is no stream url, no
+ * EventSource, the stream errors or drops (EventSource would otherwise
+ * reconnect on its own) — a 503 from a worker whose streams are all taken
+ * included — or the server gives up with a `timeout` event.
+ * Never rejects.
+ */
+export function waitForBatch(
+  eventsUrl: string | null | undefined,
+  eventSourceImpl: BatchEventSourceFactory | undefined = defaultEventSource,
+): Promise<boolean> {
+  if (!eventsUrl || !eventSourceImpl) return Promise.resolve(false);
+  return new Promise((resolve) => {
+    let source: BatchEventSource;
+    try {
+      source = eventSourceImpl(eventsUrl);
+    } catch (err) {
+      console.error("Agent status stream failed", err);
+      resolve(false);
+      return;
+    }
+    const finish = (resolved: boolean) => {
+      source.close();
+      resolve(resolved);
+    };
+    source.addEventListener("status", (event) => {
+      let status: string | undefined;
+      try {
+        status = (JSON.parse(event.data) as BatchStatusData).status;
+      } catch {
+        status = undefined;
+      }
+      if (status !== "drafting") finish(Boolean(status));
+    });
+    source.addEventListener("timeout", () => finish(false));
+    source.onerror = () => finish(false);
+  });
+}
+
 export interface PollBatchOptions {
+  /**
+   * The batch's status stream. When given (and EventSource exists), the
+   * drafting wait happens there and polling only takes over if it fails.
+   */
+  eventsUrl?: string | null;
+  /** Defaults to the global `EventSource`. */
+  eventSourceImpl?: BatchEventSourceFactory;
   /** Defaults to the global `fetch`. */
   fetchImpl?: typeof fetch;
   /** Defaults to a real `setTimeout`-backed sleep. */
@@ -81,13 +143,17 @@ const defaultSleep = (ms: number): Promise<void> =>
  * Resolves after delivering exactly one message via `onMessage` — rendering
  * the batch, an error, or a timeout hint. Every branch here is pinned by the
  * ported spec: no status url, drafting → keep polling, failed, HTTP error,
- * network error, and the attempt cap.
+ * network error, and the attempt cap. With an `eventsUrl` it first waits on
+ * the stream (waitForBatch), so the first poll normally finds the batch
+ * resolved.
  */
 export async function pollBatch(
   statusUrl: string | null | undefined,
   options: PollBatchOptions,
 ): Promise<void> {
   const {
+    eventsUrl,
+    eventSourceImpl = defaultEventSource,
     fetchImpl = fetch,
     sleep = defaultSleep,
     intervalMs = 1500,
@@ -100,6 +166,8 @@ export async function pollBatch(
     return;
   }
 
+  await waitForBatch(eventsUrl, eventSourceImpl);
+
   for (let attempt = 0; attempt < maxAttempts; attempt++) {
     let data: BatchStatusData;
     try {
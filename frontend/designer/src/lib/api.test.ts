@@ -3,7 +3,7 @@
 // goes through it). Ported out as its own direct spec now that it's a
 // standalone function instead of a `this`-bound method.
 import { beforeEach, describe, expect, it, vi } from "vitest";
-import { apiPost } from "./api";
+import { apiPost, GRID_PATCH_HEADERS } from "./api";
 
 function res({ ok = true, status = 200, body = {} }: { ok?: boolean; status?: number; body?: unknown } = {}) {
   return { ok, status, json: async () => body };
@@ -44,6 +44,18 @@ describe("apiPost", () => {
     expect(opts.body).toBe(null);
   });
 
+  it("adds extra headers (patch-response opt-in) without dropping the CSRF/JSON ones", async () => {
+    const fetchMock = vi.fn().mockResolvedValue(res({ body: {} }));
+    vi.stubGlobal("fetch", fetchMock);
+    await apiPost("/meso/api/plan/7/prescription/9/skip/", { skipped: true }, "tok", GRID_PATCH_HEADERS);
+    const call = fetchMock.mock.calls[0];
+    if (!call) throw new Error("fetch was not called");
+    const opts = call[1] as RequestInit & { headers: Record<string, string> };
+    expect(opts.headers["X-Meso-Response"]).toBe("patch");
+    expect(opts.headers["X-CSRFToken"]).toBe("tok");
+    expect(opts.headers["Content-Type"]).toBe("application/json");
+  });
+
   it("throws on a non-ok response", async () => {
     vi.stubGlobal("fetch", vi.fn().mockResolvedValue(res({ ok: false, status: 500 })));
     await expect(apiPost("/x/", null, "tok")).rejects.toThrow("Request failed: 500");
@@ -209,22 +209,85 @@ export interface MesoGrid {
   weeks: GridWeek[];
   days: GridDay[];
   history: GridHistory;
+  /** The plan's `edit_version` this payload reflects (grid cache/patch
+   * versioning). Optional for the same fixture reason as `plan` above. */
+  version?: number;
 }
 
+/** A `GridRow` as a patch carries it: the row plus the day it now sits in. */
+export interface GridPatchRow extends GridRow {
+  session_slot_id: number;
+}
+
+/** A day as a patch carries it: the day's own fields, plus its full `rows`
+ * list only when the write changed which rows the day holds (or their order)
+ * — a header-only entry (a day reorder) leaves the held rows alone. */
+export type GridPatchDay = Omit<GridDay, "rows"> & { rows?: GridRow[] };
+
+/**
+ * `serialize_grid_patch`'s shape: just the rows/days one write changed, sent
+ * in place of a full re-serialization when the request carries
+ * `X-Meso-Response: patch` (`GRID_PATCH_HEADERS`). `version` is the plan's
+ * edit version after the write — what a full refetch would report now.
+ */
+export interface GridPatch {
+  version: number;
+  mesocycle_id: number;
+  days: GridPatchDay[];
+  rows: GridPatchRow[];
+  removed_days: number[];
+  removed_rows: number[];
+}
+
+/** Any write reply that may carry a grid patch (patch-response mode). */
+export interface GridPatchCarrier {
+  grid_patch?: GridPatch;
+}
+
+/**
+ * One edit in a `plan_batch` POST (`{ops: BatchOp[]}`): the body of the
+ * matching single write endpoint plus its target — a cell pk for
+ * `prescription_patch`, the row's exercise-slot pk for the other two.
+ */
+export type BatchOp =
+  | { op: "prescription_patch"; id: number | string; text?: string; name?: string }
+  | {
+      op: "cell_line_write";
+      slot_id: number | string;
+      week_id: number | string;
+      line: number;
+      text: string;
+    }
+  | {
+      op: "exercise_slot_patch";
+      slot_id: number | string;
+      tempo?: string;
+      rest?: string;
+      note?: string;
+    };
+
+/** The opt-in header asking a designer write for a `grid_patch` reply. */
+export const GRID_PATCH_HEADERS: Readonly<Record<string, string>> = {
+  "X-Meso-Response": "patch",
+};
+
 /**
  * POST JSON to `url` with the CSRF header and same-origin credentials
  * (fetch's default), throwing on a non-ok response. `csrf` is an explicit
  * argument (the Alpine original read `this.csrf`); callers supply it from
- * the `#meso-csrf` hydration value.
+ * the `#meso-csrf` hydration value. `headers` adds request headers on top
+ * (e.g. `GRID_PATCH_HEADERS`).
  */
 export async function apiPost<T = unknown>(
   url: string,
   body: unknown,
   csrf: string,
+  headers: Readonly<Record<string, string>> = {},
 ): Promise<T> {
   const res = await fetch(url, {
     method: "POST",
     headers: {
+      ...headers,
       "Content-Type": "application/json",
       "X-CSRFToken": csrf,
     },
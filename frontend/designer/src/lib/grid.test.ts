@@ -4,8 +4,8 @@
 // faithful. (loadSuffix retired in Phase 2a with the typed load fields —
 // its cases went with it.)
 import { describe, expect, it } from "vitest";
-import { barH, cellOn, cellStyle, cycleLabelFromGrid, gridToProgram, numeric } from "./grid";
-import type { GridCell, GridDay, GridRow, GridWeek, MesoGrid, Phase } from "./api";
+import { barH, cellOn, cellStyle, cycleLabelFromGrid, gridToProgram, mergeGridPatch, numeric } from "./grid";
+import type { GridCell, GridDay, GridPatch, GridRow, GridWeek, MesoGrid, Phase } from "./api";
 
 describe("numeric", () => {
   it("accepts plain non-negative decimal strings, including a bare 0", () => {
@@ -319,3 +319,95 @@ describe("cycleLabelFromGrid", () => {
     expect(cycleLabelFromGrid(phases, [])).toBe("Hypertrophy");
   });
 });
+
+describe("mergeGridPatch", () => {
+  function patch(overrides: Partial<GridPatch> = {}): GridPatch {
+    return {
+      version: 2,
+      mesocycle_id: 1,
+      days: [],
+      rows: [],
+      removed_days: [],
+      removed_rows: [],
+      ...overrides,
+    };
+  }
+
+  // Two days: Lower (Squat, Lunge) and Upper (Bench).
+  function twoDayGrid(): MesoGrid {
+    return grid({
+      version: 1,
+      days: [
+        day({ rows: [row(), row({ exercise_slot_id: 10, name: "Lunge", order: 1 })] }),
+        day({
+          session_slot_id: 2,
+          session_id: 12,
+          session_ids: { "1": 12 },
+          day_number: 2,
+          name: "Upper",
+          order: 1,
+          rows: [row({ exercise_slot_id: 20, name: "Bench" })],
+        }),
+      ],
+    });
+  }
+
+  it("replaces a patched row in place, keeping every other day/row object", () => {
+    const held = twoDayGrid();
+    const skipped = { ...row({ cells: { "1": cell({ skipped: true }) } }), session_slot_id: 1 };
+    const merged = mergeGridPatch(held, patch({ rows: [skipped] }))!;
+
+    expect(merged.days[0]!.rows[0]!.cells["1"]!.skipped).toBe(true);
+    expect(merged.days[0]!.rows[1]).toBe(held.days[0]!.rows[1]);
+    expect(merged.days[1]).toBe(held.days[1]);
+    expect(merged.version).toBe(2);
+    expect(merged.days[0]!.rows[0]).not.toHaveProperty("session_slot_id");
+  });
+
+  it("inserts a new row into its day in order, and drops removed rows", () => {
+    const held = twoDayGrid();
+    const added = { ...row({ exercise_slot_id: 30, name: "New exercise", order: 2 }), session_slot_id: 2 };
+    const merged = mergeGridPatch(held, patch({ rows: [added], removed_rows: [10] }))!;
+
+    expect(merged.days[0]!.rows.map((r) => r.exercise_slot_id)).toEqual([9]);
+    expect(merged.days[1]!.rows.map((r) => r.exercise_slot_id)).toEqual([20, 30]);
+  });
+
+  it("replaces a full day's rows wholesale (a move/reorder) and re-sorts days by order", () => {
+    const held = twoDayGrid();
+    const { rows: _rows, ...upperHeader } = held.days[1]!;
+    const merged = mergeGridPatch(
+      held,
+      patch({
+        days: [
+          { ...held.days[0]!, rows: [row({ exercise_slot_id: 10, name: "Lunge", order: 0 })] },
+          { ...upperHeader, order: -1, rows: [row({ exercise_slot_id: 20, name: "Bench" }), row({ order: 1 })] },
+        ],
+      }),
+    )!;
+
+    expect(merged.days.map((d) => d.name)).toEqual(["Upper", "Lower"]);
+    expect(merged.days[0]!.rows.map((r) => r.exercise_slot_id)).toEqual([20, 9]);
+    expect(merged.days[1]!.rows.map((r) => r.exercise_slot_id)).toEqual([10]);
+  });
+
+  it("a header-only day keeps the rows already held (a day reorder)", () => {
+    const held = twoDayGrid();
+    const { rows: _lower, ...lower } = held.days[0]!;
+    const { rows: _upper, ...upper } = held.days[1]!;
+    const merged = mergeGridPatch(held, patch({ days: [{ ...lower, order: 1 }, { ...upper, order: 0 }] }))!;
+
+    expect(merged.days.map((d) => d.name)).toEqual(["Upper", "Lower"]);
+    expect(merged.days[1]!.rows).toBe(held.days[0]!.rows);
+  });
+
+  it("returns null when the patch can't be merged locally", () => {
+    const held = twoDayGrid();
+    // Another block's patch.
+    expect(mergeGridPatch(held, patch({ mesocycle_id: 99 }))).toBe(null);
+    // Older than the grid already held.
+    expect(mergeGridPatch(held, patch({ version: 0 }))).toBe(null);
+    // A row for a day the grid doesn't have.
+    expect(mergeGridPatch(held, patch({ rows: [{ ...row(), session_slot_id: 77 }] }))).toBe(null);
+  });
+});
@@ -2,7 +2,7 @@
 // loadSuffix, barH, cellOn, cellStyle). `round25`, `onDeliver`/`delivered`,
 // `accent`, and `theme` are confirmed dead by the inventory and dropped
 // (never template-wired / prototype-only props with no live consumer).
-import type { Day, Exercise, MesoGrid, Phase, Week } from "./api";
+import type { Day, Exercise, GridDay, GridPatch, GridRow, MesoGrid, Phase, Week } from "./api";
 
 /** True when `v` is a plain non-negative decimal string (e.g. sets/reps/load). */
 export function numeric(v: unknown): boolean {
@@ -131,3 +131,74 @@ export function cycleLabelFromGrid(phases: Phase[], weeks: Pick<Week, "id" | "la
   const wk = week ? week.label + (weeks.length ? " / " + weeks.length : "") : "";
   return [phase, wk].filter(Boolean).join(" · ");
 }
+
+// --- Patch-response mode: merging a write's `grid_patch` ------------------
+
+function byRowOrder(a: GridRow, b: GridRow): number {
+  return a.order - b.order;
+}
+
+/** The server's day order (`serialize_mesocycle_grid`: order, day_number). */
+function byDayOrder(a: GridDay, b: GridDay): number {
+  return a.order - b.order || a.day_number - b.day_number;
+}
+
+/**
+ * Merge a write's `grid_patch` (`serialize_grid_patch`, backend
+ * serializers.py) into the grid the designer holds, returning the grid a full
+ * refetch would have returned — or `null` when the patch can't be applied
+ * locally (another block's patch, one older than the held grid, or a row
+ * bound for a day the grid doesn't have), in which case the caller refetches.
+ *
+ * Same ordering rules as the server: rows by `order` within a day, days by
+ * (`order`, `day_number`). Untouched days/rows keep their object identity, so
+ * React only re-renders what the write changed.
+ */
+export function mergeGridPatch(grid: MesoGrid, patch: GridPatch): MesoGrid | null {
+  if (patch.mesocycle_id !== grid.mesocycle.id) return null;
+  if (grid.version != null && patch.version < grid.version) return null;
+
+  const removedDays = new Set(patch.removed_days);
+  const removedRows = new Set(patch.removed_rows);
+  const incomingRows = new Map(patch.rows.map((r) => [r.exercise_slot_id, r]));
+
+  const days = new Map<number, GridDay>();
+  for (const day of grid.days) {
+    if (!removedDays.has(day.session_slot_id)) days.set(day.session_slot_id, day);
+  }
+  const touchedDays = new Set<number>();
+  for (const { rows, ...header } of patch.days) {
+    const held = days.get(header.session_slot_id);
+    if (!held && !rows) return null;
+    days.set(header.session_slot_id, { ...header, rows: rows ?? held!.rows });
+    touchedDays.add(header.session_slot_id);
+  }
+
+  for (const [id, day] of days) {
+    if (day.rows.some((r) => removedRows.has(r.exercise_slot_id) || incomingRows.has(r.exercise_slot_id))) {
+      days.set(id, {
+        ...day,
+        rows: day.rows.filter(
+          (r) => !removedRows.has(r.exercise_slot_id) && !incomingRows.has(r.exercise_slot_id),
+        ),
+      });
+      touchedDays.add(id);
+    }
+  }
+  for (const { session_slot_id, ...row } of patch.rows) {
+    const day = days.get(session_slot_id);
+    if (!day) return null;
+    days.set(session_slot_id, { ...day, rows: [...day.rows, row] });
+    touchedDays.add(session_slot_id);
+  }
+  for (const id of touchedDays) {
+    const day = days.get(id)!;
+    days.set(id, { ...day, rows: [...day.rows].sort(byRowOrder) });
+  }
+
+  return {
+    ...grid,
+    days: [...days.values()].sort(byDayOrder),
+    version: patch.version,
+  };
+}
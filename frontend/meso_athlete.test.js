@@ -14,12 +14,15 @@ import {
 } from "../app/store_project/static/js/meso_athlete.js";
 
 const LOG_URL = "/meso/api/me/session/42/log/";
+const SYNC_URL = "/meso/api/me/logs/sync/";
 const ONE_RM_URL = "/meso/api/me/session/42/one-rm/";
 
 // A minimal logger with two exercises (one prescription each, two sets each).
 function makeLogger(overrides = {}) {
   const c = createLogger();
   c.logUrl = LOG_URL;
+  c.syncUrl = SYNC_URL;
+  c.sessionId = 42;
   c.csrf = "tok";
   c.status = "pending";
   c.exercises = [
@@ -291,24 +294,77 @@ describe("save → tour refresh nudge (#451)", () => {
 });
 
 describe("flushQueue", () => {
+  // The bulk sync's answer for each queued item, in request order.
+  function synced(queue, overrides = {}) {
+    return res({
+      body: {
+        ok: true,
+        results: queue.map((item) => ({
+          key: item.key,
+          session: item.session,
+          ok: true,
+          log: { status: "done", sets: [{ prescription: 1, set_number: 1 }] },
+          new_records: [],
+          ...overrides,
+        })),
+      },
+    });
+  }
+
   it("replays a queued save and clears it on success", async () => {
     vi.useFakeTimers();
     const c = makeLogger();
     c.enqueue({ status: "done", sets: [{ prescription: 1, set_number: 1 }] });
     c.queued = true;
-    global.fetch = vi.fn().mockResolvedValue(
-      res({
-        body: {
-          log: { status: "done", sets: [{ prescription: 1, set_number: 1 }] },
-        },
-      }),
-    );
+    global.fetch = vi.fn().mockResolvedValue(synced(c.readQueue()));
     await c.flushQueue();
     expect(c.readQueue()).toHaveLength(0);
     expect(c.queued).toBe(false);
     expect(c.status).toBe("done");
   });
 
+  it("sends every queued session in one keyed request", async () => {
+    const c = makeLogger();
+    c.writeQueue([{ url: "/meso/api/me/session/99/log/", body: { sets: [] } }]);
+    c.enqueue({ status: "done", sets: [] });
+    global.fetch = vi.fn().mockResolvedValue(res({ body: { results: [] } }));
+    await c.flushQueue();
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+    const [url, init] = global.fetch.mock.calls[0];
+    expect(url).toBe(SYNC_URL);
+    const { logs } = JSON.parse(init.body);
+    // The pre-sync item's session is read off its URL and it gets a key.
+    expect(logs.map((l) => l.session)).toEqual([99, 42]);
+    expect(logs.every((l) => l.key)).toBe(true);
+    expect(logs[1].status).toBe("done");
+  });
+
+  it("drops an item the server rejected", async () => {
+    const c = makeLogger();
+    c.enqueue({ status: "done", sets: [] });
+    vi.spyOn(console, "error").mockImplementation(() => {});
+    global.fetch = vi
+      .fn()
+      .mockResolvedValue(
+        synced(c.readQueue(), { ok: false, log: null, error: "Unknown session." }),
+      );
+    await c.flushQueue();
+    expect(c.readQueue()).toHaveLength(0);
+  });
+
+  it("keeps a save queued while the sync was in flight", async () => {
+    const c = makeLogger();
+    c.writeQueue([{ url: "/meso/api/me/session/99/log/", body: { sets: [] } }]);
+    global.fetch = vi.fn().mockImplementation(async (url, init) => {
+      c.enqueue({ status: "pending", sets: [] }); // saved offline meanwhile
+      return synced(JSON.parse(init.body).logs);
+    });
+    await c.flushQueue();
+    const left = c.readQueue();
+    expect(left).toHaveLength(1);
+    expect(left[0].url).toBe(LOG_URL);
+  });
+
   it("keeps the item queued when still offline", async () => {
     const c = makeLogger();
     c.enqueue({ status: "pending", sets: [] });
@@ -325,6 +381,14 @@ describe("flushQueue", () => {
     expect(c.readQueue()).toHaveLength(1);
   });
 
+  it("keeps the whole queue on a server error", async () => {
+    const c = makeLogger();
+    c.enqueue({ status: "pending", sets: [] });
+    global.fetch = vi.fn().mockResolvedValue(res({ ok: false, status: 500 }));
+    await c.flushQueue();
+    expect(c.readQueue()).toHaveLength(1);
+  });
+
   it("does nothing when the queue is empty", async () => {
     const c = makeLogger();
     global.fetch = vi.fn();
@@ -5,7 +5,10 @@
 // sending / error. No offline queue or retry logic here (unlike the athlete
 // logger) — a failed send just re-arms the button.
 
-import { createMesoDeliver } from "../app/store_project/static/js/meso_deliver.js";
+import {
+  BATCH_POLL_MS,
+  createMesoDeliver,
+} from "../app/store_project/static/js/meso_deliver.js";
 
 const PLAN_ID = 7;
 const CSRF = "tok";
@@ -172,3 +175,73 @@ describe("deliver → tour refresh nudge (#451)", () => {
     expect(handler).not.toHaveBeenCalled();
   });
 });
+
+// Batch-deliver runs as a queued job; the screen the coach lands back on polls
+// the batch's status URL until every client is resolved.
+describe("pollBatch", () => {
+  const STATUS_URL = "/meso/api/batch-delivery/3/status/";
+
+  function statusRes(status, extra = {}) {
+    return {
+      ok: true,
+      status: 200,
+      json: async () => ({
+        ok: true,
+        status,
+        total: 1,
+        delivered: status === "done" ? 1 : 0,
+        failed: 0,
+        pending: status === "done" ? 0 : 1,
+        targets: [],
+        ...extra,
+      }),
+    };
+  }
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("does nothing on init without a batch in flight", () => {
+    const c = createMesoDeliver(PLAN_ID, CSRF, null);
+    global.fetch = vi.fn();
+    c.init();
+    expect(global.fetch).not.toHaveBeenCalled();
+    expect(c.batch).toBe(null);
+  });
+
+  it("polls until the batch is done, then stops", async () => {
+    vi.useFakeTimers();
+    const c = createMesoDeliver(PLAN_ID, CSRF, null, STATUS_URL);
+    global.fetch = vi
+      .fn()
+      .mockResolvedValueOnce(statusRes("running"))
+      .mockResolvedValueOnce(statusRes("done"));
+
+    await c.pollBatch();
+    expect(global.fetch).toHaveBeenCalledWith(STATUS_URL, expect.anything());
+    expect(c.batch.status).toBe("running");
+    expect(c.batchActive).toBe(true);
+
+    await vi.advanceTimersByTimeAsync(BATCH_POLL_MS);
+    expect(global.fetch).toHaveBeenCalledTimes(2);
+    expect(c.batch.status).toBe("done");
+    expect(c.batchActive).toBe(false);
+
+    await vi.advanceTimersByTimeAsync(BATCH_POLL_MS * 3);
+    expect(global.fetch).toHaveBeenCalledTimes(2);
+  });
+
+  it("stops polling and flags an error when a poll fails", async () => {
+    vi.useFakeTimers();
+    vi.spyOn(console, "error").mockImplementation(() => {});
+    const c = createMesoDeliver(PLAN_ID, CSRF, null, STATUS_URL);
+    global.fetch = vi.fn().mockResolvedValue(res({ ok: false, status: 404 }));
+
+    await c.pollBatch();
+    await vi.advanceTimersByTimeAsync(BATCH_POLL_MS * 3);
+
+    expect(c.batchError).toBe(true);
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+});